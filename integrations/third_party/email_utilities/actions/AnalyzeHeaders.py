@@ -22,17 +22,17 @@ import re
 import socket
 
 import checkdmarc
-import dns.resolver
-import pydnsbl
 import tldextract
 from dateutil.parser import parse
-from ipwhois import IPWhois
 from soar_sdk.ScriptResult import EXECUTION_STATE_COMPLETED
 from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import output_handler
 
 from ..core import EmailParserRouting, EmailUtilitiesManager
-from ..core.IpLocation import DbIpCity
+from ..core.HeaderLookups import CACHE_SUMMARIZERS, HeaderLookups
+from ..core.LookupCache import LookupCache
+
+LOOKUP_CACHE_CONTEXT_KEY = "analyze_headers_lookup_cache"
 
 
 def ip_in_subnetwork(ip_address, subnetwork):
@@ -165,152 +165,42 @@ def return_domain(email):
     return domain.group(1)
 
 
-def ip_check(ip, domain):
-    spf_record = EmailUtilitiesManager.SpfRecord.from_domain(domain).record.split(" ")
-
-    includes = [x.split(":")[1] for x in spf_record if x.startswith("include")]
-    ips = [x.split(":")[1] for x in spf_record if x.startswith("ip")]
-    for include_domain in includes:
-        include_spf = EmailUtilitiesManager.SpfRecord.from_domain(
-            include_domain,
-        ).record.split(" ")
-        includes.extend(
-            [x.split(":")[1] for x in include_spf if x.startswith("include")],
-        )
-        ips.extend([x.split(":")[1] for x in include_spf if x.startswith("ip")])
-    for cidr in ips:
+def ip_check(ip, domain, lookups=None):
+    lookups = lookups or HeaderLookups()
+    for cidr in lookups.get_spf_networks(domain):
         if ip_in_subnetwork(ip, cidr):
             return True
     return False
 
 
-def parseHops(received):
-    previous_hop = {}
-    hops = []
-    ip_checker = pydnsbl.DNSBLIpChecker()
-    domain_checker = pydnsbl.DNSBLDomainChecker()
+def parseHops(received, lookups=None):
+    """Parses the received headers and enriches their hops concurrently.
+    :param received: {list} The received headers, the last hop first.
+    :param lookups: {HeaderLookups} The lookups to enrich the hops with.
+    :return: {list} The hops, the first hop first.
+    """
+    lookups = lookups or HeaderLookups()
+    parsed_routes = []
     for hop in reversed(received):
-        hop_info = {}
-        hop_info["blacklist_info"] = []
-        hop_info["from_ip_whois"] = {}
-        hop_info["by_ip_whois"] = {}
+        parsed_route = EmailParserRouting.parserouting(hop)
+        if "date" in parsed_route:
+            parsed_routes.append(parsed_route)
 
-        try:
-            parsed_route = EmailParserRouting.parserouting(hop)
-        except Exception:
-            raise
-        if "date" not in parsed_route:
-            continue
+    hops = lookups.enrich_hops(parsed_routes)
+    previous_date = None
+    for parsed_route, hop_info in zip(parsed_routes, hops):
         hop_info["time"] = (
             parsed_route["date"].astimezone(datetime.UTC).replace(tzinfo=None)
         )
-        hop_info["blacklisted"] = False
-        if "from" in parsed_route:
-            for f in parsed_route["from"]:
-                denylist = {}
-                hop_info["from"] = f
-                try:
-                    test_ip = ipaddress.ip_address(f)
-                    ip_check = ip_checker.check(f)
-                    # hop_info['from'] = f
-                    try:
-                        obj = IPWhois(f)
-                        hop_info["from_ip_whois"] = obj.lookup_rdap(depth=1)
-                        response = DbIpCity.get(f, api_key="free")
-                        hop_info["from_geo"] = json.loads(response.to_json())
-                    except Exception as expe:
-                        template = (
-                            "An exception of type {0} occurred. Arguments:\n{1!r}"
-                        )
-                        message = template.format(type(expe).__name__, expe.args)
-
-                    denylist["blacklisted"] = ip_check.blacklisted
-                    denylist["detected_by"] = ip_check.detected_by.copy()
-                    denylist["categories"] = ip_check.categories.copy()
-                    hop_info["blacklist_info"].append(denylist)
-                except ValueError:
-                    try:
-                        domain_check = domain_checker.check(f)
-                        resolved_ip_answer = dns.resolver.resolve(f)
-                        # for r in resolved_ip_answer:
-                        #    resolved_ip = r
-                        try:
-                            obj = IPWhois(resolved_ip_answer[0])
-                            ip_whois = obj.lookup_rdap(depth=1)
-                            response = DbIpCity.get(
-                                resolved_ip_answer[0],
-                                api_key="free",
-                            )
-                            hop_info["from_geo"] = json.loads(response.to_json())
-                            hop_info["from_ip_whois"] = ip_whois
-                        except Exception as exp:
-                            template = (
-                                "An exception of type {0} occurred. Arguments:\n{1!r}"
-                            )
-                            message = template.format(type(exp).__name__, exp.args)
-
-                        denylist["blacklisted"] = domain_check.blacklisted
-                        denylist["detected_by"] = domain_check.detected_by.copy()
-                        denylist["categories"] = domain_check.categories.copy()
-                        hop_info["blacklist_info"].append(denylist)
-                    except Exception as e:
-                        template = (
-                            "An exception of type {0} occurred. Arguments:\n{1!r}"
-                        )
-                        message = template.format(type(e).__name__, e.args)
-                        logger(message)
-                except Exception as ex:
-                    template = "An exception of type {0} occurred. Arguments:\n{1!r}"
-                    message = template.format(type(ex).__name__, ex.args)
-                    logger(message)
-
-                if "blacklisted" in denylist:
-                    if denylist["blacklisted"] == True:
-                        hop_info["blacklisted"] = True
-        else:
-            hop_info["from"] = ""
-        if "by" in parsed_route:
-            hop_info["by"] = parsed_route["by"][0]
-            try:
-                test_ip = ipaddress.ip_address(hop_info["by"])
-
-                obj = IPWhois(hop_info["by"])
-
-                response = DbIpCity.get(hop_info["by"], api_key="free")
-                hop_info["by_geo"] = json.loads(response.to_json())
-                hop_info["by_ip_whois"] = obj.lookup_rdap(depth=1)
-
-            except Exception:
-                try:
-                    resolved_ip_answer = dns.resolver.resolve(hop_info["by"])
-                    resolved_ip = resolved_ip_answer[0]
-                    try:
-                        obj = IPWhois(resolved_ip)
-                        hop_info["by_ip_whois"] = obj.lookup_rdap(depth=1)
-                        response = DbIpCity.get(resolved_ip, api_key="free")
-                        hop_info["by_geo"] = json.loads(response.to_json())
-                    except Exception as expl:
-                        template = (
-                            "An exception of type {0} occurred. Arguments:\n{1!r}"
-                        )
-                        message = template.format(type(expl).__name__, expl.args)
-                except Exception as exp:
-                    template = "An exception of type {0} occurred. Arguments:\n{1!r}"
-                    message = template.format(type(exp).__name__, exp.args)
-
         if "with" in parsed_route:
             hop_info["with"] = parsed_route["with"].split(" ")[0]
         else:
             hop_info["with"] = ""
-        if previous_hop:
-            hop_info["delay"] = (
-                parsed_route["date"] - previous_hop["date"]
-            ).total_seconds()
+        if previous_date is not None:
+            hop_info["delay"] = (parsed_route["date"] - previous_date).total_seconds()
         else:
             hop_info["delay"] = "*"
-        previous_hop = hop_info
-        previous_hop["date"] = parsed_route["date"]
-        hops.append(hop_info)
+        previous_date = hop_info["date"] = parsed_route["date"]
     return hops
 
 
@@ -323,12 +213,14 @@ def coalesce(input_dict, *arg):
     return None
 
 
-def buildResult(header, siemplify):
+def buildResult(header, siemplify, lookups=None):
     """Creates the result object after parsing the email.
     :param header:
-    :param mail_data:
+    :param siemplify:
+    :param lookups: {HeaderLookups} The lookups to enrich the hops with.
     :return:
     """
+    lookups = lookups or HeaderLookups(logger=siemplify.LOGGER)
     result = {
         "From": coalesce(header, "from"),
         "To": coalesce(header, "to", "delivered-to"),
@@ -368,16 +260,19 @@ def buildResult(header, siemplify):
 
     dkim = EmailUtilitiesManager.DKIM(logger=siemplify.LOGGER, headers=header)
     arc = EmailUtilitiesManager.ARC(logger=siemplify.LOGGER, headers=header)
+    txt_resolver = EmailUtilitiesManager.CachingTxtResolver(cache=lookups.cache)
 
     try:
-        result["DKIMVerify"] = dkim.verify()
+        result["DKIMVerify"] = dkim.verify(dnsfunc=txt_resolver)
     except Exception as e:
         result["DKIMVerify"] = "error"
         result["DKIMVerificationError"] = str(e)
 
     arc_res = {}
     try:
-        arc_res["result"], arc_res["details"], arc_res["reason"] = arc.verify()
+        arc_res["result"], arc_res["details"], arc_res["reason"] = arc.verify(
+            dnsfunc=txt_resolver,
+        )
         arc_res["result"] = arc_res["result"].decode()
         result["ARCVerify"] = arc_res
     except:
@@ -387,7 +282,7 @@ def buildResult(header, siemplify):
     result["SourceServer"] = ""
 
     try:
-        result["RelayInfo"] = parseHops(header["received"])
+        result["RelayInfo"] = parseHops(header["received"], lookups)
         for fromserver_str in reversed(header["received"]):
             if "by" in fromserver_str:
                 fromserver = EmailParserRouting.parserouting(fromserver_str)
@@ -400,11 +295,9 @@ def buildResult(header, siemplify):
                     if "by" in fromserver:
                         result["SourceServer"] = fromserver["by"][0]
                         try:
-                            result["SourceServerIP"] = (
-                                EmailUtilitiesManager.Resolver().query(
-                                    result["SourceServer"],
-                                )[0][2]
-                            )
+                            result["SourceServerIP"] = lookups.resolve(
+                                result["SourceServer"],
+                            )[0]
                         except:
                             pass
                 continue
@@ -412,7 +305,11 @@ def buildResult(header, siemplify):
         pass
 
     try:
-        result["SPF"]["Auth"] = ip_check(result["SourceServerIP"], result["FromDomain"])
+        result["SPF"]["Auth"] = ip_check(
+            result["SourceServerIP"],
+            result["FromDomain"],
+            lookups,
+        )
     except Exception:
         result["SPF"]["Auth"] = False
     try:
@@ -442,7 +339,14 @@ def main(siemplify):
     )
     h = json.loads(headers_json)
 
-    headers_res = buildResult(h, siemplify)
+    cache = LookupCache(summarizers=CACHE_SUMMARIZERS)
+    cache.load_from_action(siemplify, LOOKUP_CACHE_CONTEXT_KEY)
+    lookups = HeaderLookups(cache=cache, logger=siemplify.LOGGER)
+    try:
+        headers_res = buildResult(h, siemplify, lookups)
+    finally:
+        lookups.close()
+    cache.save_to_action(siemplify, LOOKUP_CACHE_CONTEXT_KEY)
     # print(json.dumps(headers_res, indent=4, sort_keys=True, default=str))
     siemplify.result.add_result_json(headers_res)
     siemplify.result.add_json("Headers", headers_res)
@@ -455,5 +359,4 @@ def main(siemplify):
 if __name__ == "__main__":
     siemplify = SiemplifyAction()
     siemplify.script_name = "Analyze Headers"
-    logger = siemplify.LOGGER.info
     main(siemplify)
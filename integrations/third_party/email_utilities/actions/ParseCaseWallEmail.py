@@ -24,7 +24,11 @@ from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import output_handler
 
 from ..core.AttachmentsManager import AttachmentsManager
-from ..core.EmailManager import EmailManager
+from ..core.EmailManager import (
+    AttachmentContent,
+    EmailManager,
+    encode_attachment_contents,
+)
 
 SUPPORTED_ATTACHMENTS = [".eml", ".msg"]
 ORIG_EMAIL_DESCRIPTION = [
@@ -40,6 +44,8 @@ def json_serial(obj):
         return serial
     if isinstance(obj, bytes):
         return base64.b64encode(obj).decode()
+    if isinstance(obj, AttachmentContent):
+        return str(obj)
     raise TypeError("Type not serializable")
 
 
@@ -81,6 +87,7 @@ def main():
         siemplify=siemplify,
         logger=siemplify.LOGGER,
         custom_regex=custom_regex,
+        lazy_attachments=True,
     )
     attach_mgr = AttachmentsManager(siemplify=siemplify)
     attachments = attach_mgr.get_alert_attachments()
@@ -160,11 +167,11 @@ def main():
     if save_to_case_wall:
         updated_entities = []
         for attachment in parsed_email["attachments"]:
-            if attachment["raw"] != "":
+            if attachment["raw"]:
                 try:
                     attachment_res = attach_mgr.add_attachment(
                         attachment["filename"],
-                        attachment["raw"],
+                        str(attachment["raw"]),
                         siemplify.case_id,
                         siemplify.alert_id,
                     )
@@ -195,6 +202,9 @@ def main():
                 f"updating file entity attachment_id: {updated_entities}",
             )
             siemplify.update_entities(updated_entities)
+    # The attachments' content, including the attachments of attached emails,
+    # is only base64 encoded for the output
+    encode_attachment_contents(parsed_email)
     siemplify.result.add_json(attachment_name, parsed_email, "Email File")
 
     # print(json.dumps({"parsed_emails": parsed_emails}, sort_keys=True, default=json_serial))
@@ -25,11 +25,13 @@ import json
 import os
 import re
 import string
+import threading
 import typing
 import urllib
 import uuid
 from base64 import urlsafe_b64decode
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from email.message import Message
 from email.utils import parseaddr
 from html import unescape
@@ -55,6 +57,7 @@ from . import EmailParserRouting, OleId
 from .EmailUtilitiesManager import (
     extract_valid_ips_from_body,
     fix_malformed_eml_content,
+    parse_eml_headers,
 )
 
 if typing.TYPE_CHECKING:
@@ -136,13 +139,101 @@ ENTITY_REGEXS = {
 
 EXTEND_GRAPH_URL = "{}/external/v1/investigator/ExtendCaseGraph"
 INVALID_URL_PATTERN = r"https://[^\s]+https://[^\s]+"
+#: Maximum number of body windows whose entities are extracted concurrently.
+MAX_BODY_WINDOW_WORKERS = 4
+
+_url_extractors = threading.local()
+# Shared by all the bodies, so its threads keep their URL extractors
+_body_window_executor = ThreadPoolExecutor(
+    max_workers=MAX_BODY_WINDOW_WORKERS,
+    thread_name_prefix="body-window",
+)
+
+
+def get_url_extractor(extract_email=False):
+    """Get a URLExtract of the current thread.
+
+    Creating a URLExtract loads and decodes its whole TLD list, which takes
+    much longer than most searches, so each thread reuses its instances.
+
+    Args:
+        extract_email (bool): whether the extractor also finds email addresses.
+
+    Returns:
+        URLExtract: the thread's extractor.
+
+    """
+    extractors = getattr(_url_extractors, "extractors", None)
+    if extractors is None:
+        extractors = _url_extractors.extractors = {}
+    if extract_email not in extractors:
+        extractors[extract_email] = URLExtract(
+            cache_dns=False,
+            extract_email=extract_email,
+        )
+    return extractors[extract_email]
 
 
 class EmailEncoder(JSONEncoder):
     def default(self, o):
+        if isinstance(o, AttachmentContent):
+            return str(o)
         return o.__dict__
 
 
+#: Size of the slices attachments are hashed in.
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class AttachmentContent:
+    """The content of an attachment, base64 encoded only when it is output.
+
+    Parsing keeps a single copy of each attachment's decoded bytes. The base64
+    text that the attachment's "raw" field used to hold is produced by `str()`
+    or by the JSON encoders, so it is never held for all attachments at once.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return base64.b64encode(self.data).decode()
+
+    def __bool__(self):
+        return len(self.data) > 0
+
+    def __eq__(self, other):
+        if isinstance(other, AttachmentContent):
+            return self.data == other.data
+        if isinstance(other, str):
+            # Compare the lengths first to not encode the content needlessly
+            encoded_length = 4 * ((len(self.data) + 2) // 3)
+            return len(other) == encoded_length and str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.data)
+
+    def __repr__(self):
+        return f"AttachmentContent(<{len(self.data)} bytes>)"
+
+
+def encode_attachment_contents(parsed):
+    """Replace the AttachmentContent objects of a parsed email, in place.
+
+    Every AttachmentContent in the nested dicts and lists of `parsed`, including
+    the attachments of its attached emails, is replaced with its base64 text.
+    """
+    items = parsed.items() if isinstance(parsed, dict) else enumerate(parsed)
+    for key, value in items:
+        if isinstance(value, AttachmentContent):
+            parsed[key] = str(value)
+        elif isinstance(value, (dict, list)):
+            encode_attachment_contents(value)
+
+
 maketrans = str.maketrans
 
 
@@ -251,6 +342,7 @@ class URLDefenseDecoder:
 class EmailUtils:
     def __init__(self, custom_regex=None):
         self.custom_regex = custom_regex
+        self._entity_patterns = None
 
     @staticmethod
     def find_urls_regex(body: str) -> Iterable[str]:
@@ -281,15 +373,10 @@ class EmailUtils:
             "filename": filename,
             "size": len(content),
             "extension": os.path.splitext(filename)[1][1:],
-            "hash": {
-                "md5": hashlib.md5(content).hexdigest(),
-                "sha1": hashlib.sha1(content).hexdigest(),
-                "sha256": hashlib.sha256(content).hexdigest(),
-                "sha512": hashlib.sha512(content).hexdigest(),
-            },
+            "hash": EmailUtils.get_file_hash(content),
             "mime_type": mime_type,
             "mime_type_short": mime_type_short,
-            "raw": base64.b64encode(content).decode(),
+            "raw": AttachmentContent(content),
         }
         return attachment_json
 
@@ -378,6 +465,9 @@ class EmailUtils:
         """Generate hashes of various types (MD5, SHA-1, SHA-256, SHA-512) for the
         provided data.
 
+        The data is read once, in slices that stay in the CPU cache while all
+        the hashes are updated with them.
+
         Args:
           data (bytes): The data to calculate the hashes on.
 
@@ -386,15 +476,15 @@ class EmailUtils:
 
         """
         hashalgo = ["md5", "sha1", "sha256", "sha512"]
-        hash_ = {}
+        hashers = [getattr(hashlib, k)() for k in hashalgo]
 
-        for k in hashalgo:
-            ha = getattr(hashlib, k)
-            h = ha()
-            h.update(data)
-            hash_[k] = h.hexdigest()
+        view = memoryview(data)
+        for start in range(0, len(view), HASH_CHUNK_SIZE):
+            chunk = view[start : start + HASH_CHUNK_SIZE]
+            for h in hashers:
+                h.update(chunk)
 
-        return hash_
+        return {k: h.hexdigest() for k, h in zip(hashalgo, hashers)}
 
     @staticmethod
     def decode_string(string, encoding):
@@ -443,6 +533,9 @@ class EmailUtils:
 
             return serial
 
+        if isinstance(obj, AttachmentContent):
+            return str(obj)
+
         raise TypeError(f"Type not serializable - {type(obj)!s}")
 
     def export_to_json(parsed_msg, sort_keys=False):
@@ -507,7 +600,10 @@ class EmailUtils:
     @staticmethod
     def is_ole_file(content_bytes):
         try:
-            return olefile.isOleFile(content_bytes)
+            # Only the header is checked, so don't pass a copy of all the content
+            return olefile.isOleFile(
+                bytes(memoryview(content_bytes)[: olefile.MINIMAL_OLEFILE_SIZE]),
+            )
         except (FileNotFoundError, ValueError):
             return False
 
@@ -554,7 +650,7 @@ class EmailUtils:
     def extract_emails(body):
         extracted_emails = {}
 
-        extractor = URLExtract(cache_dns=False, extract_email=True)
+        extractor = get_url_extractor(extract_email=True)
         try:
             matched_urls = extractor.find_urls(body)
 
@@ -562,7 +658,7 @@ class EmailUtils:
             matched_urls = EmailUtils.find_urls_regex(body)
 
         for match in matched_urls:
-            c = URLExtract(cache_dns=False)
+            c = get_url_extractor()
             try:
                 removed_url = c.find_urls(match, check_dns=False)
 
@@ -595,7 +691,7 @@ class EmailUtils:
 
         """
         list_observed_urls: typing.Counter[str] = Counter()
-        extractor = URLExtract(cache_dns=False)
+        extractor = get_url_extractor()
         try:
             matched_urls = extractor.find_urls(body, check_dns=True)
 
@@ -652,35 +748,47 @@ class EmailUtils:
         entities.extend(self.custom_entities(in_str))
         return entities
 
+    def get_entity_patterns(self):
+        """Get the compiled built-in and custom entity patterns.
+
+        Returns:
+            list: (entity type, compiled patterns) pairs, in search order.
+
+        """
+        if self._entity_patterns is None:
+            self._entity_patterns = [
+                (
+                    entity_type,
+                    [re.compile(p) for p in entity_source[entity_type]["patterns"]],
+                )
+                for entity_source in [ENTITY_REGEXS, self.custom_regex]
+                for entity_type in entity_source
+            ]
+        return self._entity_patterns
+
     def custom_entities(self, in_str):
         matched_entities = []
-        for entity_source in [ENTITY_REGEXS, self.custom_regex]:
-            for entity_type in entity_source:
-                for regex_search in entity_source[entity_type]["patterns"]:
-                    matches = re.finditer(regex_search, in_str)
-                    if bool(matches):
-                        for m in matches:
-                            entity = {}
-                            entity["entity_type"] = entity_type
-                            if entity_type == "DestinationURL":
-                                entity["identifier"] = EmailUtils.clean_found_url(
-                                    m.group(0),
-                                )
-                            elif (
-                                entity_type == "ADDRESS"
-                                and not extract_valid_ips_from_body(m.group(0))
-                            ):
-                                continue
-                            else:
-                                entity["identifier"] = m.group(0)
-
-                            if entity["identifier"] and re.search(
-                                INVALID_URL_PATTERN,
-                                entity["identifier"],
-                            ):
-                                continue
-                            if entity["identifier"]:
-                                matched_entities.append(entity)
+        for entity_type, patterns in self.get_entity_patterns():
+            for pattern in patterns:
+                for m in pattern.finditer(in_str):
+                    entity = {}
+                    entity["entity_type"] = entity_type
+                    if entity_type == "DestinationURL":
+                        entity["identifier"] = EmailUtils.clean_found_url(m.group(0))
+                    elif entity_type == "ADDRESS" and not extract_valid_ips_from_body(
+                        m.group(0),
+                    ):
+                        continue
+                    else:
+                        entity["identifier"] = m.group(0)
+
+                    if entity["identifier"] and re.search(
+                        INVALID_URL_PATTERN,
+                        entity["identifier"],
+                    ):
+                        continue
+                    if entity["identifier"]:
+                        matched_entities.append(entity)
         return matched_entities
 
     @staticmethod
@@ -839,23 +947,28 @@ class EmailBody:
         return body_json
 
     def parse_body(self, body):
-        """This will parse a body and observed IOCs"""
-        parsed = []
-        _parsed = {}
+        """This will parse a body and observed IOCs.
+
+        The windows of large bodies are searched concurrently. The entities are
+        returned in the order they are found in, without duplicates.
+        """
+        body_slices = list(self.string_sliding_window_loop(body))
+        if len(body_slices) > 1:
+            parsed_slices = list(
+                _body_window_executor.map(
+                    self.email_utils.parsed_entities, body_slices
+                ),
+            )
+        else:
+            parsed_slices = [self.email_utils.parsed_entities(s) for s in body_slices]
+
         entity_list = []
-        _entities = {}
-        for body_slice in self.string_sliding_window_loop(body):
-            parsed = self.email_utils.parsed_entities(body_slice)
+        seen = set()
+        for parsed in parsed_slices:
             for parsed_entity in parsed:
-                found = 0
-                for _entity in entity_list:
-                    if (
-                        _entity["identifier"] == parsed_entity["identifier"]
-                        and _entity["entity_type"] == parsed_entity["entity_type"]
-                    ):
-                        found = 1
-                        break
-                if found == 0:
+                key = (parsed_entity["identifier"], parsed_entity["entity_type"])
+                if key not in seen:
+                    seen.add(key)
                     entity_list.append(parsed_entity)
         return entity_list
 
@@ -1277,7 +1390,7 @@ class EMLParser:
         else:
             parsed_attachment = self.prepare_attachment(msg, counter)
             if parsed_attachment:
-                return [self.prepare_attachment(msg, counter)]
+                return [parsed_attachment]
             return []
 
         return attachments
@@ -1378,7 +1491,7 @@ class EMLParser:
             else:
                 print("No data in attachment")
 
-            attachment["raw"] = (base64.b64encode(data)).decode("utf-8")
+            attachment["raw"] = AttachmentContent(data)
 
             ch: dict[str, list[str]] = {}
             for k, v in msg.items():
@@ -1511,28 +1624,40 @@ class EMLParser:
 
 
 class EmailManager:
-    def __init__(self, siemplify=None, logger=None, custom_regex=None):
+    """Parses emails and their nested emails and attachments.
+
+    :param lazy_attachments: {bool} keep the "raw" field of the returned
+        attachments as AttachmentContent objects, which are base64 encoded only
+        when they are converted to a string or to JSON. Otherwise, they are
+        base64 encoded strings.
+    """
+
+    def __init__(
+        self,
+        siemplify=None,
+        logger=None,
+        custom_regex=None,
+        lazy_attachments=False,
+    ):
         self.logger = logger
         self.siemplify = siemplify
         self.attachments = []
         self.attached_emails = []
         self.custom_regex = custom_regex
+        self.lazy_attachments = lazy_attachments
 
     def traverse_attachments(self, attachment_name, content_bytes, nested_level):
-        try:
-            if EmailUtils.is_ole_file(content_bytes):
-                try:
-                    self.logger.info("trying parse msg")
-                    parsed = self.parse_msg(content_bytes)
-                    self.logger.info("parsed MSG")
-                    self.logger.info(parsed)
+        if EmailUtils.is_ole_file(content_bytes):
+            try:
+                self.logger.info("trying parse msg")
+                parsed = self.parse_msg(content_bytes)
+                self.logger.info("parsed MSG")
+                self.logger.info(parsed)
 
-                except Exception as e:
-                    self.logger.info(e)
-                    return None
-            else:
-                parsed = self.parse_eml(content_bytes)
-        except Exception:
+            except Exception as e:
+                self.logger.info(e)
+                return None
+        else:
             parsed = self.parse_eml(content_bytes)
 
         if not parsed:
@@ -1545,19 +1670,26 @@ class EmailManager:
             for attached_eml in parsed["attached_emails"]:
                 nl = nl + 1
                 attached_eml["level"] = nl
+                if not self.lazy_attachments:
+                    encode_attachment_contents(attached_eml)
                 self.attached_emails.append(attached_eml)
             del parsed["attached_emails"]
         for attachment in parsed["attachments"]:
             attachment["level"] = nested_level
+            content = attachment["raw"]
 
-            self.attachments.append(attachment.copy())
+            self.attachments.append(
+                {
+                    **attachment,
+                    "raw": content if self.lazy_attachments else str(content),
+                },
+            )
             # if attachment['mime_type_short'] == 'message/rfc822' or
             # attachment['mime_type_short'] == 'Composite Document File V2 Document,
             # No summary info':
-            decoded_data = base64.b64decode(attachment["raw"])
             p_email = self.traverse_attachments(
                 attachment["filename"],
-                decoded_data,
+                content.data,
                 nested_level + 1,
             )
             if p_email:
@@ -1616,7 +1748,12 @@ class EmailManager:
             dict[str, Any]: dict object for parsed eml.
 
         """
-        eml_file_content = fix_malformed_eml_content(eml_file_content)
+        # Only the headers are parsed first, so content that is not an email,
+        # such as most attachments, is not parsed in full
+        headers = parse_eml_headers(eml_file_content)
+        if not headers:
+            return None
+        eml_file_content = fix_malformed_eml_content(eml_file_content, headers)
         msg = email.message_from_bytes(eml_file_content, policy=email.policy.default)
         email_utils = EmailUtils(custom_regex=self.custom_regex)
         if not msg:
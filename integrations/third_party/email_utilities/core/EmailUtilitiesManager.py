@@ -16,11 +16,14 @@ from __future__ import annotations
 
 import base64
 import binascii
+import email.parser
+import email.policy
 import hashlib
 import logging
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import dnslib
 
@@ -38,7 +41,6 @@ except ImportError:
     pass
 from netaddr import valid_ipv4, valid_ipv6
 
-import eml_parser
 from dkim.crypto import (
     DigestTooLargeError,
     RSASSA_PKCS1_v1_5_sign,
@@ -48,10 +50,13 @@ from dkim.crypto import (
     parse_public_key,
 )
 
+from .LookupCache import LookupCache
+
 __all__ = [
     "ARC",
     "DKIM",
     "AuthresNotFoundError",
+    "CachingTxtResolver",
     "CV_Fail",
     "CV_None",
     "CV_Pass",
@@ -325,6 +330,104 @@ def get_txt(name, timeout=5):
     return txt
 
 
+#: Seconds to cache a missing record for when the zone does not tell.
+DEFAULT_NEGATIVE_TXT_TTL = 5 * 60
+#: Maximum number of concurrent TXT lookups when prefetching keys.
+MAX_TXT_WORKERS = 8
+
+
+class CachingTxtResolver:
+    """Looks up TXT records, such as DKIM and ARC keys, through a cache.
+
+    An instance is a drop-in `dnsfunc` for the verification functions and
+    methods. Records are cached for their TTL and missing records for the
+    zone's negative caching TTL, so verifying several emails signed by the same
+    domain only looks each key up once. Failed lookups are cached briefly too.
+
+    @param cache: the LookupCache to use, e.g. one stored in an action's context
+    @param resolver: the dns.resolver.Resolver to query (default system resolver)
+    @param max_workers: the maximum number of concurrent lookups of prefetch
+    """
+
+    def __init__(self, cache=None, resolver=None, max_workers=MAX_TXT_WORKERS):
+        self.cache = cache if cache is not None else LookupCache()
+        self.resolver = resolver
+        self.max_workers = max_workers
+
+    def __call__(self, name, timeout=5):
+        try:
+            unicode_name = name.decode()
+        except UnicodeDecodeError:
+            return None
+        txt = self.cache.get_or_lookup(
+            "txt",
+            unicode_name,
+            lambda: self._lookup(unicode_name, timeout),
+        )
+        if txt is None:
+            return None
+        return txt.encode("latin-1")
+
+    def prefetch(self, names, timeout=5):
+        """Look up several names concurrently, e.g. the keys of all signatures.
+
+        Failures are not raised here, they are raised again from the cache when
+        the name is looked up for verification.
+
+        @param names: the bytestring domain names to look up
+        """
+        names = set(names)
+        if len(names) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for future in [executor.submit(self, n, timeout) for n in names]:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+
+    def _lookup(self, name, timeout):
+        resolver = self.resolver or dns.resolver.get_default_resolver()
+        try:
+            answer = resolver.resolve(
+                name,
+                dns.rdatatype.TXT,
+                raise_on_no_answer=False,
+                lifetime=timeout,
+            )
+        except dns.resolver.NXDOMAIN as e:
+            return None, _get_negative_ttl(e.response(e.qnames()[0]))
+        if answer.rrset is None:
+            return None, _get_negative_ttl(answer.response)
+        txt = b"".join(list(answer.rrset)[0].strings)
+        return txt.decode("latin-1"), answer.rrset.ttl
+
+
+def _get_negative_ttl(response):
+    for rrset in getattr(response, "authority", []):
+        if rrset.rdtype == dns.rdatatype.SOA:
+            return min(rrset.ttl, list(rrset)[0].minimum)
+    return DEFAULT_NEGATIVE_TXT_TTL
+
+
+def _prefetch_keys(dnsfunc, tag_lists, timeout):
+    """Prefetch the keys of several signatures if dnsfunc supports it."""
+    if not hasattr(dnsfunc, "prefetch"):
+        return
+    names = []
+    for tag_list in tag_lists:
+        try:
+            sig = parse_tag_value(tag_list)
+            names.append(sig[b"s"] + b"._domainkey." + sig[b"d"] + b".")
+        except (InvalidTagValueList, KeyError):
+            pass
+    dnsfunc.prefetch(names, timeout=timeout)
+
+
+#: TXT lookups shared by all the verifications of the process.
+cached_get_txt = CachingTxtResolver()
+
+
 class HashThrough:
     def __init__(self, hasher, info=False):
         self.data = []
@@ -705,7 +808,7 @@ def evaluate_pk(name, s):
     return pk, keysize, ktag, seqtlsrpt
 
 
-def load_pk_from_dns(name, dnsfunc=get_txt, timeout=5):
+def load_pk_from_dns(name, dnsfunc=cached_get_txt, timeout=5):
     s = dnsfunc(name, timeout=timeout)
     pk, keysize, ktag, seqtlsrpt = evaluate_pk(name, s)
     return pk, keysize, ktag, seqtlsrpt
@@ -1294,10 +1397,15 @@ class DKIM(DomainSigner):
     #: for a DNS domain.  The default uses dnspython or pydns.
     #: @return: True if signature verifies or False otherwise
     #: @raise DKIMException: when the message, signature, or key are badly formed
-    def verify(self, idx=0, dnsfunc=get_txt):
+    def verify(self, idx=0, dnsfunc=cached_get_txt):
         prep = self.verify_headerprep(idx)
         if prep:
             sig, include_headers, sigheaders = prep
+            _prefetch_keys(
+                dnsfunc,
+                [h[b"dkim-signature"] for h in sigheaders],
+                self.timeout,
+            )
             return self.verify_sig(sig, include_headers, sigheaders[idx], dnsfunc)
         return False  # No signature
 
@@ -1582,11 +1690,20 @@ class ARC(DomainSigner):
     # chain that has ended), list of
     #: result dictionaries, result reason)
     #: @raise DKIMException: when the message, signature, or key are badly formed
-    def verify(self, dnsfunc=get_txt):
+    def verify(self, dnsfunc=cached_get_txt):
         result_data = []
         max_instance, arc_headers_w_instance = self.sorted_arc_headers()
         if max_instance == 0:
             return CV_None, result_data, "Message is not ARC signed"
+        _prefetch_keys(
+            dnsfunc,
+            [
+                y
+                for _, (x, y) in arc_headers_w_instance
+                if x.lower() in (b"arc-seal", b"arc-message-signature")
+            ],
+            self.timeout,
+        )
         for instance in range(max_instance, 0, -1):
             try:
                 result = self.verify_instance(
@@ -1642,7 +1759,7 @@ class ARC(DomainSigner):
     #: for a DNS domain.  The default uses dnspython or pydns.
     #: @return: True if signature verifies or False otherwise
     #: @raise DKIMException: when the message, signature, or key are badly formed
-    def verify_instance(self, arc_headers_w_instance, instance, dnsfunc=get_txt):
+    def verify_instance(self, arc_headers_w_instance, instance, dnsfunc=cached_get_txt):
         if (instance == 0) or (len(arc_headers_w_instance) == 0):
             raise ParameterError(
                 "request to verify instance %d not present" % (instance),
@@ -1819,7 +1936,14 @@ def sign(
     )
 
 
-def verify(message, logger=None, dnsfunc=get_txt, minkey=1024, timeout=5, tlsrpt=False):
+def verify(
+    message,
+    logger=None,
+    dnsfunc=cached_get_txt,
+    minkey=1024,
+    timeout=5,
+    tlsrpt=False,
+):
     """Verify the first (topmost) DKIM signature on an RFC822 formatted message.
     @param message: an RFC822 formatted message (with either \\n or \\r\\n line endings)
     @param logger: a logger to which info info will be written (default None)
@@ -1899,7 +2023,7 @@ def arc_sign(
     )
 
 
-def arc_verify(message, logger=None, dnsfunc=get_txt, minkey=1024, timeout=5):
+def arc_verify(message, logger=None, dnsfunc=cached_get_txt, minkey=1024, timeout=5):
     # type: (bytes, any, function, int) -> tuple
     """Verify the ARC chain on an RFC822 formatted message.
     @param message: an RFC822 formatted message (with either \\n or \\r\\n line endings)
@@ -2222,20 +2346,45 @@ def get_spf_string_for_domain(domain):
         return None
 
 
-def fix_malformed_eml_content(content_bytes: bytes) -> bytes:
+HEADER_BLOCK_END_PATTERN = re.compile(rb"\r?\n\r?\n")
+
+
+def parse_eml_headers(content_bytes: bytes) -> email.message.EmailMessage:
+    """Parse the top level headers of eml content, without parsing its body.
+
+    Args:
+        content_bytes (bytes): eml file content.
+
+    Returns:
+        email.message.EmailMessage: A message with the headers only. It has no
+            headers if the content is not an email.
+
+    """
+    header_end = HEADER_BLOCK_END_PATTERN.search(content_bytes)
+    header_bytes = content_bytes[: header_end.end()] if header_end else content_bytes
+    parser = email.parser.BytesHeaderParser(policy=email.policy.default)
+    return parser.parsebytes(header_bytes)
+
+
+def fix_malformed_eml_content(
+    content_bytes: bytes,
+    headers: email.message.EmailMessage | None = None,
+) -> bytes:
     """Fix malformed eml bytes content if exist.
     fix for b/356792519
 
     Args:
         content_bytes (bytes): eml file content.
+        headers (email.message.EmailMessage | None): the content's headers, as
+            returned by parse_eml_headers. Parsed from the content if None.
 
     Returns:
         bytes: fixed eml content.
 
     """
-    ep_obj = eml_parser.EmlParser()
-    parsed_eml = ep_obj.decode_email_bytes(content_bytes)
-    main_content_type = parsed_eml["header"]["header"].get("content-type", [])
+    if headers is None:
+        headers = parse_eml_headers(content_bytes)
+    main_content_type = headers.get_all("content-type", [])
     if (
         len(main_content_type) > 1
         and str(main_content_type[0]) == "text/plain"
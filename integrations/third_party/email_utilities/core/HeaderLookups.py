@@ -0,0 +1,350 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import json
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import dns.resolver
+import pydnsbl
+from ipwhois import IPWhois
+
+from . import EmailUtilitiesManager
+from .IpLocation import DbIpCity
+from .LookupCache import LookupCache
+
+MAX_WORKERS: int = 8
+RDAP_TTL: float = 24 * 60 * 60
+GEO_TTL: float = 24 * 60 * 60
+DNSBL_TTL: float = 60 * 60
+SPF_TTL: float = 60 * 60
+MAX_SPF_INCLUDES: int = 50
+RDAP_FIELDS: tuple[str, ...] = (
+    "query",
+    "asn",
+    "asn_cidr",
+    "asn_country_code",
+    "asn_date",
+    "asn_description",
+    "asn_registry",
+    "entities",
+)
+RDAP_NETWORK_FIELDS: tuple[str, ...] = (
+    "cidr",
+    "country",
+    "start_address",
+    "end_address",
+    "handle",
+    "ip_version",
+    "name",
+    "parent_handle",
+    "status",
+    "type",
+)
+RDAP_OBJECT_FIELDS: tuple[str, ...] = ("handle", "roles", "entities")
+RDAP_CONTACT_FIELDS: tuple[str, ...] = ("name", "kind", "email")
+
+
+def lookup_rdap(ip: str) -> dict[str, Any]:
+    return IPWhois(ip).lookup_rdap(depth=1)
+
+
+def summarize_rdap(rdap: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the main fields of an RDAP record.
+
+    The notices, links, remarks, events and raw responses of the network and
+    its entities are dropped, so the record stays small enough to be cached
+    in the action's context. Summarizing a summary returns it unchanged.
+    """
+    summary: dict[str, Any] = {k: rdap.get(k) for k in RDAP_FIELDS}
+    network: dict[str, Any] = rdap.get("network") or {}
+    summary["network"] = {k: network.get(k) for k in RDAP_NETWORK_FIELDS}
+    summary["objects"] = {}
+    for handle, obj in (rdap.get("objects") or {}).items():
+        contact: dict[str, Any] = obj.get("contact") or {}
+        summary["objects"][handle] = {k: obj.get(k) for k in RDAP_OBJECT_FIELDS}
+        summary["objects"][handle]["contact"] = {
+            k: contact.get(k) for k in RDAP_CONTACT_FIELDS
+        }
+
+    return summary
+
+
+CACHE_SUMMARIZERS: dict[str, Callable[[Any], Any]] = {"rdap": summarize_rdap}
+
+
+def lookup_geo(ip: str) -> dict[str, Any]:
+    return json.loads(DbIpCity.get(ip, api_key="free").to_json())
+
+
+def lookup_spf(domain: str) -> str | None:
+    return EmailUtilitiesManager.SpfRecord.from_domain(domain).record
+
+
+def is_ip_address(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+
+    except ValueError:
+        return False
+
+    return True
+
+
+class HeaderLookups:
+    """Network lookups used to analyze the hops of an email's headers.
+
+    Every lookup goes through a shared `LookupCache`, so an IP address or a
+    domain that appears in several hops, or in several SPF includes, is only
+    looked up once, including when the lookups run concurrently.
+
+    The DNS resolver and the RDAP, geolocation, SPF and deny list lookups can
+    be replaced, e.g. to run against local stub servers.
+    """
+
+    def __init__(
+        self,
+        cache: LookupCache | None = None,
+        resolver: dns.resolver.Resolver | None = None,
+        rdap_lookup: Callable[[str], dict[str, Any]] = lookup_rdap,
+        geo_lookup: Callable[[str], dict[str, Any]] = lookup_geo,
+        spf_lookup: Callable[[str], str | None] = lookup_spf,
+        dnsbl_lookup: Callable[[str], dict[str, Any]] | None = None,
+        max_workers: int = MAX_WORKERS,
+        logger: Any = None,
+    ) -> None:
+        self.cache: LookupCache = (
+            cache if cache is not None else LookupCache(summarizers=CACHE_SUMMARIZERS)
+        )
+        self.resolver: dns.resolver.Resolver = resolver or dns.resolver.Resolver()
+        self.rdap_lookup: Callable[[str], dict[str, Any]] = rdap_lookup
+        self.geo_lookup: Callable[[str], dict[str, Any]] = geo_lookup
+        self.spf_lookup: Callable[[str], str | None] = spf_lookup
+        self.dnsbl_lookup: Callable[[str], dict[str, Any]] = (
+            dnsbl_lookup or self._lookup_dnsbl
+        )
+        self.max_workers: int = max_workers
+        self.logger: Any = logger
+        self._local: threading.local = threading.local()
+        self._loops: list[asyncio.AbstractEventLoop] = []
+        self._loops_lock: threading.Lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the event loops of the DNSBL checkers."""
+        with self._loops_lock:
+            for loop in self._loops:
+                loop.close()
+
+            self._loops.clear()
+
+    def resolve(self, name: str) -> list[str]:
+        """Resolve a domain's A records, cached for the records' TTL."""
+
+        def lookup() -> tuple[list[str], float]:
+            answer: dns.resolver.Answer = self.resolver.resolve(name)
+            return [r.to_text() for r in answer], answer.rrset.ttl
+
+        return self.cache.get_or_lookup("dns", name, lookup)
+
+    def rdap(self, ip: str) -> dict[str, Any]:
+        """Look up an IP address's RDAP record.
+
+        The full record is returned, but only its `summarize_rdap` summary is
+        kept when the cache is stored in the action's context.
+        """
+        return self.cache.get_or_lookup(
+            "rdap",
+            ip,
+            lambda: (self.rdap_lookup(ip), RDAP_TTL),
+        )
+
+    def geo(self, ip: str) -> dict[str, Any]:
+        return self.cache.get_or_lookup(
+            "geo",
+            ip,
+            lambda: (self.geo_lookup(ip), GEO_TTL),
+        )
+
+    def spf(self, domain: str) -> str | None:
+        return self.cache.get_or_lookup(
+            "spf",
+            domain,
+            lambda: (self.spf_lookup(domain), SPF_TTL),
+        )
+
+    def check_denylists(self, name: str) -> dict[str, Any]:
+        """Check an IP address or a domain against the DNS based deny lists.
+
+        Returns:
+            A dict with the `blacklisted`, `detected_by` and `categories` of
+            the check. The categories are a sorted list.
+
+        """
+        return self.cache.get_or_lookup(
+            "dnsbl",
+            name,
+            lambda: (self.dnsbl_lookup(name), DNSBL_TTL),
+        )
+
+    def get_spf_networks(self, domain: str) -> list[str]:
+        """Get the networks a domain's SPF record allows, following includes.
+
+        Every included domain is looked up once, even if several records
+        include it, and the includes of each level are looked up concurrently.
+
+        Returns:
+            The allowed networks in CIDR notation.
+
+        """
+        networks: list[str] = []
+        seen: set[str] = {domain}
+        level: list[str] = [domain]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while level:
+                records: list[str | None] = list(executor.map(self._try_spf, level))
+                level = []
+                for record in records:
+                    mechanisms: list[str] = (record or "").split(" ")
+                    networks.extend(
+                        m.split(":", 1)[1] for m in mechanisms if m.startswith("ip")
+                    )
+                    for m in mechanisms:
+                        include: str = m.split(":", 1)[1] if ":" in m else ""
+                        if (
+                            m.startswith("include")
+                            and include not in seen
+                            and len(seen) < MAX_SPF_INCLUDES
+                        ):
+                            seen.add(include)
+                            level.append(include)
+
+        return networks
+
+    def enrich_hops(
+        self,
+        parsed_routes: Iterable[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Enrich parsed hops concurrently.
+
+        Returns:
+            The enrichment of each hop, in the order of `parsed_routes`.
+
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.enrich_hop, parsed_routes))
+
+    def enrich_hop(self, parsed_route: dict[str, Any]) -> dict[str, Any]:
+        """Look up the deny lists, whois and geolocation of a hop's servers."""
+        hop_info: dict[str, Any] = {
+            "blacklist_info": [],
+            "from_ip_whois": {},
+            "by_ip_whois": {},
+            "blacklisted": False,
+            "from": "",
+        }
+        for f in parsed_route.get("from", []):
+            hop_info["from"] = f
+            try:
+                denylist: dict[str, Any] = self.check_denylists(f)
+                ip: str = f if is_ip_address(f) else self.resolve(f)[0]
+
+            except Exception as e:
+                self._log(e)
+                continue
+
+            self._add_whois(hop_info, "from", ip)
+            hop_info["blacklist_info"].append(
+                {
+                    "blacklisted": denylist["blacklisted"],
+                    "detected_by": {
+                        k: list(v) for k, v in denylist["detected_by"].items()
+                    },
+                    "categories": set(denylist["categories"]),
+                },
+            )
+            if denylist["blacklisted"]:
+                hop_info["blacklisted"] = True
+
+        if "by" in parsed_route:
+            hop_info["by"] = parsed_route["by"][0]
+            try:
+                ip = (
+                    hop_info["by"]
+                    if is_ip_address(hop_info["by"])
+                    else self.resolve(hop_info["by"])[0]
+                )
+                self._add_whois(hop_info, "by", ip)
+
+            except Exception:
+                pass
+
+        return hop_info
+
+    def _add_whois(self, hop_info: dict[str, Any], prefix: str, ip: str) -> None:
+        try:
+            hop_info[f"{prefix}_ip_whois"] = self.rdap(ip)
+            hop_info[f"{prefix}_geo"] = self.geo(ip)
+
+        except Exception:
+            pass
+
+    def _try_spf(self, domain: str) -> str | None:
+        try:
+            return self.spf(domain)
+
+        except Exception as e:
+            self._log(e)
+            return None
+
+    def _lookup_dnsbl(self, name: str) -> dict[str, Any]:
+        result: pydnsbl.checker.DNSBLResult = self._get_dnsbl_checker(
+            is_ip_address(name),
+        ).check(name)
+        return {
+            "blacklisted": result.blacklisted,
+            "detected_by": dict(result.detected_by),
+            "categories": sorted(result.categories),
+        }
+
+    def _get_dnsbl_checker(self, is_ip: bool) -> pydnsbl.checker.BaseDNSBLChecker:
+        checkers: dict[bool, pydnsbl.checker.BaseDNSBLChecker] | None = getattr(
+            self._local,
+            "checkers",
+            None,
+        )
+        if checkers is None:
+            loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+            with self._loops_lock:
+                self._loops.append(loop)
+
+            checkers = {
+                True: pydnsbl.DNSBLIpChecker(loop=loop),
+                False: pydnsbl.DNSBLDomainChecker(loop=loop),
+            }
+            self._local.checkers = checkers
+
+        return checkers[is_ip]
+
+    def _log(self, exception: Exception) -> None:
+        if self.logger is None:
+            return
+
+        template: str = "An exception of type {0} occurred. Arguments:\n{1!r}"
+        self.logger.info(template.format(type(exception).__name__, exception.args))
@@ -0,0 +1,267 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, TypeAlias
+
+JsonStr: TypeAlias = str
+Lookup: TypeAlias = Callable[[], tuple[Any, float]]
+
+ACTION_GLOBAL_CONTEXT_TYPE: int = 0
+GLOBAL_CONTEXT_IDENTIFIER: str = "GLOBAL"
+DEFAULT_MAX_ENTRIES: int = 2000
+DEFAULT_MAX_SIZE: int = 256 * 1024
+DEFAULT_NEGATIVE_TTL: float = 5 * 60
+
+
+class CachedLookupError(LookupError):
+    """Raised when a lookup is known to have failed recently."""
+
+
+class LookupCache:
+    """Thread safe cache of network lookup results with a TTL per entry.
+
+    Concurrent lookups of the same key are merged into a single call, so a
+    value that several workers need at once is only fetched once. Failed
+    lookups are remembered for a short time as well, so an unreachable server
+    is not asked again for every hop of the same email.
+
+    At most `max_entries` entries are kept in memory: expired entries are
+    dropped when they are read, and when a new entry does not fit, the expired
+    entries and then the ones that expire first are dropped.
+
+    Results must be JSON serializable, so the cache can be stored in the
+    action's context and reused by the following runs. Large results can be
+    reduced before they are stored by a summarizer for their kind of lookup;
+    the results returned during the run are not affected.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_size: int = DEFAULT_MAX_SIZE,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        clock: Callable[[], float] = time.time,
+        summarizers: dict[str, Callable[[Any], Any]] | None = None,
+    ) -> None:
+        self.max_entries: int = max_entries
+        self.max_size: int = max_size
+        self.negative_ttl: float = negative_ttl
+        self._clock: Callable[[], float] = clock
+        self.summarizers: dict[str, Callable[[Any], Any]] = summarizers or {}
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._pending: dict[str, Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_lookup(self, kind: str, name: str, lookup: Lookup) -> Any:
+        """Get a cached result, or look it up and cache it.
+
+        Args:
+            kind: The kind of the lookup, e.g. "rdap" or "dns".
+            name: The looked up IP address or domain.
+            lookup: Performs the lookup and returns the result and the number
+                of seconds it stays valid.
+
+        Returns:
+            The lookup's result.
+
+        Raises:
+            CachedLookupError: If the same lookup failed recently.
+            Exception: Any exception raised by `lookup`.
+
+        """
+        key: str = f"{kind}:{name.lower()}"
+        with self._lock:
+            entry: dict[str, Any] | None = self._get_fresh_entry(key)
+            if entry is not None:
+                return self._unpack(entry)
+
+            future: Future | None = self._pending.get(key)
+            owner: bool = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value, ttl = lookup()
+
+        except Exception as e:
+            with self._lock:
+                self._add_entry(
+                    key,
+                    {
+                        "error": f"{type(e).__name__}: {e}",
+                        "expires": self._clock() + self.negative_ttl,
+                    },
+                )
+                del self._pending[key]
+
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._add_entry(key, {"value": value, "expires": self._clock() + ttl})
+            del self._pending[key]
+
+        future.set_result(value)
+        return value
+
+    def load(self, raw: JsonStr | None) -> None:
+        """Add the entries of a serialized cache that did not expire yet.
+
+        Args:
+            raw: A cache serialized by `dump`. Invalid content is ignored.
+
+        """
+        try:
+            entries: Any = json.loads(raw) if raw else {}
+
+        except ValueError:
+            return
+
+        if not isinstance(entries, dict):
+            return
+
+        now: float = self._clock()
+        with self._lock:
+            for key, entry in entries.items():
+                if (
+                    isinstance(entry, dict)
+                    and entry.get("expires", 0) > now
+                    and key not in self._entries
+                ):
+                    self._add_entry(key, entry)
+
+    def dump(self) -> JsonStr:
+        """Serialize the entries that did not expire yet.
+
+        The results of the kinds of lookups that have a summarizer are replaced
+        by their summaries. When there are more than `max_entries` entries, or
+        the serialized entries are longer than `max_size` characters, the ones
+        that expire first are dropped.
+
+        Returns:
+            The cache as a JSON string.
+
+        """
+        now: float = self._clock()
+        with self._lock:
+            fresh: list[tuple[str, dict[str, Any]]] = sorted(
+                ((k, e) for k, e in self._entries.items() if e["expires"] > now),
+                key=lambda item: item[1]["expires"],
+                reverse=True,
+            )
+
+        kept: dict[str, dict[str, Any]] = {}
+        size: int = len("{}")
+        for key, entry in fresh[: self.max_entries]:
+            summarize: Callable[[Any], Any] | None = self.summarizers.get(
+                key.split(":", 1)[0],
+            )
+            if summarize is not None and "value" in entry:
+                entry = {**entry, "value": summarize(entry["value"])}
+
+            entry_size: int = len(json.dumps({key: entry})) - len("{}") + len(", ")
+            if size + entry_size > self.max_size:
+                break
+
+            kept[key] = entry
+            size += entry_size
+
+        return json.dumps(kept)
+
+    def load_from_action(self, siemplify: Any, key: str) -> None:
+        """Load the cache stored in the action's global context.
+
+        Args:
+            siemplify: The SiemplifyAction object.
+            key: The context property the cache is stored in.
+
+        """
+        try:
+            self.load(
+                siemplify.get_context_property(
+                    context_type=ACTION_GLOBAL_CONTEXT_TYPE,
+                    identifier=GLOBAL_CONTEXT_IDENTIFIER,
+                    property_key=key,
+                ),
+            )
+
+        except Exception as e:
+            siemplify.LOGGER.error(f"Failed to load the lookup cache: {e}")
+
+    def save_to_action(self, siemplify: Any, key: str) -> None:
+        """Store the cache in the action's global context.
+
+        Args:
+            siemplify: The SiemplifyAction object.
+            key: The context property to store the cache in.
+
+        """
+        try:
+            siemplify.set_context_property(
+                context_type=ACTION_GLOBAL_CONTEXT_TYPE,
+                identifier=GLOBAL_CONTEXT_IDENTIFIER,
+                property_key=key,
+                property_value=self.dump(),
+            )
+
+        except Exception as e:
+            siemplify.LOGGER.error(f"Failed to save the lookup cache: {e}")
+
+    def _get_fresh_entry(self, key: str) -> dict[str, Any] | None:
+        entry: dict[str, Any] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry["expires"] <= self._clock():
+            del self._entries[key]
+            return None
+
+        return entry
+
+    def _add_entry(self, key: str, entry: dict[str, Any]) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+
+        self._entries[key] = entry
+
+    def _evict(self) -> None:
+        """Make room for a new entry, dropping the entries that expire first."""
+        now: float = self._clock()
+        fresh: list[tuple[str, dict[str, Any]]] = sorted(
+            ((k, e) for k, e in self._entries.items() if e["expires"] > now),
+            key=lambda item: item[1]["expires"],
+        )
+        self._entries = dict(fresh[max(len(fresh) - self.max_entries + 1, 0) :])
+
+    @staticmethod
+    def _unpack(entry: dict[str, Any]) -> Any:
+        if "error" in entry:
+            raise CachedLookupError(entry["error"])
+
+        return entry["value"]
@@ -0,0 +1,208 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import base64
+import email.message
+import json
+import types
+from typing import Any
+from unittest import mock
+
+import olefile
+import pytest
+
+from ...core import EmailManager as email_manager
+from ...core.EmailManager import (
+    AttachmentContent,
+    EmailBody,
+    EmailManager,
+    EmailUtils,
+    encode_attachment_contents,
+)
+
+PDF_CONTENT: bytes = b"%PDF-1.4\n" + bytes(range(256)) * 4
+NESTED_EML: bytes = (
+    b"From: nested@example.com\r\n"
+    b"To: victim@example.com\r\n"
+    b"Subject: Nested\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"The nested body\r\n"
+)
+OUTER_EML: bytes = (
+    b"From: sender@example.com\r\n"
+    b"To: victim@example.com\r\n"
+    b"Subject: Outer\r\n"
+    b"MIME-Version: 1.0\r\n"
+    b'Content-Type: multipart/mixed; boundary="b"\r\n'
+    b"\r\n"
+    b"--b\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"The outer body\r\n"
+    b"--b\r\n"
+    b'Content-Type: application/pdf; name="invoice.pdf"\r\n'
+    b'Content-Disposition: attachment; filename="invoice.pdf"\r\n'
+    b"Content-Transfer-Encoding: base64\r\n"
+    b"\r\n" + base64.encodebytes(PDF_CONTENT).replace(b"\n", b"\r\n") + b"--b\r\n"
+    b'Content-Type: message/rfc822; name="nested.eml"\r\n'
+    b'Content-Disposition: attachment; filename="nested.eml"\r\n'
+    b"\r\n" + NESTED_EML + b"--b--\r\n"
+)
+OLE_CONTENT: bytes = olefile.MAGIC + bytes(olefile.MINIMAL_OLEFILE_SIZE)
+
+
+def create_manager(lazy_attachments: bool = False) -> EmailManager:
+    return EmailManager(
+        logger=mock.MagicMock(),
+        custom_regex={},
+        lazy_attachments=lazy_attachments,
+    )
+
+
+def create_msg(subject: str, attachments: list[Any]) -> types.SimpleNamespace:
+    """Create an object with the fields MSGParser reads from extract_msg."""
+    header: email.message.Message = email.message.Message()
+    header["Subject"] = subject
+    return types.SimpleNamespace(
+        subject=subject,
+        sender="sender@example.com",
+        to="victim@example.com",
+        cc=None,
+        bcc=None,
+        date=None,
+        header=header,
+        body=f"The body of {subject}",
+        htmlBody=None,
+        attachments=attachments,
+    )
+
+
+@pytest.fixture
+def nested_msg(monkeypatch: pytest.MonkeyPatch) -> bytes:
+    """An .msg file with an attached .msg file that has a PDF attachment."""
+    inner: types.SimpleNamespace = create_msg(
+        "Inner",
+        [types.SimpleNamespace(type="data", shortFilename="inv.pdf", data=PDF_CONTENT)],
+    )
+    outer: types.SimpleNamespace = create_msg(
+        "Outer",
+        [types.SimpleNamespace(type="msg", shortFilename="inner", data=inner)],
+    )
+    properties: dict[str, Any] = {
+        "attachments": {
+            "0": {
+                "AttachFilename": "inner",
+                "attachments": {
+                    "0": {
+                        "AttachFilename": "inv.pdf",
+                        "AttachLongFilename": "invoice.pdf",
+                    },
+                },
+            },
+        },
+    }
+    monkeypatch.setattr(email_manager.extract_msg, "openMsg", lambda _: outer)
+    monkeypatch.setattr(
+        email_manager,
+        "MsOxMessage",
+        lambda _: types.SimpleNamespace(
+            _message=types.SimpleNamespace(as_dict=lambda: properties),
+        ),
+    )
+    return OLE_CONTENT
+
+
+def test_attachments_are_base64_encoded_by_default() -> None:
+    parsed: dict[str, Any] = create_manager().parse_email(
+        "outer.eml",
+        OUTER_EML,
+    )
+
+    pdf: dict[str, Any] = parsed["attachments"][0]
+    assert pdf["filename"] == "invoice.pdf"
+    assert pdf["raw"] == base64.b64encode(PDF_CONTENT).decode()
+    assert sorted(e["source_file"] for e in parsed["attached_emails"]) == [
+        "nested.eml",
+        "outer.eml",
+    ]
+    json.dumps(parsed, default=EmailUtils.json_serial)
+
+
+def test_lazy_attachments_are_encoded_on_output() -> None:
+    parsed: dict[str, Any] = create_manager(lazy_attachments=True).parse_email(
+        "outer.eml", OUTER_EML
+    )
+
+    pdf: dict[str, Any] = parsed["attachments"][0]
+    assert isinstance(pdf["raw"], AttachmentContent)
+    assert pdf["raw"].data == PDF_CONTENT
+    assert json.loads(EmailUtils.export_to_json({"raw": pdf["raw"]}))["raw"] == (
+        base64.b64encode(PDF_CONTENT).decode()
+    )
+
+    encode_attachment_contents(parsed)
+    assert pdf["raw"] == base64.b64encode(PDF_CONTENT).decode()
+    json.dumps(parsed, default=EmailUtils.json_serial)
+
+
+@pytest.mark.parametrize("lazy_attachments", [False, True])
+def test_attachments_of_nested_msg_files_are_encoded(
+    nested_msg: bytes,
+    lazy_attachments: bool,
+) -> None:
+    parsed: dict[str, Any] = create_manager(
+        lazy_attachments=lazy_attachments
+    ).parse_email("outer.msg", nested_msg)
+    if lazy_attachments:
+        encode_attachment_contents(parsed)
+
+    inner: dict[str, Any] = next(
+        e for e in parsed["attached_emails"] if e["source_file"] == "inner.msg"
+    )
+    assert inner["attachments"][0]["filename"] == "invoice.pdf"
+    assert inner["attachments"][0]["raw"] == base64.b64encode(PDF_CONTENT).decode()
+    json.dumps(parsed)
+
+
+@pytest.mark.parametrize("content", [b"", b"\r\n\r\n", PDF_CONTENT])
+def test_content_without_headers_is_not_parsed(content: bytes) -> None:
+    assert create_manager().parse_eml(content) is None
+
+
+def test_body_windows_are_parsed_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    windows: list[str] = [
+        f"Visit https://site{i}.example.com/page or mail user{i}@example.org "
+        f"from 10.0.0.{i} and https://shared.example.com/ again"
+        for i in range(6)
+    ]
+    body: str = "".join(window.ljust(50000) for window in windows) + " "
+    email_body: EmailBody = EmailBody(email_utils=EmailUtils(custom_regex={}))
+    assert len(list(email_body.string_sliding_window_loop(body))) == len(windows)
+
+    parsed: list[dict[str, Any]] = email_body.parse_body(body)
+
+    monkeypatch.setattr(
+        EmailBody,
+        "string_sliding_window_loop",
+        staticmethod(lambda body: iter([body])),
+    )
+    assert parsed == email_body.parse_body(body)
+    identifiers: list[str] = [entity["identifier"] for entity in parsed]
+    assert identifiers.index("https://site0.example.com/page") < identifiers.index(
+        "https://site5.example.com/page",
+    )
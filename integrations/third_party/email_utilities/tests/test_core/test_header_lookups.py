@@ -0,0 +1,190 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from ...core.HeaderLookups import HeaderLookups, summarize_rdap
+from ...core.LookupCache import LookupCache
+
+RDAP: dict[str, Any] = {
+    "query": "1.1.1.1",
+    "asn": "15169",
+    "asn_cidr": "1.1.1.0/24",
+    "asn_country_code": "US",
+    "asn_date": "2006-01-13",
+    "asn_description": "GOOGLE, US",
+    "asn_registry": "arin",
+    "entities": ["GOGL"],
+    "nir": None,
+    "raw": {"large": "response"},
+    "network": {
+        "cidr": "1.1.1.0/24",
+        "name": "GOOGLE",
+        "handle": "NET-1",
+        "notices": [{"title": "Terms of Service", "description": "..."}],
+        "links": ["https://rdap.example.com"],
+    },
+    "objects": {
+        "GOGL": {
+            "handle": "GOGL",
+            "roles": ["registrant"],
+            "entities": ["ABUSE"],
+            "contact": {"name": "Google LLC", "kind": "org", "address": "..."},
+            "remarks": [{"title": "Comments", "description": "..."}],
+        },
+    },
+}
+
+
+class StubRecord:
+    def __init__(self, address: str) -> None:
+        self.address: str = address
+
+    def to_text(self) -> str:
+        return self.address
+
+
+class StubAnswer(list):
+    def __init__(self, addresses: list[str], ttl: int) -> None:
+        super().__init__(StubRecord(a) for a in addresses)
+        self.rrset: Any = type("RRset", (), {"ttl": ttl})()
+
+
+class StubResolver:
+    def __init__(self, records: dict[str, list[str]]) -> None:
+        self.records: dict[str, list[str]] = records
+        self.queries: list[str] = []
+
+    def resolve(self, name: str) -> StubAnswer:
+        self.queries.append(name)
+        return StubAnswer(self.records[name], 300)
+
+
+class StubLookup:
+    """Counts the names a lookup was called with."""
+
+    def __init__(self, results: dict[str, Any]) -> None:
+        self.results: dict[str, Any] = results
+        self.names: list[str] = []
+
+    def __call__(self, name: str) -> Any:
+        self.names.append(name)
+        return self.results[name]
+
+
+def create_lookups(**kwargs: Any) -> HeaderLookups:
+    defaults: dict[str, Any] = {
+        "resolver": StubResolver({"mx.example.com": ["1.1.1.1"]}),
+        "rdap_lookup": StubLookup({"1.1.1.1": RDAP}),
+        "geo_lookup": StubLookup({"1.1.1.1": {"country": "US"}}),
+        "spf_lookup": StubLookup({}),
+        "dnsbl_lookup": StubLookup(
+            {
+                name: {"blacklisted": False, "detected_by": {}, "categories": []}
+                for name in ("1.1.1.1", "mx.example.com")
+            },
+        ),
+    }
+    defaults.update(kwargs)
+    return HeaderLookups(**defaults)
+
+
+def test_summarize_rdap_keeps_only_the_reported_fields() -> None:
+    summary: dict[str, Any] = summarize_rdap(RDAP)
+
+    assert "raw" not in summary
+    assert summary["asn_description"] == "GOOGLE, US"
+    assert summary["network"]["name"] == "GOOGLE"
+    assert "notices" not in summary["network"]
+    assert summary["objects"]["GOGL"]["contact"]["name"] == "Google LLC"
+    assert "remarks" not in summary["objects"]["GOGL"]
+    assert len(json.dumps(summary)) < len(json.dumps(RDAP))
+
+
+def test_hops_sharing_a_server_are_looked_up_once() -> None:
+    lookups: HeaderLookups = create_lookups()
+    routes: list[dict[str, Any]] = [
+        {"from": ["mx.example.com"], "by": ["1.1.1.1"]},
+        {"from": ["1.1.1.1"], "by": ["mx.example.com"]},
+    ]
+
+    hops: list[dict[str, Any]] = lookups.enrich_hops(routes)
+
+    assert [h["from"] for h in hops] == ["mx.example.com", "1.1.1.1"]
+    assert all(h["from_ip_whois"] == RDAP for h in hops)
+    assert all(h["by_geo"] == {"country": "US"} for h in hops)
+    assert lookups.resolver.queries == ["mx.example.com"]
+    assert lookups.rdap_lookup.names == ["1.1.1.1"]
+    assert lookups.geo_lookup.names == ["1.1.1.1"]
+
+
+def test_a_failed_lookup_does_not_fail_the_hop() -> None:
+    lookups: HeaderLookups = create_lookups(resolver=StubResolver({}))
+
+    hop: dict[str, Any] = lookups.enrich_hop(
+        {"from": ["mx.example.com"], "by": ["1.1.1.1"]},
+    )
+
+    assert hop["from"] == "mx.example.com"
+    assert hop["blacklist_info"] == []
+    assert hop["from_ip_whois"] == {}
+    assert hop["by_ip_whois"] == RDAP
+
+
+def test_spf_includes_are_followed_once() -> None:
+    spf_lookup: StubLookup = StubLookup(
+        {
+            "example.com": "v=spf1 ip4:1.1.1.0/24 include:a.com include:b.com",
+            "a.com": "v=spf1 ip4:2.2.2.0/24 include:b.com",
+            "b.com": "v=spf1 ip6:2001:db8::/32 include:a.com",
+        },
+    )
+    lookups: HeaderLookups = create_lookups(spf_lookup=spf_lookup)
+
+    networks: list[str] = lookups.get_spf_networks("example.com")
+
+    assert sorted(networks) == ["1.1.1.0/24", "2.2.2.0/24", "2001:db8::/32"]
+    assert sorted(spf_lookup.names) == ["a.com", "b.com", "example.com"]
+
+
+def test_summarize_rdap_is_idempotent() -> None:
+    assert summarize_rdap(summarize_rdap(RDAP)) == summarize_rdap(RDAP)
+
+
+def test_full_rdap_is_returned_and_summary_is_stored() -> None:
+    lookups: HeaderLookups = create_lookups()
+
+    assert lookups.rdap("1.1.1.1") == RDAP
+    assert json.loads(lookups.cache.dump())["rdap:1.1.1.1"]["value"] == (
+        summarize_rdap(RDAP)
+    )
+    assert lookups.rdap("1.1.1.1") == RDAP
+
+
+def test_lookups_are_reused_through_the_cache() -> None:
+    lookups: HeaderLookups = create_lookups()
+    lookups.rdap("1.1.1.1")
+    rdap_lookup: StubLookup = StubLookup({})
+
+    reloaded: LookupCache = LookupCache()
+    reloaded.load(lookups.cache.dump())
+
+    assert create_lookups(cache=reloaded, rdap_lookup=rdap_lookup).rdap(
+        "1.1.1.1",
+    ) == summarize_rdap(RDAP)
+    assert rdap_lookup.names == []
@@ -0,0 +1,193 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from ...core.LookupCache import CachedLookupError, LookupCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSiemplify:
+    """Records the action context properties it was given."""
+
+    def __init__(self) -> None:
+        self.properties: dict[str, str] = {}
+
+    def get_context_property(
+        self,
+        context_type: int,
+        identifier: str,
+        property_key: str,
+    ) -> str | None:
+        return self.properties.get(property_key)
+
+    def set_context_property(
+        self,
+        context_type: int,
+        identifier: str,
+        property_key: str,
+        property_value: str,
+    ) -> None:
+        self.properties[property_key] = property_value
+
+
+def test_lookups_are_cached_until_they_expire() -> None:
+    clock: FakeClock = FakeClock()
+    cache: LookupCache = LookupCache(clock=clock)
+    calls: list[str] = []
+
+    def lookup() -> tuple[str, float]:
+        calls.append("x")
+        return f"value {len(calls)}", 10
+
+    assert cache.get_or_lookup("dns", "Example.com", lookup) == "value 1"
+    assert cache.get_or_lookup("dns", "example.com", lookup) == "value 1"
+
+    clock.now += 11
+    assert cache.get_or_lookup("dns", "example.com", lookup) == "value 2"
+    assert len(calls) == 2
+
+
+def test_failed_lookups_are_remembered_for_the_negative_ttl() -> None:
+    clock: FakeClock = FakeClock()
+    cache: LookupCache = LookupCache(negative_ttl=5, clock=clock)
+
+    def lookup() -> tuple[str, float]:
+        raise TimeoutError("no answer")
+
+    with pytest.raises(TimeoutError):
+        cache.get_or_lookup("rdap", "1.1.1.1", lookup)
+
+    with pytest.raises(CachedLookupError, match="TimeoutError: no answer"):
+        cache.get_or_lookup("rdap", "1.1.1.1", lookup)
+
+    clock.now += 6
+    assert cache.get_or_lookup("rdap", "1.1.1.1", lambda: ("ok", 10)) == "ok"
+
+
+def test_concurrent_lookups_of_the_same_key_are_merged() -> None:
+    cache: LookupCache = LookupCache()
+    started: threading.Event = threading.Event()
+    release: threading.Event = threading.Event()
+    calls: list[str] = []
+
+    def lookup() -> tuple[str, float]:
+        calls.append("x")
+        started.set()
+        release.wait(5)
+        return "value", 10
+
+    results: list[str] = []
+    owner: threading.Thread = threading.Thread(
+        target=lambda: results.append(cache.get_or_lookup("dns", "a", lookup)),
+    )
+    owner.start()
+    started.wait(5)
+    waiter: threading.Thread = threading.Thread(
+        target=lambda: results.append(cache.get_or_lookup("dns", "a", lookup)),
+    )
+    waiter.start()
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert results == ["value", "value"]
+    assert calls == ["x"]
+
+
+def test_the_cache_is_reloaded_from_the_action_context() -> None:
+    clock: FakeClock = FakeClock()
+    siemplify: FakeSiemplify = FakeSiemplify()
+    cache: LookupCache = LookupCache(clock=clock)
+    cache.get_or_lookup("dns", "fresh", lambda: (["1.1.1.1"], 100))
+    cache.get_or_lookup("dns", "stale", lambda: (["2.2.2.2"], 1))
+    clock.now += 2
+    cache.save_to_action(siemplify, "key")
+
+    reloaded: LookupCache = LookupCache(clock=clock)
+    reloaded.load_from_action(siemplify, "key")
+
+    assert len(reloaded) == 1
+    assert reloaded.get_or_lookup("dns", "fresh", pytest.fail) == ["1.1.1.1"]
+
+
+@pytest.mark.parametrize("raw", [None, "", "not json", "[1, 2]"])
+def test_invalid_content_is_ignored(raw: str | None) -> None:
+    cache: LookupCache = LookupCache()
+    cache.load(raw)
+
+    assert len(cache) == 0
+
+
+def test_dump_keeps_the_entries_that_expire_last() -> None:
+    cache: LookupCache = LookupCache(max_entries=2)
+    for ttl in (10, 30, 20):
+        cache.get_or_lookup("dns", str(ttl), lambda ttl=ttl: ("value", ttl))
+
+    assert sorted(json.loads(cache.dump())) == ["dns:20", "dns:30"]
+
+
+def test_entries_in_memory_are_bounded() -> None:
+    clock: FakeClock = FakeClock()
+    cache: LookupCache = LookupCache(max_entries=3, clock=clock)
+    cache.get_or_lookup("dns", "expired", lambda: ("value", 1))
+    clock.now += 2
+    for ttl in (10, 30, 20):
+        cache.get_or_lookup("dns", str(ttl), lambda ttl=ttl: ("value", ttl))
+
+    assert len(cache) == 3
+
+    cache.get_or_lookup("dns", "40", lambda: ("value", 40))
+
+    assert len(cache) == 3
+    assert sorted(json.loads(cache.dump())) == ["dns:20", "dns:30", "dns:40"]
+
+
+def test_dump_is_capped_by_size() -> None:
+    cache: LookupCache = LookupCache(max_size=1000)
+    for i in range(100):
+        cache.get_or_lookup("rdap", str(i), lambda i=i: ("x" * 50, 100 + i))
+
+    dumped: str = cache.dump()
+    entries: dict[str, dict] = json.loads(dumped)
+
+    assert len(dumped) <= 1000
+    assert 0 < len(entries) < 100
+    assert "rdap:99" in entries
+    assert "rdap:0" not in entries
+
+
+def test_dump_stores_summaries_of_the_summarized_kinds() -> None:
+    cache: LookupCache = LookupCache(summarizers={"rdap": lambda value: value[:1]})
+    cache.get_or_lookup("rdap", "1.1.1.1", lambda: ("full", 10))
+    cache.get_or_lookup("dns", "example.com", lambda: ("full", 10))
+
+    entries: dict[str, dict] = json.loads(cache.dump())
+
+    assert entries["rdap:1.1.1.1"]["value"] == "f"
+    assert entries["dns:example.com"]["value"] == "full"
+    assert cache.get_or_lookup("rdap", "1.1.1.1", lambda: ("new", 10)) == "full"
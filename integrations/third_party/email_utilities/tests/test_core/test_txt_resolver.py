@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import dns.rdatatype
+import dns.resolver
+
+from ...core.EmailUtilitiesManager import (
+    DEFAULT_NEGATIVE_TXT_TTL,
+    CachingTxtResolver,
+    _prefetch_keys,
+)
+from ...core.LookupCache import LookupCache
+from .test_lookup_cache import FakeClock
+
+KEY_NAME: str = "sel._domainkey.example.com."
+
+
+class FakeRRset(list):
+    def __init__(self, rdtype: int, ttl: int, rdatas: list[Any]) -> None:
+        super().__init__(rdatas)
+        self.rdtype: int = rdtype
+        self.ttl: int = ttl
+
+
+class FakeRdata:
+    def __init__(self, **attributes: Any) -> None:
+        self.__dict__.update(attributes)
+
+
+class FakeResponse:
+    def __init__(self, authority: list[FakeRRset]) -> None:
+        self.authority: list[FakeRRset] = authority
+
+
+class FakeAnswer:
+    def __init__(self, rrset: FakeRRset | None, response: FakeResponse) -> None:
+        self.rrset: FakeRRset | None = rrset
+        self.response: FakeResponse = response
+
+
+class FakeResolver:
+    """Answers TXT queries from a dict and records the queried names."""
+
+    def __init__(self, records: dict[str, Any]) -> None:
+        self.records: dict[str, Any] = records
+        self.queries: list[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def resolve(self, name: str, rdtype: int, **kwargs: Any) -> FakeAnswer:
+        with self._lock:
+            self.queries.append(name)
+
+        record: Any = self.records[name]
+        if isinstance(record, Exception):
+            raise record
+
+        return record
+
+
+def soa_response(ttl: int, minimum: int) -> FakeResponse:
+    return FakeResponse(
+        [FakeRRset(dns.rdatatype.SOA, ttl, [FakeRdata(minimum=minimum)])],
+    )
+
+
+def txt_answer(ttl: int, *strings: bytes) -> FakeAnswer:
+    rrset: FakeRRset = FakeRRset(dns.rdatatype.TXT, ttl, [FakeRdata(strings=strings)])
+    return FakeAnswer(rrset, FakeResponse([]))
+
+
+def make_resolver(
+    records: dict[str, Any],
+) -> tuple[CachingTxtResolver, FakeResolver, FakeClock]:
+    clock: FakeClock = FakeClock()
+    resolver: FakeResolver = FakeResolver(records)
+    return CachingTxtResolver(LookupCache(clock=clock), resolver), resolver, clock
+
+
+def test_records_are_reused_for_their_ttl() -> None:
+    dnsfunc, resolver, clock = make_resolver(
+        {KEY_NAME: txt_answer(60, b"v=DKIM1; ", b"p=abc")},
+    )
+
+    assert dnsfunc(KEY_NAME.encode()) == b"v=DKIM1; p=abc"
+    clock.now += 59
+    assert dnsfunc(KEY_NAME.encode()) == b"v=DKIM1; p=abc"
+    assert resolver.queries == [KEY_NAME]
+
+    clock.now += 2
+    dnsfunc(KEY_NAME.encode())
+    assert resolver.queries == [KEY_NAME, KEY_NAME]
+
+
+def test_missing_domains_are_cached_for_the_negative_ttl() -> None:
+    nxdomain: dns.resolver.NXDOMAIN = dns.resolver.NXDOMAIN(
+        qnames=[KEY_NAME],
+        responses={KEY_NAME: soa_response(3600, 120)},
+    )
+    dnsfunc, resolver, clock = make_resolver({KEY_NAME: nxdomain})
+
+    assert dnsfunc(KEY_NAME.encode()) is None
+    clock.now += 119
+    assert dnsfunc(KEY_NAME.encode()) is None
+    assert resolver.queries == [KEY_NAME]
+
+    clock.now += 2
+    dnsfunc(KEY_NAME.encode())
+    assert resolver.queries == [KEY_NAME, KEY_NAME]
+
+
+def test_missing_records_are_cached_for_the_negative_ttl() -> None:
+    no_answer: FakeAnswer = FakeAnswer(None, soa_response(30, 600))
+    dnsfunc, resolver, clock = make_resolver({KEY_NAME: no_answer})
+
+    assert dnsfunc(KEY_NAME.encode()) is None
+    clock.now += 29
+    assert dnsfunc(KEY_NAME.encode()) is None
+    assert resolver.queries == [KEY_NAME]
+
+    clock.now += 2
+    dnsfunc(KEY_NAME.encode())
+    assert resolver.queries == [KEY_NAME, KEY_NAME]
+
+
+def test_missing_records_without_soa_use_the_default_negative_ttl() -> None:
+    dnsfunc, resolver, clock = make_resolver(
+        {KEY_NAME: FakeAnswer(None, FakeResponse([]))},
+    )
+
+    dnsfunc(KEY_NAME.encode())
+    clock.now += DEFAULT_NEGATIVE_TXT_TTL - 1
+    dnsfunc(KEY_NAME.encode())
+
+    assert resolver.queries == [KEY_NAME]
+
+
+def test_prefetch_looks_up_each_name_once() -> None:
+    other: str = "sel._domainkey.example.org."
+    dnsfunc, resolver, _ = make_resolver(
+        {KEY_NAME: txt_answer(60, b"p=abc"), other: txt_answer(60, b"p=def")},
+    )
+
+    dnsfunc.prefetch([KEY_NAME.encode(), other.encode(), KEY_NAME.encode()])
+    assert sorted(resolver.queries) == sorted([KEY_NAME, other])
+
+    assert dnsfunc(KEY_NAME.encode()) == b"p=abc"
+    assert dnsfunc(other.encode()) == b"p=def"
+    assert len(resolver.queries) == 2
+
+
+def test_prefetch_keys_of_signatures() -> None:
+    other: str = "other._domainkey.example.com."
+    dnsfunc, resolver, _ = make_resolver(
+        {KEY_NAME: txt_answer(60, b"p=abc"), other: txt_answer(60, b"p=def")},
+    )
+
+    _prefetch_keys(
+        dnsfunc,
+        [
+            b"v=1; d=example.com; s=sel; b=abc",
+            b"v=1; d=example.com; s=sel; b=def",
+            b"v=1; d=example.com; s=other; b=ghi",
+            b"v=1; d=example.com",
+            b"not a tag list",
+        ],
+        timeout=5,
+    )
+
+    assert sorted(resolver.queries) == sorted([KEY_NAME, other])
@@ -30,7 +30,7 @@ from dulwich import porcelain
 from dulwich.contrib.paramiko_vendor import _ParamikoWrapper
 from dulwich.contrib.requests_vendor import RequestsHttpGitClient
 from dulwich.errors import GitProtocolError, HangupException
-from dulwich.object_store import tree_lookup_path
+from dulwich.object_store import BaseObjectStore, tree_lookup_path
 from dulwich.objects import Blob, Commit, ShaFile, Tree
 from dulwich.refs import HEADREF, LOCAL_BRANCH_PREFIX
 from dulwich.repo import Repo
@@ -42,6 +42,162 @@ if TYPE_CHECKING:
     from soar_sdk.SiemplifyLogger import SiemplifyLogger
 
 
+FILE_MODE = stat.S_IFREG | 0o644
+DIR_MODE = stat.S_IFDIR
+# Pending blobs are written to a pack once they reach this size, to bound memory
+MAX_PENDING_BYTES = 64 * 1024 * 1024
+
+
+class _TreeNode:
+    """A folder of the tree being built.
+
+    Attributes:
+        base: SHA of the tree whose entries the folder keeps. None for a new or
+            replaced folder
+        previous: SHA of the tree the folder had before it was changed, used to
+            skip unchanged objects
+        children: The changed entries - a _TreeNode for folders or a blob SHA for
+            files
+
+    """
+
+    __slots__ = ("base", "children", "previous")
+
+    def __init__(self, base: bytes | None, previous: bytes | None = None):
+        self.base = base
+        self.previous = base if previous is None else previous
+        self.children: dict[bytes, _TreeNode | bytes] = {}
+
+
+class TreeBuilder:
+    """Builds a new tree from many file changes at once.
+
+    The changed paths are collected in a nested structure of folders, and every
+    changed folder is hashed once, bottom-up, when the tree is written. New blobs
+    and trees are written to the object store as a single pack, and files or
+    folders whose SHA is the same as in the previous tree are not written at all.
+    """
+
+    def __init__(
+        self,
+        object_store: BaseObjectStore,
+        tree_id: bytes | None = None,
+        max_pending_bytes: int = MAX_PENDING_BYTES,
+    ):
+        self.object_store = object_store
+        self.max_pending_bytes = max_pending_bytes
+        self.root = _TreeNode(tree_id)
+        self._objects: dict[bytes, ShaFile] = {}
+        self._pending_bytes = 0
+        self._trees: dict[bytes, Tree] = {}
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.root.children) or self.root.base != self.root.previous
+
+    def add_file(self, path: bytes, content: bytes) -> None:
+        """Add or overwrite a file
+
+        Args:
+            path (bytes): Path of the file, relative to the root of the tree
+            content (bytes): File contents
+
+        """
+        *folders, name = path.split(b"/")
+        node = self._get_node(folders)
+        blob = Blob.from_string(content)
+        node.children[name] = blob.id
+        if blob.id in self._objects or self._get_entry(node.previous, name) == (
+            FILE_MODE,
+            blob.id,
+        ):
+            return
+
+        self._objects[blob.id] = blob
+        self._pending_bytes += len(content)
+        if self._pending_bytes >= self.max_pending_bytes:
+            self._write_objects()
+
+    def replace_folder(self, path: bytes) -> None:
+        """Replace a folder with an empty one, deleting all the files under it
+
+        Args:
+            path (bytes): Path of the folder, relative to the root of the tree
+
+        """
+        *folders, name = path.split(b"/")
+        parent = self._get_node(folders)
+        parent.children[name] = _TreeNode(
+            None, self._get_subtree(parent.previous, name)
+        )
+
+    def write(self) -> Tree:
+        """Write all the changes to the object store
+
+        Returns:
+            Tree: The new root tree
+
+        """
+        tree = self._build(self.root)
+        self._write_objects()
+        self.root = _TreeNode(tree.id)
+        self._trees.clear()
+        return tree
+
+    def _get_node(self, folders: list[bytes]) -> _TreeNode:
+        node = self.root
+        for name in folders:
+            child = node.children.get(name)
+            if not isinstance(child, _TreeNode):
+                child = _TreeNode(
+                    self._get_subtree(node.base, name) if child is None else None,
+                    self._get_subtree(node.previous, name),
+                )
+                node.children[name] = child
+            node = child
+        return node
+
+    def _build(self, node: _TreeNode) -> Tree:
+        tree = Tree()
+        if node.base is not None:
+            for name, mode, sha in self._get_tree(node.base).iteritems():
+                tree.add(name, mode, sha)
+        for name, child in node.children.items():
+            if isinstance(child, _TreeNode):
+                tree.add(name, DIR_MODE, self._build(child).id)
+            else:
+                tree.add(name, FILE_MODE, child)
+        if tree.id != node.previous:
+            self._objects.setdefault(tree.id, tree)
+        return tree
+
+    def _write_objects(self) -> None:
+        self.object_store.add_objects([(obj, None) for obj in self._objects.values()])
+        self._objects.clear()
+        self._pending_bytes = 0
+
+    def _get_tree(self, sha: bytes) -> Tree:
+        if sha not in self._trees:
+            self._trees[sha] = self.object_store[sha]
+        return self._trees[sha]
+
+    def _get_entry(
+        self, tree_id: bytes | None, name: bytes
+    ) -> tuple[int, bytes] | None:
+        if tree_id is None:
+            return None
+        try:
+            return self._get_tree(tree_id)[name]
+        except KeyError:
+            return None
+
+    def _get_subtree(self, tree_id: bytes | None, name: bytes) -> bytes | None:
+        entry = self._get_entry(tree_id, name)
+        if entry is None or not stat.S_ISDIR(entry[0]):
+            return None
+        return entry[1]
+
+
 class Git:
     """GitManager"""
 
@@ -121,7 +277,24 @@ class Git:
             # Branch changed, checking out
             self._checkout()
 
-        self.tree: Tree = self.get_head_tree()
+        self.tree = self.get_head_tree()
+
+    @property
+    def tree(self) -> Tree:
+        """The working tree, including all the changes made by update_objects
+
+        Returns:
+            Tree: The working tree
+
+        """
+        if self._tree_builder.changed:
+            self._tree = self._tree_builder.write()
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree: Tree) -> None:
+        self._tree = tree
+        self._tree_builder = TreeBuilder(self.repo.object_store, tree.id)
 
     @property
     def head(self) -> Commit:
@@ -150,12 +323,15 @@ class Git:
         # noinspection PyTypeChecker
         return self.repo.get_object(self.repo.get_object(branch_sha).tree)
 
-    def commit_and_push(self, message: str) -> None:
+    def commit_and_push(self, message: str) -> bool:
         """Create a commit and push based on current tree
 
         Args:
             message (str): Commit message
 
+        Returns:
+            bool: False if the commit couldn't be pushed, True otherwise
+
         """
         if self.branch_tree.id != self.tree.id:
             self.logger.info(f"Committing tree {self.tree.id} with message {message}")
@@ -165,9 +341,9 @@ class Git:
                 committer=self.author,
                 author=self.author,
             )
-            self.push()
-        else:
-            self.logger.info("No changes found. Nothing to commit.")
+            return self.push()
+        self.logger.info("No changes found. Nothing to commit.")
+        return True
 
     def pull(self) -> None:
         """Pulls changes from the repo. We ignore conflicts and reset local repo to
@@ -177,7 +353,7 @@ class Git:
         for key, value in list(remote_refs.items()):
             self.repo.refs[key] = value
 
-    def push(self, force_push=False) -> None:
+    def push(self, force_push=False) -> bool:
         """Push current branch to the repo
 
         Args:
@@ -185,6 +361,10 @@ class Git:
             remote objects,
             equivalent to 'git push --force'. Defaults to False.
 
+        Returns:
+            bool: False if the local branch diverged from the remote one, True
+            otherwise
+
         """
         try:
             porcelain.push(
@@ -204,6 +384,8 @@ class Git:
             self.logger.info(
                 "Updates will be pushed in the next python script execution",
             )
+            return False
+        return True
 
     def _checkout(self) -> None:
         """Checkout a branch
@@ -305,9 +487,12 @@ class Git:
             self.repo.close()
             raise
 
-    def update_objects(self, files: list[File], base_path: str | bytes = b"") -> Tree:
+    def update_objects(self, files: list[File], base_path: str | bytes = b"") -> None:
         """Main method to edit objects in the repo.
 
+        The changes are collected in memory and written to the object store, as a
+        single pack, the next time the tree is read, e.g. by commit_and_push.
+
         Args:
             files (list[File]): A list or generator of File objects
             base_path (bytes, optional): Relative path in the repo.
@@ -316,102 +501,19 @@ class Git:
                 Files will not be deleted, but will be overwritten.
                 Defaults to root path.
 
-        Returns:
-            Tree: The modified tree
-
         """
         if isinstance(base_path, str):
             base_path = base_path.encode("utf-8")
-        self.tree = self._modify_tree(files, self.tree, base_path)
-        self.repo.object_store.add_object(self.tree)
-        return self.tree
-
-    def _modify_tree(self, files: list[File], tree: Tree, base_path=b"") -> Tree:
-        """Modifies a given tree, recursively, and adds all objects to the
-        repo.object_store
-
-        Args:
-            files (list[File]): A list or generator of File objects
-            tree (Tree): A tree object to update
-            base_path (bytes, optional): Relative path in the repo. If supplied - All
-            files under that
-                base will be deleted/overwritten. Defaults to root path.
-
-        Returns:
-            Tree: The modified tree
-
-        """
-        try:
-            _, subtree = tree.lookup_path(
-                lambda sha: self.repo[sha],
-                base_path.split(b"/")[0],
-            )
-            subtree = self.repo[subtree]
-        except KeyError:
-            subtree = Tree()
-
-        if not base_path:
-            new_tree = self._create_raw_tree(files, tree)
-            self.repo.object_store.add_object(new_tree)
-            return new_tree
-
-        base_path = base_path.split(b"/")
-        folder_name = base_path.pop(0)
-        base_path = b"/".join(base_path)
-        if not base_path:
-            # New Directory
-            new_tree = self._create_raw_tree(files)
-        else:
-            new_tree = self._modify_tree(files, subtree, base_path)
-        self.repo.object_store.add_object(new_tree)
-        tree.add(folder_name, stat.S_IFDIR, new_tree.id)
-        return tree
-
-    def _create_raw_tree(self, files: list[File], tree: Tree = None) -> Tree:
-        """It is recommended to use the function update_objects.
-        Creates a new tree object or updates the one passed down to it.
-        If a tree object is passed down it will inherit all the other objects and
-        won't delete files.
-
-        Args:
-            files (list[Files]): list or generator of Files object
-            tree (Tree, optional): Tree to modify. if not passed, it will create a
-            new tree. Defaults to None.
-
-        Returns:
-            Tree: The new tree
-
-        """
-        if not tree:
-            tree = Tree()
+        base_path = base_path.strip(b"/")
+        prefix = b""
+        if base_path:
+            self._tree_builder.replace_folder(base_path)
+            prefix = base_path + b"/"
         for file in files:
-            mode = stat.S_IFREG | 0o644
-            obj = Blob()
-            obj.data = file.content
-            path_items = file.path.encode("utf-8").split(b"/")
-            sub_tree = tree
-            old_trees = [sub_tree]
-            for name in path_items[:-1]:
-                try:
-                    _, sub_tree_sha = sub_tree[name]
-                except KeyError:
-                    sub_tree = Tree()
-                else:
-                    sub_tree = self.repo.get_object(sub_tree_sha)
-                old_trees.append(sub_tree)
-
-            for old_tree, name in reversed(
-                tuple(zip(old_trees, path_items, strict=False)),
-            ):
-                old_tree[name] = (mode, obj.id)
-                self.repo.object_store.add_object(obj)
-                obj = old_tree
-                mode = stat.S_IFDIR
-
-            self.repo.object_store.add_object(obj)
-            tree = obj
-
-        return tree
+            self._tree_builder.add_file(
+                prefix + file.path.encode("utf-8"),
+                file.content,
+            )
 
     def get_raw_object_from_path(
         self,
@@ -29,6 +29,7 @@ from .constants import (
     DEFAULT_USERNAME,
     IGNORED_INTEGRATIONS,
     INTEGRATION_NAME,
+    MAX_EXPORT_WORKERS,
     ROOT_README,
     ScriptType,
     WorkflowTypes,
@@ -85,6 +86,7 @@ class GitSyncManager:
             smp_credentials.get("username") if smp_credentials else None,
             smp_credentials.get("password") if smp_credentials else None,
             smp_verify,
+            pool_size=MAX_EXPORT_WORKERS,
         )
         self.git_client = Git(
             repo_url,
@@ -485,12 +487,15 @@ class GitSyncManager:
             base_path += "/"
         self.git_client.update_objects([File(f"{base_path}README.md", readme)])
 
-    def commit_and_push(self, message: str) -> None:
+    def commit_and_push(self, message: str) -> bool:
         """Commits all the changes and pushes the commit to the repo
 
         Args:
             message: The commit message
 
+        Returns:
+            False if the commit couldn't be pushed, True otherwise
+
         """
         if self.content.metadata.get_setting_by_name("update_root_readme"):
             # Generate root readme
@@ -499,7 +504,7 @@ class GitSyncManager:
 
         self.content.metadata.system_version = self.api.get_system_version()
         self.content.push_metadata()
-        self.git_client.commit_and_push(message)
+        return self.git_client.commit_and_push(message)
 
     @property
     def _marketplace_integrations(self) -> list[dict]:
@@ -18,6 +18,7 @@ from urllib.parse import urljoin
 
 import requests
 from packaging import version
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from TIPCommon.rest.soar_api import (
     get_integration_instance_details_by_id,
@@ -26,6 +27,7 @@ from TIPCommon.rest.soar_api import (
 
 VERSION_6117 = version.parse("6.1.17")
 VERSION_6138 = version.parse("6.1.38.77")
+DEFAULT_POOL_SIZE = 10
 
 
 class BaseUrlSession(requests.Session):
@@ -53,11 +55,16 @@ class SiemplifyApiClient:
         smp_username=None,
         smp_password=None,
         use_ssl=False,
+        pool_size=DEFAULT_POOL_SIZE,
     ) -> None:
         self.api_root = f"{api_root}/external/v1/"
         self.api_key = api_key
         self.use_ssl = use_ssl
         self.session = BaseUrlSession(base_url=self.api_root)
+        # Keep a connection per concurrent request, so they can all be reused
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.smp_username = smp_username
         self.smp_password = smp_password
         self.session.headers = {"AppKey": self.api_key}
@@ -14,12 +14,14 @@
 
 from __future__ import annotations
 
-import collections
-import copy
+import bisect
+import dataclasses
+import enum
+import hashlib
 import json
-from collections.abc import Iterable, Iterator, MutableMapping, MutableSequence
+from collections.abc import Iterator, MutableMapping
 from collections.abc import Set as AbstractSet
-from typing import Generic, Protocol, TypeAlias, TypeVar
+from typing import Any, Generic, Protocol, TypeAlias, TypeVar
 
 from soar_sdk import SiemplifyBase, SiemplifyUtils
 from soar_sdk.SiemplifyAction import SiemplifyAction
@@ -28,14 +30,17 @@ from soar_sdk.SiemplifyJob import SiemplifyJob
 _KT = TypeVar("_KT")
 _VT = TypeVar("_VT")
 _Index: TypeAlias = int
+_Stamp: TypeAlias = int
 _Record: TypeAlias = MutableMapping[_KT, _VT]
-_Cache: TypeAlias = MutableSequence[_Record]
-_KeyToIndex: TypeAlias = MutableMapping[_KT, _Index]
-_CacheInitData = collections.namedtuple("_CacheInitData", ["cache", "largest_index"])
+_ChunkContent: TypeAlias = dict[_KT, list[Any]]
 JsonStr: TypeAlias = str
 
 CONTEXT_MOD_TIME_KEY: str = "name_to_modification_time_mapping_{0}"
+CACHE_KEY_PREFIX: str = "name_to_modification_time_cache"
+CACHE_CHUNK_KEY: str = "{0}_{1}"
+CACHE_METADATA_KEY: str = "{0}_metadata"
 ROW_PADDING_LENGTH: int = 40
+KEY_HASH_LENGTH: int = 8
 ACTION_GLOBAL_CONTENT_TYPE: int = 0
 GLOBAL_CONTEXT_IDENTIFIER: str = "GLOBAL"
 
@@ -98,149 +103,303 @@ class SiemplifyActionContext(Context):
         )
 
 
+class EvictionPolicy(enum.Enum):
+    """The order in which items are evicted when the cache exceeds its max size."""
+
+    FIFO = "fifo"
+    LRU = "lru"
+
+
+@dataclasses.dataclass
+class _Chunk:
+    """A single DB row of the cache, holding the keys whose hash is in its range.
+
+    The content maps each key to a `[value, stamp]` pair, ordered by stamp, and is
+    only loaded from the DB when the chunk is accessed.
+    """
+
+    row: _Index
+    lower_bound: int
+    size: int = 0
+    oldest: _Stamp | None = None
+    content: _ChunkContent | None = None
+    dirty: bool = False
+
+    @classmethod
+    def from_json(cls, json_obj: dict[str, Any]) -> _Chunk:
+        return cls(
+            row=json_obj["row"],
+            lower_bound=json_obj["lower_bound"],
+            size=json_obj["size"],
+            oldest=json_obj["oldest"],
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "row": self.row,
+            "lower_bound": self.lower_bound,
+            "size": self.size,
+            "oldest": self.oldest,
+        }
+
+
 class Cache(MutableMapping[_KT, _VT], Generic[_KT, _VT]):
     """Class that handles cache like a dict while abstracting DB handling,
     data distribution and rows managing from the user.
+
+    Keys are distributed between DB rows (chunks) by their hash. A metadata row
+    keeps the chunks' hash ranges, sizes and the stamp of their oldest item, so
+    reading or writing a key only loads the chunk that holds it, the size of the
+    cache is known without loading any chunk, and only the chunks that changed
+    are written back. When `max_size` is set, the oldest items by insertion
+    (FIFO) or by access (LRU) are evicted.
+
+    The rows' keys start with `key_prefix`, so caches with different prefixes can
+    share a context. The items of rows saved by the previous implementation
+    under `legacy_row_key` are migrated when the cache has no metadata yet, and
+    the legacy rows are cleared once the migrated cache was pushed.
     """
 
-    def __init__(self, context_handler: Context) -> None:
+    def __init__(
+        self,
+        context_handler: Context,
+        max_size: int | None = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.FIFO,
+        key_prefix: str = CACHE_KEY_PREFIX,
+        legacy_row_key: str | None = CONTEXT_MOD_TIME_KEY,
+    ) -> None:
         self._context: Context = context_handler
-        self._no_saved_context: bool = self._get_no_saved_context()
-        cache_init_data: _CacheInitData = self._get_cache_init_data()
-        self._largest_row_index: _Index = cache_init_data.largest_index
-        self._cache: _Cache = cache_init_data.cache
-        self._key_to_row_index: _KeyToIndex[_KT] = self._init_key_to_row_map()
-        self._new_cache: _Record[_KT, _VT] = {}
+        self.max_size: int | None = max_size
+        self.eviction_policy: EvictionPolicy = eviction_policy
+        self.key_prefix: str = key_prefix
+        self._legacy_row_key: str | None = legacy_row_key
+        self._legacy_rows: int = 0
+        self._chunks: list[_Chunk] = []
+        self._lower_bounds: list[int] = []
+        self._size: int = 0
+        self._clock: _Stamp = 0
+        self._next_row: _Index = 0
+        self._metadata_dirty: bool = False
+        self._load_metadata()
+
+    def _load_metadata(self) -> None:
+        metadata: JsonStr | None = self._context.get_context(self._metadata_key())
+        if metadata:
+            metadata_json: dict[str, Any] = json.loads(metadata)
+            self._size = metadata_json["size"]
+            self._clock = metadata_json["clock"]
+            self._next_row = metadata_json["next_row"]
+            self._chunks = [_Chunk.from_json(c) for c in metadata_json["chunks"]]
+            self._lower_bounds = [c.lower_bound for c in self._chunks]
+            return
 
-    def _get_no_saved_context(self) -> bool:
-        return self._get_scoped_job_context_property(0) is None
+        self._chunks = [_Chunk(row=0, lower_bound=0, content={})]
+        self._lower_bounds = [0]
+        self._next_row = 1
+        self._migrate_legacy_rows()
 
-    def _get_cache_init_data(self) -> _CacheInitData:
-        if self._no_saved_context:
-            return _CacheInitData(cache=[{}], largest_index=0)
+    def _migrate_legacy_rows(self) -> None:
+        """Move the items of the rows that were saved before chunks had metadata."""
+        if self._legacy_row_key is None:
+            return
 
         i: _Index = 0
-        cache: _Cache = []
-        context: JsonStr | None = self._get_scoped_job_context_property(i)
-        while context is not None:
-            cache.append(_load_record(context))
+        row: JsonStr | None = self._get_legacy_row(i)
+        while row is not None:
+            for key, value in _load_record(row).items():
+                self[key] = value
+
             i += 1
-            context = self._get_scoped_job_context_property(i)
+            row = self._get_legacy_row(i)
+
+        self._legacy_rows = i
+        self._metadata_dirty = self._metadata_dirty or i > 0
 
-        return _CacheInitData(cache=cache, largest_index=i - 1)
+    def _get_legacy_row(self, index: _Index) -> JsonStr | None:
+        return self._context.get_context(self._legacy_row_key.format(index))
 
-    def _init_key_to_row_map(self) -> _KeyToIndex[_KT]:
-        results: _KeyToIndex[_KT] = {}
-        for i, record in enumerate(self._cache):
-            for key in record:
-                results[key] = i
+    def _clear_legacy_rows(self) -> None:
+        for i in range(self._legacy_rows):
+            self._context.set_context(self._legacy_row_key.format(i), "")
 
-        return results
+        self._legacy_rows = 0
 
     # @override
     def __len__(self) -> int:
-        return len(self._new_cache) + sum(len(record) for record in self._cache)
+        return self._size
 
     # @override
     def __iter__(self) -> Iterator[_KT]:
-        all_cache: _Record[_KT, _VT] = copy.deepcopy(self._new_cache)
-        for record in self._cache:
-            all_cache.update(record)
+        return iter([key for chunk in self._chunks for key in self._load_chunk(chunk)])
 
-        return iter(all_cache)
+    # @override
+    def __contains__(self, key: object) -> bool:
+        return key in self._load_chunk(self._find_chunk(key))
 
     # @override
     def __setitem__(self, key: _KT, value: _VT) -> None:
-        if key not in self._key_to_row_index:
-            self._new_cache[key] = value
+        chunk: _Chunk = self._find_chunk(key)
+        content: _ChunkContent = self._load_chunk(chunk)
+        if key in content and self.eviction_policy is EvictionPolicy.FIFO:
+            content[key][0] = value
+            chunk.dirty = True
             return
 
-        i: _Index = self._key_to_row_index[key]
-        self._cache[i][key] = value
+        if key in content:
+            del content[key]
+
+        else:
+            chunk.size += 1
+            self._size += 1
+
+        content[key] = [value, self._tick()]
+        self._update_chunk(chunk)
+        self._evict_to_max_size()
 
     # @override
     def __getitem__(self, key: _KT) -> _VT:
-        if key in self._new_cache:
-            return self._new_cache[key]
+        chunk: _Chunk = self._find_chunk(key)
+        content: _ChunkContent = self._load_chunk(chunk)
+        value: _VT = content[key][0]
+        if self.eviction_policy is EvictionPolicy.LRU:
+            del content[key]
+            content[key] = [value, self._tick()]
+            self._update_chunk(chunk)
 
-        i: _Index = self._key_to_row_index[key]
-        return self._cache[i][key]
+        return value
 
     # @override
     def __delitem__(self, key: _KT) -> None:
-        if key in self._new_cache:
-            del self._new_cache[key]
-            return
-
-        i: _Index = self._key_to_row_index[key]
-        del self._cache[i][key]
+        chunk: _Chunk = self._find_chunk(key)
+        self._remove(chunk, key)
 
     def filter_items(self, keys: AbstractSet[_KT]) -> None:
         """Filter keys that don't exist in the platform from the cache."""
-        c: _Cache = copy.deepcopy(self._cache)
-        for i, record in enumerate(c):
-            self._cache[i] = {k: v for k, v in list(record.items()) if k in keys}
+        for chunk in self._chunks:
+            for key in [k for k in self._load_chunk(chunk) if k not in keys]:
+                self._remove(chunk, key)
 
     def push_local_to_external(self) -> None:
-        """Push the local cache of this object to the external cache storage."""
-        self._distribute_new_cache_to_fill_existing_cache_and_push()
-        self._distribute_new_cache_to_new_rows_and_push()
-
-    def _distribute_new_cache_to_fill_existing_cache_and_push(self) -> None:
-        self._distribute_new_items_to_unfilled_existing_rows()
-        self._push_regular_cache()
-
-    def _distribute_new_items_to_unfilled_existing_rows(self) -> None:
-        row_indexes: Iterable[_Index] = self._get_indexes_sorted_by_content_length()
-        for i in row_indexes:
-            self._fill_row_with_new_items(self._cache[i])
-
-    def _get_indexes_sorted_by_content_length(self) -> Iterable[_Index]:
-        indexes: list[_Index] = list(range(len(self._cache)))
-        return sorted(indexes, key=lambda i: len(_dump_property_value(self._cache[i])))
-
-    def _fill_row_with_new_items(self, row: _Record[_KT, _VT]) -> None:
-        dumped_row: JsonStr = _dump_property_value(row)
-        while self._row_can_be_filled(dumped_row):
-            _move_item(from_=self._new_cache, to=row)
-            dumped_row = _dump_property_value(row)
-
-        if _row_is_too_long(dumped_row):
-            _move_item(from_=row, to=self._new_cache)
-
-    def _row_can_be_filled(self, dumped_row: JsonStr) -> bool:
-        return self._new_cache and not _row_is_too_long(dumped_row)
-
-    def _push_regular_cache(self) -> None:
-        for i, record in enumerate(self._cache):
-            self._set_scoped_job_context_property(i, record)
-
-    def _distribute_new_cache_to_new_rows_and_push(self) -> None:
-        while self._new_cache:
-            self._largest_row_index += 1
-            self._remove_new_cached_items_and_save_them_to_row(self._largest_row_index)
-
-    def _remove_new_cached_items_and_save_them_to_row(self, index: _Index) -> None:
-        removed_keys: _Record[_KT, _VT] = {}
-        new_cache: _Record[_KT, _VT] = copy.deepcopy(self._new_cache)
-        while new_cache:
-            try:
-                self._set_scoped_job_context_property(index, new_cache)
-                break
-
-            except SiemplifyBase.MaximumContextLengthException:
-                _move_item(from_=new_cache, to=removed_keys)
+        """Push the local cache of this object to the external cache storage.
+
+        Only the chunks that changed since they were loaded are written. The
+        legacy rows that were migrated are cleared once the metadata is written.
+        """
+        for chunk in [c for c in self._chunks if c.dirty]:
+            self._push_chunk(chunk)
+
+        if self._metadata_dirty:
+            self._push_metadata()
+
+        if self._legacy_rows:
+            self._clear_legacy_rows()
+
+    def _find_chunk(self, key: object) -> _Chunk:
+        return self._chunks[bisect.bisect_right(self._lower_bounds, _hash_key(key)) - 1]
+
+    def _load_chunk(self, chunk: _Chunk) -> _ChunkContent:
+        if chunk.content is None:
+            chunk.content = _load_record(
+                self._context.get_context(self._chunk_key(chunk.row))
+            )
+            self._size += len(chunk.content) - chunk.size
+            chunk.size = len(chunk.content)
+
+        return chunk.content
+
+    def _tick(self) -> _Stamp:
+        self._clock += 1
+        self._metadata_dirty = True
+        return self._clock
+
+    def _update_chunk(self, chunk: _Chunk) -> None:
+        chunk.oldest = _get_oldest_stamp(chunk.content)
+        chunk.dirty = True
+        self._metadata_dirty = True
+
+    def _remove(self, chunk: _Chunk, key: _KT) -> None:
+        del self._load_chunk(chunk)[key]
+        chunk.size -= 1
+        self._size -= 1
+        self._update_chunk(chunk)
+
+    def _evict_to_max_size(self) -> None:
+        while self.max_size is not None and self._size > self.max_size:
+            chunk: _Chunk = min(
+                (c for c in self._chunks if c.size > 0),
+                key=lambda c: c.oldest if c.oldest is not None else -1,
+            )
+            self._remove(chunk, next(iter(self._load_chunk(chunk))))
+
+    def _push_chunk(self, chunk: _Chunk) -> None:
+        value: JsonStr = _dump_property_value(chunk.content)
+        if _row_is_too_long(value):
+            self._push_split_chunk(chunk)
+            return
 
-        self._new_cache = removed_keys
+        try:
+            self._context.set_context(self._chunk_key(chunk.row), value)
 
-    def _get_scoped_job_context_property(self, index: _Index) -> JsonStr | None:
-        key: str = _row_key(index)
-        return self._context.get_context(key)
+        except SiemplifyBase.MaximumContextLengthException:
+            self._push_split_chunk(chunk)
+            return
 
-    def _set_scoped_job_context_property(self, index: _Index, cache: _Record) -> None:
-        key: str = _row_key(index)
-        value: JsonStr = _dump_property_value(cache)
-        self._context.set_context(key, value)
+        chunk.dirty = False
+
+    def _push_split_chunk(self, chunk: _Chunk) -> None:
+        new_chunk: _Chunk = self._split_chunk(chunk)
+        self._push_chunk(chunk)
+        self._push_chunk(new_chunk)
+
+    def _split_chunk(self, chunk: _Chunk) -> _Chunk:
+        """Move the upper half of a chunk's hash range to a new chunk."""
+        content: _ChunkContent = self._load_chunk(chunk)
+        hashes: list[int] = sorted({_hash_key(key) for key in content})
+        if len(hashes) < 2:
+            raise ValueError(f"Cache item in row {chunk.row} is too long to be saved")
+
+        lower_bound: int = hashes[len(hashes) // 2]
+        upper: _ChunkContent = {
+            k: v for k, v in content.items() if _hash_key(k) >= lower_bound
+        }
+        chunk.content = {k: v for k, v in content.items() if k not in upper}
+        chunk.size = len(chunk.content)
+        new_chunk: _Chunk = _Chunk(
+            row=self._next_row,
+            lower_bound=lower_bound,
+            size=len(upper),
+            content=upper,
+        )
+        self._next_row += 1
+        self._update_chunk(chunk)
+        self._update_chunk(new_chunk)
+
+        i: _Index = bisect.bisect_right(self._lower_bounds, lower_bound)
+        self._lower_bounds.insert(i, lower_bound)
+        self._chunks.insert(i, new_chunk)
+        return new_chunk
+
+    def _push_metadata(self) -> None:
+        metadata: dict[str, Any] = {
+            "size": self._size,
+            "clock": self._clock,
+            "next_row": self._next_row,
+            "chunks": [chunk.to_json() for chunk in self._chunks],
+        }
+        value: JsonStr = _dump_property_value(metadata)
+        if _row_is_too_long(value):
+            raise ValueError(
+                f"Cache metadata of {len(self._chunks)} rows is too long to be saved"
+            )
+
+        self._context.set_context(self._metadata_key(), value)
+        self._metadata_dirty = False
+
+    def _chunk_key(self, row: _Index) -> str:
+        return CACHE_CHUNK_KEY.format(self.key_prefix, row)
+
+    def _metadata_key(self) -> str:
+        return CACHE_METADATA_KEY.format(self.key_prefix)
 
 
 def _load_record(row_value: JsonStr, /) -> _Record:
@@ -251,16 +410,17 @@ def _load_record(row_value: JsonStr, /) -> _Record:
     return _record
 
 
-def _row_is_too_long(row: JsonStr) -> bool:
-    return len(row) >= SiemplifyUtils.MAXIMUM_PROPERTY_VALUE - ROW_PADDING_LENGTH
+def _get_oldest_stamp(content: _ChunkContent, /) -> _Stamp | None:
+    return next(iter(content.values()))[1] if content else None
 
 
-def _move_item(*, from_: _Record[_KT, _VT], to: _Record[_KT, _VT]) -> None:
-    to.update([from_.popitem()])
+def _hash_key(key: object, /) -> int:
+    digest: str = hashlib.sha256(str(key).encode("utf-8")).hexdigest()
+    return int(digest, 16) % 10**KEY_HASH_LENGTH
 
 
-def _row_key(_i: _Index, /) -> str:
-    return CONTEXT_MOD_TIME_KEY.format(_i)
+def _row_is_too_long(row: JsonStr) -> bool:
+    return len(row) >= SiemplifyUtils.MAXIMUM_PROPERTY_VALUE - ROW_PADDING_LENGTH
 
 
 def _dump_property_value(__v, /) -> JsonStr:
@@ -61,6 +61,8 @@ AVAILABLE_CONTENT = [
 ]
 
 ALL_ENVIRONMENTS_IDENTIFIER = "*"
+# Concurrent API calls used to fetch content for a push
+MAX_EXPORT_WORKERS = 8
 
 
 #############
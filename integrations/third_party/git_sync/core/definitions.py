@@ -239,6 +239,7 @@ class Integration(Content):
         self.managers = []
         self.dependencies = []
         self.has_resources = False
+        self._custom_definitions: dict[Any, dict] = {}
         for file in [x for x in self.zipfile.namelist() if not x.endswith("/")]:
             if file.startswith("ActionsDefinitions"):
                 self.actions.append(json.loads(self.zipfile.read(file)))
@@ -308,6 +309,26 @@ class Integration(Content):
     def __repr__(self):
         return self.identifier
 
+    def get_custom_definition(self, api: SiemplifyApiClient, card: dict) -> dict:
+        """Get the definition of a custom item of the integration.
+
+        Every definition is only fetched once, so the files of the integration can
+        be iterated again without fetching them again.
+
+        Args:
+            api: SiemplifyApiClient object
+            card: The item's card, from the integration card's cards
+
+        Returns:
+            The item's definition
+
+        """
+        if card["id"] not in self._custom_definitions:
+            definition = api.get_ide_item(card["id"], card["type"])
+            definition["id"] = 0
+            self._custom_definitions[card["id"]] = definition
+        return self._custom_definitions[card["id"]]
+
     def iter_files(self, api: SiemplifyApiClient) -> Iterator[File]:
         """Iterates all files in integration.
 
@@ -335,8 +356,7 @@ class Integration(Content):
 
             for card in self.integration_card["cards"]:
                 if card["isCustom"]:
-                    definition = api.get_ide_item(card["id"], card["type"])
-                    definition["id"] = 0
+                    definition = self.get_custom_definition(api, card)
 
                     if card["type"] == ScriptType.ACTION.value:
                         yield File(
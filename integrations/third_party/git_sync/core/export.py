@@ -0,0 +1,177 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from .cache import Cache, get_context_factory
+from .constants import MAX_EXPORT_WORKERS
+
+if TYPE_CHECKING:
+    from dulwich.objects import Tree
+    from soar_sdk.SiemplifyJob import SiemplifyJob
+
+    from .definitions import File
+    from .GitManager import Git
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+EXPORT_CACHE_KEY: str = "{0}:{1}"
+EXPORT_CACHE_KEY_PREFIX: str = "exported_content_fingerprints"
+
+
+def iter_concurrently(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int = MAX_EXPORT_WORKERS,
+) -> Iterator[tuple[_T, Future[_R]]]:
+    """Call a function on items concurrently and yield the results in order.
+
+    Only a few calls run ahead of the consumer, so the results are streamed
+    instead of all being held in memory.
+
+    Args:
+        func: The function to call on every item
+        items: The items to call the function on
+        max_workers: The maximum number of concurrent calls
+
+    Yields:
+        Every item with the future of its call, in the order of items. The future's
+        result raises the exception of a failed call.
+
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: collections.deque[tuple[_T, Future[_R]]] = collections.deque(
+            (item, executor.submit(func, item))
+            for item in itertools.islice(items, 2 * max_workers)
+        )
+        while pending:
+            item, future = pending.popleft()
+            pending.extend(
+                (next_item, executor.submit(func, next_item))
+                for next_item in itertools.islice(items, 1)
+            )
+            yield item, future
+
+
+def get_fingerprint(content: bytes | str, readme_addon: str | None = None) -> str:
+    """Fingerprint the exported content of an item together with its readme addon
+
+    Returns:
+        The fingerprint as a hex string
+
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    digest = hashlib.sha256(content)
+    digest.update(b"\0" + (readme_addon or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_files_fingerprint(files: Iterable[File]) -> str:
+    """Fingerprint the exported files of an item, including their paths
+
+    Returns:
+        The fingerprint as a hex string
+
+    """
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(file.path.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(file.content).digest())
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """Fingerprints of the items pushed to the repo by the previous runs.
+
+    An item whose fingerprint didn't change since it was last pushed, and whose
+    path is still in the repo, doesn't have to be fetched or pushed again. The
+    fingerprints are kept in the job's context, and must only be saved after the
+    changes were pushed successfully.
+    """
+
+    def __init__(self, cache: Cache[str, list[str]], git: Git, tree: Tree) -> None:
+        self._cache: Cache[str, list[str]] = cache
+        self._git: Git = git
+        self._tree: Tree = tree
+        self._seen: set[str] = set()
+        self._content_types: set[str] = set()
+        self._pushed: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_siemplify(cls, siemplify: SiemplifyJob, git: Git) -> ExportCache:
+        """Load the cache of a job, comparing paths to the current HEAD tree"""
+        cache: Cache[str, list[str]] = Cache(
+            get_context_factory(siemplify),
+            key_prefix=EXPORT_CACHE_KEY_PREFIX,
+            legacy_row_key=None,
+        )
+        return cls(cache, git, git.get_head_tree())
+
+    def is_unchanged(
+        self, content_type: str, identifier: str, fingerprint: str
+    ) -> bool:
+        """Check if an item was pushed with the same fingerprint and is still in
+        the repo
+        """
+        key = EXPORT_CACHE_KEY.format(content_type, identifier)
+        self._seen.add(key)
+        self._content_types.add(content_type)
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != fingerprint:
+            return False
+        try:
+            self._git.get_raw_object_from_path(entry[1], self._tree)
+        except KeyError:
+            return False
+        return True
+
+    def update(
+        self,
+        content_type: str,
+        identifier: str,
+        fingerprint: str,
+        path: str,
+    ) -> None:
+        """Record the fingerprint and repo path of a pushed item"""
+        key = EXPORT_CACHE_KEY.format(content_type, identifier)
+        self._seen.add(key)
+        self._content_types.add(content_type)
+        self._pushed[key] = [fingerprint, path]
+
+    def save(self) -> None:
+        """Save the fingerprints of the pushed items to the job's context.
+
+        Items of the checked content types that no longer exist are removed.
+        """
+        for key, entry in self._pushed.items():
+            self._cache[key] = entry
+        self._cache.filter_items(
+            self._seen
+            | {
+                key
+                for key in self._cache
+                if key.split(":", 1)[0] not in self._content_types
+            },
+        )
+        self._cache.push_local_to_external()
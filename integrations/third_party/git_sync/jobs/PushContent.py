@@ -34,6 +34,13 @@ from ..core.definitions import (
     VisualFamily,
     Workflow,
 )
+from ..core.export import (
+    ExportCache,
+    get_files_fingerprint,
+    get_fingerprint,
+    iter_concurrently,
+)
+from ..core.GitContentManager import INTEGRATIONS_PATH, PLAYBOOKS_PATH
 from ..core.GitSyncManager import GitSyncManager
 
 SCRIPT_NAME = "Push Content"
@@ -54,22 +61,48 @@ def main():
 
     try:
         gitsync = GitSyncManager.from_siemplify_object(siemplify)
+        export_cache = ExportCache.from_siemplify(siemplify, gitsync.git_client)
 
         # Integrations
         if features["Integrations"]:
             siemplify.LOGGER.info("========== Integrations ==========")
-            for integration in [
-                x
-                for x in gitsync.api.get_ide_cards()
-                if x.get("identifier") not in IGNORED_INTEGRATIONS
-            ]:
-                siemplify.LOGGER.info(f"Pushing {integration['identifier']}")
-                integration_obj = Integration(
-                    integration,
-                    BytesIO(gitsync.api.export_package(integration["identifier"])),
-                )
+            for integration, package in iter_concurrently(
+                lambda x: gitsync.api.export_package(x["identifier"]),
+                [
+                    x
+                    for x in gitsync.api.get_ide_cards()
+                    if x.get("identifier") not in IGNORED_INTEGRATIONS
+                ],
+            ):
+                identifier = integration["identifier"]
+                integration_obj = Integration(integration, BytesIO(package.result()))
                 try:
+                    # The exported files include the integration card and the
+                    # custom item definitions, which are not part of the package
+                    integration_obj.generate_readme(
+                        gitsync.content.metadata.get_readme_addon(
+                            "Integration",
+                            identifier,
+                        ),
+                    )
+                    fingerprint = get_files_fingerprint(
+                        integration_obj.iter_files(gitsync.api),
+                    )
+                    if export_cache.is_unchanged(
+                        "Integration",
+                        identifier,
+                        fingerprint,
+                    ):
+                        siemplify.LOGGER.info(f"Skipping unchanged {identifier}")
+                        continue
+                    siemplify.LOGGER.info(f"Pushing {identifier}")
                     gitsync.content.push_integration(integration_obj)
+                    export_cache.update(
+                        "Integration",
+                        identifier,
+                        fingerprint,
+                        f"{INTEGRATIONS_PATH}/{identifier}",
+                    )
                 except Exception as e:
                     siemplify.LOGGER.error(
                         f"Couldn't upload {integration_obj.identifier}. ERROR: {e}",
@@ -78,12 +111,43 @@ def main():
         # Playbooks
         if features["Playbooks"]:
             siemplify.LOGGER.info("========== Playbooks ==========")
+            changed_playbooks = []
             for playbook in gitsync.api.get_playbooks():
-                siemplify.LOGGER.info(f"Pushing {playbook['name']}")
-                playbook = gitsync.api.get_playbook(playbook["identifier"])
-                workflow = Workflow(playbook)
+                modification_time = playbook.get("modificationTimeUnixTimeInMs")
+                fingerprint = get_fingerprint(
+                    str(modification_time),
+                    gitsync.content.metadata.get_readme_addon(
+                        "Playbook",
+                        playbook["name"],
+                    ),
+                )
+                if modification_time is not None and export_cache.is_unchanged(
+                    "Playbook",
+                    playbook["identifier"],
+                    fingerprint,
+                ):
+                    siemplify.LOGGER.info(f"Skipping unchanged {playbook['name']}")
+                    continue
+                changed_playbooks.append((playbook, fingerprint))
+
+            def get_workflow(item):
+                workflow = Workflow(gitsync.api.get_playbook(item[0]["identifier"]))
                 workflow.update_instance_name_in_steps(gitsync.api, siemplify)
+                return workflow
+
+            for (playbook, fingerprint), workflow in iter_concurrently(
+                get_workflow,
+                changed_playbooks,
+            ):
+                siemplify.LOGGER.info(f"Pushing {playbook['name']}")
+                workflow = workflow.result()
                 gitsync.content.push_playbook(workflow)
+                export_cache.update(
+                    "Playbook",
+                    playbook["identifier"],
+                    fingerprint,
+                    f"{PLAYBOOKS_PATH}/{workflow.category}/{workflow.name}",
+                )
 
         # Jobs
         if features["Jobs"]:
@@ -109,74 +173,81 @@ def main():
         # Simulated Cases
         if features["Simulated Cases"]:
             siemplify.LOGGER.info("========== Simulated Cases ==========")
-            for case in gitsync.api.get_simulated_cases():
+            for case, exported_case in iter_concurrently(
+                gitsync.api.export_simulated_case,
+                gitsync.api.get_simulated_cases(),
+            ):
                 siemplify.LOGGER.info(f"Pushing {case}")
-                gitsync.content.push_simulated_case(
-                    case,
-                    gitsync.api.export_simulated_case(case),
-                )
+                gitsync.content.push_simulated_case(case, exported_case.result())
 
         # Integration Instances
         if features["Integration Instances"]:
             siemplify.LOGGER.info("========== Integration Instances ==========")
             integration_instances = []
-            for environment in gitsync.api.get_environment_names() + [
-                ALL_ENVIRONMENTS_IDENTIFIER,
-            ]:
-                for instance in [
-                    x
-                    for x in gitsync.api.get_integrations_instances(environment)
+            environment_instances = []
+            for environment, instances in iter_concurrently(
+                gitsync.api.get_integrations_instances,
+                gitsync.api.get_environment_names() + [ALL_ENVIRONMENTS_IDENTIFIER],
+            ):
+                environment_instances.extend(
+                    (environment, x)
+                    for x in instances.result()
                     if x.get("integrationIdentifier") not in IGNORED_INTEGRATIONS
-                ]:
-                    siemplify.LOGGER.info(f"Pushing {instance['instanceName']}")
-                    settings = gitsync.api.get_integration_instance_settings(
-                        instance["identifier"],
-                    )
-                    for sett in settings:  # Remove Agent Identifiers from settings - should be created separately
-                        if sett["propertyName"] == "AgentIdentifier":
-                            sett["value"] = None
-                        sett["creationTimeUnixTimeInMs"] = 0
-                        sett["modificationTimeUnixTimeInMs"] = 0
-                    if commit_passwords:
-                        try:
-                            secrets = siemplify.get_configuration(
-                                instance["identifier"],
-                            )
-                            for prop in settings:
-                                if prop["propertyType"] == 3:
-                                    try:
-                                        prop["value"] = secrets[prop["propertyName"]]
-                                    except KeyError:
-                                        siemplify.LOGGER.warn(
-                                            f"{instance['instanceName']} was updated with new "
-                                            f"parameters but they weren't configured.",
-                                        )
-                        except Exception:
-                            siemplify.LOGGER.warn(
-                                f"{instance['identifier']} is not configured. Skipping passwords",
-                            )
-
-                    integration_instances.append(
-                        {
-                            "environment": environment,
-                            "integrationIdentifier": instance["integrationIdentifier"],
-                            "settings": {
-                                "instanceDescription": instance["instanceDescription"],
-                                "instanceName": instance["instanceName"],
-                                "settings": settings,
-                            },
+                )
+            for (environment, instance), settings in iter_concurrently(
+                lambda x: gitsync.api.get_integration_instance_settings(
+                    x[1]["identifier"],
+                ),
+                environment_instances,
+            ):
+                siemplify.LOGGER.info(f"Pushing {instance['instanceName']}")
+                settings = settings.result()
+                for sett in settings:  # Remove Agent Identifiers from settings - should be created separately
+                    if sett["propertyName"] == "AgentIdentifier":
+                        sett["value"] = None
+                    sett["creationTimeUnixTimeInMs"] = 0
+                    sett["modificationTimeUnixTimeInMs"] = 0
+                if commit_passwords:
+                    try:
+                        secrets = siemplify.get_configuration(
+                            instance["identifier"],
+                        )
+                        for prop in settings:
+                            if prop["propertyType"] == 3:
+                                try:
+                                    prop["value"] = secrets[prop["propertyName"]]
+                                except KeyError:
+                                    siemplify.LOGGER.warn(
+                                        f"{instance['instanceName']} was updated with new "
+                                        f"parameters but they weren't configured.",
+                                    )
+                    except Exception:
+                        siemplify.LOGGER.warn(
+                            f"{instance['identifier']} is not configured. Skipping passwords",
+                        )
+
+                integration_instances.append(
+                    {
+                        "environment": environment,
+                        "integrationIdentifier": instance["integrationIdentifier"],
+                        "settings": {
+                            "instanceDescription": instance["instanceDescription"],
+                            "instanceName": instance["instanceName"],
+                            "settings": settings,
                         },
-                    )
+                    },
+                )
             gitsync.content.push_integration_instances(integration_instances)
 
         # Ontology - Visual Families
         if features["Visual Families"]:
             siemplify.LOGGER.info("========== Visual Families ==========")
-            for visualFamily in gitsync.api.get_custom_families():
+            for visualFamily, family_data in iter_concurrently(
+                lambda x: gitsync.api.get_custom_family(x["id"]),
+                gitsync.api.get_custom_families(),
+            ):
                 siemplify.LOGGER.info(f"Pushing {visualFamily['family']}")
-                gitsync.content.push_visual_family(
-                    VisualFamily(gitsync.api.get_custom_family(visualFamily["id"])),
-                )
+                gitsync.content.push_visual_family(VisualFamily(family_data.result()))
 
         # Ontology - Mappings
         if features["Mappings"]:
@@ -190,13 +261,16 @@ def main():
                     if not records:
                         continue
                     rules = []
-                    for record in records:
+                    for record, rule in iter_concurrently(
+                        lambda x: gitsync.api.get_mapping_rules(
+                            x["source"],
+                            x["product"],
+                            x["eventName"],
+                        ),
+                        records,
+                    ):
                         record["exampleEventFields"] = []  # remove event assets
-                        rule = gitsync.api.get_mapping_rules(
-                            record["source"],
-                            record["product"],
-                            record["eventName"],
-                        )
+                        rule = rule.result()
                         for r in rule["familyFields"] + rule["systemFields"]:
                             # remove bad rules with no source
                             if (
@@ -273,7 +347,8 @@ def main():
             gitsync.content.push_sla_definitions(gitsync.api.get_sla_records())
 
         siemplify.LOGGER.info("Done! uploading everything to git")
-        gitsync.commit_and_push(commit_msg)
+        if gitsync.commit_and_push(commit_msg):
+            export_cache.save()
 
     except Exception as e:
         siemplify.LOGGER.error(f"General error performing Job {SCRIPT_NAME}")
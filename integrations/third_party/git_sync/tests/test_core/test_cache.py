@@ -0,0 +1,150 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ...core import cache
+from ...core.cache import CONTEXT_MOD_TIME_KEY, Cache, EvictionPolicy
+
+
+class FakeContext:
+    """An in-memory context that records the keys it was written to."""
+
+    def __init__(self, rows: dict[str, str] | None = None) -> None:
+        self.rows: dict[str, str] = dict(rows or {})
+        self.written: list[str] = []
+
+    def get_context(self, key: str) -> str | None:
+        return self.rows.get(key)
+
+    def set_context(self, key: str, value: str) -> None:
+        self.rows[key] = value
+        self.written.append(key)
+
+
+def test_items_are_reloaded_from_the_context() -> None:
+    context = FakeContext()
+    c: Cache[str, int] = Cache(context)
+    for i in range(50):
+        c[f"playbook_{i}"] = i
+    c.push_local_to_external()
+
+    reloaded: Cache[str, int] = Cache(context)
+
+    assert len(reloaded) == 50
+    assert dict(reloaded.items()) == {f"playbook_{i}": i for i in range(50)}
+
+
+def test_only_changed_rows_are_pushed() -> None:
+    context = FakeContext()
+    c: Cache[str, int] = Cache(context)
+    c["a"] = 1
+    c.push_local_to_external()
+    context.written.clear()
+
+    Cache(context).push_local_to_external()
+
+    assert context.written == []
+
+
+def test_legacy_rows_are_migrated_and_cleared_after_push() -> None:
+    context = FakeContext(
+        {
+            CONTEXT_MOD_TIME_KEY.format(0): json.dumps({"a": 1, "b": 2}),
+            CONTEXT_MOD_TIME_KEY.format(1): json.dumps({"c": 3}),
+        }
+    )
+    c: Cache[str, int] = Cache(context)
+
+    assert dict(c.items()) == {"a": 1, "b": 2, "c": 3}
+    assert context.rows[CONTEXT_MOD_TIME_KEY.format(0)] != ""
+
+    c.push_local_to_external()
+
+    assert context.rows[CONTEXT_MOD_TIME_KEY.format(0)] == ""
+    assert context.rows[CONTEXT_MOD_TIME_KEY.format(1)] == ""
+    assert dict(Cache(context).items()) == {"a": 1, "b": 2, "c": 3}
+
+
+def test_caches_with_different_prefixes_share_a_context() -> None:
+    context = FakeContext()
+    first: Cache[str, int] = Cache(context)
+    second: Cache[str, int] = Cache(context, key_prefix="other", legacy_row_key=None)
+    first["a"] = 1
+    second["a"] = 2
+    first.push_local_to_external()
+    second.push_local_to_external()
+
+    assert Cache(context)["a"] == 1
+    assert Cache(context, key_prefix="other", legacy_row_key=None)["a"] == 2
+
+
+def test_fifo_eviction_removes_the_first_inserted_items() -> None:
+    c: Cache[str, int] = Cache(FakeContext(), max_size=3)
+    for key in "abcd":
+        c[key] = 0
+    c["b"] = 1
+
+    assert sorted(c) == ["b", "c", "d"]
+
+
+def test_lru_eviction_removes_the_least_recently_used_items() -> None:
+    context = FakeContext()
+    c: Cache[str, int] = Cache(context, max_size=3, eviction_policy=EvictionPolicy.LRU)
+    for key in "abc":
+        c[key] = 0
+    assert c["a"] == 0
+    c.push_local_to_external()
+
+    reloaded: Cache[str, int] = Cache(
+        context, max_size=3, eviction_policy=EvictionPolicy.LRU
+    )
+    reloaded["d"] = 0
+
+    assert sorted(reloaded) == ["a", "c", "d"]
+
+
+def test_long_rows_are_split(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        cache.SiemplifyUtils, "MAXIMUM_PROPERTY_VALUE", 500, raising=False
+    )
+    context = FakeContext()
+    c: Cache[str, str] = Cache(context)
+    items: dict[str, str] = {f"playbook_{i}": "x" * 20 for i in range(40)}
+    c.update(items)
+    c.push_local_to_external()
+
+    chunk_rows: list[str] = [
+        k
+        for k in context.rows
+        if k.startswith(cache.CACHE_KEY_PREFIX) and k[-1].isdigit()
+    ]
+    assert len(chunk_rows) > 1
+    assert all(len(context.rows[k]) < 500 for k in chunk_rows)
+    assert dict(Cache(context).items()) == items
+
+
+def test_too_long_metadata_is_not_saved(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        cache.SiemplifyUtils, "MAXIMUM_PROPERTY_VALUE", 120, raising=False
+    )
+    c: Cache[str, str] = Cache(FakeContext())
+    c.update({f"playbook_{i}": "x" * 20 for i in range(10)})
+
+    with pytest.raises(ValueError, match="metadata"):
+        c.push_local_to_external()
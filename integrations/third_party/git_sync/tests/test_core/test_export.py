@@ -0,0 +1,157 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from typing import Any
+
+from ...core.cache import Cache
+from ...core.constants import ScriptType
+from ...core.definitions import Integration
+from ...core.export import (
+    EXPORT_CACHE_KEY_PREFIX,
+    ExportCache,
+    get_files_fingerprint,
+)
+from .test_cache import FakeContext
+
+
+class FakeGit:
+    """A git client whose tree holds the given paths."""
+
+    def __init__(self, paths: set[str]) -> None:
+        self.paths: set[str] = paths
+
+    def get_raw_object_from_path(self, path: str, tree: Any = None) -> str:
+        if path not in self.paths:
+            raise KeyError(path)
+        return path
+
+
+class FakeApi:
+    """Returns the definitions of custom items, counting the requests."""
+
+    def __init__(self, definitions: dict[int, dict]) -> None:
+        self.definitions: dict[int, dict] = definitions
+        self.requests: list[int] = []
+
+    def get_ide_item(self, item_id: int, item_type: int) -> dict:
+        self.requests.append(item_id)
+        return dict(self.definitions[item_id])
+
+
+def create_cache(context: FakeContext, paths: set[str]) -> ExportCache:
+    cache: Cache[str, list[str]] = Cache(
+        context,
+        key_prefix=EXPORT_CACHE_KEY_PREFIX,
+        legacy_row_key=None,
+    )
+    return ExportCache(cache, FakeGit(paths), tree=None)
+
+
+def create_integration(card_name: str = "Ping") -> Integration:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("Integration-Test.def", json.dumps({"Version": 1.0}))
+        zip_file.writestr(f"ActionsScripts/{card_name}.py", "print('ping')")
+    integration = Integration(
+        {
+            "identifier": "Test",
+            "isCustomIntegration": False,
+            "cards": [
+                {
+                    "id": 1,
+                    "name": card_name,
+                    "type": ScriptType.ACTION.value,
+                    "isCustom": True,
+                },
+            ],
+        },
+        buffer,
+    )
+    integration.readme = "# Test"
+    return integration
+
+
+def test_unchanged_items_are_skipped() -> None:
+    context = FakeContext()
+    cache = create_cache(context, {"Integrations/Test"})
+    cache.update("Integration", "Test", "fingerprint", "Integrations/Test")
+    cache.save()
+
+    reloaded = create_cache(context, {"Integrations/Test"})
+
+    assert reloaded.is_unchanged("Integration", "Test", "fingerprint")
+    assert not reloaded.is_unchanged("Integration", "Test", "other fingerprint")
+    assert not reloaded.is_unchanged("Playbook", "Test", "fingerprint")
+
+
+def test_items_missing_from_the_tree_are_not_skipped() -> None:
+    context = FakeContext()
+    cache = create_cache(context, {"Integrations/Test"})
+    cache.update("Integration", "Test", "fingerprint", "Integrations/Test")
+    cache.save()
+
+    assert not create_cache(context, set()).is_unchanged(
+        "Integration",
+        "Test",
+        "fingerprint",
+    )
+
+
+def test_items_that_were_not_exported_again_are_removed() -> None:
+    context = FakeContext()
+    cache = create_cache(context, set())
+    cache.update("Integration", "Kept", "1", "Integrations/Kept")
+    cache.update("Integration", "Removed", "1", "Integrations/Removed")
+    cache.update("Playbook", "Unchecked", "1", "Playbooks/Unchecked")
+    cache.save()
+
+    paths = {"Integrations/Kept", "Integrations/Removed", "Playbooks/Unchecked"}
+    cache = create_cache(context, paths)
+    cache.is_unchanged("Integration", "Kept", "1")
+    cache.save()
+    reloaded = create_cache(context, paths)
+
+    assert reloaded.is_unchanged("Integration", "Kept", "1")
+    assert not reloaded.is_unchanged("Integration", "Removed", "1")
+    assert reloaded.is_unchanged("Playbook", "Unchecked", "1")
+
+
+def test_fingerprint_covers_the_custom_item_definitions() -> None:
+    api = FakeApi({1: {"id": 1, "Name": "Ping", "Script": "v1"}})
+    fingerprint = get_files_fingerprint(create_integration().iter_files(api))
+
+    assert fingerprint == get_files_fingerprint(create_integration().iter_files(api))
+    api.definitions[1]["Script"] = "v2"
+    assert fingerprint != get_files_fingerprint(
+        create_integration().iter_files(api),
+    )
+    assert fingerprint != get_files_fingerprint(
+        create_integration("Pong").iter_files(api),
+    )
+
+
+def test_custom_item_definitions_are_fetched_once() -> None:
+    api = FakeApi({1: {"id": 1, "Name": "Ping"}})
+    integration = create_integration()
+
+    first = [(f.path, f.content) for f in integration.iter_files(api)]
+    second = [(f.path, f.content) for f in integration.iter_files(api)]
+
+    assert first == second
+    assert api.requests == [1]
@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
+import pytest
+from dulwich.objects import Tree
+from dulwich.repo import Repo
+
+from ...core import GitManager
+from ...core.definitions import File
+from ...core.GitManager import Git
+
+BRANCH_REF: bytes = b"refs/heads/main"
+
+
+@pytest.fixture
+def git(tmp_path: Any) -> Git:
+    """A Git client of a local repo with a single commit"""
+    repo = Repo.init(str(tmp_path))
+    repo.refs.set_symbolic_ref(b"HEAD", BRANCH_REF)
+    git = Git.__new__(Git)
+    git.repo = repo
+    git.logger = mock.MagicMock()
+    git.author = b"Test <test@example.com>"
+    git.local_branch_ref = BRANCH_REF
+    git.connection_args = {}
+    tree = Tree()
+    repo.object_store.add_object(tree)
+    repo.do_commit(message=b"Initial", committer=git.author, tree=tree.id)
+    git.tree = git.get_head_tree()
+    return git
+
+
+def test_push_returns_true_when_pushed(
+    git: Git,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    push = mock.MagicMock()
+    monkeypatch.setattr(GitManager.porcelain, "push", push)
+
+    assert git.push() is True
+    push.assert_called_once()
+
+
+def test_push_returns_false_when_the_branches_diverged(
+    git: Git,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    push = mock.MagicMock(
+        side_effect=GitManager.porcelain.DivergedBranches(b"a", b"b"),
+    )
+    monkeypatch.setattr(GitManager.porcelain, "push", push)
+
+    assert git.push() is False
+
+
+@pytest.mark.parametrize("pushed", [True, False])
+def test_commit_and_push_returns_whether_the_changes_were_pushed(
+    git: Git,
+    monkeypatch: pytest.MonkeyPatch,
+    pushed: bool,
+) -> None:
+    monkeypatch.setattr(git, "push", mock.MagicMock(return_value=pushed))
+    git.update_objects([File("README.md", "# Test")])
+
+    assert git.commit_and_push("Update") is pushed
+    git.push.assert_called_once()
+
+
+def test_commit_and_push_without_changes_does_not_push(
+    git: Git,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(git, "push", mock.MagicMock())
+
+    assert git.commit_and_push("Update") is True
+    git.push.assert_not_called()
@@ -224,13 +224,18 @@ def main(is_test_run):
         )
 
         # Change order to ascending
-        dns_events = dns_events[::-1]
+        dns_events = list(dns_events)[::-1]
 
         if is_test_run:
             dns_events = dns_events[:1]
 
         siemplify.LOGGER.info(f"Found {len(dns_events)} new DNS Security Events to process.")
 
+        # Create environment manager
+        environment_common = GetEnvironmentCommonFactory.create_environment_manager(
+            siemplify, environment_field_name, environment_regex_pattern
+        )
+
         # Process each pre-filtered event
         for dns_event in dns_events:
             siemplify.LOGGER.info(
@@ -242,11 +247,6 @@ def main(is_test_run):
                     siemplify.LOGGER.info("Timeout is approaching. Connector will gracefully exit")
                     break
 
-                # Create environment manager
-                environment_common = GetEnvironmentCommonFactory.create_environment_manager(
-                    siemplify, environment_field_name, environment_regex_pattern
-                )
-
                 # Convert event to AlertInfo using the datamodel method
                 alert_info = dns_event.get_alert_info(
                     AlertInfo(), environment_common, device_product_field
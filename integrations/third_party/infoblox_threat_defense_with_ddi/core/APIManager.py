@@ -1,7 +1,10 @@
 from __future__ import annotations
+import collections
+import itertools
 import time
 import requests
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 from .datamodels import DNSSecurityEvent, SOCInsight
 from .InfobloxExceptions import RateLimitException
@@ -10,6 +13,7 @@ from .constants import (
     ENDPOINTS,
     DEFAULT_RESULTS_LIMIT,
     DEFAULT_PAGE_SIZE,
+    MAX_PREFETCHED_PAGES,
     RETRY_COUNT,
     DEFAULT_REQUEST_TIMEOUT,
     WAIT_TIME_FOR_RETRY,
@@ -98,6 +102,10 @@ class APIManager:
         """
         Paginate the results.
 
+        The first page is fetched on its own. If it is full, the next offset pages are
+        fetched concurrently, with up to MAX_PREFETCHED_PAGES pages fetched ahead of
+        the consumer, until a short page is returned or the limit is reached.
+
         Args:
             api_name (str): API name.
             method (str): The method of the request (GET, POST, PUT, DELETE, PATCH).
@@ -106,39 +114,58 @@ class APIManager:
             params (dict, optional): The parameters of the request.
             body (dict, optional): The JSON payload of the request.
             limit (int, optional): The limit of the results. Defaults to DEFAULT_RESULTS_LIMIT.
+            is_connector_request (bool, optional): If True, stop at a failed page instead
+                of raising, once the first page was fetched. Defaults to False.
 
-        Returns:
-            list: List of results.
-        """
-        limit = limit or DEFAULT_RESULTS_LIMIT
-        params["_offset"] = params.get("_offset", 0)
-        params["_limit"] = DEFAULT_PAGE_SIZE if limit >= DEFAULT_PAGE_SIZE else limit
-        response = self._make_rest_call(api_name, method, url, params=params, body=body)
-        results = response.get(result_key, [])
-
-        while True:
-            if not response.get(result_key) or len(results) >= limit:
-                break
-            remaining = limit - len(results)
-            params["_offset"] += params["_limit"]
-            params["_limit"] = (
-                DEFAULT_PAGE_SIZE if remaining >= DEFAULT_PAGE_SIZE else remaining
+        Yields:
+            list: The results of every page.
+        """
+        params = params or {}
+        offset = int(params.get("_offset", 0))
+        end_offset = offset + (limit or DEFAULT_RESULTS_LIMIT)
+
+        def fetch_page(page_offset):
+            page_size = min(DEFAULT_PAGE_SIZE, end_offset - page_offset)
+            response = self._make_rest_call(
+                api_name,
+                method,
+                url,
+                params={**params, "_offset": page_offset, "_limit": page_size},
+                body=body,
             )
-            if is_connector_request:
+            return page_size, response.get(result_key, [])
+
+        page_size, results = fetch_page(offset)
+        yield results
+        if len(results) < page_size:
+            return
+
+        offsets = iter(range(offset + page_size, end_offset, DEFAULT_PAGE_SIZE))
+        executor = ThreadPoolExecutor(max_workers=MAX_PREFETCHED_PAGES)
+        try:
+            pending = collections.deque(
+                executor.submit(fetch_page, page_offset)
+                for page_offset in itertools.islice(offsets, MAX_PREFETCHED_PAGES)
+            )
+            while pending:
                 try:
-                    response = self._make_rest_call(
-                        api_name, method, url, params=params, body=body
-                    )
+                    page_size, results = pending.popleft().result()
                 except Exception as e:
+                    if not is_connector_request:
+                        raise
                     self.siemplify.LOGGER.exception(e)
-                    return results
-            else:
-                response = self._make_rest_call(
-                    api_name, method, url, params=params, body=body
-                )
-            results.extend(response.get(result_key, []))
+                    return
 
-        return results
+                yield results
+                if len(results) < page_size:
+                    return
+
+                pending.extend(
+                    executor.submit(fetch_page, page_offset)
+                    for page_offset in itertools.islice(offsets, 1)
+                )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _make_rest_call(
         self,
@@ -1028,6 +1055,7 @@ class APIManager:
         # Extract insights from response
         insights = []
         if response and "insightList" in response:
+            existing_ids = set(existing_ids or [])
             insights = [
                 insight
                 for item in response["insightList"]
@@ -1057,15 +1085,15 @@ class APIManager:
             network (str, optional): Filter by comma-separated network name
             limit (int, optional): Maximum number of results to return (default: 1000)
 
-        Returns:
-            tuple: (list of DNS Security Event objects, list of DNSSecurityEvent model instances)
+        Yields:
+            DNSSecurityEvent: The new events, in the order returned by the API.
         """
         # Build API parameters
         params = self.build_dns_security_events_params(**kwargs)
 
         # Make API call
         url = self._get_full_url(GET_DNS_SECURITY_EVENTS_ACTION_IDENTIFIER)
-        results = self._paginator(
+        pages = self._paginator(
             GET_DNS_SECURITY_EVENTS_ACTION_IDENTIFIER,
             "GET",
             url,
@@ -1075,13 +1103,15 @@ class APIManager:
             result_key="result",
         )
 
-        dns_events = [
-            event_obj
-            for event in results
-            if (event_obj := DNSSecurityEvent(event)).event_id not in existing_ids
-        ]
-
-        return dns_events
+        # Events shift between the offset pages while new events arrive, so events
+        # seen on a previous page are skipped as well
+        seen_ids = set(existing_ids or [])
+        for page in pages:
+            for event in page:
+                event_obj = DNSSecurityEvent(event)
+                if event_obj.event_id not in seen_ids:
+                    seen_ids.add(event_obj.event_id)
+                    yield event_obj
 
     def build_dns_security_events_params(
         self,
@@ -10,6 +10,7 @@ DEFAULT_DEVICE_PRODUCT = INTEGRATION_NAME
 RULE_GENERATOR = DEFAULT_DEVICE_VENDOR
 COMMON_ACTION_ERROR_MESSAGE = "Error while executing action {}. Reason: {}"
 DEFAULT_PAGE_SIZE = 1000
+MAX_PREFETCHED_PAGES = 4
 RETRY_COUNT = 3
 WAIT_TIME_FOR_RETRY = 5
 DEFAULT_RESULTS_LIMIT = 10000000
@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ...core import APIManager as api_manager_module
+from ...core.APIManager import APIManager
+from ...core.datamodels import DNSSecurityEvent
+
+PAGE_SIZE = 2
+
+
+@pytest.fixture(autouse=True)
+def small_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api_manager_module, "DEFAULT_PAGE_SIZE", PAGE_SIZE)
+
+
+def event_json(index: int) -> dict:
+    return {
+        "event_time": f"2025-01-01T00:00:{index:02d}.000Z",
+        "qname": f"domain-{index}.example.com",
+        "device": f"device-{index}",
+        "tclass": "Malware",
+    }
+
+
+def create_manager(events: list[dict], failing_offsets=()) -> tuple[APIManager, list[tuple]]:
+    """Create a manager that serves the events by offset and records the requested pages."""
+    manager: APIManager = APIManager("https://infoblox.example.com/", "key", siemplify=MagicMock())
+    requested_pages: list[tuple] = []
+
+    def make_rest_call(api_identifier, method, url, params=None, body=None):
+        requested_pages.append((params["_offset"], params["_limit"]))
+        if params["_offset"] in failing_offsets:
+            raise ValueError("Internal server error")
+        return {"result": events[params["_offset"] : params["_offset"] + params["_limit"]]}
+
+    manager._make_rest_call = make_rest_call
+    return manager, requested_pages
+
+
+def paginate(manager: APIManager, **kwargs) -> list[list[dict]]:
+    return list(
+        manager._paginator(
+            "api", "GET", "https://infoblox.example.com/", result_key="result", **kwargs
+        )
+    )
+
+
+def test_paginator_stops_at_short_page() -> None:
+    events: list[dict] = [event_json(i) for i in range(5)]
+    manager, requested_pages = create_manager(events)
+
+    pages: list[list[dict]] = paginate(manager)
+
+    assert pages == [events[0:2], events[2:4], events[4:5]]
+    assert sorted(requested_pages)[:3] == [(0, 2), (2, 2), (4, 2)]
+
+
+def test_paginator_fetches_single_short_page_only() -> None:
+    manager, requested_pages = create_manager([event_json(0)])
+
+    assert paginate(manager) == [[event_json(0)]]
+    assert requested_pages == [(0, 2)]
+
+
+def test_paginator_stops_at_limit() -> None:
+    events: list[dict] = [event_json(i) for i in range(10)]
+    manager, requested_pages = create_manager(events)
+
+    pages: list[list[dict]] = paginate(manager, limit=5, params={"_offset": 1})
+
+    assert pages == [events[1:3], events[3:5], events[5:6]]
+    assert sorted(requested_pages) == [(1, 2), (3, 2), (5, 1)]
+
+
+def test_paginator_ends_connector_request_at_failed_page() -> None:
+    events: list[dict] = [event_json(i) for i in range(10)]
+    manager, _ = create_manager(events, failing_offsets={4})
+
+    pages: list[list[dict]] = paginate(manager, is_connector_request=True)
+
+    assert pages == [events[0:2], events[2:4]]
+    manager.siemplify.LOGGER.exception.assert_called_once()
+
+
+def test_paginator_raises_failed_page() -> None:
+    manager, _ = create_manager([event_json(i) for i in range(10)], failing_offsets={4})
+
+    with pytest.raises(ValueError, match="Internal server error"):
+        paginate(manager)
+
+
+def test_get_dns_security_events_skips_seen_events() -> None:
+    # The third event shifted to the next page while the pages were fetched
+    events: list[dict] = [event_json(i) for i in (0, 1, 2, 2, 3)]
+    manager, _ = create_manager(events)
+    existing_ids: list[str] = [DNSSecurityEvent(event_json(1)).event_id]
+
+    new_events: list[DNSSecurityEvent] = list(
+        manager.get_dns_security_events(existing_ids=existing_ids, limit=10)
+    )
+
+    assert [event.qname for event in new_events] == [
+        "domain-0.example.com",
+        "domain-2.example.com",
+        "domain-3.example.com",
+    ]
@@ -28,7 +28,6 @@ from soar_sdk.ScriptResult import (
     EXECUTION_STATE_FAILED,
     EXECUTION_STATE_TIMEDOUT,
 )
-from soar_sdk.SiemplifyDataModel import EntityTypes
 from soar_sdk.SiemplifyUtils import (
     convert_dict_to_json_result_dict,
     convert_unixtime_to_datetime,
@@ -45,6 +44,8 @@ from UtilsManager import (
 from .constants import (
     DEFAULT_SCORE,
     DEFAULT_TIMEOUT,
+    ENRICHMENT_RENDER_TIME_IN_SEC,
+    ENTITY_TYPE_IOC_TYPE_MAP,
     INVALID_SAMPLE_TEXT,
     PROVIDER_NAME,
     SUPPORTED_ENTITY_TYPES_ENRICHMENT,
@@ -53,6 +54,7 @@ from .datamodels import IP
 from .exceptions import (
     RecordedFutureCommonError,
     RecordedFutureNotFoundError,
+    RecordedFutureTimeoutError,
     SandboxTimeoutError,
 )
 from .RecordedFutureManager import RecordedFutureManager
@@ -81,6 +83,26 @@ def _subtitle(title):
     return f"<h3>{title}</h3>"
 
 
+def _get_ioc(entity):
+    """Return the IOC type and the normalized identifier of an entity."""
+    ioc_type = ENTITY_TYPE_IOC_TYPE_MAP.get(entity.entity_type)
+    if ioc_type is None:
+        raise RecordedFutureCommonError(
+            "Given entity type: {} can't be enriched by Recorded "
+            "Future. Please choose one of the following entity types: "
+            "{}".format(
+                entity.entity_type,
+                ",".join(SUPPORTED_ENTITY_TYPES_ENRICHMENT),
+            ),
+        )
+
+    if ioc_type == "ip":
+        return ioc_type, entity.identifier
+    if ioc_type == "vulnerability":
+        return ioc_type, entity.identifier.upper()
+    return ioc_type, entity.identifier.lower()
+
+
 class RecordedFutureCommon:
     """Recorded Future Common."""
 
@@ -123,10 +145,39 @@ class RecordedFutureCommon:
             successful_entities = []
             failed_entities = []
             not_found_entities = []
+            timed_out_entities = []
             output_message = ""
             status = EXECUTION_STATE_COMPLETED
 
+            entities = []
             for entity in self.siemplify.target_entities:
+                if entity.entity_type not in entity_types:
+                    continue
+
+                try:
+                    entities.append((entity, _get_ioc(entity)))
+                except RecordedFutureCommonError as e:
+                    failed_entities.append(entity)
+                    self.siemplify.LOGGER.error(
+                        f"An error occurred on entity {entity.identifier}",
+                    )
+                    self.siemplify.LOGGER.exception(e)
+
+            # Look up all the entities before rendering their tables and insights,
+            # leaving time to render them before the execution deadline
+            self.siemplify.LOGGER.info(f"Looking up {len(entities)} entities")
+            entity_reports = recorded_future_manager.get_reputations(
+                [ioc for _, ioc in entities],
+                include_links,
+                collective_insights_enabled,
+                timeout=max(
+                    (self.siemplify.execution_deadline_unix_time_ms - unix_now()) / 1000
+                    - ENRICHMENT_RENDER_TIME_IN_SEC,
+                    0,
+                ),
+            )
+
+            for entity, ioc in entities:
                 if unix_now() >= self.siemplify.execution_deadline_unix_time_ms:
                     self.siemplify.LOGGER.error(
                         "Timed out. execution deadline ({}) has passed".format(
@@ -138,127 +189,87 @@ class RecordedFutureCommon:
                     status = EXECUTION_STATE_TIMEDOUT
                     break
 
-                if entity.entity_type in entity_types:
-                    self.siemplify.LOGGER.info(
-                        f"Started processing entity: {entity.identifier}",
+                self.siemplify.LOGGER.info(
+                    f"Started processing entity: {entity.identifier}",
+                )
+
+                try:
+                    entity_report = entity_reports[ioc]
+                    if isinstance(entity_report, Exception):
+                        raise entity_report
+
+                    json_results[entity.identifier] = entity_report.to_json()
+                    self.siemplify.result.add_data_table(
+                        title=f"Report for: {entity.identifier}",
+                        data_table=construct_csv(entity_report.to_overview_table()),
+                    )
+                    self.siemplify.result.add_data_table(
+                        title=f"Triggered Risk Rules for: {entity.identifier}",
+                        data_table=construct_csv(entity_report.to_risk_table()),
                     )
 
-                    try:
-                        if entity.entity_type in (
-                            EntityTypes.HOSTNAME,
-                            EntityTypes.DOMAIN,
-                        ):
-                            entity_id = entity.identifier.lower()
-                            entity_report = recorded_future_manager.get_host_reputation(
-                                entity_id,
-                                include_links,
-                                collective_insights_enabled,
-                            )
-                        elif entity.entity_type == EntityTypes.CVE:
-                            entity_id = entity.identifier.upper()
-                            entity_report = recorded_future_manager.get_cve_reputation(
-                                entity_id,
-                                include_links,
-                                collective_insights_enabled,
-                            )
-                        elif entity.entity_type == EntityTypes.FILEHASH:
-                            entity_id = entity.identifier.lower()
-                            entity_report = recorded_future_manager.get_hash_reputation(
-                                entity_id,
-                                include_links,
-                                collective_insights_enabled,
-                            )
-                        elif entity.entity_type == EntityTypes.ADDRESS:
-                            entity_report = recorded_future_manager.get_ip_reputation(
-                                entity.identifier,
-                                include_links,
-                                collective_insights_enabled,
-                            )
-                        elif entity.entity_type == EntityTypes.URL:
-                            entity_id = entity.identifier.lower()
-                            entity_report = recorded_future_manager.get_url_reputation(
-                                entity_id,
-                                include_links,
-                                collective_insights_enabled,
-                            )
-                        else:
-                            raise RecordedFutureCommonError(
-                                "Given entity type: {} can't be enriched by Recorded "
-                                "Future. Please choose one of the following entity types: "
-                                "{}".format(
-                                    entity.entity_type,
-                                    ",".join(SUPPORTED_ENTITY_TYPES_ENRICHMENT),
-                                ),
-                            )
-
-                        json_results[entity.identifier] = entity_report.to_json()
+                    if include_links and entity_report.links:
                         self.siemplify.result.add_data_table(
-                            title=f"Report for: {entity.identifier}",
-                            data_table=construct_csv(entity_report.to_overview_table()),
-                        )
-                        self.siemplify.result.add_data_table(
-                            title=f"Triggered Risk Rules for: {entity.identifier}",
-                            data_table=construct_csv(entity_report.to_risk_table()),
+                            title=f"Links For: {entity.identifier}",
+                            data_table=construct_csv(
+                                entity_report.to_links_table(),
+                            ),
                         )
+                    enrichment_data = entity_report.to_enrichment_data()
 
-                        if include_links and entity_report.links:
-                            self.siemplify.result.add_data_table(
-                                title=f"Links For: {entity.identifier}",
-                                data_table=construct_csv(
-                                    entity_report.to_links_table(),
-                                ),
-                            )
-                        enrichment_data = entity_report.to_enrichment_data()
-
-                        score = entity_report.score
-                        if not score:
-                            # If there is no score in the report, the default score will be used
-                            score = DEFAULT_SCORE
-                            self.siemplify.LOGGER.info(
-                                f"There is no score for the entity {entity.identifier}, "
-                                f"the default score: {DEFAULT_SCORE} will be used.",
-                            )
-
-                        if int(score) > threshold:
-                            entity.is_suspicious = True
-                            is_risky = True
-                            self.siemplify.create_case_insight(
-                                PROVIDER_NAME,
-                                "Enriched by Reported Future",
-                                self.get_insight_content(
-                                    entity_report,
-                                    enrichment_data,
-                                ),
-                                entity.identifier,
-                                1,
-                                1,
-                            )
-
-                        if entity_report.intelCard is not None:
-                            self.siemplify.result.add_link(
-                                f"Web Report Link for {entity.identifier}: ",
-                                entity_report.intelCard,
-                            )
-
-                        entity.additional_properties.update(enrichment_data)
-                        entity.is_enriched = True
-                        entity.is_risky = is_risky
-                        successful_entities.append(entity)
+                    score = entity_report.score
+                    if not score:
+                        # If there is no score in the report, the default score will be used
+                        score = DEFAULT_SCORE
                         self.siemplify.LOGGER.info(
-                            f"Finished processing entity {entity.identifier}",
+                            f"There is no score for the entity {entity.identifier}, "
+                            f"the default score: {DEFAULT_SCORE} will be used.",
                         )
-                    except RecordedFutureNotFoundError as e:
-                        not_found_entities.append(entity)
-                        self.siemplify.LOGGER.error(
-                            f"An 404 error occurred on entity {entity.identifier}",
+
+                    if int(score) > threshold:
+                        entity.is_suspicious = True
+                        is_risky = True
+                        self.siemplify.create_case_insight(
+                            PROVIDER_NAME,
+                            "Enriched by Reported Future",
+                            self.get_insight_content(
+                                entity_report,
+                                enrichment_data,
+                            ),
+                            entity.identifier,
+                            1,
+                            1,
                         )
-                        self.siemplify.LOGGER.exception(e)
-                    except Exception as e:
-                        failed_entities.append(entity)
-                        self.siemplify.LOGGER.error(
-                            f"An error occurred on entity {entity.identifier}",
+
+                    if entity_report.intelCard is not None:
+                        self.siemplify.result.add_link(
+                            f"Web Report Link for {entity.identifier}: ",
+                            entity_report.intelCard,
                         )
-                        self.siemplify.LOGGER.exception(e)
+
+                    entity.additional_properties.update(enrichment_data)
+                    entity.is_enriched = True
+                    entity.is_risky = is_risky
+                    successful_entities.append(entity)
+                    self.siemplify.LOGGER.info(
+                        f"Finished processing entity {entity.identifier}",
+                    )
+                except RecordedFutureNotFoundError as e:
+                    not_found_entities.append(entity)
+                    self.siemplify.LOGGER.error(
+                        f"An 404 error occurred on entity {entity.identifier}",
+                    )
+                    self.siemplify.LOGGER.exception(e)
+                except RecordedFutureTimeoutError as e:
+                    timed_out_entities.append(entity)
+                    status = EXECUTION_STATE_TIMEDOUT
+                    self.siemplify.LOGGER.error(e)
+                except Exception as e:
+                    failed_entities.append(entity)
+                    self.siemplify.LOGGER.error(
+                        f"An error occurred on entity {entity.identifier}",
+                    )
+                    self.siemplify.LOGGER.exception(e)
 
             if successful_entities:
                 entities_names = [entity.identifier for entity in successful_entities]
@@ -283,10 +294,16 @@ class RecordedFutureCommon:
                     "\n".join([entity.identifier for entity in failed_entities]),
                 )
 
+            if timed_out_entities:
+                output_message += "Timed out processing entities: \n{}\n".format(
+                    "\n".join([entity.identifier for entity in timed_out_entities]),
+                )
+
             if (
                 not failed_entities
                 and not not_found_entities
                 and not successful_entities
+                and not timed_out_entities
             ):
                 output_message = "No entities were enriched."
 
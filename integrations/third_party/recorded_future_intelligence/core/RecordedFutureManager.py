@@ -20,6 +20,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
 from psengine.analyst_notes import AnalystNoteMgr, AnalystNotePublishError
@@ -51,6 +52,7 @@ from .constants import (
     ALERT_ID_FIELD,
     CLASSIC_ALERT_DEFAULT_STATUSES,
     CONNECTOR_DATETIME_FORMAT,
+    ENRICHMENT_MAX_WORKERS,
     ENTITY_PREFIX_TYPE_MAP,
     PLAYBOOK_ALERT_API_LIMIT,
 )
@@ -58,6 +60,7 @@ from .exceptions import (
     RecordedFutureDataModelTransformationLayerError,
     RecordedFutureManagerError,
     RecordedFutureNotFoundError,
+    RecordedFutureTimeoutError,
 )
 from .RecordedFutureDataModelTransformationLayer import (
     build_alert,
@@ -82,6 +85,14 @@ ENDPOINTS = {
     "analyst_note": "v2/analystnote/publish",
     "update_alert": "/v2/alert/update",
 }
+# Lookup fields and report builder of every IOC type
+IOC_REPUTATION_MAP = {
+    "ip": (["intelCard", "location"], build_siemplify_ip_object),
+    "vulnerability": (["intelCard"], build_siemplify_cve_object),
+    "hash": (["intelCard", "hashAlgorithm"], build_siemplify_hash_object),
+    "domain": (["intelCard"], build_siemplify_host_object),
+    "url": (["intelCard"], build_siemplify_url_object),
+}
 
 
 class RecordedFutureManager:
@@ -110,8 +121,14 @@ class RecordedFutureManager:
         include_links,
         collective_insights_enabled,
     ):
+        data = self._lookup_ioc(entity, ioc_type, fields, include_links)
+        if collective_insights_enabled:
+            self._submit_insights([self._build_insight(entity, ioc_type)])
+        return data
+
+    def _lookup_ioc(self, entity, ioc_type, fields, include_links):
         if include_links:
-            fields.append("links")
+            fields = [*fields, "links"]
 
         try:
             data = self.enrich.lookup(entity, entity_type=ioc_type, fields=fields)
@@ -120,26 +137,93 @@ class RecordedFutureManager:
 
         if not data.is_enriched:
             raise RecordedFutureNotFoundError
+        return data.content
+
+    def _build_insight(self, entity, ioc_type):
+        insight_data = {
+            "ioc": {"type": ioc_type, "value": entity},
+            "detection": {"type": "playbook", "name": self.siemplify.case.title},
+            "timestamp": datetime.fromtimestamp(
+                self.siemplify.case.creation_time / 1000,
+            ),
+            "incident": {
+                "id": str(self.siemplify.case.identifier),
+                "name": self.siemplify.case.title,
+                "type": "google-secops-threat-detection",
+            },
+        }
+        return Insight(**insight_data)
+
+    def _submit_insights(self, insights):
+        try:
+            self.collective_insights.submit(insight=insights, debug=False)
+        except (ValidationError, CollectiveInsightsError) as err:
+            self.siemplify.LOGGER.error(err)
+
+    def get_reputations(
+        self,
+        iocs,
+        include_links,
+        collective_insights_enabled,
+        timeout=None,
+    ):
+        """Get the reputation of several entities, with up to ENRICHMENT_MAX_WORKERS
+        concurrent lookups. Every entity is looked up once, and the Collective
+        Insights of all the enriched entities are submitted together.
+        :param iocs: {list} (IOC type, entity) pairs, where the IOC type is one of
+            IOC_REPUTATION_MAP
+        :param include_links {bool} False when links shouldn't be included
+        :param collective_insights_enabled {bool} True when Collective Insights should be submitted
+        :param timeout: {float} Seconds to wait for the lookups, None to wait for all of
+            them. Lookups that didn't finish in time are reported as
+            RecordedFutureTimeoutError and the ones that didn't start are cancelled.
+        :return: {dict} The report of every (IOC type, entity) pair, or the exception
+            raised while looking it up.
+        """
+        iocs = list(dict.fromkeys(iocs))
+        executor = ThreadPoolExecutor(max_workers=ENRICHMENT_MAX_WORKERS)
+        try:
+            futures = [
+                executor.submit(
+                    self._lookup_ioc,
+                    entity,
+                    ioc_type,
+                    IOC_REPUTATION_MAP[ioc_type][0],
+                    include_links,
+                )
+                for ioc_type, entity in iocs
+            ]
+            done, _ = wait(futures, timeout=timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        reports = {}
+        for (ioc_type, entity), future in zip(iocs, futures):
+            if future not in done:
+                reports[ioc_type, entity] = RecordedFutureTimeoutError(
+                    f"Timed out looking up {entity}",
+                )
+                continue
 
-        if collective_insights_enabled:
-            insight_data = {
-                "ioc": {"type": ioc_type, "value": entity},
-                "detection": {"type": "playbook", "name": self.siemplify.case.title},
-                "timestamp": datetime.fromtimestamp(
-                    self.siemplify.case.creation_time / 1000,
-                ),
-                "incident": {
-                    "id": str(self.siemplify.case.identifier),
-                    "name": self.siemplify.case.title,
-                    "type": "google-secops-threat-detection",
-                },
-            }
-            insight = Insight(**insight_data)
             try:
-                self.collective_insights.submit(insight=insight, debug=False)
-            except (ValidationError, CollectiveInsightsError) as err:
-                self.siemplify.LOGGER.error(err)
-        return data.content
+                reports[ioc_type, entity] = IOC_REPUTATION_MAP[ioc_type][1](
+                    future.result(),
+                    entity,
+                )
+            except Exception as e:
+                reports[ioc_type, entity] = e
+
+        enriched_iocs = [
+            ioc for ioc, report in reports.items() if not isinstance(report, Exception)
+        ]
+        if collective_insights_enabled and enriched_iocs:
+            self._submit_insights(
+                [
+                    self._build_insight(entity, ioc_type)
+                    for ioc_type, entity in enriched_iocs
+                ],
+            )
+        return reports
 
     def get_ip_reputation(self, entity, include_links, collective_insights_enabled):
         """Get IP Reputation, works as a general function for all entity types
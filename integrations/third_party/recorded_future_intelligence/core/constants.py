@@ -70,6 +70,17 @@ SUPPORTED_ENTITY_TYPES_ENRICHMENT = [
     "DOMAIN",
 ]
 SUPPORTED_ENTITY_TYPES_RELATED_ENTITIES = ["ADDRESS", "FILEHASH", "CVE", "HOSTNAME"]
+ENTITY_TYPE_IOC_TYPE_MAP = {
+    EntityTypes.URL: "url",
+    EntityTypes.ADDRESS: "ip",
+    EntityTypes.FILEHASH: "hash",
+    EntityTypes.CVE: "vulnerability",
+    EntityTypes.HOSTNAME: "domain",
+    EntityTypes.DOMAIN: "domain",
+}
+ENRICHMENT_MAX_WORKERS = 10
+# Time left after the lookups to render the results of the enrichment actions
+ENRICHMENT_RENDER_TIME_IN_SEC = 10
 ENRICHMENT_DATA_PREFIX = "RF"
 
 ENTITY_IP = "entity_ips"
@@ -43,5 +43,9 @@ class RecordedFutureUnauthorizedError(Exception):
     """Exception for Unauthorized case."""
 
 
+class RecordedFutureTimeoutError(Exception):
+    """Exception for lookups that didn't finish before the execution deadline."""
+
+
 class SandboxTimeoutError(Exception):
     """Exception for Recorded Future Sandbox Timeout."""
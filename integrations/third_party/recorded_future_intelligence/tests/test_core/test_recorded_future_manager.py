@@ -0,0 +1,151 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ...core import RecordedFutureManager as manager_module
+from ...core.exceptions import (
+    RecordedFutureManagerError,
+    RecordedFutureNotFoundError,
+    RecordedFutureTimeoutError,
+)
+from ...core.RecordedFutureManager import RecordedFutureManager
+
+
+@pytest.fixture(autouse=True)
+def raw_reports(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Return the looked up content as the report of every IOC type."""
+    for ioc_type, (fields, _) in list(manager_module.IOC_REPUTATION_MAP.items()):
+        monkeypatch.setitem(
+            manager_module.IOC_REPUTATION_MAP,
+            ioc_type,
+            (fields, lambda content, entity: content),
+        )
+
+
+class FakeLookupMgr:
+    """Look up entities and record the lookups that were made."""
+
+    def __init__(self, blocked: threading.Event | None = None) -> None:
+        self.blocked: threading.Event | None = blocked
+        self.lookups: list[tuple[str, str]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def lookup(self, entity: str, entity_type: str, fields: list[str]):
+        with self._lock:
+            self.lookups.append((entity_type, entity))
+
+        if entity.startswith("error"):
+            raise manager_module.EnrichmentLookupError("Internal server error")
+        if entity.startswith("slow") and self.blocked is not None:
+            self.blocked.wait(5)
+
+        return SimpleNamespace(
+            is_enriched=not entity.startswith("missing"),
+            content={"entity": entity, "fields": fields},
+        )
+
+
+def create_manager(lookup_mgr: FakeLookupMgr) -> RecordedFutureManager:
+    """Create a manager without connecting to the API."""
+    manager: RecordedFutureManager = RecordedFutureManager.__new__(
+        RecordedFutureManager,
+    )
+    manager.siemplify = MagicMock()
+    manager.enrich = lookup_mgr
+    manager.collective_insights = MagicMock()
+    return manager
+
+
+def test_get_reputations_looks_up_every_entity_once() -> None:
+    lookup_mgr: FakeLookupMgr = FakeLookupMgr()
+    manager: RecordedFutureManager = create_manager(lookup_mgr)
+    iocs: list[tuple[str, str]] = [
+        ("ip", "1.1.1.1"),
+        ("domain", "example.com"),
+        ("ip", "1.1.1.1"),
+        ("domain", "example.com"),
+        ("vulnerability", "CVE-2020-0001"),
+    ]
+
+    reports = manager.get_reputations(
+        iocs,
+        include_links=True,
+        collective_insights_enabled=False,
+    )
+
+    assert Counter(lookup_mgr.lookups) == {
+        ("ip", "1.1.1.1"): 1,
+        ("domain", "example.com"): 1,
+        ("vulnerability", "CVE-2020-0001"): 1,
+    }
+    assert reports["ip", "1.1.1.1"] == {
+        "entity": "1.1.1.1",
+        "fields": ["intelCard", "location", "links"],
+    }
+    assert set(reports) == set(iocs)
+
+
+def test_get_reputations_isolates_entity_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager: RecordedFutureManager = create_manager(FakeLookupMgr())
+    monkeypatch.setattr(
+        manager,
+        "_build_insight",
+        lambda entity, ioc_type: (ioc_type, entity),
+    )
+
+    reports = manager.get_reputations(
+        [
+            ("domain", "error.com"),
+            ("domain", "missing.com"),
+            ("domain", "example.com"),
+        ],
+        include_links=False,
+        collective_insights_enabled=True,
+    )
+
+    assert isinstance(reports["domain", "error.com"], RecordedFutureManagerError)
+    assert isinstance(reports["domain", "missing.com"], RecordedFutureNotFoundError)
+    assert reports["domain", "example.com"]["entity"] == "example.com"
+    manager.collective_insights.submit.assert_called_once_with(
+        insight=[("domain", "example.com")],
+        debug=False,
+    )
+
+
+def test_get_reputations_reports_unfinished_lookups_as_timed_out() -> None:
+    blocked: threading.Event = threading.Event()
+    manager: RecordedFutureManager = create_manager(FakeLookupMgr(blocked))
+
+    try:
+        reports = manager.get_reputations(
+            [("domain", "slow.com"), ("domain", "example.com")],
+            include_links=False,
+            collective_insights_enabled=False,
+            timeout=0.5,
+        )
+    finally:
+        blocked.set()
+
+    assert isinstance(reports["domain", "slow.com"], RecordedFutureTimeoutError)
+    assert reports["domain", "example.com"]["entity"] == "example.com"
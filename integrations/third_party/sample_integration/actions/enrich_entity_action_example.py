@@ -4,13 +4,12 @@ from typing import TYPE_CHECKING
 
 from soar_sdk.SiemplifyUtils import unix_now
 from TIPCommon.base.action import EntityTypesEnum
-from TIPCommon.base.action.base_enrich_action import EnrichAction
 from TIPCommon.base.action.data_models import DataTable
 from TIPCommon.extraction import extract_action_param
 from TIPCommon.transformation import add_prefix_to_dict, construct_csv
 from TIPCommon.validation import ParameterValidator
 
-from ..core.base_action import SampleAction
+from ..core.base_action import BatchEnrichAction
 from ..core.constants import (
     ENRICH_ENTITY_ACTION_EXAMPLE_SCRIPT_NAME,
     SupportedEntitiesEnum,
@@ -29,7 +28,7 @@ SUCCESS_MESSAGE: str = "Successfully enriched the following entities: {}"
 NO_ENTITIES_MESSAGE: str = "No eligible entities were found in the scope of the Alert."
 
 
-class EnrichEntityActionExample(EnrichAction, SampleAction):
+class EnrichEntityActionExample(BatchEnrichAction):
     def __init__(self) -> None:
         super().__init__(ENRICH_ENTITY_ACTION_EXAMPLE_SCRIPT_NAME)
         self.enriched_entities: list[str] = []
@@ -54,14 +53,15 @@ class EnrichEntityActionExample(EnrichAction, SampleAction):
     def _get_entity_types(self) -> list[EntityTypesEnum]:
         return SupportedEntitiesEnum(self.params.entity_type).to_entity_type_enum_list()
 
-    def _perform_enrich_action(self, current_entity: Entity) -> None:
-        self.logger.info(f"Starting enrichment for entity {current_entity.identifier}")
-        timestamp: int = unix_now()
-
-        enrichment_data: dict[str, str] = {
+    def _fetch_entity_data(self, entity: Entity) -> dict[str, str]:
+        return {
             "enriched": "true",
-            "timestamp": str(timestamp),
+            "timestamp": str(unix_now()),
         }
+
+    def _perform_enrich_action(self, current_entity: Entity) -> None:
+        self.logger.info(f"Starting enrichment for entity {current_entity.identifier}")
+        enrichment_data: dict[str, str] = self._get_entity_data(current_entity)
         self.enrichment_data: SingleJson = add_prefix_to_dict(enrichment_data, "SampleIntegration_")
         self.entity_results: dict[str, str] = enrichment_data
         self.data_tables: DataTable = [
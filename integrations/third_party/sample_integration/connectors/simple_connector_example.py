@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+import datetime as dt
 import sys
 from typing import TYPE_CHECKING
 
 from soar_sdk.SiemplifyConnectorsDataModel import AlertInfo
 from TIPCommon.base.connector import Connector
 from TIPCommon.filters import filter_old_alerts
-from TIPCommon.smp_io import read_ids, write_ids
 from TIPCommon.transformation import string_to_multi_value
 from TIPCommon.utils import is_overflowed, is_test_run
 
 from ..core import constants
 from ..core.api.api_client import ApiParameters, SampleApiClient
 from ..core.auth import AuthenticatedSession, SessionAuthenticationParameters, build_auth_params
+from ..core.seen_ids import SeenIds
 
 if TYPE_CHECKING:
     import requests
@@ -64,7 +65,12 @@ class SimpleConnector(Connector):
     def read_context_data(self) -> None:
         """Read context data from the SOAR platform."""
         self.logger.info("Reading already existing alerts ids...")
-        self.context.existing_ids = read_ids(self.siemplify)
+        # Alerts older than the max days backwards can't be fetched again
+        self.context.existing_ids = SeenIds.read(
+            self.siemplify,
+            window=dt.timedelta(days=self.params.max_days_backwards + 1),
+            max_exact_ids=constants.SEEN_IDS_MAX_EXACT_IDS,
+        )
 
     def get_last_success_time(self) -> int:
         return super().get_last_success_time(
@@ -95,7 +101,11 @@ class SimpleConnector(Connector):
         return alerts
 
     def filter_alerts(self, fetched_alerts: list[AlertInfo]) -> list[AlertInfo]:
-        """Filter out alerts that are already processed or overflowed."""
+        """Filter out alerts that are already processed or overflowed.
+
+        The alerts are checked against hashed ids, so filtering takes linear time
+        however many ids the connector has stored.
+        """
         return filter_old_alerts(
             self.siemplify,
             fetched_alerts,
@@ -126,7 +136,7 @@ class SimpleConnector(Connector):
 
     def store_alert_in_cache(self, processed_alert: AlertInfo) -> None:
         """Store the processed alert in the context."""
-        self.context.existing_ids.append(processed_alert.alert_id)
+        self.context.existing_ids.add(processed_alert.alert_id)
 
     def create_alert_info(self, processed_alert: AlertInfo) -> AlertInfo:
         """Create an AlertInfo object from the processed alert."""
@@ -142,7 +152,7 @@ class SimpleConnector(Connector):
             return
 
         self.logger.info("Saving existing ids.")
-        write_ids(self.siemplify, self.context.existing_ids)
+        self.context.existing_ids.write(self.siemplify)
 
 
 if __name__ == "__main__":
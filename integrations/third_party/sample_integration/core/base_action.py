@@ -2,15 +2,36 @@ from __future__ import annotations
 
 import os.path
 from abc import ABC
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
-from TIPCommon.base.action import Action
+from soar_sdk.SiemplifyUtils import unix_now
+from TIPCommon.base.action import Action, EntityTypesEnum
+from TIPCommon.base.action.base_enrich_action import EnrichAction
+from TIPCommon.base.utils import is_native, nativemethod
+from TIPCommon.consts import NUM_OF_MILLI_IN_SEC
+from TIPCommon.smp_time import is_approaching_action_timeout
 
 from ..core.api.api_client import ApiParameters, SampleApiClient
 from ..core.auth import AuthenticatedSession, SessionAuthenticationParameters, build_auth_params
+from ..core.constants import ENTITY_BATCH_SIZE, MAX_ENTITY_WORKERS
+from ..core.exceptions import SampleIntegrationError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     import requests
+    from TIPCommon.types import Entity
+
+
+ENTITY_TYPES_BY_VALUE: Mapping[str, EntityTypesEnum] = {
+    entity_type.value.casefold(): entity_type for entity_type in EntityTypesEnum
+}
+
+FETCH_TIMEOUT_MESSAGE: str = (
+    "The action approached its timeout before the entity's data was fetched"
+)
+NO_ENTITY_DATA_MESSAGE: str = "No data was fetched for entity {}"
 
 
 class SampleAction(Action, ABC):
@@ -61,3 +82,136 @@ class SampleAction(Action, ABC):
     @result_value.setter
     def result_value(self, value: bool) -> None:
         self._result_value = value
+
+
+class BatchEnrichAction(EnrichAction, SampleAction, ABC):
+    """Enrichment action that fetches the data of all its entities up front.
+
+    The entity loop of `Action` handles one entity at a time, so an action that
+    calls the product for every entity is bound by the product's latency. Before
+    the first entity is enriched, this action fetches the data of all the
+    supported entities, with up to `max_workers` concurrent calls of either:
+
+    - `_perform_batch_action`, for every `batch_size` entities, when the product
+      can look up several entities in one request.
+    - `_fetch_entity_data`, for every entity.
+
+    The loop then enriches the entities in their original order, so the JSON
+    results keep that order. `_perform_enrich_action` gets an entity's data with
+    `_get_entity_data`, which raises the error of a failed fetch, so a failed
+    fetch only fails its own entities. Fetches that didn't start before the
+    action approaches its timeout are cancelled.
+    """
+
+    max_workers: int = MAX_ENTITY_WORKERS
+    batch_size: int = ENTITY_BATCH_SIZE
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._executor: ThreadPoolExecutor | None = None
+        self._entity_data: dict[tuple[str, str], Future[Mapping[str, Any]]] = {}
+
+    @nativemethod
+    def _perform_batch_action(self, entities: list[Entity]) -> Mapping[str, Any]:
+        """Fetch the data of several entities in one call.
+
+        This runs in a worker thread, so it must not change the action's state.
+
+        Args:
+            entities: Up to `batch_size` entities.
+
+        Returns:
+            The data of each entity by its identifier.
+        """
+
+    @nativemethod
+    def _fetch_entity_data(self, entity: Entity) -> Any:
+        """Fetch the data of an entity.
+
+        This runs in a worker thread, so it must not change the action's state.
+        """
+
+    def _perform_action(self, current_entity: Entity | None = None) -> None:
+        if self._executor is None:
+            self._fetch_all_entity_data()
+
+        super()._perform_action(current_entity)
+
+    def _get_entity_data(self, entity: Entity) -> Any:
+        """Wait for the data of an entity to be fetched.
+
+        Raises:
+            TimeoutError: If the action times out before the data is fetched.
+            SampleIntegrationError: If no data was fetched for the entity.
+            Exception: Any exception raised while fetching the entity's data.
+        """
+        future: Future[Mapping[str, Any]] = self._entity_data[_get_entity_key(entity)]
+        timeout: float = max(
+            self.soar_action.execution_deadline_unix_time_ms - unix_now(),
+            0,
+        )
+        data: Mapping[str, Any] = future.result(timeout=timeout / NUM_OF_MILLI_IN_SEC)
+        if entity.identifier not in data:
+            raise SampleIntegrationError(NO_ENTITY_DATA_MESSAGE.format(entity.identifier))
+
+        return data[entity.identifier]
+
+    def _handle_entity_loop_timeout(self, current_entity: Entity) -> None:
+        self._cancel_pending_fetches()
+
+    def _finalize(self) -> None:
+        self._cancel_pending_fetches()
+
+    def _fetch_all_entity_data(self) -> None:
+        entities: list[Entity] = [
+            entity
+            for entity in self.soar_action.target_entities
+            if ENTITY_TYPES_BY_VALUE.get(entity.entity_type.casefold(), EntityTypesEnum.GENERIC)
+            in self.entity_types
+        ]
+        fetch: Callable[[list[Entity]], Mapping[str, Any]]
+        if is_native(self._perform_batch_action):
+            batches: list[list[Entity]] = [[entity] for entity in entities]
+            fetch = self._fetch_single_entity_data
+
+        else:
+            batches = [
+                entities[i : i + self.batch_size] for i in range(0, len(entities), self.batch_size)
+            ]
+            fetch = self._perform_batch_action
+
+        self.logger.info(
+            f"Fetching the data of {len(entities)} entities in {len(batches)} calls, "
+            f"with up to {self.max_workers} concurrent calls"
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        for batch in batches:
+            future: Future[Mapping[str, Any]] = self._executor.submit(
+                self._fetch_before_timeout,
+                fetch,
+                batch,
+            )
+            for entity in batch:
+                self._entity_data[_get_entity_key(entity)] = future
+
+    def _fetch_before_timeout(
+        self,
+        fetch: Callable[[list[Entity]], Mapping[str, Any]],
+        batch: list[Entity],
+    ) -> Mapping[str, Any]:
+        if is_approaching_action_timeout(self.soar_action.execution_deadline_unix_time_ms):
+            raise TimeoutError(FETCH_TIMEOUT_MESSAGE)
+
+        return fetch(batch)
+
+    def _fetch_single_entity_data(self, batch: list[Entity]) -> Mapping[str, Any]:
+        (entity,) = batch
+        return {entity.identifier: self._fetch_entity_data(entity)}
+
+    def _cancel_pending_fetches(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_entity_key(entity: Entity) -> tuple[str, str]:
+    return entity.identifier, entity.entity_type
@@ -38,6 +38,10 @@ ENDPOINTS: Mapping[str, str] = {
 REQUEST_TIMEOUT: int = 30
 ASYNC_ACTION_TIMEOUT_THRESHOLD_SEC: int = 60
 
+# Entity Enrichment
+MAX_ENTITY_WORKERS: int = 8
+ENTITY_BATCH_SIZE: int = 50
+
 
 # Parameter Values
 class DDLEnum(Enum):
@@ -129,6 +133,11 @@ SOURCE_GROUPING_IDENTIFIER_FORMAT: str = "{date}:{base}"
 PROCESSED_CASES_LIMIT: int = 100
 MIN_DAYS_BACKWARDS: int = 1
 MAX_DAYS_BACKWARDS: int = 30
+SEEN_IDS_DB_KEY: str = "seen_ids"
+SEEN_IDS_FILE_NAME: str = "seen_ids.txt"
+SEEN_IDS_MAX_EXACT_IDS: int = 50_000
+SEEN_IDS_BLOOM_CAPACITY: int = 100_000
+SEEN_IDS_BLOOM_ERROR_RATE: float = 1e-6
 DATE_KEY: str = "date"
 CASES_WITH_COMMENT_KEY: str = "cases_with_comment"
 COMMENT_PREFIX: str = "Job Added a comment: Exchange Rate:"
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import collections
+import datetime as dt
+import hashlib
+import math
+import struct
+import time
+from typing import TYPE_CHECKING
+
+from TIPCommon.smp_io import read_content, read_ids, write_content
+
+from . import constants
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from TIPCommon.base.interfaces.logger import ScriptLogger
+    from TIPCommon.types import ChronicleSOAR
+
+
+FORMAT_VERSION: int = 1
+HASH_SIZE: int = 6
+_HEADER: struct.Struct = struct.Struct("<BIIB")
+_RUN: struct.Struct = struct.Struct("<qI")
+_BLOOM_HEADER: struct.Struct = struct.Struct("<qIIB")
+
+
+def hash_id(alert_id: object) -> bytes:
+    """Hash an alert id to 48 bits.
+
+    With 100,000 remembered ids, the chance of a new id being mistaken for one of
+    them is about one in three billion, and a hash takes less than a fifth of the
+    space of a UUID.
+    """
+    return hashlib.blake2b(str(alert_id).encode(), digest_size=HASH_SIZE).digest()
+
+
+class BloomFilter:
+    """A bloom filter of id hashes, with the insertion time of its newest id.
+
+    Bloom filters remember ids in a few bits each, at the cost of rarely
+    reporting an id that was never added as seen.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, newest: int = 0) -> None:
+        self.capacity: int = capacity
+        self.num_bits: int = max(8, round(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes: int = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits: bytearray = bytearray((self.num_bits + 7) // 8)
+        self.count: int = 0
+        self.newest: int = newest
+
+    def __contains__(self, id_hash: bytes) -> bool:
+        return all(self.bits[i >> 3] & (1 << (i & 7)) for i in self._positions(id_hash))
+
+    def add(self, id_hash: bytes, timestamp: int) -> None:
+        for i in self._positions(id_hash):
+            self.bits[i >> 3] |= 1 << (i & 7)
+
+        self.count += 1
+        self.newest = max(self.newest, timestamp)
+
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def encode(self) -> bytes:
+        header: bytes = _BLOOM_HEADER.pack(self.newest, self.count, self.num_bits, self.num_hashes)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def decode(cls, data: memoryview, capacity: int) -> tuple[BloomFilter, int]:
+        newest, count, num_bits, num_hashes = _BLOOM_HEADER.unpack_from(data)
+        bloom: BloomFilter = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom.newest = newest
+        end: int = _BLOOM_HEADER.size + (num_bits + 7) // 8
+        if len(data) < end:
+            raise ValueError("The bloom filter is truncated")
+
+        bloom.bits = bytearray(data[_BLOOM_HEADER.size : end])
+        return bloom, end
+
+    def _positions(self, id_hash: bytes) -> list[int]:
+        h1: int = int.from_bytes(id_hash[:3], "little")
+        h2: int = int.from_bytes(id_hash[3:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+
+class SeenIds:
+    """The ids of the alerts a connector already ingested, kept for a time window.
+
+    Ids are kept as 48-bit hashes in a dict ordered by insertion time, so
+    checking an id takes constant time and expired ids are dropped from the
+    front. The store is saved as a compact binary encoding: the hashes in a
+    single column, and the insertion times run-length encoded, since every id
+    ingested by the same run shares its time.
+
+    When `max_exact_ids` is set, the oldest ids beyond it are folded into bloom
+    filters instead of being forgotten, which keeps very large windows within
+    the size of a context row. A filter is dropped once its newest id expires,
+    so its ids may be remembered for longer than the window, but never less.
+
+    A store whose encoding is truncated or otherwise corrupt is logged and loaded
+    as an empty store.
+    """
+
+    def __init__(
+        self,
+        window: dt.timedelta,
+        max_exact_ids: int | None = None,
+        bloom_capacity: int = constants.SEEN_IDS_BLOOM_CAPACITY,
+        bloom_error_rate: float = constants.SEEN_IDS_BLOOM_ERROR_RATE,
+        clock: Callable[[], float] = time.time,
+        logger: ScriptLogger | None = None,
+    ) -> None:
+        self.window: dt.timedelta = window
+        self.max_exact_ids: int | None = max_exact_ids
+        self.bloom_capacity: int = bloom_capacity
+        self.bloom_error_rate: float = bloom_error_rate
+        self._clock: Callable[[], float] = clock
+        self.logger: ScriptLogger | None = logger
+        self._ids: dict[bytes, int] = {}
+        self._blooms: list[BloomFilter] = []
+
+    def __len__(self) -> int:
+        return len(self._ids) + sum(bloom.count for bloom in self._blooms)
+
+    def __contains__(self, alert_id: object) -> bool:
+        id_hash: bytes = hash_id(alert_id)
+        return id_hash in self._ids or any(id_hash in bloom for bloom in self._blooms)
+
+    def add(self, alert_id: object) -> None:
+        """Remember an alert id, from now until the window passes."""
+        id_hash: bytes = hash_id(alert_id)
+        self._ids.pop(id_hash, None)
+        # Keep the timestamps ordered, even if the clock goes back
+        self._ids[id_hash] = max(int(self._clock()), next(reversed(self._ids.values()), 0))
+
+    def update(self, alert_ids: Iterable[object]) -> None:
+        for alert_id in alert_ids:
+            self.add(alert_id)
+
+    def expire(self) -> None:
+        """Forget the ids that were added before the window and fold the oldest
+        exact ids into bloom filters when there are more than `max_exact_ids`.
+        """
+        cutoff: int = int(self._clock() - self.window.total_seconds())
+        expired: list[bytes] = []
+        for id_hash, timestamp in self._ids.items():
+            if timestamp >= cutoff:
+                break
+
+            expired.append(id_hash)
+
+        for id_hash in expired:
+            del self._ids[id_hash]
+
+        self._blooms = [bloom for bloom in self._blooms if bloom.newest >= cutoff]
+        if self.max_exact_ids is None:
+            return
+
+        while len(self._ids) > self.max_exact_ids:
+            id_hash = next(iter(self._ids))
+            self._get_bloom().add(id_hash, self._ids.pop(id_hash))
+
+    def encode(self) -> str:
+        """Expire old ids and encode the store.
+
+        Returns:
+            The store as a base64 string of its binary encoding.
+        """
+        self.expire()
+        # The timestamps are ordered, so counting them gives their runs
+        runs: collections.Counter[int] = collections.Counter(self._ids.values())
+        parts: list[bytes] = [
+            _HEADER.pack(FORMAT_VERSION, len(runs), len(self._ids), len(self._blooms))
+        ]
+        parts.extend(_RUN.pack(timestamp, count) for timestamp, count in runs.items())
+        parts.append(b"".join(self._ids))
+        parts.extend(bloom.encode() for bloom in self._blooms)
+        return base64.b64encode(b"".join(parts)).decode()
+
+    def load(self, raw: str | None) -> None:
+        """Replace the store's ids with the ones in an encoded store.
+
+        Args:
+            raw: A store encoded by `encode`. Empty content is ignored, and
+                invalid content leaves the store empty.
+        """
+        if not raw:
+            return
+
+        try:
+            self._ids, self._blooms = self._decode(raw)
+
+        except (binascii.Error, struct.error, ValueError) as e:
+            self._ids, self._blooms = {}, []
+            if self.logger is not None:
+                self.logger.warn(f"Ignoring the corrupt seen ids store: {e}")
+
+    @classmethod
+    def read(
+        cls,
+        siemplify: ChronicleSOAR,
+        window: dt.timedelta,
+        db_key: str = constants.SEEN_IDS_DB_KEY,
+        file_name: str = constants.SEEN_IDS_FILE_NAME,
+        **kwargs,
+    ) -> SeenIds:
+        """Read a connector's seen ids from its data stream.
+
+        Ids stored as a plain list by `TIPCommon.smp_io.write_ids` are moved into
+        the store the first time it is read.
+
+        Args:
+            siemplify: The connector's SDK object.
+            window: How long ids are remembered.
+            db_key: The context key the store is saved in.
+            file_name: The file the store is saved in on platforms that use files.
+            **kwargs: Other `SeenIds` parameters.
+
+        Returns:
+            The connector's seen ids.
+        """
+        kwargs.setdefault("logger", siemplify.LOGGER)
+        seen_ids: SeenIds = cls(window, **kwargs)
+        raw: str = read_content(siemplify, file_name, db_key, "")
+        if raw:
+            seen_ids.load(raw)
+
+        else:
+            seen_ids.update(read_ids(siemplify))
+
+        seen_ids.expire()
+        return seen_ids
+
+    def write(
+        self,
+        siemplify: ChronicleSOAR,
+        db_key: str = constants.SEEN_IDS_DB_KEY,
+        file_name: str = constants.SEEN_IDS_FILE_NAME,
+    ) -> None:
+        """Write the seen ids to the connector's data stream."""
+        write_content(siemplify, self.encode(), file_name, db_key, "")
+
+    def _decode(self, raw: str) -> tuple[dict[bytes, int], list[BloomFilter]]:
+        data: memoryview = memoryview(base64.b64decode(raw))
+        version, num_runs, num_ids, num_blooms = _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported format version {version}")
+
+        runs_end: int = _HEADER.size + num_runs * _RUN.size
+        ids_end: int = runs_end + num_ids * HASH_SIZE
+        if len(data) < ids_end:
+            raise ValueError("The ids are truncated")
+
+        runs: list[tuple[int, int]] = list(_RUN.iter_unpack(data[_HEADER.size : runs_end]))
+        if sum(count for _, count in runs) != num_ids:
+            raise ValueError("The insertion times don't match the ids")
+
+        timestamps: list[int] = []
+        for timestamp, count in runs:
+            timestamps.extend([timestamp] * count)
+
+        hashes: bytes = bytes(data[runs_end:ids_end])
+        ids: dict[bytes, int] = dict(
+            zip(
+                [hashes[i : i + HASH_SIZE] for i in range(0, len(hashes), HASH_SIZE)],
+                timestamps,
+            )
+        )
+        blooms: list[BloomFilter] = []
+        offset: int = ids_end
+        for _ in range(num_blooms):
+            bloom, size = BloomFilter.decode(data[offset:], self.bloom_capacity)
+            blooms.append(bloom)
+            offset += size
+
+        return ids, blooms
+
+    def _get_bloom(self) -> BloomFilter:
+        if not self._blooms or self._blooms[-1].is_full():
+            self._blooms.append(BloomFilter(self.bloom_capacity, self.bloom_error_rate))
+
+        return self._blooms[-1]
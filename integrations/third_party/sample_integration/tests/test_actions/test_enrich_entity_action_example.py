@@ -19,6 +19,10 @@ DEFAULT_PARAMETERS: dict[str, str] = {
 }
 USERNAME_ENTITY_ID: str = "abcd@x.com"
 USERNAME_ENTITY_1: Entity = create_entity(USERNAME_ENTITY_ID, EntityTypesEnum.USER)
+IP_ENTITY_ID: str = "10.0.0.1"
+IP_ENTITY_1: Entity = create_entity(IP_ENTITY_ID, EntityTypesEnum.ADDRESS)
+HASH_ENTITY_ID: str = "d41d8cd98f00b204e9800998ecf8427e"
+HASH_ENTITY_1: Entity = create_entity(HASH_ENTITY_ID, EntityTypesEnum.FILE_HASH)
 SCRIPT_DEADLINE_TIME: datetime.datetime = datetime.datetime.now() + datetime.timedelta(minutes=10)
 
 
@@ -52,3 +56,34 @@ def test_enrich_entity_action_example_success(
     assert len(script_session.request_history) == 1
     assert action_output.results.output_message == success_output_msg
     assert action_output.results.execution_state == ExecutionState.COMPLETED
+
+
+@set_metadata(
+    integration_config_file_path=CONFIG_PATH,
+    parameters=DEFAULT_PARAMETERS,
+    entities=[IP_ENTITY_1, USERNAME_ENTITY_1, HASH_ENTITY_1],
+    input_context={
+        "execution_deadline_unix_time_ms": int(
+            SCRIPT_DEADLINE_TIME.timestamp() * NUM_OF_MILLI_IN_SEC
+        )
+    },
+)
+def test_enrich_entity_action_example_keeps_entities_order(
+    script_session: VatComplySession,
+    action_output: MockActionOutput,
+    vatcomply: VatComply,
+) -> None:
+    # Arrange
+    today: str = datetime.date.today().isoformat()
+    MOCK_RATES_DEFAULT["date"]: str = today
+    vatcomply.set_rates(MOCK_RATES_DEFAULT)
+    entity_ids: list[str] = [IP_ENTITY_ID, USERNAME_ENTITY_ID.upper(), HASH_ENTITY_ID.upper()]
+    success_output_msg = f"Successfully enriched the following entities: {', '.join(entity_ids)}"
+
+    # Act
+    enrich_entity_action_example.main()
+
+    # Assert
+    assert len(script_session.request_history) == 1
+    assert action_output.results.output_message == success_output_msg
+    assert action_output.results.execution_state == ExecutionState.COMPLETED
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import base64
 import datetime
 import pathlib
 import sys
 from typing import TYPE_CHECKING
+from unittest import mock
 
+import pytest
 from integration_testing.common import set_is_test_run_to_true
 from integration_testing.platform.external_context import (
     ExternalContextRowKey,
@@ -16,6 +19,7 @@ from TIPCommon.data_models import DatabaseContextType
 from TIPCommon.utils import is_test_run
 
 from sample_integration.connectors.simple_connector_example import SimpleConnector
+from sample_integration.core.seen_ids import SeenIds
 from sample_integration.tests.common import CONFIG, INTEGRATION_PATH, MOCK_RATES_DEFAULT
 from sample_integration.tests.core.product import VatComply
 from sample_integration.tests.core.session import VatComplySession
@@ -92,3 +96,75 @@ def test_sample_connector_example_with_no_external_context(
         identifier=None,
     )
     assert row_key not in external_context
+
+
+def test_seen_ids_round_trip_and_expiry() -> None:
+    now: list[float] = [1_000_000.0]
+    seen_ids: SeenIds = SeenIds(datetime.timedelta(hours=1), clock=lambda: now[0])
+    seen_ids.update(["old-1", "old-2"])
+    now[0] += 60 * 60
+    seen_ids.add("new")
+
+    loaded: SeenIds = SeenIds(datetime.timedelta(hours=1), clock=lambda: now[0])
+    loaded.load(seen_ids.encode())
+
+    assert "new" in loaded
+    assert "old-1" in loaded
+    assert "unknown" not in loaded
+
+    now[0] += 1
+    loaded.expire()
+
+    assert len(loaded) == 1
+    assert "new" in loaded
+    assert "old-1" not in loaded
+
+
+def test_seen_ids_folds_oldest_ids_into_bloom_filters() -> None:
+    seen_ids: SeenIds = SeenIds(datetime.timedelta(days=1), max_exact_ids=10)
+    alert_ids: list[str] = [f"alert-{i}" for i in range(100)]
+    seen_ids.update(alert_ids)
+
+    loaded: SeenIds = SeenIds(datetime.timedelta(days=1))
+    loaded.load(seen_ids.encode())
+
+    assert len(loaded) == len(alert_ids)
+    assert all(alert_id in loaded for alert_id in alert_ids)
+
+
+def test_seen_ids_ignores_invalid_content() -> None:
+    seen_ids: SeenIds = SeenIds(datetime.timedelta(days=1))
+    seen_ids.load("not a store")
+
+    assert len(seen_ids) == 0
+
+
+def _truncate(encoded: str, size: int) -> str:
+    return base64.b64encode(base64.b64decode(encoded)[:size]).decode()
+
+
+@pytest.mark.parametrize("removed_bytes", [1, 6, 100])
+def test_seen_ids_starts_empty_from_truncated_content(removed_bytes: int) -> None:
+    seen_ids: SeenIds = SeenIds(datetime.timedelta(days=1), max_exact_ids=10)
+    seen_ids.update(f"alert-{i}" for i in range(20))
+    encoded: bytes = base64.b64decode(seen_ids.encode())
+    logger: mock.Mock = mock.Mock()
+
+    loaded: SeenIds = SeenIds(datetime.timedelta(days=1), logger=logger)
+    loaded.add("previous")
+    loaded.load(_truncate(seen_ids.encode(), len(encoded) - removed_bytes))
+
+    assert len(loaded) == 0
+    logger.warn.assert_called_once()
+
+
+def test_seen_ids_starts_empty_from_truncated_exact_ids() -> None:
+    seen_ids: SeenIds = SeenIds(datetime.timedelta(days=1))
+    seen_ids.update(f"alert-{i}" for i in range(20))
+    logger: mock.Mock = mock.Mock()
+
+    loaded: SeenIds = SeenIds(datetime.timedelta(days=1), logger=logger)
+    loaded.load(_truncate(seen_ids.encode(), 40))
+
+    assert len(loaded) == 0
+    logger.warn.assert_called_once()
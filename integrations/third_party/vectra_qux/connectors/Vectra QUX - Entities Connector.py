@@ -23,9 +23,15 @@ from ..core.constants import (
     DEFAULT_ENTITY_TYPE,
     DEFAULT_TIME_FRAME,
     DETECTION_CATEGORIES,
+    ENTITY_IDS_BATCH_SIZE,
     MAX_IDS,
 )
-from ..core.UtilsManager import validate_integer, validate_limit_param
+from ..core.UtilsManager import (
+    chunk_list,
+    iter_prefetched,
+    validate_integer,
+    validate_limit_param,
+)
 from ..core.VectraQUXExceptions import VectraQUXException
 from ..core.VectraQUXManager import VectraQUXManager
 
@@ -95,6 +101,55 @@ def validate_input_params(
     )
 
 
+def fetch_entity_pages(vectra_manager, entity_pages, entity_type):
+    """Fetch the detections of every page of entities in bulk.
+
+    Yields:
+        tuple: The entities of a page and their detections by entity ID.
+
+    """
+    for entities in entity_pages:
+        yield entities, vectra_manager.get_detections_by_entity(entities, entity_type)
+
+
+def iter_entities(
+    siemplify,
+    vectra_manager,
+    entity_pages,
+    entity_type,
+    is_test_run,
+    should_stop=None,
+):
+    """Iterate over the entities with their detections.
+
+    The detections of the next page of entities are fetched while the current one
+    is processed. If fetching them fails, the iteration stops so the processed
+    entities are saved. The next page is not fetched once should_stop returns
+    True.
+
+    Yields:
+        tuple: An entity and its active detections.
+
+    """
+    try:
+        for entities, detections in iter_prefetched(
+            fetch_entity_pages(vectra_manager, entity_pages, entity_type),
+            should_stop=should_stop,
+        ):
+            for entity in entities:
+                yield entity, detections.get(entity.id, [])
+
+    except Exception as e:
+        if is_test_run:
+            raise
+
+        siemplify.LOGGER.error(
+            "Failed to fetch entity detections. Any further entities will not be "
+            "processed",
+        )
+        siemplify.LOGGER.exception(e)
+
+
 @output_handler
 def main(is_test_run):
     processed_alerts = []
@@ -287,7 +342,23 @@ def main(is_test_run):
             key=lambda x: datetime.strptime(x.last_timestamp, "%Y-%m-%dT%H:%M:%SZ"),
         )
 
-        for alert in filtered_alerts:
+        environment_common = GetEnvironmentCommonFactory.create_environment_manager(
+            siemplify,
+            environment_field_name,
+            environment_regex_pattern,
+        )
+
+        for alert, detections in iter_entities(
+            siemplify,
+            vectra_manager,
+            chunk_list(filtered_alerts, ENTITY_IDS_BATCH_SIZE),
+            entity_type,
+            is_test_run,
+            should_stop=lambda: is_approaching_timeout(
+                connector_starting_time,
+                python_process_timeout,
+            ),
+        ):
             siemplify.LOGGER.info(f"Started processing entity {alert.id}")
             try:
                 if is_approaching_timeout(
@@ -299,26 +370,12 @@ def main(is_test_run):
                     )
                     break
 
-                detections = vectra_manager.list_entity_detections(
-                    alert.id,
-                    entity_type,
-                    limit=0,
-                )
-
                 if not detections:
                     siemplify.LOGGER.info(
                         f"No detection found. Skipping entity {alert.id}",
                     )
                     continue
 
-                environment_common = (
-                    GetEnvironmentCommonFactory.create_environment_manager(
-                        siemplify,
-                        environment_field_name,
-                        environment_regex_pattern,
-                    )
-                )
-
                 alert_info = alert.get_alert_info(
                     AlertInfo(),
                     detections,
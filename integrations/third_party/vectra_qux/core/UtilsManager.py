@@ -4,6 +4,7 @@ import datetime
 import json
 import os
 import re
+import threading
 
 from soar_sdk.SiemplifyUtils import (
     convert_datetime_to_unix_time,
@@ -478,6 +479,90 @@ def get_alert_id(entity_id, last_timestamp, entity_type):
     return f"{entity_type}#{entity_id}-{last_timestamp}"
 
 
+# Connector functions
+def chunk_list(items, size):
+    """Split a list into consecutive chunks.
+
+    Args:
+        items (list): The list to split.
+        size (int): The maximum size of a chunk.
+
+    Returns:
+        list: The chunks of the list.
+
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class _Prefetch:
+    """Fetch the next item of an iterator in a daemon thread.
+
+    Unlike the workers of a ThreadPoolExecutor, daemon threads are not joined
+    when the interpreter exits, so a fetch that is still running when the
+    iteration stops doesn't delay the end of the script.
+    """
+
+    DONE = object()
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+        self._item = None
+        self._error = None
+        self._thread = threading.Thread(target=self._fetch, daemon=True)
+        self._thread.start()
+
+    def _fetch(self):
+        try:
+            self._item = next(self._iterator, self.DONE)
+        except Exception as e:
+            self._error = e
+
+    def result(self):
+        """Wait for the item.
+
+        Returns:
+            The next item of the iterator, or DONE if it is exhausted.
+
+        Raises:
+            Exception: The exception raised while fetching the item.
+
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+        return self._item
+
+
+def iter_prefetched(iterable, should_stop=None):
+    """Iterate over an iterable while its next item is fetched in the background.
+
+    Args:
+        iterable (iterable): The iterable to iterate over, e.g. a generator that
+            fetches a page of results for every item.
+        should_stop (callable): Called before the next item is fetched. If it
+            returns True, e.g. because the script's deadline is near, the next
+            item is not fetched and the iteration stops after the current one.
+
+    Yields:
+        The items of the iterable, in order.
+
+    """
+    iterator = iter(iterable)
+    prefetch = _Prefetch(iterator)
+    while True:
+        item = prefetch.result()
+        if item is _Prefetch.DONE:
+            return
+
+        if should_stop is not None and should_stop():
+            yield item
+            return
+
+        prefetch = _Prefetch(iterator)
+        yield item
+
+
 # Job functions
 def get_last_success_time_for_job(
     siemplify,
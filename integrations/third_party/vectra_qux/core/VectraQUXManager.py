@@ -19,6 +19,7 @@ from .constants import (
     DESCRIBE_ENTITY_API_NAME,
     DOWANLOAD_PCAP_API_NAME,
     ENDPOINTS,
+    ENTITY_IDS_BATCH_SIZE,
     ENTITY_SEARCH_API_NAME,
     GROUP_TYPE_FIELD_MAPPING,
     LIST_ASSIGNMENTS_API_NAME,
@@ -41,7 +42,7 @@ from .constants import (
     VECTRA_DATETIME_FORMAT,
     WAIT_TIME_FOR_RETRY,
 )
-from .UtilsManager import HandleExceptions, get_alert_id
+from .UtilsManager import HandleExceptions, chunk_list, get_alert_id
 from .VectraQUXExceptions import FileNotFoundException, RateLimitException
 from .VectraQUXParser import VectraQUXParser
 
@@ -320,6 +321,50 @@ class VectraQUXManager:
         response_list = [self.parser.build_detection_object(res) for res in response]
         return response_list
 
+    def get_detections_by_entity(self, entities, entity_type, state="active"):
+        """Retrieves the detections of several entities, in batches of entity IDs.
+
+        Args:
+            entities (list): The Entity objects to retrieve the detections of.
+            entity_type (str): The type of the entities (account or host).
+            state (str): The state of the detections to retrieve, default is "active".
+
+        Returns:
+            dict: The lists of Detection objects by entity ID, in the order the API
+                returned them.
+
+        Raises:
+            VectraQUXException: If the API returns an error.
+
+        """
+        request_url = self._get_full_url(LIST_ENTITY_DETECTIONS_API_NAME)
+        src_field = "src_linked_account" if entity_type == "account" else "src_host"
+        entity_ids = {str(entity.id): entity.id for entity in entities}
+        detections_by_entity = {}
+        for ids in chunk_list(list(entity_ids), ENTITY_IDS_BATCH_SIZE):
+            params = {
+                "query_string": (
+                    f"detection.{src_field}.id:({' OR '.join(ids)}) "
+                    f'AND detection.state:"{state}"'
+                ),
+            }
+            response = self._paginator(
+                LIST_ENTITY_DETECTIONS_API_NAME,
+                "GET",
+                request_url,
+                limit=0,
+                params=params,
+            )
+            for res in response:
+                source = res.get(src_field) or {}
+                entity_id = entity_ids.get(str(source.get("id")))
+                if entity_id is not None:
+                    detections_by_entity.setdefault(entity_id, []).append(
+                        self.parser.build_detection_object(res),
+                    )
+
+        return detections_by_entity
+
     def get_assignment_list(self, query_params, max_assignment_to_return):
         """Get a list of assignments based on specified query parameters and up to a specified limit.
 
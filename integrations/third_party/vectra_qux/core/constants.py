@@ -50,6 +50,7 @@ VECTRA_DATETIME_FORMAT = "%Y-%m-%dT%H%M"
 FIRST_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 DEFAULT_PAGE_SIZE = 1000
+ENTITY_IDS_BATCH_SIZE = 100
 RETRY_COUNT = 3
 WAIT_TIME_FOR_RETRY = 5
 DEFAULT_RESULTS_LIMIT = 10000000
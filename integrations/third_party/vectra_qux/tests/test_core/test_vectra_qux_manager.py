@@ -0,0 +1,96 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ...core import VectraQUXManager as manager_module
+from ...core.VectraQUXManager import VectraQUXManager
+from ...core.VectraQUXParser import VectraQUXParser
+
+API_ROOT = "https://vectra.example.com"
+
+
+def create_manager() -> VectraQUXManager:
+    """Create a manager without connecting to the API."""
+    manager: VectraQUXManager = VectraQUXManager.__new__(VectraQUXManager)
+    manager.api_root = API_ROOT
+    manager.parser = VectraQUXParser()
+    manager.siemplify = MagicMock()
+    return manager
+
+
+def detection_json(detection_id: int, src_field: str, entity_id: int) -> dict:
+    return {
+        "id": detection_id,
+        "state": "active",
+        "category": "COMMAND & CONTROL",
+        "detection_type": "Hidden HTTPS Tunnel",
+        "last_timestamp": "2025-01-01T00:00:00Z",
+        "threat": 50,
+        "src_account": None,
+        "src_host": None,
+        src_field: {
+            "id": entity_id,
+            "name": f"entity-{entity_id}",
+            "url": f"{API_ROOT}/api/v2.5/entities/{entity_id}",
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("entity_type", "src_field"),
+    [("account", "src_linked_account"), ("host", "src_host")],
+)
+def test_get_detections_by_entity_maps_source_entity(
+    monkeypatch: pytest.MonkeyPatch,
+    entity_type: str,
+    src_field: str,
+) -> None:
+    monkeypatch.setattr(manager_module, "ENTITY_IDS_BATCH_SIZE", 2)
+    manager: VectraQUXManager = create_manager()
+    manager._paginator = MagicMock(
+        side_effect=[
+            [
+                detection_json(11, src_field, 1),
+                detection_json(12, src_field, 2),
+                detection_json(13, src_field, 1),
+            ],
+            [detection_json(14, src_field, 4)],
+        ],
+    )
+    entities: list[SimpleNamespace] = [SimpleNamespace(id=i) for i in (1, 2, 3)]
+
+    detections = manager.get_detections_by_entity(entities, entity_type)
+
+    assert {
+        entity_id: [detection.detection_id for detection in entity_detections]
+        for entity_id, entity_detections in detections.items()
+    } == {1: [11, 13], 2: [12]}
+    assert [call.kwargs["params"] for call in manager._paginator.call_args_list] == [
+        {
+            "query_string": (
+                f'detection.{src_field}.id:(1 OR 2) AND detection.state:"active"'
+            ),
+        },
+        {
+            "query_string": (
+                f'detection.{src_field}.id:(3) AND detection.state:"active"'
+            ),
+        },
+    ]
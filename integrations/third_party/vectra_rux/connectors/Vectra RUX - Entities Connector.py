@@ -23,7 +23,11 @@ from ..core.constants import (
     DEFAULT_TIME_FRAME,
     MAX_IDS,
 )
-from ..core.UtilsManager import validate_integer, validate_limit_param
+from ..core.UtilsManager import (
+    iter_prefetched,
+    validate_integer,
+    validate_limit_param,
+)
 from ..core.VectraRUXExceptions import VectraRUXException
 from ..core.VectraRUXManager import VectraRUXManager
 
@@ -57,6 +61,66 @@ def validate_input_params(entity_type, hours_backwards, limit):
     return entity_type, hours_backwards, limit
 
 
+def fetch_entity_pages(siemplify, vectra_manager, entity_pages, entity_type):
+    """Fetch the detections and assignments of every page of entities in bulk.
+
+    Assignments are only fetched for the entities that have active detections.
+
+    Yields:
+        tuple: The entities of a page, their detections and their assignments by
+            entity ID.
+
+    """
+    for entities in entity_pages:
+        siemplify.LOGGER.info(f"Found {len(entities)} entities.")
+        detections = vectra_manager.get_detections_by_entity(entities)
+        assignments = vectra_manager.get_assignments_by_entity(
+            [entity for entity in entities if detections.get(entity.entity_id)],
+            entity_type,
+        )
+        yield entities, detections, assignments
+
+
+def iter_entities(
+    siemplify,
+    vectra_manager,
+    entity_pages,
+    entity_type,
+    is_test_run,
+    should_stop=None,
+):
+    """Iterate over the entities with their detections and assignments.
+
+    The next page of entities is fetched while the current one is processed. If
+    fetching it fails, the iteration stops so the processed entities are saved.
+    The next page is not fetched once should_stop returns True.
+
+    Yields:
+        tuple: An entity, its active detections and its assignments.
+
+    """
+    try:
+        for entities, detections, assignments in iter_prefetched(
+            fetch_entity_pages(siemplify, vectra_manager, entity_pages, entity_type),
+            should_stop=should_stop,
+        ):
+            for entity in entities:
+                yield (
+                    entity,
+                    detections.get(entity.entity_id, []),
+                    assignments.get(entity.entity_id, []),
+                )
+
+    except Exception as e:
+        if is_test_run:
+            raise
+
+        siemplify.LOGGER.error(
+            "Failed to fetch entities. Any further entities will not be processed",
+        )
+        siemplify.LOGGER.exception(e)
+
+
 @output_handler
 def main(is_test_run):
     processed_alerts = []
@@ -180,7 +244,12 @@ def main(is_test_run):
             siemplify=siemplify,
         )
 
-        filtered_alerts = vectra_manager.list_entities_by_filters(
+        environment_common = GetEnvironmentCommonFactory.create_environment_manager(
+            siemplify,
+            environment_field_name,
+            environment_regex_pattern,
+        )
+        entity_pages = vectra_manager.iter_entities_by_filters(
             existing_ids=set(existing_ids),
             entity_type=entity_type,
             start_time=start_time,
@@ -189,9 +258,17 @@ def main(is_test_run):
             specific_tag=specific_tag,
         )
 
-        siemplify.LOGGER.info(f"Found {len(filtered_alerts)} entities.")
-
-        for alert in filtered_alerts:
+        for alert, detections, assignments in iter_entities(
+            siemplify,
+            vectra_manager,
+            entity_pages,
+            entity_type,
+            is_test_run,
+            should_stop=lambda: is_approaching_timeout(
+                connector_starting_time,
+                python_process_timeout,
+            ),
+        ):
             siemplify.LOGGER.info(f"Started processing entity {alert.entity_id}")
             try:
                 if is_approaching_timeout(
@@ -203,35 +280,13 @@ def main(is_test_run):
                     )
                     break
 
-                if alert.detection_ids:
-                    detections = vectra_manager.list_entity_detections(
-                        detection_ids=alert.detection_ids,
-                        state="active",
-                        limit=0,
-                    )
-                else:
-                    detections = []
-
                 if not detections:
                     siemplify.LOGGER.info(
                         f"No detection found. Skipping entity {alert.entity_id}",
                     )
                     continue
 
-                # Get assignments
-                _, assignments = vectra_manager.get_assignment_list(
-                    query_params={f"{entity_type}s": alert.entity_id},
-                    max_assignment_to_return=0,
-                )
                 alert.raw_data["assignments"] = assignments
-                environment_common = (
-                    GetEnvironmentCommonFactory.create_environment_manager(
-                        siemplify,
-                        environment_field_name,
-                        environment_regex_pattern,
-                    )
-                )
-
                 alert_info = alert.get_alert_info(
                     AlertInfo(),
                     detections,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import copy
+import threading
 import time
 import urllib.parse
 from datetime import datetime
@@ -17,8 +17,10 @@ from .constants import (
     DEFAULT_RESULTS_LIMIT,
     DESCRIBE_DETECTION_API_NAME,
     DESCRIBE_ENTITY_API_NAME,
+    DETECTION_IDS_BATCH_SIZE,
     DOWNLOAD_PCAP_API_NAME,
     ENDPOINTS,
+    ENTITY_IDS_BATCH_SIZE,
     FIRST_TIMESTAMP_FORMAT,
     GROUP_TYPE_FIELD_MAPPING,
     LIST_ASSIGNMENTS_API_NAME,
@@ -40,7 +42,7 @@ from .constants import (
     UPDATE_GROUP_MEMBERS_API_NAME,
     WAIT_TIME_FOR_RETRY,
 )
-from .UtilsManager import HandleExceptions, get_alert_id
+from .UtilsManager import HandleExceptions, chunk_list, get_alert_id
 from .VectraRUXExceptions import (
     FileNotFoundException,
     RateLimitException,
@@ -82,6 +84,7 @@ class VectraRUXManager:
         )
         self.stored_client_id = None
         self.api_rate_exception = "API rate limit exceeded."
+        self.token_lock = threading.Lock()
         self.generate_token()
 
     def _get_full_url(self, url_id, **kwargs):
@@ -188,6 +191,7 @@ class VectraRUXManager:
             RateLimitException: If the API rate limit is exceeded.
 
         """
+        access_token = self.access_token
         response = self.session.request(
             method,
             url,
@@ -214,10 +218,14 @@ class VectraRUXManager:
             raise RateLimitException(self.api_rate_exception)
         except UnauthorizeException as e:
             if retry_count_token > 0:
-                self.siemplify.LOGGER.exception(
-                    f"Exception occure - {e}. Hence, Generating new tokens.",
-                )
-                self.generate_token(using_refresh_token=True)
+                # Requests may run concurrently, so only the first of them refreshes
+                # the tokens and the others retry with the new ones
+                with self.token_lock:
+                    if self.access_token == access_token:
+                        self.siemplify.LOGGER.exception(
+                            f"Exception occure - {e}. Hence, Generating new tokens.",
+                        )
+                        self.generate_token(using_refresh_token=True)
                 retry_count_token -= 1
                 return self._make_rest_call(
                     api_name,
@@ -508,6 +516,31 @@ class VectraRUXManager:
 
         return proceeded_data, response
 
+    def get_assignments_by_entity(self, entities, entity_type):
+        """Retrieves the assignments of several entities, in batches of entity IDs.
+
+        Args:
+            entities (list): The Entity objects to retrieve the assignments of.
+            entity_type (str): The type of the entities (account or host).
+
+        Returns:
+            dict: The lists of raw assignments by entity ID.
+
+        """
+        entity_ids = {str(entity.entity_id): entity.entity_id for entity in entities}
+        assignments_by_entity = {}
+        for ids in chunk_list(list(entity_ids), ENTITY_IDS_BATCH_SIZE):
+            _, assignments = self.get_assignment_list(
+                query_params={f"{entity_type}s": ",".join(ids)},
+                max_assignment_to_return=0,
+            )
+            for assignment in assignments:
+                entity_id = entity_ids.get(str(assignment.get(f"{entity_type}_id")))
+                if entity_id is not None:
+                    assignments_by_entity.setdefault(entity_id, []).append(assignment)
+
+        return assignments_by_entity
+
     def describe_detection(self, detection_id):
         """Retrieves a detection object based on the provided detection ID.
 
@@ -589,6 +622,43 @@ class VectraRUXManager:
 
         return response_list
 
+    def get_detections_by_entity(self, entities, state="active"):
+        """Retrieves the detections of several entities, in batches of detection IDs.
+
+        Args:
+            entities (list): The Entity objects to retrieve the detections of.
+            state (str): The state of the detections to retrieve.
+
+        Returns:
+            dict: The lists of Detection objects by entity ID, in the order the API
+                returned them.
+
+        """
+        entities_by_detection_id = {}
+        for entity in entities:
+            for detection_id in entity.detection_ids:
+                entities_by_detection_id.setdefault(detection_id, []).append(entity)
+
+        detections_by_entity = {}
+        for detection_ids in chunk_list(
+            list(entities_by_detection_id),
+            DETECTION_IDS_BATCH_SIZE,
+        ):
+            for detection in self.list_entity_detections(
+                detection_ids=detection_ids,
+                state=state,
+                limit=0,
+            ):
+                for entity in entities_by_detection_id.get(
+                    str(detection.detection_id),
+                    [],
+                ):
+                    detections_by_entity.setdefault(entity.entity_id, []).append(
+                        detection,
+                    )
+
+        return detections_by_entity
+
     def get_entity_tags(self, entity_id, entity_type):
         """Retrieves a list of tags for a given entity.
 
@@ -1189,7 +1259,7 @@ class VectraRUXManager:
         ]
         return group_members
 
-    def list_entities_by_filters(
+    def iter_entities_by_filters(
         self,
         existing_ids,
         entity_type,
@@ -1198,7 +1268,27 @@ class VectraRUXManager:
         is_prioritized,
         specific_tag,
     ):
-        """Retrieves a list of entities of a given type."""
+        """Iterates over the pages of new entities of a given type.
+
+        Entities whose alert ID is in the existing IDs, or that were already
+        returned, are skipped. Pages are fetched until the limit of new entities
+        is reached.
+
+        Args:
+            existing_ids (set): The IDs of the alerts that were already created.
+            entity_type (str): The type of the entities (account or host).
+            start_time (int): Only entities modified since this unix time are
+                returned.
+            limit (int): The maximum number of new entities to return.
+            is_prioritized (bool): Whether to only return prioritized entities.
+            specific_tag (str): Only entities with this tag are returned.
+
+        Yields:
+            list: The new Entity objects of every page, ordered by their last
+                modification time.
+
+        """
+        limit = limit or DEFAULT_RESULTS_LIMIT
         request_url = self._get_full_url(LIST_ENTITIES_API_NAME)
         params = {
             "type": entity_type,
@@ -1208,6 +1298,7 @@ class VectraRUXManager:
             "ordering": "last_modified_timestamp",
             "state": "active",
             "page": 1,
+            "page_size": min(DEFAULT_PAGE_SIZE, limit),
         }
         if is_prioritized:
             params["is_prioritized"] = is_prioritized
@@ -1215,25 +1306,25 @@ class VectraRUXManager:
         if specific_tag:
             params["tags"] = specific_tag
 
-        new_entities = []
-        existing_entities = copy.deepcopy(existing_ids)
-        original_limit = limit
-        while True:
+        seen_ids = set(existing_ids)
+        entities_count = 0
+        while entities_count < limit:
             try:
-                results = self._paginator(
+                response = self._make_rest_call(
                     LIST_ENTITIES_API_NAME,
                     "GET",
                     request_url,
-                    limit=limit,
                     params=params,
-                    is_connector_request=True,
                 )
             except Exception as e:
                 if "Invalid page" in str(e):
-                    results = []
-                else:
+                    return
+                if params["page"] == 1:
                     raise
+                self.siemplify.LOGGER.exception(e)
+                return
 
+            results = response.get("results", [])
             duplicates = []
             entities = [
                 self.parser.build_entity_object(entity)
@@ -1244,31 +1335,21 @@ class VectraRUXManager:
                         entity["last_modified_timestamp"],
                         entity_type,
                     ),
-                    existing_entities,
+                    seen_ids,
                     duplicates,
                 )
-            ]
-            new_entities.extend(entities)
-
-            if results and duplicates:
-                if self._are_all_the_records_duplicates(duplicates, results):
-                    if limit < DEFAULT_PAGE_SIZE:
-                        params["page"] = params["page"] + 1
-                    else:
-                        params["page"] = params["page"] + limit // DEFAULT_PAGE_SIZE
-                    self.siemplify.LOGGER.info(
-                        f"All the records are duplicates. Setting page to {params['page']}",
-                    )
-                    continue
+            ][: limit - entities_count]
+            if duplicates:
                 self.siemplify.LOGGER.info(f"Found duplicates = {duplicates}")
-                params["last_modified_timestamp_gte"] = results[-1][
-                    "last_modified_timestamp"
-                ]
-                limit = original_limit - len(new_entities)
-                params["page"] = 1
-                continue
 
-            return new_entities
+            entities_count += len(entities)
+            if entities:
+                yield entities
+
+            if not response.get(NEXT_PAGE_URL_KEY):
+                return
+
+            params["page"] += 1
 
     @staticmethod
     def _is_duplicate(_id, existing_ids, duplicates):
@@ -1277,9 +1358,3 @@ class VectraRUXManager:
             return True
         existing_ids.add(_id)
         return False
-
-    @staticmethod
-    def _are_all_the_records_duplicates(duplicates, results):
-        if len(duplicates) == len(results):
-            return True
-        return False
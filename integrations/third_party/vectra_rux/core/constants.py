@@ -46,6 +46,8 @@ VECTRA_DATETIME_FORMAT = "%Y-%m-%dT%H%M"
 FIRST_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 DEFAULT_PAGE_SIZE = 1000
+DETECTION_IDS_BATCH_SIZE = 200
+ENTITY_IDS_BATCH_SIZE = 200
 RETRY_COUNT = 3
 RETRY_COUNT_TOKEN = 1
 WAIT_TIME_FOR_RETRY = 5
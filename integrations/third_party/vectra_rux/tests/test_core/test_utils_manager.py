@@ -0,0 +1,65 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pytest
+
+from ...core.UtilsManager import chunk_list, iter_prefetched
+
+
+def test_chunk_list() -> None:
+    assert chunk_list([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunk_list([], 2) == []
+
+
+def test_iter_prefetched_yields_items_in_order() -> None:
+    assert list(iter_prefetched(iter(range(5)))) == [0, 1, 2, 3, 4]
+
+
+def test_iter_prefetched_does_not_fetch_after_stop() -> None:
+    fetched: list[int] = []
+
+    def fetch_pages():
+        for page in range(5):
+            fetched.append(page)
+            yield page
+
+    items: list[int] = list(iter_prefetched(fetch_pages(), should_stop=lambda: True))
+
+    assert items == [0]
+    assert fetched == [0]
+
+
+def test_iter_prefetched_stops_when_deadline_is_reached() -> None:
+    calls: list[int] = []
+
+    def should_stop() -> bool:
+        calls.append(len(calls))
+        return len(calls) == 2
+
+    assert list(iter_prefetched(iter(range(5)), should_stop=should_stop)) == [0, 1]
+
+
+def test_iter_prefetched_raises_fetch_error() -> None:
+    def fetch_pages():
+        yield 0
+        raise ValueError("Invalid response")
+
+    items: list[int] = []
+    with pytest.raises(ValueError, match="Invalid response"):
+        for item in iter_prefetched(fetch_pages()):
+            items.append(item)
+
+    assert items == [0]
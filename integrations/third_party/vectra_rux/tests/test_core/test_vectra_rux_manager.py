@@ -0,0 +1,239 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ...core import VectraRUXManager as manager_module
+from ...core.datamodels import Entity
+from ...core.UtilsManager import get_alert_id
+from ...core.VectraRUXExceptions import VectraRUXException
+from ...core.VectraRUXManager import VectraRUXManager
+from ...core.VectraRUXParser import VectraRUXParser
+
+API_ROOT = "https://vectra.example.com"
+START_TIME = 1_700_000_000_000
+
+
+def create_manager() -> VectraRUXManager:
+    """Create a manager without authenticating to the API."""
+    manager: VectraRUXManager = VectraRUXManager.__new__(VectraRUXManager)
+    manager.api_root = API_ROOT
+    manager.parser = VectraRUXParser()
+    manager.siemplify = MagicMock()
+    return manager
+
+
+def entity_json(entity_id: int, modified: str, detection_ids=()) -> dict:
+    return {
+        "id": entity_id,
+        "name": f"entity-{entity_id}",
+        "type": "host",
+        "last_modified_timestamp": modified,
+        "tags": [],
+        "detection_set": [
+            f"{API_ROOT}/api/v3.4/detections/{detection_id}"
+            for detection_id in detection_ids
+        ],
+    }
+
+
+def detection_json(detection_id: int) -> dict:
+    return {
+        "id": detection_id,
+        "state": "active",
+        "src_account": None,
+        "src_host": {"id": 1, "name": "host-1", "url": f"{API_ROOT}/hosts/1"},
+    }
+
+
+def create_entity(entity_id: int, detection_ids=()) -> Entity:
+    return VectraRUXParser().build_entity_object(
+        entity_json(entity_id, "2025-01-01T00:00:00Z", detection_ids),
+    )
+
+
+def test_get_detections_by_entity_maps_detection_ids_in_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(manager_module, "DETECTION_IDS_BATCH_SIZE", 2)
+    manager: VectraRUXManager = create_manager()
+    manager._paginator = MagicMock(
+        side_effect=[
+            [detection_json(11), detection_json(12)],
+            [detection_json(13)],
+        ],
+    )
+    entities: list[Entity] = [
+        create_entity(1, [11, 12]),
+        create_entity(2, [12, 13]),
+        create_entity(3),
+    ]
+
+    detections = manager.get_detections_by_entity(entities, state="active")
+
+    assert {
+        entity_id: [detection.detection_id for detection in entity_detections]
+        for entity_id, entity_detections in detections.items()
+    } == {1: [11, 12], 2: [12, 13]}
+    assert [call.kwargs["params"] for call in manager._paginator.call_args_list] == [
+        {"id": "11,12", "state": "active"},
+        {"id": "13", "state": "active"},
+    ]
+
+
+@pytest.mark.parametrize("entity_type", ["account", "host"])
+def test_get_assignments_by_entity_maps_entity_type_id(entity_type: str) -> None:
+    manager: VectraRUXManager = create_manager()
+    other_type: str = "host" if entity_type == "account" else "account"
+    assignments: list[dict] = [
+        {"id": 100, f"{entity_type}_id": 1, f"{other_type}_id": 2},
+        {"id": 101, f"{entity_type}_id": 2, f"{other_type}_id": 1},
+        {"id": 102, f"{entity_type}_id": 1},
+    ]
+    manager.get_assignment_list = MagicMock(return_value=([], assignments))
+
+    result = manager.get_assignments_by_entity(
+        [create_entity(1), create_entity(2), create_entity(3)],
+        entity_type,
+    )
+
+    assert {
+        entity_id: [assignment["id"] for assignment in entity_assignments]
+        for entity_id, entity_assignments in result.items()
+    } == {1: [100, 102], 2: [101]}
+    manager.get_assignment_list.assert_called_once_with(
+        query_params={f"{entity_type}s": "1,2,3"},
+        max_assignment_to_return=0,
+    )
+
+
+def mock_entity_pages(manager: VectraRUXManager, *pages) -> list[dict]:
+    """Make the manager return the given pages and record the requested params."""
+    requested_params: list[dict] = []
+
+    def make_rest_call(api_name, method, url, params=None):
+        requested_params.append(dict(params))
+        page = pages[len(requested_params) - 1]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    manager._make_rest_call = make_rest_call
+    return requested_params
+
+
+def list_entity_ids(pages) -> list[list[int]]:
+    return [[entity.entity_id for entity in page] for page in pages]
+
+
+def test_iter_entities_by_filters_skips_existing_and_returned_entities() -> None:
+    manager: VectraRUXManager = create_manager()
+    requested_params: list[dict] = mock_entity_pages(
+        manager,
+        {
+            "results": [entity_json(1, "t1"), entity_json(2, "t1")],
+            "next": f"{API_ROOT}/api/v3.4/entities?page=2",
+        },
+        {"results": [entity_json(2, "t1"), entity_json(3, "t2")], "next": None},
+    )
+
+    pages = manager.iter_entities_by_filters(
+        existing_ids=[get_alert_id(1, "t1", "host")],
+        entity_type="host",
+        start_time=START_TIME,
+        limit=10,
+        is_prioritized=False,
+        specific_tag=None,
+    )
+
+    assert list_entity_ids(pages) == [[2], [3]]
+    assert [params["page"] for params in requested_params] == [1, 2]
+    assert requested_params[0]["ordering"] == "last_modified_timestamp"
+    assert requested_params[0]["page_size"] == 10
+
+
+def test_iter_entities_by_filters_stops_at_limit() -> None:
+    manager: VectraRUXManager = create_manager()
+    requested_params: list[dict] = mock_entity_pages(
+        manager,
+        {
+            "results": [entity_json(i, "t1") for i in range(1, 4)],
+            "next": f"{API_ROOT}/api/v3.4/entities?page=2",
+        },
+    )
+
+    pages = manager.iter_entities_by_filters(
+        existing_ids=[],
+        entity_type="host",
+        start_time=START_TIME,
+        limit=2,
+        is_prioritized=False,
+        specific_tag=None,
+    )
+
+    assert list_entity_ids(pages) == [[1, 2]]
+    assert len(requested_params) == 1
+
+
+def test_iter_entities_by_filters_raises_first_page_error() -> None:
+    manager: VectraRUXManager = create_manager()
+    mock_entity_pages(manager, VectraRUXException("Internal server error"))
+
+    pages = manager.iter_entities_by_filters(
+        existing_ids=[],
+        entity_type="host",
+        start_time=START_TIME,
+        limit=10,
+        is_prioritized=False,
+        specific_tag=None,
+    )
+
+    with pytest.raises(VectraRUXException):
+        list(pages)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        VectraRUXException("Internal server error"),
+        VectraRUXException("Invalid page."),
+    ],
+)
+def test_iter_entities_by_filters_returns_fetched_pages_on_later_error(
+    error: Exception,
+) -> None:
+    manager: VectraRUXManager = create_manager()
+    mock_entity_pages(
+        manager,
+        {
+            "results": [entity_json(1, "t1")],
+            "next": f"{API_ROOT}/api/v3.4/entities?page=2",
+        },
+        error,
+    )
+
+    pages = manager.iter_entities_by_filters(
+        existing_ids=[],
+        entity_type="host",
+        start_time=START_TIME,
+        limit=10,
+        is_prioritized=False,
+        specific_tag=None,
+    )
+
+    assert list_entity_ids(pages) == [[1]]
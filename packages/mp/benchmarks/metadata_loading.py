@@ -0,0 +1,112 @@
+"""Benchmark the loading of "non-built" integrations' metadata.
+
+Loads every non-built integration under a marketplace directory (by default,
+`integrations/third_party`) in four modes and prints the total time of each:
+
+- baseline: the pure-Python YAML loader without any caching
+- cold: the fastest available YAML loader with empty caches
+- warm-disk: a new process's in-memory cache is empty, but the disk cache is full
+- warm-memory: loading the same unchanged files again in the same process
+
+Usage:
+    python benchmarks/metadata_loading.py [marketplace-dir]
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import tempfile
+import time
+import unittest.mock
+from typing import TYPE_CHECKING, TypeVar
+
+import rich
+import yaml
+
+import mp.core.data_models.metadata_cache
+import mp.core.file_utils
+from mp.core.data_models.integration import Integration
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_T = TypeVar("_T")
+
+DEFAULT_MARKETPLACE_PATH: pathlib.Path = (
+    pathlib.Path(__file__).parents[3] / "integrations" / "third_party"
+)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    marketplace: pathlib.Path = (
+        pathlib.Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MARKETPLACE_PATH
+    )
+    paths: list[pathlib.Path] = _get_non_built_integrations(marketplace)
+    rich.print(f"Loading {len(paths)} integrations from {marketplace}")
+
+    with tempfile.TemporaryDirectory() as d:
+        mp.core.data_models.metadata_cache.set_cache_dir(None)
+        with (
+            unittest.mock.patch.object(yaml, "__with_libyaml__", new=False),
+            unittest.mock.patch.object(mp.core.data_models.metadata_cache, "load", _load_uncached),
+        ):
+            _report("baseline", paths)
+
+        mp.core.data_models.metadata_cache.set_cache_dir(pathlib.Path(d))
+        mp.core.data_models.metadata_cache.clear()
+        _report("cold", paths)
+
+        mp.core.data_models.metadata_cache.clear()
+        _report("warm-disk", paths)
+
+        _report("warm-memory", paths)
+
+
+def _load_uncached(
+    _: str,
+    path: pathlib.Path,
+    load_fn: Callable[[str], _T],
+) -> _T:
+    return load_fn(path.read_text(encoding="utf-8"))
+
+
+def _get_non_built_integrations(marketplace: pathlib.Path) -> list[pathlib.Path]:
+    return sorted(
+        p
+        for p in marketplace.rglob("*")
+        if p.is_dir()
+        and mp.core.file_utils.is_integration(p)
+        and mp.core.file_utils.is_non_built(p)
+    )
+
+
+def _report(name: str, paths: list[pathlib.Path]) -> None:
+    start: float = time.perf_counter()
+    for path in paths:
+        try:
+            Integration.from_non_built_path(path)
+        except ValueError:
+            continue
+
+    rich.print(f"{name:>12}: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,9 @@
 
 This script initializes and runs the Typer application, exposing various
 commands for building, checking, configuring, and formatting integration
-projects within the marketplace. It imports the sub-applications from
-the `build_project`, `check`, `config`, and `format` modules and mounts
-them onto the main Typer instance.
+projects within the marketplace. The sub-applications of the `build_project`,
+`check`, `config`, `format` and other modules are registered as lazy commands,
+so each of them is imported only when its command is used.
 """
 
 # Copyright 2025 Google LLC
@@ -23,33 +23,17 @@ them onto the main Typer instance.
 
 from __future__ import annotations
 
-import typer
-
-from . import build_project, check, config, dev_env, run_pre_build_tests, validate
-from . import format as format_app
+from .commands import COMMANDS, create_app
 
 __all__: list[str] = [
-    "build_project",
-    "check",
-    "config",
-    "format_app",
+    "COMMANDS",
     "main",
-    "run_pre_build_tests",
-    "validate",
 ]
 
 
 def main() -> None:
     """Entry point for the `mp` CLI tool, initializing all sub-applications."""
-    app: typer.Typer = typer.Typer()
-    app.add_typer(build_project.app)
-    app.add_typer(check.app)
-    app.add_typer(config.app)
-    app.add_typer(format_app.app)
-    app.add_typer(run_pre_build_tests.app)
-    app.add_typer(dev_env.app, name="dev-env")
-    app.add_typer(validate.app)
-    app()
+    create_app()()
 
 
 if __name__ == "__main__":
@@ -26,6 +26,7 @@ components.
 from __future__ import annotations
 
 import dataclasses
+import pathlib
 from typing import TYPE_CHECKING, Annotated
 
 import rich
@@ -33,13 +34,14 @@ import typer
 
 import mp.core.config
 import mp.core.file_utils
+import mp.core.profiling
 from mp.core.custom_types import RepositoryType
 
+from .build_cache import BuildCacheStats
 from .marketplace import Marketplace
 from .post_build.duplicate_integrations import raise_errors_for_duplicate_integrations
 
 if TYPE_CHECKING:
-    import pathlib
     from collections.abc import Iterable, Sequence
 
     from mp.core.config import RuntimeParams
@@ -127,6 +129,24 @@ def build(  # noqa: PLR0913
             ),
         ),
     ] = False,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            help=(
+                "Restore integrations whose sources did not change from the local build"
+                " cache instead of rebuilding them."
+            ),
+        ),
+    ] = True,
+    profile: Annotated[
+        str | None,
+        typer.Option(
+            help=(
+                "Write a Chrome trace of the time spent on each integration and stage to"
+                " this path, and print the slowest ones."
+            ),
+        ),
+    ] = None,
     quiet: Annotated[
         bool,
         typer.Option(
@@ -147,6 +167,8 @@ def build(  # noqa: PLR0913
         integration: the integrations to build
         group: the groups to build
         deconstruct: whether to deconstruct instead of build
+        cache: whether to use the build cache
+        profile: the path to write a trace of the build into, if any
         quiet: quiet log options
         verbose: Verbose log options
 
@@ -157,41 +179,58 @@ def build(  # noqa: PLR0913
     params: BuildParams = BuildParams(repository, integration, group, deconstruct)
     params.validate()
 
-    commercial_mp: Marketplace = Marketplace(mp.core.file_utils.get_commercial_path())
-    community_mp: Marketplace = Marketplace(mp.core.file_utils.get_community_path())
-    if integration:
-        rich.print("Building integrations...")
-        _build_integrations(set(integration), commercial_mp, deconstruct=deconstruct)
-        _build_integrations(set(integration), community_mp, deconstruct=deconstruct)
-        rich.print("Done building integrations.")
-
-    elif group:
-        rich.print("Building groups...")
-        _build_groups(set(group), commercial_mp)
-        _build_groups(set(group), community_mp)
-        rich.print("Done building groups.")
-
-    elif repository:
-        repos: set[RepositoryType] = set(repository)
-        if RepositoryType.COMMERCIAL in repos:
-            rich.print("Building all integrations and groups in commercial repo...")
-            commercial_mp.build()
-            commercial_mp.write_marketplace_json()
-            rich.print("Done Commercial integrations build.")
-
-        if RepositoryType.COMMUNITY in repos:
-            rich.print("Building all integrations and groups in third party repo...")
-            community_mp.build()
-            community_mp.write_marketplace_json()
-            rich.print("Done third party integrations build.")
-
-        if is_full_build(repository):
-            rich.print("Checking for duplicate integrations...")
-            raise_errors_for_duplicate_integrations(
-                commercial_path=commercial_mp.out_path,
-                community_path=commercial_mp.out_path,
-            )
-            rich.print("Done checking for duplicate integrations.")
+    with mp.core.profiling.profile(pathlib.Path(profile) if profile else None):
+        commercial_mp: Marketplace = Marketplace(
+            mp.core.file_utils.get_commercial_path(),
+            use_cache=cache,
+        )
+        community_mp: Marketplace = Marketplace(
+            mp.core.file_utils.get_community_path(),
+            use_cache=cache,
+        )
+        if cache:
+            commercial_mp.prune_caches()
+
+        stats: list[BuildCacheStats] = []
+        if integration:
+            rich.print("Building integrations...")
+            stats.extend((
+                _build_integrations(set(integration), commercial_mp, deconstruct=deconstruct),
+                _build_integrations(set(integration), community_mp, deconstruct=deconstruct),
+            ))
+            rich.print("Done building integrations.")
+
+        elif group:
+            rich.print("Building groups...")
+            stats.extend((
+                _build_groups(set(group), commercial_mp),
+                _build_groups(set(group), community_mp),
+            ))
+            rich.print("Done building groups.")
+
+        elif repository:
+            repos: set[RepositoryType] = set(repository)
+            if RepositoryType.COMMERCIAL in repos:
+                rich.print("Building all integrations and groups in commercial repo...")
+                stats.append(commercial_mp.build())
+                commercial_mp.write_marketplace_json()
+                rich.print("Done Commercial integrations build.")
+
+            if RepositoryType.COMMUNITY in repos:
+                rich.print("Building all integrations and groups in third party repo...")
+                stats.append(community_mp.build())
+                community_mp.write_marketplace_json()
+                rich.print("Done third party integrations build.")
+
+            if is_full_build(repository):
+                rich.print("Checking for duplicate integrations...")
+                raise_errors_for_duplicate_integrations(
+                    commercial_path=commercial_mp.out_path,
+                    community_path=commercial_mp.out_path,
+                )
+                rich.print("Done checking for duplicate integrations.")
+
+        BuildCacheStats.merge(stats).display()
 
 
 def _build_integrations(
@@ -199,7 +238,7 @@ def _build_integrations(
     marketplace_: Marketplace,
     *,
     deconstruct: bool,
-) -> None:
+) -> BuildCacheStats:
     valid_integrations_: set[pathlib.Path] = _get_marketplace_paths_from_names(
         integrations,
         marketplace_.path,
@@ -221,10 +260,12 @@ def _build_integrations(
             marketplace_.deconstruct_integrations(valid_integrations_)
 
         else:
-            marketplace_.build_integrations(valid_integrations_)
+            return marketplace_.build_integrations(valid_integrations_)
+
+    return BuildCacheStats()
 
 
-def _build_groups(groups: Iterable[str], marketplace_: Marketplace) -> None:
+def _build_groups(groups: Iterable[str], marketplace_: Marketplace) -> BuildCacheStats:
     valid_groups: set[pathlib.Path] = _get_marketplace_paths_from_names(
         names=groups,
         marketplace_path=marketplace_.path,
@@ -236,7 +277,9 @@ def _build_groups(groups: Iterable[str], marketplace_: Marketplace) -> None:
 
     if valid_groups:
         rich.print(f"Building the following groups: {', '.join(valid_group_names)}")
-        marketplace_.build_groups(valid_groups)
+        return marketplace_.build_groups(valid_groups)
+
+    return BuildCacheStats()
 
 
 def _get_marketplace_paths_from_names(
@@ -0,0 +1,282 @@
+"""Content-addressed cache of built integrations.
+
+This module provides the `BuildCache` class, which stores the "out" directory
+of every built integration under a key derived from the integration's source
+tree, its lock file, the `mp` version and the running Python version.
+Integrations whose key did not change since the last build are restored from
+the cache instead of being rebuilt.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+import rich
+
+import mp.core.config
+import mp.core.constants
+import mp.core.file_utils
+import mp.core.utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+HASH_CHUNK_SIZE: int = 1 << 20
+IGNORED_DIR_NAMES: set[str] = {
+    mp.core.constants.INTEGRATION_VENV,
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+}
+IGNORED_FILE_SUFFIXES: set[str] = {".pyc"}
+MAX_UNUSED_SECONDS: int = 14 * 24 * 60 * 60
+
+
+class CacheStatus(enum.Enum):
+    HIT = "hit"
+    MISS = "miss"
+    DISABLED = "disabled"
+
+
+@dataclasses.dataclass(slots=True)
+class BuildCacheStats:
+    statuses: dict[str, CacheStatus] = dataclasses.field(default_factory=dict)
+
+    @property
+    def hits(self) -> list[str]:
+        """The names of the integrations that were restored from the cache."""
+        return sorted(n for n, s in self.statuses.items() if s is CacheStatus.HIT)
+
+    @property
+    def misses(self) -> list[str]:
+        """The names of the integrations that were built and then cached."""
+        return sorted(n for n, s in self.statuses.items() if s is CacheStatus.MISS)
+
+    @classmethod
+    def merge(cls, stats: Iterable[BuildCacheStats]) -> BuildCacheStats:
+        """Merge multiple stats objects into a single one.
+
+        Args:
+            stats: the stats to merge
+
+        Returns:
+            A new stats object containing the statuses of all the provided stats
+
+        """
+        merged: BuildCacheStats = cls()
+        for s in stats:
+            merged.statuses.update(s.statuses)
+
+        return merged
+
+    def display(self) -> None:
+        """Print the per-integration cache hits and misses."""
+        if not self.hits and not self.misses:
+            return
+
+        rich.print(
+            f"Build cache: {len(self.hits)} hit(s), {len(self.misses)} miss(es)"
+            f" out of {len(self.statuses)} integration(s)"
+        )
+        for name in self.hits:
+            rich.print(f"  [green]hit[/green]  {name}")
+
+        for name in self.misses:
+            rich.print(f"  [yellow]miss[/yellow] {name}")
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class BuildCache:
+    root: pathlib.Path
+
+    @classmethod
+    def from_config(cls) -> BuildCache:
+        """Create a build cache located in the configured marketplace.
+
+        Returns:
+            A `BuildCache` rooted in the marketplace's cache directory
+
+        """
+        return cls(get_build_cache_path())
+
+    def restore(self, key: str, out_path: pathlib.Path) -> pathlib.Path | None:
+        """Restore a cached build into `out_path`.
+
+        Args:
+            key: the cache key of the integration
+            out_path: the marketplace's "out" directory to restore the build into
+
+        Returns:
+            The path of the restored integration in `out_path`, or `None` if the
+            key is not cached
+
+        """
+        entry: pathlib.Path | None = self._get_entry_content(key)
+        if entry is None:
+            return None
+
+        # Mark the entry as used, so it is not pruned
+        os.utime(entry.parent)
+        integration_out_path: pathlib.Path = out_path / entry.name
+        mp.core.file_utils.recreate_dir(integration_out_path)
+        shutil.copytree(entry, integration_out_path, dirs_exist_ok=True)
+        return integration_out_path
+
+    def store(self, key: str, integration_out_path: pathlib.Path) -> None:
+        """Store a built integration under `key`.
+
+        The entry is first written into a temporary directory and then renamed
+        into place, so concurrent builds never observe a partial entry.
+
+        Args:
+            key: the cache key of the integration
+            integration_out_path: the built integration's "out" directory
+
+        Raises:
+            OSError: if the entry could not be written and no other build stored it
+
+        """
+        if not integration_out_path.exists():
+            return
+
+        entry: pathlib.Path = self.root / key
+        if entry.exists():
+            return
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp: pathlib.Path = pathlib.Path(tempfile.mkdtemp(prefix=f".{key}_", dir=self.root))
+        try:
+            shutil.copytree(integration_out_path, tmp / integration_out_path.name)
+            tmp.replace(entry)
+
+        except OSError:
+            if not entry.exists():
+                raise
+
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def prune(self) -> None:
+        """Remove entries that were not stored or restored recently.
+
+        Entries that are being written by a concurrent build are hidden
+        temporary directories, so they are only removed if they were left behind
+        for longer than the unused entries.
+        """
+        if not self.root.exists():
+            return
+
+        now: float = time.time()
+        for entry in self.root.iterdir():
+            try:
+                is_unused: bool = now - entry.stat().st_mtime > MAX_UNUSED_SECONDS
+            except FileNotFoundError:
+                continue
+
+            if is_unused:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def _get_entry_content(self, key: str) -> pathlib.Path | None:
+        entry: pathlib.Path = self.root / key
+        if not entry.is_dir():
+            return None
+
+        children: list[pathlib.Path] = [p for p in entry.iterdir() if p.is_dir()]
+        if len(children) != 1:
+            return None
+
+        return children[0]
+
+
+def get_build_cache_path() -> pathlib.Path:
+    """Get the path of the build cache directory.
+
+    Returns:
+        The build cache's directory path
+
+    """
+    return (
+        mp.core.config.get_marketplace_path()
+        / mp.core.constants.CACHE_DIR_NAME
+        / mp.core.constants.BUILD_CACHE_DIR_NAME
+    )
+
+
+def get_key(integration_path: pathlib.Path) -> str:
+    """Compute the cache key of an integration.
+
+    The key covers every source file of the integration (including its
+    `uv.lock`), the group's common scripts if the integration is part of a
+    group, the `mp` version and the running Python version.
+
+    Args:
+        integration_path: the path of the integration's source directory
+
+    Returns:
+        A hex digest that identifies the integration's build inputs
+
+    """
+    h = hashlib.sha256()
+    h.update(f"mp={mp.core.utils.get_mp_version()}\0".encode())
+    h.update(f"python={sys.version_info.major}.{sys.version_info.minor}\0".encode())
+    _hash_tree(h, integration_path, prefix="integration")
+
+    lock: pathlib.Path = integration_path / mp.core.constants.LOCK_FILE
+    if lock.exists():
+        h.update(b"lock\0")
+        _hash_file(h, lock)
+
+    common: pathlib.Path = integration_path.parent / mp.core.constants.COMMON_SCRIPTS_DIR
+    if common.is_dir():
+        _hash_tree(h, common, prefix="common")
+
+    return h.hexdigest()
+
+
+def _hash_tree(h: hashlib._Hash, root: pathlib.Path, prefix: str) -> None:
+    for file in _iter_source_files(root):
+        relative: str = file.relative_to(root).as_posix()
+        h.update(f"{prefix}/{relative}\0".encode())
+        _hash_file(h, file)
+
+
+def _hash_file(h: hashlib._Hash, file: pathlib.Path) -> None:
+    with file.open("rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+
+    h.update(b"\0")
+
+
+def _iter_source_files(root: pathlib.Path) -> Iterator[pathlib.Path]:
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(d for d in dir_names if d not in IGNORED_DIR_NAMES)
+        for name in sorted(file_names):
+            file: pathlib.Path = pathlib.Path(dir_path) / name
+            if file.suffix not in IGNORED_FILE_SUFFIXES:
+                yield file
@@ -24,23 +24,31 @@ built integrations back into their source structure.
 
 from __future__ import annotations
 
-import multiprocessing
+import dataclasses
 import shutil
 from typing import TYPE_CHECKING
 
 import rich
 
+import mp.build_project.build_cache
+import mp.build_project.post_build.marketplace_json
+import mp.build_project.restructure.code
 import mp.core.config
 import mp.core.constants
+import mp.core.data_models.metadata_cache
 import mp.core.file_utils
-import mp.core.unix
+import mp.core.profiling
+import mp.core.scheduler
 import mp.core.utils
 from mp.core.data_models.integration import BuiltFullDetails, BuiltIntegration, Integration
+from mp.core.profiling import SpanKind
 
+from .build_cache import BuildCache, BuildCacheStats, CacheStatus
 from .post_build.full_details_json import write_full_details
-from .post_build.marketplace_json import write_marketplace_json
+from .post_build.marketplace_json import write_marketplace_fragment, write_marketplace_json
 from .restructure.deconstruct import DeconstructIntegration
-from .restructure.integration import restructure_integration
+from .restructure.integration import RestructureOptions, restructure_integration
+from .wheel_store import WheelStore
 
 if TYPE_CHECKING:
     import pathlib
@@ -49,13 +57,24 @@ if TYPE_CHECKING:
     from mp.core.custom_types import Products
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class _IntegrationBuild:
+    name: str
+    status: CacheStatus
+    key: str | None = None
+    out_path: pathlib.Path | None = None
+    needs_format: bool = False
+
+
 class Marketplace:
-    def __init__(self, integrations_dir: pathlib.Path) -> None:
+    def __init__(self, integrations_dir: pathlib.Path, *, use_cache: bool = True) -> None:
         """Class constructor.
 
         Args:
             integrations_dir: The path to a marketplace - where folders of integrations
                 and groups exist
+            use_cache: Whether to restore unchanged integrations from the build cache
+                and to share resolved requirements and wheels between integrations
 
         """
         self.path: pathlib.Path = integrations_dir
@@ -71,65 +90,106 @@ class Marketplace:
         self.out_path /= integrations_dir.name
         self.out_path.mkdir(exist_ok=True)
 
+        self.fragments_path: pathlib.Path = (
+            out_path / mp.core.constants.OUT_MARKETPLACE_FRAGMENTS_DIR_NAME / integrations_dir.name
+        )
+
+        self.cache: BuildCache | None = BuildCache.from_config() if use_cache else None
+        self.wheel_store: WheelStore | None = WheelStore.from_config() if use_cache else None
+        self.code_cache: pathlib.Path | None = (
+            mp_path / mp.core.constants.CACHE_DIR_NAME / mp.core.constants.CODE_CACHE_DIR_NAME
+            if use_cache
+            else None
+        )
+        mp.core.data_models.metadata_cache.set_cache_dir(
+            mp_path / mp.core.constants.CACHE_DIR_NAME / mp.core.constants.METADATA_CACHE_DIR_NAME
+            if use_cache
+            else None
+        )
+
+    def prune_caches(self) -> None:
+        """Remove the build and metadata cache entries that were not used recently.
+
+        The caches are shared by all the marketplaces, so this only needs to be
+        called on one of them.
+        """
+        if self.cache is not None:
+            self.cache.prune()
+
+        mp.core.data_models.metadata_cache.prune()
+
     def write_marketplace_json(self) -> None:
-        """Write the marketplace JSON file to the marketplace's out path."""
-        write_marketplace_json(self.out_path)
+        """Write the marketplace JSON file to the marketplace's out path.
+
+        The file is assembled from the marketplace fragments written when the
+        integrations were built or restored from the build cache.
+        """
+        with mp.core.profiling.span("marketplace json"):
+            write_marketplace_json(self.out_path, self.fragments_path)
+
+    def build(self) -> BuildCacheStats:
+        """Build all integrations and groups in the marketplace.
 
-    def build(self) -> None:
-        """Build all integrations and groups in the marketplace."""
+        Returns:
+            The build cache stats of all the built integrations
+
+        """
         products: Products[set[pathlib.Path]] = (
             mp.core.file_utils.get_integrations_and_groups_from_paths(self.path)
         )
-        self.build_groups(products.groups)
-        self.build_integrations(products.integrations)
+        return self.build_integrations([
+            *_get_groups_integrations(products.groups),
+            *products.integrations,
+        ])
 
-    def build_groups(self, group_paths: Iterable[pathlib.Path]) -> None:
+    def build_groups(self, group_paths: Iterable[pathlib.Path]) -> BuildCacheStats:
         """Build all groups provided by `group_paths`.
 
-        Args:
-            group_paths: The paths of integrations to build
-
-        """
-        processes: int = mp.core.config.get_processes_number()
-        with multiprocessing.Pool(processes=processes) as pool:
-            pool.map(self.build_group, group_paths)
-
-    def build_group(self, group_dir: pathlib.Path) -> None:
-        """Build a single group provided by `group_path`.
+        The groups are flattened into their integrations, which are all built on
+        the same pool.
 
         Args:
-            group_dir: The paths of the integration to build
+            group_paths: The paths of integrations to build
 
-        Raises:
-            FileNotFoundError: when `group_dir` does not exist
+        Returns:
+            The build cache stats of all the built integrations
 
         """
-        if not group_dir.exists():
-            msg: str = f"Invalid integration {group_dir}"
-            raise FileNotFoundError(msg)
-
-        self.build_integrations(group_dir.iterdir())
+        return self.build_integrations(_get_groups_integrations(group_paths))
 
-    def build_integrations(self, integration_paths: Iterable[pathlib.Path]) -> None:
+    def build_integrations(self, integration_paths: Iterable[pathlib.Path]) -> BuildCacheStats:
         """Build all integrations provided by `integration_paths`.
 
+        The integrations are built on the shared process pool without formatting
+        their code. The code of all the rebuilt integrations is then formatted
+        together, and only then are they stored in the build cache.
+
         Args:
             integration_paths: The paths of integrations to build
 
+        Returns:
+            The build cache stats of all the built integrations
+
         """
         paths: Iterator[pathlib.Path] = (
             p for p in integration_paths if p.exists() and mp.core.file_utils.is_integration(p)
         )
-        processes: int = mp.core.config.get_processes_number()
-        with multiprocessing.Pool(processes=processes) as pool:
-            pool.map(self.build_integration, paths)
+        return self._finish_builds(
+            mp.core.scheduler.map_processes(self._build_integration_unformatted, paths)
+        )
 
-    def build_integration(self, integration_path: pathlib.Path) -> None:
+    def build_integration(self, integration_path: pathlib.Path) -> BuildCacheStats:
         """Build a single integration provided by `integration_path`.
 
+        If the build cache is enabled and the integration's sources did not change
+        since it was last built, the cached build is restored instead.
+
         Args:
             integration_path: The paths of the integration to build
 
+        Returns:
+            The build cache stats of the integration
+
         Raises:
             FileNotFoundError: when `integration_path` does not exist
 
@@ -138,9 +198,73 @@ class Marketplace:
             msg: str = f"Invalid integration {integration_path}"
             raise FileNotFoundError(msg)
 
-        integration: Integration = self._get_integration_to_build(integration_path)
+        return self._finish_builds([self._build_integration_unformatted(integration_path)])
+
+    def _build_integration_unformatted(self, integration_path: pathlib.Path) -> _IntegrationBuild:
+        with mp.core.profiling.span(integration_path.name, SpanKind.INTEGRATION):
+            if self.cache is None:
+                return self._build_integration_from_source(integration_path, CacheStatus.DISABLED)
+
+            with mp.core.profiling.span("cache key"):
+                key: str = mp.build_project.build_cache.get_key(integration_path)
+
+            with mp.core.profiling.span("cache restore"):
+                restored: pathlib.Path | None = self.cache.restore(key, self.out_path)
+
+            if restored is None:
+                return self._build_integration_from_source(integration_path, CacheStatus.MISS, key)
+
+            rich.print(f"Integration {integration_path.name} restored from build cache")
+            if not mp.build_project.post_build.marketplace_json.has_marketplace_fragment(
+                self.fragments_path, restored.name, key
+            ):
+                with mp.core.profiling.span("marketplace fragment"):
+                    write_marketplace_fragment(restored, self.fragments_path, key)
+
+            return _IntegrationBuild(integration_path.name, CacheStatus.HIT)
+
+    def _finish_builds(self, builds: Iterable[_IntegrationBuild]) -> BuildCacheStats:
+        builds = list(builds)
+        with mp.core.profiling.span("format code"):
+            mp.build_project.restructure.code.format_integrations_code(
+                b.out_path for b in builds if b.out_path is not None and b.needs_format
+            )
+
+        for b in builds:
+            if self.cache is not None and b.key is not None and b.out_path is not None:
+                with (
+                    mp.core.profiling.span(b.name, SpanKind.INTEGRATION),
+                    mp.core.profiling.span("cache store"),
+                ):
+                    self.cache.store(b.key, b.out_path)
+
+        return BuildCacheStats({b.name: b.status for b in builds})
+
+    def _build_integration_from_source(
+        self,
+        integration_path: pathlib.Path,
+        status: CacheStatus,
+        key: str | None = None,
+    ) -> _IntegrationBuild:
+        is_non_built: bool = mp.core.file_utils.is_non_built(integration_path)
+        with mp.core.profiling.span("load integration"):
+            integration: Integration = self._get_integration_to_build(integration_path)
+
         self._build_integration(integration, integration_path)
-        self._remove_project_files_from_built_out_path(integration.identifier)
+        with mp.core.profiling.span("remove project files"):
+            self._remove_project_files_from_built_out_path(integration.identifier)
+
+        with mp.core.profiling.span("marketplace fragment"):
+            write_marketplace_fragment(
+                self.out_path / integration.identifier, self.fragments_path, key
+            )
+        return _IntegrationBuild(
+            name=integration_path.name,
+            status=status,
+            key=key,
+            out_path=self.out_path / integration.identifier,
+            needs_format=is_non_built,
+        )
 
     def _get_integration_to_build(self, integration_path: pathlib.Path) -> Integration:
         if not mp.core.file_utils.is_non_built(integration_path):
@@ -168,10 +292,16 @@ class Marketplace:
         integration_out_path.mkdir(exist_ok=True)
 
         built: BuiltIntegration = integration.to_built()
-        restructure_integration(built, integration_path, integration_out_path)
+        restructure_integration(
+            built,
+            integration_path,
+            integration_out_path,
+            RestructureOptions(self.wheel_store, self.code_cache, format_code=False),
+        )
 
-        full_details: BuiltFullDetails = integration.to_built_full_details()
-        write_full_details(full_details, integration_out_path)
+        with mp.core.profiling.span("full details"):
+            full_details: BuiltFullDetails = integration.to_built_full_details()
+            write_full_details(full_details, integration_out_path)
 
     def _remove_project_files_from_built_out_path(self, integration_id: str) -> None:
         rich.print("Removing unneeded files from out path")
@@ -205,9 +335,7 @@ class Marketplace:
         paths: Iterator[pathlib.Path] = (
             p for p in integration_paths if p.exists() and mp.core.file_utils.is_integration(p)
         )
-        processes: int = mp.core.config.get_processes_number()
-        with multiprocessing.Pool(processes=processes) as pool:
-            pool.map(self.deconstruct_integration, paths)
+        mp.core.scheduler.map_processes(self.deconstruct_integration, paths)
 
     def deconstruct_integration(self, integration_path: pathlib.Path) -> None:
         """Deconstruct a single integration provided by `integration_path`.
@@ -272,3 +400,15 @@ class Marketplace:
             integration / mp.core.constants.README_FILE,
             integration / mp.core.constants.INTEGRATION_VENV,
         )
+
+
+def _get_groups_integrations(group_paths: Iterable[pathlib.Path]) -> list[pathlib.Path]:
+    integrations: list[pathlib.Path] = []
+    for group_dir in group_paths:
+        if not group_dir.exists():
+            msg: str = f"Invalid integration {group_dir}"
+            raise FileNotFoundError(msg)
+
+        integrations.extend(group_dir.iterdir())
+
+    return integrations
@@ -24,7 +24,8 @@ from __future__ import annotations
 
 import dataclasses
 import json
-from typing import TYPE_CHECKING, NamedTuple
+import operator
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import mp.core.constants
 import mp.core.file_utils
@@ -51,6 +52,8 @@ SECONDS_IN_DAY: int = SECONDS_IN_MINUTE * MINUTES_IN_HOUR * HOURS_IN_DAY
 DAY_IN_MILLISECONDS: int = mp.core.constants.MS_IN_SEC * SECONDS_IN_DAY
 UPDATE_NOTIFICATIONS_DAYS: int = 4
 NEW_NOTIFICATION_DAYS: int = 30
+FRAGMENT_KEY: str = "key"
+FRAGMENT_METADATA: str = "metadata"
 
 
 class DuplicateIntegrationIdentifierInMarketplaceError(Exception):
@@ -65,11 +68,17 @@ class ReleaseTimes(NamedTuple):
     new_notification: int | None
 
 
-def write_marketplace_json(dst: pathlib.Path) -> None:
+def write_marketplace_json(dst: pathlib.Path, fragments_dir: pathlib.Path | None = None) -> None:
     """Write the marketplace JSON file to a path.
 
+    If `fragments_dir` is provided, the marketplace JSON is assembled from the
+    fragments the build wrote for each integration, and only integrations
+    without a fragment are read from their built files. Fragments are written
+    for those integrations, so the next time they are not read again.
+
     Args:
         dst: destination path to write the marketplace JSON into
+        fragments_dir: the directory of the integrations' marketplace fragments
 
     Raises:
         DuplicateIntegrationIdentifierInMarketplaceError:
@@ -84,11 +93,13 @@ def write_marketplace_json(dst: pathlib.Path) -> None:
     duplicates: list[tuple[str, str]] = []
     def_files: list[BuiltFullDetailsIntegrationMetadata] = []
     for i in products.integrations:
-        mjd: MarketplaceJsonDefinition = MarketplaceJsonDefinition(i)
-        def_file_path: pathlib.Path = i / mp.core.constants.INTEGRATION_DEF_FILE.format(
-            i.name,
+        def_file: BuiltFullDetailsIntegrationMetadata | None = (
+            load_marketplace_fragment(fragments_dir, i.name) if fragments_dir is not None else None
         )
-        def_file: BuiltFullDetailsIntegrationMetadata = mjd.get_def_file(def_file_path)
+        if def_file is None:
+            def_file = MarketplaceJsonDefinition(i).get_def_file()
+            if fragments_dir is not None:
+                _write_fragment(fragments_dir, i.name, def_file, key=None)
 
         identifier: str = def_file["Identifier"]
         if identifier in identifiers:
@@ -102,27 +113,113 @@ def write_marketplace_json(dst: pathlib.Path) -> None:
         msg: str = f"The following integrations have duplicates: {names}"
         raise DuplicateIntegrationIdentifierInMarketplaceError(msg)
 
+    def_files.sort(key=operator.itemgetter("Identifier"))
     marketplace_json: pathlib.Path = dst / mp.core.constants.MARKETPLACE_JSON_NAME
     marketplace_json.write_text(json.dumps(def_files, sort_keys=True, indent=4), encoding="UTF-8")
 
 
+def write_marketplace_fragment(
+    integration_out_path: pathlib.Path,
+    fragments_dir: pathlib.Path,
+    key: str | None = None,
+) -> None:
+    """Write a built integration's marketplace JSON definition into a fragment.
+
+    Fragments are compact and are later assembled into the marketplace JSON by
+    `write_marketplace_json`, without reading the integration's built files again.
+
+    Args:
+        integration_out_path: the built integration's "out" directory
+        fragments_dir: the directory to write the fragment into
+        key: the build cache key of the integration, if it has one
+
+    """
+    def_file: BuiltFullDetailsIntegrationMetadata = MarketplaceJsonDefinition(
+        integration_out_path
+    ).get_def_file()
+    _write_fragment(fragments_dir, integration_out_path.name, def_file, key)
+
+
+def has_marketplace_fragment(fragments_dir: pathlib.Path, name: str, key: str) -> bool:
+    """Check whether an integration has a fragment of the build with `key`.
+
+    Args:
+        fragments_dir: the directory of the integrations' marketplace fragments
+        name: the name of the integration's "out" directory
+        key: the build cache key of the integration
+
+    Returns:
+        Whether the integration's fragment was written for the build with `key`
+
+    """
+    fragment: dict[str, Any] | None = _read_fragment(fragments_dir, name)
+    return fragment is not None and fragment.get(FRAGMENT_KEY) == key
+
+
+def load_marketplace_fragment(
+    fragments_dir: pathlib.Path,
+    name: str,
+) -> BuiltFullDetailsIntegrationMetadata | None:
+    """Load an integration's marketplace JSON definition from its fragment.
+
+    Args:
+        fragments_dir: the directory of the integrations' marketplace fragments
+        name: the name of the integration's "out" directory
+
+    Returns:
+        The integration's marketplace JSON definition, or `None` if it has no
+        valid fragment
+
+    """
+    fragment: dict[str, Any] | None = _read_fragment(fragments_dir, name)
+    if fragment is None or not isinstance(fragment.get(FRAGMENT_METADATA), dict):
+        return None
+
+    return fragment[FRAGMENT_METADATA]
+
+
+def _write_fragment(
+    fragments_dir: pathlib.Path,
+    name: str,
+    def_file: BuiltFullDetailsIntegrationMetadata,
+    key: str | None,
+) -> None:
+    fragments_dir.mkdir(parents=True, exist_ok=True)
+    mp.core.file_utils.write_text_atomically(
+        _get_fragment_path(fragments_dir, name),
+        json.dumps({FRAGMENT_KEY: key, FRAGMENT_METADATA: def_file}, separators=(",", ":")),
+    )
+
+
+def _read_fragment(fragments_dir: pathlib.Path, name: str) -> dict[str, Any] | None:
+    try:
+        fragment: Any = json.loads(_get_fragment_path(fragments_dir, name).read_bytes())
+
+    except (OSError, ValueError):
+        return None
+
+    return fragment if isinstance(fragment, dict) else None
+
+
+def _get_fragment_path(fragments_dir: pathlib.Path, name: str) -> pathlib.Path:
+    return fragments_dir / f"{name}.json"
+
+
 @dataclasses.dataclass(slots=True, frozen=True)
 class MarketplaceJsonDefinition:
     integration_path: pathlib.Path
 
-    def get_def_file(
-        self,
-        def_file_path: pathlib.Path,
-    ) -> BuiltFullDetailsIntegrationMetadata:
+    def get_def_file(self) -> BuiltFullDetailsIntegrationMetadata:
         """Get an integration's marketplace JSON definition.
 
-        Args:
-            def_file_path: The integration's `.def` file's path
-
         Returns:
             An integrations built version of the marketplace JSON definition
 
         """
+        def_file_path: pathlib.Path = (
+            self.integration_path
+            / mp.core.constants.INTEGRATION_DEF_FILE.format(self.integration_path.name)
+        )
         metadata: BuiltFullDetailsIntegrationMetadata = json.loads(
             def_file_path.read_text(encoding="utf-8")
         )
@@ -33,42 +33,72 @@ from .restructurable import Restructurable
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import Iterable
+
+
+SCRIPTS_DIRS: tuple[str, ...] = (
+    mp.core.constants.OUT_ACTION_SCRIPTS_DIR,
+    mp.core.constants.OUT_CONNECTOR_SCRIPTS_DIR,
+    mp.core.constants.OUT_JOB_SCRIPTS_DIR,
+    mp.core.constants.OUT_WIDGET_SCRIPTS_DIR,
+    mp.core.constants.OUT_MANAGERS_SCRIPTS_DIR,
+)
+MAX_FILES_PER_FORMAT: int = 200
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
 class Code(Restructurable):
     out_path: pathlib.Path
+    cache_dir: pathlib.Path | None = None
+    format_code: bool = True
 
     def restructure(self) -> None:
-        """Restructure an integration's code to its "out" path."""
-        self._restructure_action_code()
-        self._restructure_connectors_code()
-        self._restructure_jobs_code()
-        self._restructure_widget_code()
-        self._restructure_managers_code()
-
-    def _restructure_action_code(self) -> None:
-        self._restructure_code(mp.core.constants.OUT_ACTION_SCRIPTS_DIR)
-
-    def _restructure_connectors_code(self) -> None:
-        self._restructure_code(mp.core.constants.OUT_CONNECTOR_SCRIPTS_DIR)
-
-    def _restructure_jobs_code(self) -> None:
-        self._restructure_code(mp.core.constants.OUT_JOB_SCRIPTS_DIR)
-
-    def _restructure_widget_code(self) -> None:
-        self._restructure_code(mp.core.constants.OUT_WIDGET_SCRIPTS_DIR)
-
-    def _restructure_managers_code(self) -> None:
-        self._restructure_code(mp.core.constants.OUT_MANAGERS_SCRIPTS_DIR)
-
-    def _restructure_code(self, dir_name: str) -> None:
-        out_dir: pathlib.Path = self.out_path / dir_name
-        if not out_dir.exists():
-            return
-
-        files: set[pathlib.Path] = {
-            file for file in out_dir.iterdir() if mp.core.file_utils.is_python_file(file)
-        }
-        mp.core.code_manipulation.restructure_scripts_imports(files)
-        mp.core.code_manipulation.format_python_files(files)
+        """Restructure an integration's code to its "out" path.
+
+        The imports of all the integration's scripts are restructured in a single
+        batch. Unless `format_code` is false, the scripts are then formatted with
+        a single formatter run. Callers that build many integrations can disable
+        it and use `format_integrations_code` once for all of them instead.
+        """
+        files: list[pathlib.Path] = get_scripts_files(self.out_path)
+        mp.core.code_manipulation.restructure_scripts_imports(files, self.cache_dir)
+        if self.format_code and files:
+            mp.core.code_manipulation.format_python_files(files)
+
+
+def get_scripts_files(out_path: pathlib.Path) -> list[pathlib.Path]:
+    """Get all the python script files of a built integration.
+
+    Args:
+        out_path: the integration's "out" path
+
+    Returns:
+        The python files in all the integration's scripts directories
+
+    """
+    files: list[pathlib.Path] = []
+    for dir_name in SCRIPTS_DIRS:
+        out_dir: pathlib.Path = out_path / dir_name
+        if out_dir.exists():
+            files.extend(
+                file
+                for file in sorted(out_dir.iterdir())
+                if mp.core.file_utils.is_python_file(file)
+            )
+
+    return files
+
+
+def format_integrations_code(out_paths: Iterable[pathlib.Path]) -> None:
+    """Format the scripts of multiple built integrations together.
+
+    The files are formatted by as few formatter runs as possible - they are only
+    split into batches to keep the command line within the OS's length limits.
+
+    Args:
+        out_paths: the "out" paths of the integrations to format
+
+    """
+    files: list[pathlib.Path] = [f for p in out_paths for f in get_scripts_files(p)]
+    for i in range(0, len(files), MAX_FILES_PER_FORMAT):
+        mp.core.code_manipulation.format_python_files(files[i : i + MAX_FILES_PER_FORMAT])
@@ -4,6 +4,8 @@ This module provides a class, `Dependencies`, that handles the process of
 resolving and downloading the required dependencies for an integration.
 It leverages temporary directories and files to manage the download process
 and then copies the resolved dependencies to the integration's output path.
+When a `WheelStore` is provided, resolved requirements and downloaded wheels
+are shared between integrations and builds instead.
 """
 
 # Copyright 2025 Google LLC
@@ -26,20 +28,29 @@ import dataclasses
 import pathlib
 import shutil
 import tempfile
+from typing import TYPE_CHECKING
 
 import mp.core.constants
 import mp.core.unix
 
 from .restructurable import Restructurable
 
+if TYPE_CHECKING:
+    from mp.build_project.wheel_store import WheelStore
+
 
 @dataclasses.dataclass(slots=True, frozen=True)
 class Dependencies(Restructurable):
     path: pathlib.Path
     out_path: pathlib.Path
+    wheel_store: WheelStore | None = None
 
     def restructure(self) -> None:
         """Restructure an integration's dependencies, downloading them to `out_path`."""
+        if self.wheel_store is not None:
+            self._restructure_from_wheel_store(self.wheel_store)
+            return
+
         with (
             tempfile.NamedTemporaryFile(
                 mode="r",
@@ -67,3 +78,13 @@ class Dependencies(Restructurable):
                 shutil.copytree(deps, out_deps)
         finally:
             requirements.unlink()
+
+    def _restructure_from_wheel_store(self, wheel_store: WheelStore) -> None:
+        with tempfile.TemporaryDirectory(prefix="requirements_") as d:
+            requirements: pathlib.Path = pathlib.Path(d) / mp.core.constants.REQUIREMENTS_FILE
+            wheel_store.resolve_requirements(self.path, requirements)
+            wheel_store.fetch_wheels(
+                project_path=self.path,
+                requirements_path=requirements,
+                dst_path=self.out_path / mp.core.constants.OUT_DEPENDENCIES_DIR,
+            )
@@ -3,7 +3,9 @@
 This module provides a high-level function, `restructure_integration`, which
 coordinates the individual restructuring steps for an integration, including
 metadata, scripts, code, and dependencies. It adapts the process based on
-whether the integration is fully built or partially built.
+whether the integration is fully built or partially built. The dependencies
+step is I/O-bound and only writes to its own directory, so it runs alongside
+the other steps.
 """
 
 # Copyright 2025 Google LLC
@@ -22,24 +24,47 @@ whether the integration is fully built or partially built.
 
 from __future__ import annotations
 
+import dataclasses
 from typing import TYPE_CHECKING
 
 import rich
 
 import mp.core.file_utils
+import mp.core.scheduler
+from mp.core.scheduler import Stage, StageKind
 
 from . import code, dependencies, metadata, scripts
 
 if TYPE_CHECKING:
     import pathlib
 
+    from mp.build_project.wheel_store import WheelStore
     from mp.core.data_models.integration import BuiltIntegration
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class RestructureOptions:
+    """Options of an integration's restructure.
+
+    Attributes:
+        wheel_store: A shared store to get the integration's dependencies from.
+            If not provided, the dependencies are resolved and downloaded from scratch
+        code_cache: A directory to cache the integration's restructured scripts in
+        format_code: Whether to format the integration's scripts. Disable it to
+            format the scripts of many integrations together afterward
+
+    """
+
+    wheel_store: WheelStore | None = None
+    code_cache: pathlib.Path | None = None
+    format_code: bool = True
+
+
 def restructure_integration(
     integration_metadata: BuiltIntegration,
     integration_path: pathlib.Path,
     integration_out_path: pathlib.Path,
+    options: RestructureOptions | None = None,
 ) -> None:
     """Restructure an integration to its "out" path.
 
@@ -49,19 +74,28 @@ def restructure_integration(
         integration_metadata: An integration's meta - built version
         integration_path: The path to the integration's folder
         integration_out_path: The path to the integration's "out" folder
+        options: The restructure's options. The defaults are used if not provided
 
     """
+    options = options or RestructureOptions()
     rich.print(f"Restructuring {integration_metadata['metadata']['Identifier']}")
-    if mp.core.file_utils.is_non_built(integration_path):
-        rich.print("Restructuring metadata")
-        metadata.Metadata(integration_out_path, integration_metadata).restructure()
-
-        rich.print("Restructuring scripts")
-        scripts.Scripts(integration_path, integration_out_path).restructure()
-
-        rich.print("Restructuring code")
-        code.Code(integration_out_path).restructure()
-
+    stages: list[Stage] = []
     if not mp.core.file_utils.is_built(integration_path):
-        rich.print("Restructuring dependencies")
-        dependencies.Dependencies(integration_path, integration_out_path).restructure()
+        deps: dependencies.Dependencies = dependencies.Dependencies(
+            integration_path,
+            integration_out_path,
+            options.wheel_store,
+        )
+        stages.append(Stage("dependencies", deps.restructure, kind=StageKind.IO))
+
+    if mp.core.file_utils.is_non_built(integration_path):
+        meta: metadata.Metadata = metadata.Metadata(integration_out_path, integration_metadata)
+        scripts_: scripts.Scripts = scripts.Scripts(integration_path, integration_out_path)
+        code_: code.Code = code.Code(integration_out_path, options.code_cache, options.format_code)
+        stages.extend((
+            Stage("metadata", meta.restructure),
+            Stage("scripts", scripts_.restructure, depends_on=("metadata",)),
+            Stage("code", code_.restructure, depends_on=("scripts",)),
+        ))
+
+    mp.core.scheduler.run_stages(stages)
@@ -0,0 +1,312 @@
+"""Persistent store of downloaded wheels and resolved requirements.
+
+This module provides the `WheelStore` class, which is shared by all the
+integrations built on a machine. It keeps two caches:
+
+- Resolved `requirements.txt` files, keyed by a hash of the integration's
+  `uv.lock` and `pyproject.toml` and the Python version, so `uv export` only
+  runs when an integration's lock changes.
+- Downloaded wheels, keyed by a hash of the pinned requirement line, the Python
+  version and the platform tag, so every pinned requirement is downloaded once
+  and then hard-linked into each integration's dependencies directory.
+
+When both caches are warm, building an integration's dependencies does not
+require network access.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pathlib
+import re
+import shutil
+import sys
+import tempfile
+from typing import TYPE_CHECKING
+
+import mp.core.config
+import mp.core.constants
+import mp.core.unix
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+LOCAL_WHEEL_SUFFIX: str = ".whl"
+REQUIREMENT_NAME_REGEX: re.Pattern[str] = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)")
+NAME_SEPARATORS_REGEX: re.Pattern[str] = re.compile(r"[-_.]+")
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Requirement:
+    line: str
+    name: str
+    key: str
+    has_marker: bool
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class WheelStore:
+    root: pathlib.Path
+
+    @classmethod
+    def from_config(cls) -> WheelStore:
+        """Create a wheel store located in the configured marketplace.
+
+        Returns:
+            A `WheelStore` rooted in the marketplace's cache directory
+
+        """
+        return cls(mp.core.config.get_marketplace_path() / mp.core.constants.CACHE_DIR_NAME)
+
+    @property
+    def wheels_path(self) -> pathlib.Path:
+        """The directory that contains an entry of wheels for each requirement."""
+        return self.root / mp.core.constants.WHEELS_CACHE_DIR_NAME
+
+    @property
+    def requirements_path(self) -> pathlib.Path:
+        """The directory that contains the resolved requirements of each lock."""
+        return self.root / mp.core.constants.REQUIREMENTS_CACHE_DIR_NAME
+
+    def resolve_requirements(
+        self,
+        project_path: pathlib.Path,
+        requirements_path: pathlib.Path,
+    ) -> None:
+        """Write a project's resolved requirements into `requirements_path`.
+
+        The requirements are restored from the store if the project's lock did not
+        change since they were last resolved. Otherwise, they are exported using
+        `uv` and stored.
+
+        Args:
+            project_path: the path to the project folder - one that contains a
+                `pyproject.toml` file
+            requirements_path: the path to the requirements' file to write into
+
+        """
+        key: str | None = _get_lock_key(project_path)
+        if key is not None:
+            cached: pathlib.Path = self.requirements_path / f"{key}.txt"
+            if cached.exists():
+                shutil.copyfile(cached, requirements_path)
+                return
+
+        mp.core.unix.compile_core_integration_dependencies(project_path, requirements_path)
+
+        # `uv export` creates the lock file if it did not exist
+        key = _get_lock_key(project_path)
+        if key is not None:
+            self.requirements_path.mkdir(parents=True, exist_ok=True)
+            _copy_file_atomically(requirements_path, self.requirements_path / f"{key}.txt")
+
+    def fetch_wheels(
+        self,
+        project_path: pathlib.Path,
+        requirements_path: pathlib.Path,
+        dst_path: pathlib.Path,
+    ) -> None:
+        """Place the wheels of all the requirements in `dst_path`.
+
+        Requirements that are missing from the store are downloaded with a single
+        `pip download` call and then stored. All the wheels are then hard-linked
+        from the store into `dst_path`, falling back to a copy if the store and
+        the destination are on different file systems.
+
+        Args:
+            project_path: the path of the project repository
+            requirements_path: the path of the resolved 'requirements.txt' file
+            dst_path: the path to place the wheels in
+
+        """
+        dst_path.mkdir(parents=True, exist_ok=True)
+        requirements: list[Requirement] = parse_requirements(
+            requirements_path.read_text(encoding="utf-8"),
+            project_path=project_path,
+        )
+        missing: list[Requirement] = [r for r in requirements if not self._has_entry(r)]
+        if missing:
+            self._download(project_path, missing, dst_path)
+
+        for requirement in requirements:
+            entry: pathlib.Path = self.wheels_path / requirement.key
+            if entry.exists():
+                _link_files(entry.iterdir(), dst_path)
+
+    def _has_entry(self, requirement: Requirement) -> bool:
+        return (self.wheels_path / requirement.key).is_dir()
+
+    def _download(
+        self,
+        project_path: pathlib.Path,
+        requirements: list[Requirement],
+        dst_path: pathlib.Path,
+    ) -> None:
+        with tempfile.TemporaryDirectory(prefix="wheels_") as d:
+            tmp: pathlib.Path = pathlib.Path(d)
+            requirements_file: pathlib.Path = tmp / mp.core.constants.REQUIREMENTS_FILE
+            requirements_file.write_text(
+                "\n".join(r.line for r in requirements),
+                encoding="utf-8",
+            )
+            downloads: pathlib.Path = tmp / "downloads"
+            downloads.mkdir()
+            mp.core.unix.download_wheels_from_requirements(
+                project_path=project_path,
+                requirements_path=requirements_file,
+                dst_path=downloads,
+                no_deps=True,
+            )
+
+            files: list[pathlib.Path] = sorted(downloads.iterdir())
+            matches: dict[Requirement, list[pathlib.Path]] = {
+                r: [f for f in files if _is_file_of_requirement(f, r)] for r in requirements
+            }
+
+            # Requirements excluded by their environment marker legitimately have no
+            # files. An empty entry is stored for them only if the download was
+            # complete, to not cache a failure that pip was allowed to ignore
+            is_complete: bool = all(m for r, m in matches.items() if not r.has_marker)
+            for requirement, requirement_files in matches.items():
+                if requirement_files or (requirement.has_marker and is_complete):
+                    self._store_entry(requirement, requirement_files)
+
+            matched: set[pathlib.Path] = {f for m in matches.values() for f in m}
+            _link_files((f for f in files if f not in matched), dst_path)
+
+    def _store_entry(self, requirement: Requirement, files: Iterable[pathlib.Path]) -> None:
+        entry: pathlib.Path = self.wheels_path / requirement.key
+        if entry.exists():
+            return
+
+        self.wheels_path.mkdir(parents=True, exist_ok=True)
+        tmp: pathlib.Path = pathlib.Path(
+            tempfile.mkdtemp(prefix=f".{requirement.key}_", dir=self.wheels_path)
+        )
+        try:
+            for file in files:
+                shutil.copyfile(file, tmp / file.name)
+
+            tmp.replace(entry)
+
+        except OSError:
+            if not entry.exists():
+                raise
+
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def parse_requirements(content: str, project_path: pathlib.Path) -> list[Requirement]:
+    """Parse the content of a resolved 'requirements.txt' file.
+
+    Comments, blank lines, option lines and indented `# via` annotations are
+    skipped.
+
+    Args:
+        content: the content of the requirements' file
+        project_path: the path that relative local requirements are relative to
+
+    Returns:
+        The parsed requirements
+
+    """
+    python_version: str = f"{sys.version_info.major}.{sys.version_info.minor}"
+    platform: str = mp.core.unix.get_wheels_platform()
+    requirements: list[Requirement] = []
+    for raw in content.splitlines():
+        if not raw or raw[0].isspace() or raw.startswith(("#", "-")):
+            continue
+
+        line: str = raw.strip()
+        h = hashlib.sha256(f"{line}\0{python_version}\0{platform}\0".encode())
+        name: str
+        local: pathlib.Path = project_path / line
+        if line.endswith(LOCAL_WHEEL_SUFFIX) and local.is_file():
+            name = local.name.split("-", maxsplit=1)[0]
+            h.update(local.read_bytes())
+
+        elif match := REQUIREMENT_NAME_REGEX.match(line):
+            name = match.group(1)
+
+        else:
+            continue
+
+        requirements.append(
+            Requirement(
+                line=line,
+                name=_normalize_name(name),
+                key=h.hexdigest(),
+                has_marker=";" in line,
+            )
+        )
+
+    return requirements
+
+
+def _get_lock_key(project_path: pathlib.Path) -> str | None:
+    lock: pathlib.Path = project_path / mp.core.constants.LOCK_FILE
+    if not lock.exists():
+        return None
+
+    h = hashlib.sha256()
+    h.update(lock.read_bytes())
+    h.update(b"\0")
+    project: pathlib.Path = project_path / mp.core.constants.PROJECT_FILE
+    if project.exists():
+        h.update(project.read_bytes())
+
+    h.update(
+        f"\0{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}".encode()
+    )
+    return h.hexdigest()
+
+
+def _normalize_name(name: str) -> str:
+    return NAME_SEPARATORS_REGEX.sub("_", name).lower()
+
+
+def _is_file_of_requirement(file: pathlib.Path, requirement: Requirement) -> bool:
+    file_name: str = _normalize_name(file.name)
+    return re.match(rf"{re.escape(requirement.name)}_\d", file_name) is not None
+
+
+def _link_files(files: Iterable[pathlib.Path], dst_path: pathlib.Path) -> None:
+    for file in files:
+        dst: pathlib.Path = dst_path / file.name
+        if dst.exists():
+            continue
+
+        try:
+            os.link(file, dst)
+        except OSError:
+            shutil.copyfile(file, dst)
+
+
+def _copy_file_atomically(src: pathlib.Path, dst: pathlib.Path) -> None:
+    fd, tmp = tempfile.mkstemp(prefix=f".{dst.name}_", dir=dst.parent)
+    os.close(fd)
+    tmp_path: pathlib.Path = pathlib.Path(tmp)
+    try:
+        shutil.copyfile(src, tmp_path)
+        tmp_path.replace(dst)
+
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,60 @@
+"""The `mp` CLI's subcommands.
+
+Each subcommand is registered as a lazy command, so its module is imported only
+when the command is used.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import typer
+
+from .core.lazy_group import LazyCommand, LazyTyperGroup
+
+COMMANDS: tuple[LazyCommand, ...] = (
+    LazyCommand("build", "mp.build_project", "Build the marketplace"),
+    LazyCommand("check", "mp.check", "Check and lint python"),
+    LazyCommand("config", "mp.config", "Configure script settings"),
+    LazyCommand("format", "mp.format", "Format '.py' files."),
+    LazyCommand("test", "mp.run_pre_build_tests", "Run integration pre_build tests"),
+    LazyCommand(
+        "dev-env",
+        "mp.dev_env",
+        "Commands for interacting with the development environment (playground)",
+        is_group=True,
+    ),
+    LazyCommand("validate", "mp.validate", "Validate the marketplace"),
+)
+
+
+class MpGroup(LazyTyperGroup):
+    lazy_commands = COMMANDS
+
+
+def create_app() -> typer.Typer:
+    """Create the `mp` CLI application.
+
+    Returns:
+        The application, with all subcommands registered lazily
+
+    """
+    app: typer.Typer = typer.Typer(cls=MpGroup)
+    app.callback()(_callback)
+    return app
+
+
+def _callback() -> None:
+    pass
@@ -95,7 +95,10 @@ def _set_marketplace_path(marketplace_path: str) -> None:
 
 def _set_processes_number(processes: int) -> None:
     if not isinstance(processes, int) or not _is_processes_in_range(processes):
-        msg: str = "Processes must be an integer between 1 and 10"
+        msg: str = (
+            "Processes must be an integer between"
+            f" {mp.core.config.PROCESSES_MIN_VALUE} and {mp.core.config.PROCESSES_MAX_VALUE}"
+        )
         raise ValueError(msg)
 
     mp.core.config.set_processes_number(processes)
@@ -17,12 +17,15 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import tokenize
 import warnings
 from typing import TYPE_CHECKING
 
 import libcst as cst
 
-from . import constants, file_utils, unix
+from . import constants, file_utils, scheduler, unix, utils
 
 if TYPE_CHECKING:
     import pathlib
@@ -31,6 +34,15 @@ if TYPE_CHECKING:
     from .custom_types import RuffParams
 
 
+RESERVED_IMPORT_NAMES: frozenset[str] = frozenset({
+    constants.CORE_SCRIPTS_DIR,
+    constants.COMMON_SCRIPTS_DIR,
+    constants.SDK_PACKAGE_NAME,
+})
+RELATIVE_IMPORT_TOKENS: frozenset[str] = frozenset({".", "..."})
+SKIPPED_TOKEN_TYPES: frozenset[int] = frozenset({tokenize.NL, tokenize.COMMENT})
+
+
 class LinterWarning(RuntimeWarning):
     """Found linting issues."""
 
@@ -82,16 +94,130 @@ def format_python_files(paths: Iterable[pathlib.Path]) -> None:
         warnings.warn(msg, FormatterWarning, stacklevel=1)
 
 
-def restructure_scripts_imports(paths: Iterable[pathlib.Path]) -> None:
+def restructure_scripts_imports(
+    paths: Iterable[pathlib.Path],
+    cache_dir: pathlib.Path | None = None,
+) -> None:
     """Restructure script imports in python files.
 
+    Files whose tokens show no relative or reserved imports are left as they are
+    without being parsed. The rest are parsed and transformed on the shared
+    process pool. If `cache_dir` is provided, the transformed code is cached
+    there by the hash of the original code, so unchanged files are never
+    parsed again.
+
     Args:
         paths: the paths of the files to be modified.
+        cache_dir: a directory to cache the transformed code in
+
+    """
+    codes: dict[pathlib.Path, str] = {
+        p: p.read_bytes().decode("utf-8") for p in paths if p.suffix == ".py"
+    }
+    results: dict[pathlib.Path, str] = {
+        p: _normalize_newlines(c) for p, c in codes.items() if not needs_imports_restructure(c)
+    }
+
+    pending: list[pathlib.Path] = []
+    for path, code in codes.items():
+        if path in results:
+            continue
+
+        cached: str | None = _get_cached_code(cache_dir, code)
+        if cached is None:
+            pending.append(path)
+        else:
+            results[path] = cached
+
+    transformed: list[str] = scheduler.map_processes(
+        restructure_script_imports,
+        [_normalize_newlines(codes[p]) for p in pending],
+    )
+    for path, code in zip(pending, transformed, strict=True):
+        results[path] = code
+        _set_cached_code(cache_dir, codes[path], code)
+
+    for path, code in results.items():
+        if code != codes[path]:
+            path.write_text(code, encoding="utf-8")
+
+
+def needs_imports_restructure(code_string: str) -> bool:
+    """Check whether a code string has imports that `ImportTransformer` changes.
+
+    This only tokenizes the code, which is much cheaper than parsing it.
+
+    Args:
+        code_string: the code string to check.
+
+    Returns:
+        Whether the code contains a relative import or an import from one of the
+        reserved packages. Code that cannot be tokenized is considered as needing
+        a restructure, so that parsing it reports the error.
 
     """
-    paths = [p for p in paths if p.suffix == ".py"]
-    for path in paths:
-        file_utils.replace_file_content(path, replace_fn=restructure_script_imports)
+    if "from" not in code_string:
+        return False
+
+    previous: tokenize.TokenInfo | None = None
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code_string).readline):
+            if token.type in SKIPPED_TOKEN_TYPES:
+                continue
+
+            if (
+                previous is not None
+                and previous.type == tokenize.NAME
+                and previous.string == "from"
+                and _is_restructured_import_start(token)
+            ):
+                return True
+
+            previous = token
+
+    except (tokenize.TokenError, SyntaxError):
+        return True
+
+    return False
+
+
+def _is_restructured_import_start(token: tokenize.TokenInfo) -> bool:
+    if token.type == tokenize.OP:
+        return token.string in RELATIVE_IMPORT_TOKENS
+
+    return token.type == tokenize.NAME and token.string in RESERVED_IMPORT_NAMES
+
+
+def _normalize_newlines(code_string: str) -> str:
+    return code_string.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _get_code_cache_key(code_string: str) -> str:
+    h = hashlib.sha256(f"mp={utils.get_mp_version()}\0".encode())
+    h.update(code_string.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _get_cached_code(cache_dir: pathlib.Path | None, code_string: str) -> str | None:
+    if cache_dir is None:
+        return None
+
+    cached: pathlib.Path = cache_dir / _get_code_cache_key(code_string)
+    if not cached.exists():
+        return None
+
+    return cached.read_text(encoding="utf-8")
+
+
+def _set_cached_code(cache_dir: pathlib.Path | None, code_string: str, result: str) -> None:
+    if cache_dir is None:
+        return
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    file_utils.write_text_atomically(
+        cache_dir / _get_code_cache_key(code_string),
+        result,
+    )
 
 
 def restructure_script_imports(code_string: str) -> str:
@@ -19,6 +19,7 @@ from __future__ import annotations
 import configparser
 import dataclasses
 import functools
+import os
 import pathlib
 import typing
 import warnings
@@ -38,7 +39,7 @@ QUIET_LOG_KEY: str = "is_quiet"
 DEFAULT_SECTION_NAME: str = "DEFAULT"
 RUNTIME_SECTION_NAME: str = "RUNTIME"
 PROCESSES_MIN_VALUE: int = 1
-PROCESSES_MAX_VALUE: int = 10
+PROCESSES_MAX_VALUE: int = max(10, os.cpu_count() or 1)
 DEFAULT_PROCESSES_NUMBER: int = 5
 DEFAULT_QUIET_VALUE: str = "no"
 DEFAULT_VERBOSE_VALUE: str = "no"
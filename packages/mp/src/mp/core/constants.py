@@ -28,6 +28,7 @@ INTEGRATIONS_TYPES: tuple[str, ...] = (
 )
 OUT_INTEGRATIONS_DIR_NAME: str = "integrations"
 OUT_DIR_NAME: str = "out"
+OUT_MARKETPLACE_FRAGMENTS_DIR_NAME: str = "marketplace_fragments"
 REQUIREMENTS_FILE: str = "requirements.txt"
 INTEGRATION_DEF_FILE: str = "Integration-{0}.def"
 INTEGRATION_FULL_DETAILS_FILE: str = "{0}.fulldetails"
@@ -35,6 +36,15 @@ RN_JSON_FILE: str = "RN.json"
 OUT_DEPENDENCIES_DIR: str = "Dependencies"
 INTEGRATION_VENV: str = ".venv"
 MARKETPLACE_JSON_NAME: str = "marketplace.json"
+CACHE_DIR_NAME: str = ".mp_cache"
+BUILD_CACHE_DIR_NAME: str = "build"
+WHEELS_CACHE_DIR_NAME: str = "wheels"
+REQUIREMENTS_CACHE_DIR_NAME: str = "requirements"
+CODE_CACHE_DIR_NAME: str = "code"
+METADATA_CACHE_DIR_NAME: str = "metadata"
+VENVS_CACHE_DIR_NAME: str = "venvs"
+TEST_DURATIONS_FILE: str = "test_durations.json"
+DEPLOYMENTS_FILE: str = "deployments.json"
 
 OUT_ACTIONS_META_DIR: str = "ActionsDefinitions"
 OUT_CONNECTORS_META_DIR: str = "Connectors"
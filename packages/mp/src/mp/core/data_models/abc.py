@@ -16,15 +16,18 @@ from __future__ import annotations
 
 import abc
 import enum
+import functools
 import json
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, cast
 
 import pydantic
 import yaml
 
 import mp.core.utils
 
+from . import metadata_cache
+
 if TYPE_CHECKING:
     import pathlib
 
@@ -303,13 +306,30 @@ class ScriptMetadata(BuildableScript[_BT, _NBT], abc.ABC, Generic[_BT, _NBT]):
         Returns:
             A metadata object
 
+        """
+        return metadata_cache.load(
+            _get_namespace(cls),
+            metadata_path,
+            functools.partial(cls._from_non_built_content, metadata_path),
+        )
+
+    @classmethod
+    def _from_non_built_content(cls, metadata_path: pathlib.Path, non_built_content: str) -> Self:
+        """Create the script's metadata object from the non-built metadata's content.
+
+        Args:
+            metadata_path: The path to the non-built metadata component
+            non_built_content: The non-built metadata component's content
+
+        Returns:
+            A metadata object
+
         Raises:
             ValueError: when the non-built YAML failed to be loaded
 
         """
-        non_built_content: str = metadata_path.read_text(encoding="utf-8")
         try:
-            metadata_json: _NBT = yaml.safe_load(non_built_content)
+            metadata_json: _NBT = cast("_NBT", mp.core.utils.load_yaml(non_built_content))
             non_built: Self = cls.from_non_built(metadata_path.stem, metadata_json)
         except (ValueError, yaml.YAMLError) as e:
             msg: str = f"Failed to load yaml from {metadata_path}\n{non_built_content}"
@@ -380,8 +400,7 @@ class SequentialMetadata(Buildable[_BT, _NBT], abc.ABC, Generic[_BT, _NBT]):
             A metadata object
 
         """
-        non_built: str = meta_path.read_text(encoding="utf-8")
-        return cls.from_non_built_str(non_built)
+        return metadata_cache.load(_get_namespace(cls), meta_path, cls.from_non_built_str)
 
     @classmethod
     def from_non_built_str(cls, raw_text: str) -> list[Self]:
@@ -398,10 +417,14 @@ class SequentialMetadata(Buildable[_BT, _NBT], abc.ABC, Generic[_BT, _NBT]):
 
         """
         try:
-            content: list[_NBT] = yaml.safe_load(raw_text)
+            content: list[_NBT] = cast("list[_NBT]", mp.core.utils.load_yaml(raw_text))
             results: list[Self] = [cls.from_non_built(c) for c in content]
         except (ValueError, yaml.YAMLError) as e:
             msg: str = "Failed to load yaml."
             raise ValueError(mp.core.utils.trim_values(msg)) from e
         else:
             return results
+
+
+def _get_namespace(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
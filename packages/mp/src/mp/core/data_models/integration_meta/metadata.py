@@ -17,10 +17,9 @@ from __future__ import annotations
 import base64
 import json
 import pathlib
-from typing import Annotated, Any, NotRequired, Self, TypedDict
+from typing import Annotated, Any, NotRequired, Self, TypedDict, cast
 
 import pydantic
-import yaml
 
 import mp.core.constants
 import mp.core.data_models.abc
@@ -218,7 +217,9 @@ class IntegrationMetadata(
         metadata_path: pathlib.Path = path / mp.core.constants.DEFINITION_FILE
         built: str = metadata_path.read_text(encoding="utf-8")
         try:
-            metadata_content: NonBuiltIntegrationMetadata = yaml.safe_load(built)
+            metadata_content: NonBuiltIntegrationMetadata = cast(
+                "NonBuiltIntegrationMetadata", mp.core.utils.load_yaml(built)
+            )
             _read_image_files(metadata_content, path)
             metadata: Self = cls.from_non_built(metadata_content)
             metadata.is_certified = mp.core.file_utils.is_commercial_integration(path)
@@ -0,0 +1,169 @@
+"""Cache of metadata objects loaded from "non-built" integration files.
+
+Loading a metadata file means parsing its YAML and validating it into pydantic
+models, and the same files are loaded more than once by a single command. This
+module caches the validated objects at two levels:
+
+- In memory, keyed by the file's path, modification time and size, so loading
+  an unchanged file again in the same process does not even read it.
+- On disk, keyed by a hash of the file's content, so unchanged files are not
+  parsed again by later runs. The disk cache is only used after
+  `set_cache_dir` was called.
+
+The cached objects are kept pickled, so every load returns a new object that
+callers are free to modify.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, TypeVar
+
+import pydantic
+
+import mp.core.utils
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_T = TypeVar("_T")
+_MemoryKey = tuple[str, str, int, int]
+
+MAX_UNUSED_SECONDS: int = 14 * 24 * 60 * 60
+
+_memory: dict[_MemoryKey, bytes] = {}
+_memory_lock: threading.Lock = threading.Lock()
+
+
+@dataclasses.dataclass(slots=True)
+class _Settings:
+    cache_dir: pathlib.Path | None = None
+
+
+_settings: _Settings = _Settings()
+
+
+def set_cache_dir(cache_dir: pathlib.Path | None) -> None:
+    """Set the directory of the on-disk cache.
+
+    Args:
+        cache_dir: the directory to cache loaded objects in, or `None` to only
+            cache them in memory
+
+    """
+    _settings.cache_dir = cache_dir
+
+
+def clear() -> None:
+    """Clear the in-memory cache."""
+    with _memory_lock:
+        _memory.clear()
+
+
+def prune() -> None:
+    """Remove on-disk cache entries that were not written or read recently."""
+    cache_dir: pathlib.Path | None = _settings.cache_dir
+    if cache_dir is None or not cache_dir.exists():
+        return
+
+    now: float = time.time()
+    for path in cache_dir.iterdir():
+        try:
+            if now - path.stat().st_mtime > MAX_UNUSED_SECONDS:
+                path.unlink()
+
+        except FileNotFoundError:
+            continue
+
+
+def load(
+    namespace: str,
+    path: pathlib.Path,
+    load_fn: Callable[[str], _T],
+) -> _T:
+    """Load an object from a file, using the cache if possible.
+
+    Args:
+        namespace: identifies the type of the loaded object, so the same file
+            loaded as different types is cached separately
+        path: the path of the file to load
+        load_fn: a function that creates the object from the file's content.
+            It is only called on cache misses
+
+    Returns:
+        The loaded object
+
+    """
+    stat = path.stat()
+    memory_key: _MemoryKey = (namespace, str(path), stat.st_mtime_ns, stat.st_size)
+    with _memory_lock:
+        pickled: bytes | None = _memory.get(memory_key)
+
+    if pickled is None:
+        pickled = _load_pickled(namespace, path, load_fn)
+        with _memory_lock:
+            _memory[memory_key] = pickled
+
+    return pickle.loads(pickled)
+
+
+def _load_pickled(namespace: str, path: pathlib.Path, load_fn: Callable[[str], object]) -> bytes:
+    content: str = path.read_text(encoding="utf-8")
+    disk_path: pathlib.Path | None = _get_disk_path(namespace, path, content)
+    if disk_path is not None and disk_path.exists():
+        # Mark the entry as used, so it is not pruned
+        disk_path.touch()
+        return disk_path.read_bytes()
+
+    pickled: bytes = pickle.dumps(load_fn(content), protocol=pickle.HIGHEST_PROTOCOL)
+    if disk_path is not None:
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(disk_path, pickled)
+
+    return pickled
+
+
+def _get_disk_path(namespace: str, path: pathlib.Path, content: str) -> pathlib.Path | None:
+    if _settings.cache_dir is None:
+        return None
+
+    h = hashlib.sha256(f"mp={mp.core.utils.get_mp_version()}\0".encode())
+    h.update(f"pydantic={pydantic.VERSION}\0{namespace}\0".encode())
+    h.update(f"{path.name}\0".encode())
+    h.update(content.encode("utf-8"))
+    return _settings.cache_dir / h.hexdigest()
+
+
+def _write_atomically(path: pathlib.Path, content: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}_", dir=path.parent)
+    tmp_path: pathlib.Path = pathlib.Path(tmp)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+
+        tmp_path.replace(path)
+
+    finally:
+        tmp_path.unlink(missing_ok=True)
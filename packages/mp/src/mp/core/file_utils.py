@@ -20,9 +20,13 @@ Used for things such as path manipulation and file content operations.
 from __future__ import annotations
 
 import base64
+import contextlib
 import dataclasses
+import os
 import pathlib
 import shutil
+import sys
+import tempfile
 from typing import TYPE_CHECKING, Any
 
 import yaml
@@ -31,9 +35,13 @@ from . import config, constants
 from .custom_types import ManagerName, Products
 from .validators import validate_png_content, validate_svg_content
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 if TYPE_CHECKING:
-    import pathlib
-    from collections.abc import Callable, Mapping, Sequence
+    from collections.abc import Callable, Generator, Mapping, Sequence
 
 
 VALID_REPEATED_FILES: set[str] = {"__init__.py"}
@@ -211,6 +219,65 @@ def replace_file_content(file: pathlib.Path, replace_fn: Callable[[str], str]) -
     file.write_text(file_content, encoding="utf-8")
 
 
+def write_text_atomically(path: pathlib.Path, content: str) -> None:
+    """Write text into a file so that concurrent readers never see partial content.
+
+    Args:
+        path: the file to write into
+        content: the text to write
+
+    """
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}_", dir=path.parent)
+    tmp_path: pathlib.Path = pathlib.Path(tmp)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        tmp_path.replace(path)
+
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def lock_file(path: pathlib.Path) -> Generator[None]:
+    """Hold an exclusive lock on a file, shared with other processes.
+
+    Blocks until the lock is acquired. The file is created if needed and is
+    left in place when the lock is released.
+
+    Args:
+        path: the lock file's path
+
+    Yields:
+        Nothing, while the lock is held
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def remove_paths_if_exists(*paths: pathlib.Path) -> None:
     """Remove all the provided paths."""
     for path in paths:
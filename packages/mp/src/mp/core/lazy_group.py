@@ -0,0 +1,142 @@
+"""A Typer group that imports its sub-commands only when they are used.
+
+Every `mp` command lives in its own sub-package, together with its heavy
+dependencies. Listing the commands in a `LazyTyperGroup`, instead of adding
+their Typer apps to the main app, keeps `mp`'s startup from importing all of
+them: a command's module is imported only when that command runs or when its
+own help is shown.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import importlib
+from typing import TYPE_CHECKING, ClassVar
+
+import typer
+import typer.core
+import typer.main
+
+if TYPE_CHECKING:
+    from typer import _click
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class LazyCommand:
+    name: str
+    module: str
+    help: str
+    is_group: bool = False
+
+
+class LazyTyperGroup(typer.core.TyperGroup):
+    """A Typer group that loads the commands in `lazy_commands` on demand.
+
+    Each lazy command's module must have a Typer app named `app`. Sub-classes
+    set `lazy_commands` to the commands they provide.
+    """
+
+    lazy_commands: ClassVar[tuple[LazyCommand, ...]] = ()
+    _is_formatting_help: bool = False
+
+    @functools.cached_property
+    def _loaded(self) -> dict[str, _click.Command]:
+        return {}
+
+    def list_commands(self, ctx: _click.Context) -> list[str]:
+        """List the names of the group's commands, including the lazy ones.
+
+        Args:
+            ctx: the click context
+
+        Returns:
+            The commands' names
+
+        """
+        return [*super().list_commands(ctx), *(c.name for c in self.lazy_commands)]
+
+    def get_command(self, ctx: _click.Context, cmd_name: str) -> _click.Command | None:
+        """Get a command by its name, importing it if it is a lazy command.
+
+        Args:
+            ctx: the click context
+            cmd_name: the command's name
+
+        Returns:
+            The command, or `None` if the group has no such command
+
+        """
+        lazy: LazyCommand | None = next(
+            (c for c in self.lazy_commands if c.name == cmd_name),
+            None,
+        )
+        if lazy is None:
+            return super().get_command(ctx, cmd_name)
+
+        # The main help only shows the commands' short help, which is known
+        # without importing them
+        if self._is_formatting_help:
+            return typer.core.TyperCommand(name=lazy.name, help=lazy.help)
+
+        if lazy.name not in self._loaded:
+            self._loaded[lazy.name] = load_command(lazy)
+
+        return self._loaded[lazy.name]
+
+    def format_help(self, ctx: _click.Context, formatter: _click.HelpFormatter) -> None:
+        """Write the group's help without importing its lazy commands.
+
+        Args:
+            ctx: the click context
+            formatter: the formatter to write the help into
+
+        """
+        self._is_formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+
+        finally:
+            self._is_formatting_help = False
+
+
+def load_command(lazy: LazyCommand) -> _click.Command:
+    """Import a lazy command's module and create its click command.
+
+    The command is created the same way as when its app is added to a parent
+    app using `add_typer`.
+
+    Args:
+        lazy: the command to load
+
+    Returns:
+        The click command of the lazy command
+
+    Raises:
+        ValueError: if the module's app does not provide the command
+
+    """
+    module_app: typer.Typer = importlib.import_module(lazy.module).app
+    parent: typer.Typer = typer.Typer(add_completion=False)
+    parent.add_typer(module_app, name=lazy.name if lazy.is_group else None)
+    group: typer.core.TyperGroup = typer.main.get_group(parent)
+    command: _click.Command | None = group.commands.get(lazy.name)
+    if command is None:
+        msg: str = f"Module '{lazy.module}' does not provide the command '{lazy.name}'"
+        raise ValueError(msg)
+
+    return command
@@ -0,0 +1,257 @@
+"""Tracing of the time `mp` commands spend on each integration and stage.
+
+Work is recorded in spans. A span is only recorded while a profile is active,
+which is signaled to the worker processes of the shared scheduler through an
+environment variable, so spans cost nothing otherwise. Each process appends its
+spans to its own file in the profile's directory, and when the profile ends
+they are merged into a single Chrome trace file that can be opened in Perfetto
+or in `chrome://tracing`.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import enum
+import functools
+import json
+import operator
+import os
+import pathlib
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+PROFILE_DIR_ENV: str = "MP_PROFILE_DIR"
+SUMMARY_ROWS: int = 10
+NS_IN_US: int = 1_000
+US_IN_SEC: int = 1_000_000
+
+_integration: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "integration", default=None
+)
+_write_lock: threading.Lock = threading.Lock()
+
+
+class SpanKind(enum.Enum):
+    INTEGRATION = "integration"
+    STAGE = "stage"
+    SUBPROCESS = "subprocess"
+
+
+@contextlib.contextmanager
+def span(name: str, kind: SpanKind = SpanKind.STAGE) -> Generator[None]:
+    """Record the time spent in the context as a span.
+
+    Spans recorded inside an integration's span are attributed to that
+    integration, including spans of stages that run on other threads of the
+    scheduler.
+
+    Args:
+        name: the span's name - an integration's name for integration spans
+        kind: the kind of work the span covers
+
+    Yields:
+        Nothing. The span ends when the context exits
+
+    """
+    profile_dir: str | None = os.environ.get(PROFILE_DIR_ENV)
+    if not profile_dir:
+        yield
+        return
+
+    token: contextvars.Token[str | None] | None = (
+        _integration.set(name) if kind is SpanKind.INTEGRATION else None
+    )
+    start_ns: int = time.time_ns()
+    try:
+        yield
+
+    finally:
+        end_ns: int = time.time_ns()
+        integration: str | None = _integration.get()
+        if token is not None:
+            _integration.reset(token)
+
+        _write_event(
+            pathlib.Path(profile_dir),
+            {
+                "name": name,
+                "cat": kind.value,
+                "ph": "X",
+                "ts": start_ns / NS_IN_US,
+                "dur": (end_ns - start_ns) / NS_IN_US,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": {"integration": integration} if integration else {},
+            },
+        )
+
+
+def traced(
+    name: str,
+    kind: SpanKind = SpanKind.SUBPROCESS,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Record every call of the decorated function as a span.
+
+    Args:
+        name: the span's name
+        kind: the kind of work the function does
+
+    Returns:
+        A decorator that wraps a function with a span
+
+    """
+
+    def decorator(fn: Callable[_P, _R]) -> Callable[_P, _R]:
+        @functools.wraps(fn)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            with span(name, kind):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def profile(trace_path: pathlib.Path | None) -> Generator[None]:
+    """Profile the work done in the context.
+
+    When the context exits, a Chrome trace of all the spans recorded by this
+    process and by the scheduler's workers is written to `trace_path`, and a
+    summary of the slowest integrations and stages is printed.
+
+    Args:
+        trace_path: the path to write the trace into. If `None`, nothing is profiled
+
+    Yields:
+        Nothing. The profile ends when the context exits
+
+    """
+    if trace_path is None:
+        yield
+        return
+
+    previous: str | None = os.environ.get(PROFILE_DIR_ENV)
+    with tempfile.TemporaryDirectory(prefix="mp_profile_") as profile_dir:
+        os.environ[PROFILE_DIR_ENV] = profile_dir
+        try:
+            yield
+
+        finally:
+            if previous is None:
+                del os.environ[PROFILE_DIR_ENV]
+
+            else:
+                os.environ[PROFILE_DIR_ENV] = previous
+
+            events: list[dict[str, Any]] = _read_events(pathlib.Path(profile_dir))
+            write_trace(trace_path, events)
+            display_summary(events)
+            Console().print(f"Trace written to {trace_path}")
+
+
+def write_trace(trace_path: pathlib.Path, events: Iterable[dict[str, Any]]) -> None:
+    """Write spans into a Chrome trace file.
+
+    Args:
+        trace_path: the path of the trace file
+        events: the spans' trace events
+
+    """
+    trace_path.parent.mkdir(parents=True, exist_ok=True)
+    trace_path.write_text(
+        json.dumps({"traceEvents": list(events), "displayTimeUnit": "ms"}),
+        encoding="utf-8",
+    )
+
+
+def display_summary(events: Iterable[dict[str, Any]]) -> None:
+    """Print the integrations and stages that took the most time.
+
+    Args:
+        events: the spans' trace events
+
+    """
+    integrations: collections.Counter[str] = collections.Counter()
+    stages: collections.Counter[tuple[str, str]] = collections.Counter()
+    calls: collections.Counter[tuple[str, str]] = collections.Counter()
+    for event in events:
+        if event["cat"] == SpanKind.INTEGRATION.value:
+            integrations[event["name"]] += event["dur"]
+
+        else:
+            stages[event["cat"], event["name"]] += event["dur"]
+            calls[event["cat"], event["name"]] += 1
+
+    console: Console = Console()
+    table: Table = _create_table("Slowest integrations", "Integration")
+    for name, duration in integrations.most_common(SUMMARY_ROWS):
+        table.add_row(name, _format_seconds(duration))
+
+    console.print(table)
+
+    table = _create_table("Slowest stages", "Stage", "Kind", "Calls")
+    for (kind, name), duration in stages.most_common(SUMMARY_ROWS):
+        table.add_row(name, kind, str(calls[kind, name]), _format_seconds(duration))
+
+    console.print(table)
+
+
+def _create_table(title: str, *columns: str) -> Table:
+    table: Table = Table(title=title, title_style="bold", box=box.ROUNDED)
+    for column in columns:
+        table.add_column(column)
+
+    table.add_column("Total time", justify="right", style="yellow")
+    return table
+
+
+def _format_seconds(duration_us: float) -> str:
+    return f"{duration_us / US_IN_SEC:.2f}s"
+
+
+def _write_event(profile_dir: pathlib.Path, event: dict[str, Any]) -> None:
+    line: str = json.dumps(event) + "\n"
+    with _write_lock, (profile_dir / f"{os.getpid()}.jsonl").open("a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _read_events(profile_dir: pathlib.Path) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for events_file in sorted(profile_dir.glob("*.jsonl")):
+        events.extend(
+            json.loads(line)
+            for line in events_file.read_text(encoding="utf-8").splitlines()
+            if line
+        )
+
+    return sorted(events, key=operator.itemgetter("ts"))
@@ -0,0 +1,131 @@
+"""Module for scheduling the work of `mp` commands.
+
+All the commands that process many integrations (`build`, `validate`, `test`)
+share the helpers in this module instead of creating their own pools:
+
+- `map_processes` runs one task per integration on a single process pool,
+  handing out tasks one at a time so idle workers pick up the next integration
+  as soon as they finish. When called from inside a worker, it runs the tasks
+  in-process, so pools are never nested.
+- `run_stages` runs the sub-stages of a single task as a small DAG. CPU-bound
+  stages run on the calling worker, while I/O-bound stages (such as downloading
+  dependencies) run on threads, so they overlap with the CPU-bound ones.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import dataclasses
+import enum
+import multiprocessing
+from typing import TYPE_CHECKING, TypeVar
+
+from . import config, profiling
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+IO_STAGE_THREADS: int = 4
+
+
+class StageKind(enum.Enum):
+    CPU = "cpu"
+    IO = "io"
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Stage:
+    name: str
+    fn: Callable[[], object]
+    kind: StageKind = StageKind.CPU
+    depends_on: tuple[str, ...] = ()
+
+
+def map_processes(fn: Callable[[_T], _R], items: Iterable[_T]) -> list[_R]:
+    """Run `fn` on every item using the shared process pool.
+
+    Items are dispatched one at a time, so a few slow items do not hold back a
+    whole chunk of work. The results are returned in the order of `items`.
+
+    Args:
+        fn: a picklable function to run on each item
+        items: the items to process
+
+    Returns:
+        The results of `fn` for each of the items
+
+    """
+    items = list(items)
+    processes: int = min(config.get_processes_number(), len(items))
+    if processes <= 1 or _is_pool_worker():
+        return [fn(item) for item in items]
+
+    with multiprocessing.Pool(processes=processes) as pool:
+        return list(pool.imap(fn, items, chunksize=1))
+
+
+def run_stages(stages: Sequence[Stage]) -> None:
+    """Run the stages of a task according to their dependencies.
+
+    Stages must be provided in a topological order - each stage may only depend
+    on stages that appear before it. CPU-bound stages run one after the other on
+    the calling thread. I/O-bound stages start on a thread as soon as the stages
+    they depend on are done. Each stage is recorded as a profiling span.
+
+    Args:
+        stages: the stages to run
+
+    Raises:
+        ValueError: if a stage depends on a stage that does not appear before it
+
+    """
+    futures: dict[str, concurrent.futures.Future[object]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=IO_STAGE_THREADS) as executor:
+        for stage in stages:
+            for dependency in stage.depends_on:
+                if dependency not in futures:
+                    msg: str = f"Stage '{stage.name}' depends on unknown stage '{dependency}'"
+                    raise ValueError(msg)
+
+                futures[dependency].result()
+
+            if stage.kind is StageKind.IO:
+                futures[stage.name] = executor.submit(
+                    contextvars.copy_context().run, _run_stage, stage
+                )
+                continue
+
+            future: concurrent.futures.Future[object] = concurrent.futures.Future()
+            future.set_result(_run_stage(stage))
+            futures[stage.name] = future
+
+        for future in futures.values():
+            future.result()
+
+
+def _run_stage(stage: Stage) -> object:
+    with profiling.span(stage.name):
+        return stage.fn()
+
+
+def _is_pool_worker() -> bool:
+    return multiprocessing.current_process().daemon
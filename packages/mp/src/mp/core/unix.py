@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import os
 import pathlib
 import subprocess as sp  # noqa: S404
 import sys
@@ -26,7 +27,7 @@ import rich
 from mp.core.exceptions import FatalValidationError, NonFatalValidationError
 from mp.core.utils import is_windows
 
-from . import config, constants, file_utils
+from . import config, constants, file_utils, profiling
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
@@ -42,6 +43,7 @@ class NonFatalCommandError(NonFatalValidationError):
     """Non-fatal error that happens during shell commands."""
 
 
+@profiling.traced("uv export")
 def compile_core_integration_dependencies(
     project_path: pathlib.Path,
     requirements_path: pathlib.Path,
@@ -117,10 +119,13 @@ def run_pip_command(command: list[str], cwd: pathlib.Path) -> None:
         raise FatalCommandError from e
 
 
+@profiling.traced("pip download")
 def download_wheels_from_requirements(
     project_path: pathlib.Path,
     requirements_path: pathlib.Path,
     dst_path: pathlib.Path,
+    *,
+    no_deps: bool = False,
 ) -> None:
     """Download `.whl` files from a requirements' file.
 
@@ -128,6 +133,8 @@ def download_wheels_from_requirements(
         project_path: the path of the project repository
         requirements_path: the path of the 'requirements.txt' file
         dst_path: the path to install the `.whl` files into
+        no_deps: whether to download only the listed requirements, without
+            resolving their dependencies. Use it for fully pinned requirements
 
     Raises:
         FatalCommandError: if a project is already initialized
@@ -151,17 +158,30 @@ def download_wheels_from_requirements(
         "--platform",
         "none-any",
     ]
+    if no_deps:
+        command.append("--no-deps")
+
     runtime_config: list[str] = _get_runtime_config()
     command.extend(runtime_config)
 
     try:
-        platform: str = "win_amd64" if is_windows() else "manylinux_2_17_x86_64"
-        command.extend(["--platform", platform])
+        command.extend(["--platform", get_wheels_platform()])
         run_pip_command(command, cwd=project_path)
     except sp.CalledProcessError as e:
         raise FatalCommandError(COMMAND_ERR_MSG.format(e)) from e
 
 
+def get_wheels_platform() -> str:
+    """Get the platform tag of the wheels downloaded for integrations.
+
+    Returns:
+        The platform tag passed to `pip download --platform`
+
+    """
+    return "win_amd64" if is_windows() else "manylinux_2_17_x86_64"
+
+
+@profiling.traced("uv add")
 def add_dependencies_to_toml(
     project_path: pathlib.Path,
     requirements_path: pathlib.Path,
@@ -222,6 +242,7 @@ def init_python_project_if_not_exists(project_path: pathlib.Path) -> None:
     file_utils.remove_paths_if_exists(*paths_to_remove)
 
 
+@profiling.traced("uv init")
 def init_python_project(project_path: pathlib.Path) -> None:
     """Initialize a python project in a folder.
 
@@ -253,6 +274,7 @@ def init_python_project(project_path: pathlib.Path) -> None:
         raise FatalCommandError(COMMAND_ERR_MSG.format(e)) from e
 
 
+@profiling.traced("ruff check")
 def ruff_check(paths: Iterable[pathlib.Path], /, **flags: bool | str) -> int:
     """Run `ruff check` on the provided paths.
 
@@ -264,6 +286,7 @@ def ruff_check(paths: Iterable[pathlib.Path], /, **flags: bool | str) -> int:
     return execute_command_and_get_output(command, paths, **flags)
 
 
+@profiling.traced("ruff format")
 def ruff_format(paths: Iterable[pathlib.Path], /, **flags: bool | str) -> int:
     """Run `ruff format` on the provided paths.
 
@@ -275,6 +298,7 @@ def ruff_format(paths: Iterable[pathlib.Path], /, **flags: bool | str) -> int:
     return execute_command_and_get_output(command, paths, **flags)
 
 
+@profiling.traced("mypy")
 def mypy(paths: Iterable[pathlib.Path], /, **flags: bool | str) -> int:
     """Run `mypy` on the provided paths.
 
@@ -286,33 +310,83 @@ def mypy(paths: Iterable[pathlib.Path], /, **flags: bool | str) -> int:
     return execute_command_and_get_output(command, paths, **flags)
 
 
-def run_script_on_paths(
+@profiling.traced("uv sync")
+def sync_project_environment(project_path: pathlib.Path, env_path: pathlib.Path) -> None:
+    """Sync a project's locked dependencies, including its dev ones, into a venv.
+
+    The project itself is not installed into the environment, so the
+    environment can be shared by other projects with the same dependencies.
+
+    Args:
+        project_path: the path to the project folder - one that contains a
+            `pyproject.toml` file
+        env_path: the path of the virtual environment to create or sync
+
+    Raises:
+        FatalCommandError: if the environment failed to sync
+
+    """
+    command: list[str] = [
+        sys.executable,
+        "-m",
+        "uv",
+        "sync",
+        "--project",
+        str(project_path),
+        "--dev",
+        "--no-install-project",
+    ]
+    if (project_path / constants.LOCK_FILE).exists():
+        command.append("--frozen")
+
+    command.extend(_get_runtime_config())
+    env: dict[str, str] = {**os.environ, "UV_PROJECT_ENVIRONMENT": str(env_path)}
+    try:
+        sp.run(  # noqa: S603
+            command, cwd=project_path, env=env, check=True, text=True, capture_output=True
+        )
+    except sp.CalledProcessError as e:
+        raise FatalCommandError(COMMAND_ERR_MSG.format(f"{e}\n{e.stderr}")) from e
+
+
+def run_python_script(
+    python_path: pathlib.Path,
     script_path: pathlib.Path,
-    *test_paths: pathlib.Path,
-) -> int:
-    """Run a custom script on the provided paths.
+    *args: str,
+    cwd: pathlib.Path,
+    python_path_dirs: Iterable[pathlib.Path] = (),
+) -> sp.CompletedProcess[str]:
+    """Run a python script using a specific interpreter.
+
+    Args:
+        python_path: the python executable to run the script with
+        script_path: the script to run
+        *args: the arguments to pass to the script
+        cwd: the working directory to run the script in
+        python_path_dirs: directories to prepend to the script's `PYTHONPATH`
 
     Returns:
-        The status code of the output
+        The completed process, with its captured output
 
     """
-    script_full_path: str = f"{script_path.resolve().absolute()}"
+    env: dict[str, str] = dict(os.environ)
+    python_path_entries: list[str] = [str(p) for p in python_path_dirs]
+    if existing := env.get("PYTHONPATH"):
+        python_path_entries.append(existing)
 
-    if not sys.platform.startswith("win"):
-        chmod_command: list[str] = ["chmod", "+x", script_full_path]
-        sp.run(chmod_command, check=True)  # noqa: S603
+    if python_path_entries:
+        env["PYTHONPATH"] = os.pathsep.join(python_path_entries)
 
-    command: list[str] = [script_full_path] + [str(p) for p in test_paths]
-
-    result = sp.run(  # noqa: S603
+    command: list[str] = [str(python_path), str(script_path), *args]
+    return sp.run(  # noqa: S603
         command,
+        cwd=cwd,
+        env=env,
         capture_output=True,
         text=True,
         check=False,
     )
 
-    return result.returncode
-
 
 def execute_command_and_get_output(
     command: list[str],
@@ -365,6 +439,7 @@ def _stream_process_output(process: sp.Popen[bytes]) -> Iterator[bytes]:
         line = buffer.readline()
 
 
+@profiling.traced("git diff")
 def get_changed_files() -> list[str]:
     """Get a list of file names that were changed since the last commit.
 
@@ -442,6 +517,7 @@ def get_flags_to_command(**flags: bool | str | list[str]) -> list[str]:
     return all_flags
 
 
+@profiling.traced("uv lock --check")
 def check_lock_file(project_path: pathlib.Path) -> None:
     """Check if the 'uv.lock' file is consistent with 'pyproject.toml' file.
 
@@ -483,6 +559,7 @@ def check_lock_file(project_path: pathlib.Path) -> None:
         raise NonFatalCommandError(error_output) from e
 
 
+@profiling.traced("git diff")
 def get_files_unmerged_to_main_branch(
     base: str, head_sha: str, integration_path: pathlib.Path
 ) -> list[pathlib.Path]:
@@ -523,6 +600,7 @@ def get_files_unmerged_to_main_branch(
         raise NonFatalCommandError(error_output) from error
 
 
+@profiling.traced("git show")
 def get_file_content_from_main_branch(file_path: pathlib.Path) -> str:
     """Return the content of a specific file from the 'main' branch.
 
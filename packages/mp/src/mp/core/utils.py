@@ -16,12 +16,16 @@
 
 from __future__ import annotations
 
+import importlib.metadata
 import re
 import sys
 from typing import TypedDict
 
+import yaml
+
 from mp.core.constants import WINDOWS_PLATFORM
 
+MP_PACKAGE_NAME: str = "mp"
 SNAKE_PATTERN_1 = re.compile(r"(.)([A-Z][a-z]+)")
 SNAKE_PATTERN_2 = re.compile(r"([a-z0-9])([A-Z])")
 GIT_STATUS_REGEXP: re.Pattern[str] = re.compile(r"^[ A-Z?!]{2} ")
@@ -115,3 +119,34 @@ def is_windows() -> bool:
 
     """
     return sys.platform.startswith(WINDOWS_PLATFORM)
+
+
+def get_mp_version() -> str:
+    """Get the installed version of `mp`.
+
+    Returns:
+        The version of the `mp` package, or "unknown" if it is not installed
+
+    """
+    try:
+        return importlib.metadata.version(MP_PACKAGE_NAME)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def load_yaml(content: str) -> object:
+    """Load YAML content using the fastest available safe loader.
+
+    Args:
+        content: the YAML content to load
+
+    Returns:
+        The loaded YAML object
+
+    """
+    # The libyaml-based loader is much faster than the pure-Python one, but it is
+    # only available if PyYAML was built with libyaml
+    if yaml.__with_libyaml__:
+        return yaml.load(content, Loader=yaml.CSafeLoader)
+
+    return yaml.safe_load(content)
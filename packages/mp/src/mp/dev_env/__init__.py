@@ -15,16 +15,21 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
-import pathlib
-from typing import Annotated, NamedTuple
+from typing import TYPE_CHECKING, Annotated, NamedTuple
 
+import requests
 import rich
 import typer
 
 from . import api, utils
+from .deployments import DeploymentRecord
 from .minor_version_bump import minor_version_bump
 
+if TYPE_CHECKING:
+    import pathlib
+
 app = typer.Typer(help="Commands for interacting with the development environment (playground)")
 
 
@@ -146,48 +151,60 @@ def login(
             raise typer.Exit(1) from e
 
 
-@app.command(help="Deploy an integration to the SOAR environment configured by the login command.")
+@app.command(help="Deploy integrations to the SOAR environment configured by the login command.")
 def deploy(
-    integration: str = typer.Argument(..., help="Integration to build and deploy."),
+    integrations: Annotated[list[str], typer.Argument(help="Integrations to build and deploy.")],
     *,
     is_staging: Annotated[
         bool,
         typer.Option("--staging", help="Add this option to deploy integration in to staging mode."),
     ] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            help="Deploy integrations even if they did not change since they were last deployed.",
+        ),
+    ] = False,
 ) -> None:
-    """Build and deploy an integration to the dev environment (playground).
+    """Build and deploy integrations to the dev environment (playground).
+
+    The integrations are built together in-process, and the packages that changed
+    since they were last deployed are uploaded concurrently.
 
     Args:
-        integration: The integration to build and deploy.
+        integrations: The integrations to build and deploy.
         is_staging: Add this option to deploy integration in to staging mode.
+        force: Deploy integrations even if they did not change since they were last deployed.
 
     Raises:
-        typer.Exit: If the integration is not found.
+        typer.Exit: If an integration is not found or failed to upload.
 
     """
     config = utils.load_dev_env_config()
-    integrations_root = pathlib.Path.cwd() / "integrations"
-    source_path = None
-
-    for repo in ["commercial", "third_party"]:
-        candidate = integrations_root / repo / integration
-        if candidate.exists():
-            source_path = candidate
-            break
-
-    if not source_path:
-        rich.print(
-            f"[red]Could not find source integration "
-            f"at integrations/commercial|third_party/{integration}[/red]"
-        )
-        raise typer.Exit(1)
-
-    identifier = utils.get_integration_identifier(source_path)
-    utils.build_integration(integration)
-    built_dir = utils.find_built_integration_dir(source_path, identifier)
-    minor_version_bump(built_dir, source_path)
-    zip_path = utils.zip_integration_dir(built_dir)
-    rich.print(f"Zipped built integration at {zip_path}")
+    source_paths = utils.find_source_integrations(integrations)
+    utils.build_integrations(source_paths)
+
+    record = DeploymentRecord.from_config(config["api_root"], is_staging=is_staging)
+    zip_paths: dict[str, pathlib.Path] = {}
+    digests: dict[str, str] = {}
+    for source_path in source_paths:
+        identifier = utils.get_integration_identifier(source_path)
+        built_dir = utils.find_built_integration_dir(source_path, identifier)
+        minor_version_bump(built_dir, source_path)
+        zip_path = utils.zip_integration_dir(built_dir)
+        digest = utils.get_file_digest(zip_path)
+        if not force and record.is_deployed(identifier, digest):
+            rich.print(f"{identifier} did not change since it was last deployed, skipping")
+            continue
+
+        rich.print(f"Zipped built integration at {zip_path}")
+        zip_paths[identifier] = zip_path
+        digests[identifier] = digest
+
+    if not zip_paths:
+        rich.print("[green]✅ All integrations are already deployed.[/green]")
+        return
 
     try:
         if config.get("api_key"):
@@ -199,11 +216,32 @@ def deploy(
                 password=config["password"],
             )
         backend_api.login()
-        details = backend_api.get_integration_details(zip_path, is_staging=is_staging)
-        integration_id = details["identifier"]
-        result = backend_api.upload_integration(zip_path, integration_id, is_staging=is_staging)
-        rich.print(f"Upload result: {result}")
-        rich.print("[green]✅ Integration deployed successfully.[/green]")
     except Exception as e:
-        rich.print(f"[red]Upload failed: {e}[/red]")
+        rich.print(f"[red]Login failed: {e}[/red]")
         raise typer.Exit(1) from e
+
+    deployed: dict[str, str] = {}
+    failed: list[str] = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(api.CONNECTIONS_POOL_SIZE, len(zip_paths))
+    ) as executor:
+        futures = {
+            executor.submit(backend_api.deploy_package, p, is_staging=is_staging): i
+            for i, p in zip_paths.items()
+        }
+        for future in concurrent.futures.as_completed(futures):
+            identifier = futures[future]
+            try:
+                result = future.result()
+            except (requests.RequestException, KeyError) as e:
+                rich.print(f"[red]Upload of {identifier} failed: {e}[/red]")
+                failed.append(identifier)
+            else:
+                rich.print(f"Upload result of {identifier}: {result}")
+                deployed[identifier] = digests[identifier]
+
+    record.store(deployed)
+    if failed:
+        raise typer.Exit(1)
+
+    rich.print("[green]✅ Integrations deployed successfully.[/green]")
@@ -18,12 +18,17 @@ import base64
 from typing import TYPE_CHECKING, Any
 
 import requests
+import requests.adapters
 import rich
 import typer
 
 if TYPE_CHECKING:
     import pathlib
 
+# A multiple of 3, so the base64 encoding of each chunk can be concatenated
+ENCODE_CHUNK_SIZE: int = 3 * 1024 * 1024
+CONNECTIONS_POOL_SIZE: int = 8
+
 
 class BackendAPI:
     """Handles backend API operations for the dev environment."""
@@ -52,6 +57,9 @@ class BackendAPI:
         self.password = password
         self.api_key = api_key
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=CONNECTIONS_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.token = None
 
         if api_key is not None:
@@ -78,13 +86,11 @@ class BackendAPI:
             self.token = resp.json()["token"]
             self.session.headers.update({"Authorization": f"Bearer {self.token}"})
 
-    def get_integration_details(
-        self, zip_path: pathlib.Path, *, is_staging: bool = False
-    ) -> dict[str, Any]:
+    def get_integration_details(self, data: str, *, is_staging: bool = False) -> dict[str, Any]:
         """Get integration details from a zipped package.
 
         Args:
-            zip_path: Path to the zipped integration package.
+            data: The zipped integration package, encoded by `encode_package`.
             is_staging: Push to staging or not.
 
         Returns:
@@ -94,19 +100,18 @@ class BackendAPI:
         details_url = f"{self.api_root}/api/external/v1/ide/GetPackageDetails?format=camel"
         if is_staging:
             details_url += "&isStaging=true"
-        data = base64.b64encode(zip_path.read_bytes()).decode()
         details_payload = {"data": data}
         resp = self.session.post(details_url, json=details_payload)
         resp.raise_for_status()
         return resp.json()
 
     def upload_integration(
-        self, zip_path: pathlib.Path, integration_id: str, *, is_staging: bool = False
+        self, data: str, integration_id: str, *, is_staging: bool = False
     ) -> dict[str, Any]:
         """Upload a zipped integration package to the backend.
 
         Args:
-            zip_path: Path to the zipped integration package.
+            data: The zipped integration package, encoded by `encode_package`.
             integration_id: The identifier of the integration.
             is_staging: Push to staging or not.
 
@@ -117,7 +122,6 @@ class BackendAPI:
         upload_url = f"{self.api_root}/api/external/v1/ide/ImportPackage?format=camel"
         if is_staging:
             upload_url += "&isStaging=true"
-        data = base64.b64encode(zip_path.read_bytes()).decode()
         upload_payload = {
             "data": data,
             "integrationIdentifier": integration_id,
@@ -126,3 +130,41 @@ class BackendAPI:
         resp = self.session.post(upload_url, json=upload_payload)
         resp.raise_for_status()
         return resp.json()
+
+    def deploy_package(self, zip_path: pathlib.Path, *, is_staging: bool = False) -> dict[str, Any]:
+        """Upload a zipped integration package, getting its identifier from the backend.
+
+        The package is encoded once and shared by both requests.
+
+        Args:
+            zip_path: Path to the zipped integration package.
+            is_staging: Push to staging or not.
+
+        Returns:
+            dict: The backend response after uploading the integration.
+
+        """
+        data = encode_package(zip_path)
+        details = self.get_integration_details(data, is_staging=is_staging)
+        return self.upload_integration(data, details["identifier"], is_staging=is_staging)
+
+
+def encode_package(zip_path: pathlib.Path) -> str:
+    """Encode a zipped integration package for the backend.
+
+    The package is read in chunks, so its raw bytes and their encoding are not
+    held in memory together.
+
+    Args:
+        zip_path: Path to the zipped integration package.
+
+    Returns:
+        str: The base64 encoding of the package.
+
+    """
+    chunks: list[str] = []
+    with zip_path.open("rb") as f:
+        while chunk := f.read(ENCODE_CHUNK_SIZE):
+            chunks.append(base64.b64encode(chunk).decode())
+
+    return "".join(chunks)
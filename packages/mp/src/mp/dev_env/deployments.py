@@ -0,0 +1,101 @@
+"""Record of the integration packages deployed to dev environments.
+
+`mp dev-env deploy` records the digest of every package it uploads, per
+environment, in the marketplace's cache directory. A package whose digest
+matches the recorded one was already deployed as-is and is not uploaded again.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import TYPE_CHECKING, Any
+
+import mp.core.config
+import mp.core.constants
+import mp.core.file_utils
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Mapping
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DeploymentRecord:
+    path: pathlib.Path
+    target: str
+
+    @classmethod
+    def from_config(cls, api_root: str, *, is_staging: bool) -> DeploymentRecord:
+        """Create the deployment record of an environment in the configured marketplace.
+
+        Args:
+            api_root: the environment's API root
+            is_staging: whether packages are deployed in staging mode
+
+        Returns:
+            A `DeploymentRecord` stored in the marketplace's cache directory
+
+        """
+        return cls(
+            mp.core.config.get_marketplace_path()
+            / mp.core.constants.CACHE_DIR_NAME
+            / mp.core.constants.DEPLOYMENTS_FILE,
+            f"{api_root.rstrip('/')}|staging={is_staging}",
+        )
+
+    def is_deployed(self, identifier: str, digest: str) -> bool:
+        """Check whether a package was already deployed to the environment.
+
+        Args:
+            identifier: the integration's identifier
+            digest: the digest of the integration's package
+
+        Returns:
+            Whether the last package deployed for the integration has this digest
+
+        """
+        return self._load().get(self.target, {}).get(identifier) == digest
+
+    def store(self, deployed: Mapping[str, str]) -> None:
+        """Record packages that were deployed to the environment.
+
+        Args:
+            deployed: the digest of the deployed package of each integration identifier
+
+        """
+        if not deployed:
+            return
+
+        record: dict[str, dict[str, str]] = self._load()
+        record[self.target] = {**record.get(self.target, {}), **deployed}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        mp.core.file_utils.write_text_atomically(
+            self.path, json.dumps(record, indent=2, sort_keys=True)
+        )
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        try:
+            record: Any = json.loads(self.path.read_text(encoding="utf-8"))
+
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(record, dict):
+            return {}
+
+        return {k: v for k, v in record.items() if isinstance(v, dict)}
@@ -14,24 +14,39 @@
 
 from __future__ import annotations
 
+import collections
+import hashlib
 import json
 import pathlib
 import shutil
-import subprocess  # noqa: S404
+import tempfile
+import zipfile
+from typing import TYPE_CHECKING
 
 import rich
 import typer
 
 import mp.core.constants
 import mp.core.file_utils
+from mp.build_project.marketplace import Marketplace
 from mp.core.data_models.integration import Integration
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 CONFIG_PATH = pathlib.Path.home() / ".mp_dev_env.json"
+ZIP_DATE_TIME: tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE: int = 0o644 << 16
+ZIP_DIR_MODE: int = (0o40755 << 16) | 0x10
 
 
 def zip_integration_dir(integration_dir: pathlib.Path) -> pathlib.Path:
     """Zip the contents of a built integration directory for upload.
 
+    The files are streamed into the archive in a sorted order and without their
+    timestamps or permissions, so the same contents always produce the same
+    archive and it can be identified by its digest.
+
     Args:
         integration_dir: Path to the built integration directory.
 
@@ -39,7 +54,43 @@ def zip_integration_dir(integration_dir: pathlib.Path) -> pathlib.Path:
         Path: The path to the created zip file.
 
     """
-    return pathlib.Path(shutil.make_archive(str(integration_dir), "zip", integration_dir))
+    zip_path: pathlib.Path = integration_dir.with_name(f"{integration_dir.name}.zip")
+    with tempfile.NamedTemporaryFile(dir=integration_dir.parent, suffix=".zip", delete=False) as f:
+        tmp_path: pathlib.Path = pathlib.Path(f.name)
+        with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for path in sorted(integration_dir.rglob("*")):
+                _write_zip_entry(zf, path, path.relative_to(integration_dir).as_posix())
+
+    tmp_path.replace(zip_path)
+    return zip_path
+
+
+def _write_zip_entry(zf: zipfile.ZipFile, path: pathlib.Path, name: str) -> None:
+    if path.is_dir():
+        info: zipfile.ZipInfo = zipfile.ZipInfo(f"{name}/", date_time=ZIP_DATE_TIME)
+        info.external_attr = ZIP_DIR_MODE
+        zf.writestr(info, b"")
+        return
+
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.external_attr = ZIP_FILE_MODE
+    info.compress_type = zipfile.ZIP_DEFLATED
+    with path.open("rb") as src, zf.open(info, "w") as dst:
+        shutil.copyfileobj(src, dst)
+
+
+def get_file_digest(path: pathlib.Path) -> str:
+    """Compute the SHA-256 digest of a file without reading it into memory at once.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        str: The file's hex digest.
+
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def load_dev_env_config() -> dict[str, str]:
@@ -59,27 +110,66 @@ def load_dev_env_config() -> dict[str, str]:
         return json.load(f)
 
 
-def build_integration(integration: str) -> None:
-    """Invoke the build command for a single integration.
+def find_source_integrations(integrations: Iterable[str]) -> list[pathlib.Path]:
+    """Find the source directories of integrations in the marketplace.
 
     Args:
-        integration: The name of the integration to build.
+        integrations: The names of the integrations.
+
+    Returns:
+        list[Path]: The integrations' source directories, in the order of `integrations`.
 
     Raises:
-        typer.Exit: If the build fails.
+        typer.Exit: If any of the integrations is not found.
 
     """
-    result = subprocess.run(  # noqa: S603
-        ["mp", "build", "--integration", integration, "--quiet"],  # noqa: S607
-        capture_output=True,
-        check=False,
-        text=True,
+    repos: tuple[pathlib.Path, ...] = (
+        mp.core.file_utils.get_commercial_path(),
+        mp.core.file_utils.get_community_path(),
     )
-    if result.returncode != 0:
-        rich.print(f"[red]Build failed:\n{result.stderr}[/red]")
-        raise typer.Exit(result.returncode)
+    source_paths: list[pathlib.Path] = []
+    not_found: list[str] = []
+    for integration in dict.fromkeys(integrations):
+        source_path: pathlib.Path | None = next(
+            (p for repo in repos if (p := repo / integration).exists()), None
+        )
+        if source_path is None:
+            not_found.append(integration)
+        else:
+            source_paths.append(source_path)
+
+    if not_found:
+        rich.print(
+            f"[red]Could not find source integrations {', '.join(not_found)} "
+            f"at integrations/commercial|third_party[/red]"
+        )
+        raise typer.Exit(1)
+
+    return source_paths
+
+
+def build_integrations(source_paths: Iterable[pathlib.Path]) -> None:
+    """Build integrations in-process, using the marketplace of each of them.
 
-    rich.print(f"Build output:\n{result.stdout}")
+    Args:
+        source_paths: Paths to the integrations' source directories.
+
+    Raises:
+        typer.Exit: If the build fails.
+
+    """
+    by_marketplace: collections.defaultdict[pathlib.Path, list[pathlib.Path]] = (
+        collections.defaultdict(list)
+    )
+    for source_path in source_paths:
+        by_marketplace[source_path.parent].append(source_path)
+
+    for marketplace_path, paths in by_marketplace.items():
+        try:
+            Marketplace(marketplace_path).build_integrations(paths)
+        except Exception as e:
+            rich.print(f"[red]Build failed:\n{e}[/red]")
+            raise typer.Exit(1) from e
 
 
 def get_integration_identifier(source_path: pathlib.Path) -> str:
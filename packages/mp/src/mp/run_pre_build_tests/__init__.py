@@ -15,32 +15,34 @@
 from __future__ import annotations
 
 import dataclasses
-import multiprocessing
+import functools
 import pathlib
 import warnings
 from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-import mp.build_project.marketplace
-import mp.core.code_manipulation
 import mp.core.config
+import mp.core.constants
 import mp.core.file_utils
+import mp.core.scheduler
 import mp.core.unix
+import mp.run_pre_build_tests.impact
+import mp.run_pre_build_tests.venv_pool
 from mp.core.code_manipulation import TestWarning
 from mp.core.custom_types import Products, RepositoryType
-from mp.core.utils import is_windows
 
+from . import runner
 from .display import display_test_reports
-from .process_test_output import IntegrationTestResults, TestIssue, process_pytest_json_report
+from .process_test_output import IntegrationTestResults, TestIssue
+from .venv_pool import VenvPool
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from mp.core.config import RuntimeParams
 
-WINDOWS_SCRIPT_NAME: str = "run_pre_build_tests.bat"
-UNIX_SCRIPT_NAME: str = "run_pre_build_tests.sh"
+    from .runner import IntegrationTestRun
 
 
 __all__: list[str] = ["TestIssue", "TestWarning", "app"]
@@ -52,34 +54,42 @@ class TestParams:
     repository: Iterable[RepositoryType]
     integrations: Iterable[str]
     groups: Iterable[str]
+    changed_files: bool = False
 
     def validate(self) -> None:
         """Validate the parameters.
 
         Validates input parameters to ensure that only one parameter among
-        `--repository`, `--groups`,
-         or `--integration` is used during execution.
+        `--repository`, `--groups`, `--integration`,
+         or `--changed-files` is used during execution.
 
         Raises appropriate error messages if none or more than one of these
         parameters is specified.
 
         Raises:
-            typer.BadParameter: If none of `--repository`, `--groups`, or
-                `--integration` is provided or more than one of them is used.
+            typer.BadParameter: If none of `--repository`, `--groups`,
+                `--integration`, or `--changed-files` is provided or more than
+                one of them is used.
 
         """
-        params: list[Iterable[str] | Iterable[RepositoryType]] = self._as_list()
+        params: list[Iterable[str] | Iterable[RepositoryType] | bool] = self._as_list()
         msg: str
         if not any(params):
-            msg = "At least one of --repository, --groups, or --integration must be used."
+            msg = (
+                "At least one of --repository, --groups, --integration, or --changed-files"
+                " must be used."
+            )
             raise typer.BadParameter(msg)
 
         if sum(map(bool, params)) != 1:
-            msg = "Only one of --repository, --groups, or --integration shall be used."
+            msg = (
+                "Only one of --repository, --groups, --integration, or --changed-files"
+                " shall be used."
+            )
             raise typer.BadParameter(msg)
 
-    def _as_list(self) -> list[Iterable[RepositoryType] | Iterable[str]]:
-        return [self.repository, self.integrations, self.groups]
+    def _as_list(self) -> list[Iterable[RepositoryType] | Iterable[str] | bool]:
+        return [self.repository, self.integrations, self.groups, self.changed_files]
 
 
 @app.command(name="test", help="Run integration pre_build tests")
@@ -106,6 +116,12 @@ def run_pre_build_tests(  # noqa: PLR0913
         ),
     ],
     *,
+    changed_files: Annotated[
+        bool,
+        typer.Option(
+            help=("Test only the integrations affected by the files changed since the last commit"),
+        ),
+    ] = False,
     raise_error_on_violations: Annotated[
         bool,
         typer.Option(
@@ -131,6 +147,8 @@ def run_pre_build_tests(  # noqa: PLR0913
         repository: the repository to build
         integration: the integrations to build
         group: the groups to build
+        changed_files: whether to test only the integrations affected by the files
+            changed since the last commit
         raise_error_on_violations: whether to raise error if any violations are found
         quiet: quiet log options
         verbose: Verbose log options
@@ -145,117 +163,125 @@ def run_pre_build_tests(  # noqa: PLR0913
     run_params: RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
     run_params.set_in_config()
 
-    params: TestParams = TestParams(repository, integration, group)
+    params: TestParams = TestParams(repository, integration, group, changed_files)
     params.validate()
 
     commercial_path: pathlib.Path = mp.core.file_utils.get_commercial_path()
     community_path: pathlib.Path = mp.core.file_utils.get_community_path()
 
-    all_integration_results: list[IntegrationTestResults] = []
+    integration_paths: list[pathlib.Path] = []
 
     if integration:
-        commercial_integrations: set[pathlib.Path] = _get_mp_paths_from_names(
-            names=integration,
-            marketplace_path=commercial_path,
+        integration_paths.extend(
+            _get_mp_paths_from_names(names=integration, marketplace_path=commercial_path)
         )
-        all_integration_results.extend(_test_integrations(commercial_integrations))
-
-        community_integrations: set[pathlib.Path] = _get_mp_paths_from_names(
-            names=integration,
-            marketplace_path=community_path,
+        integration_paths.extend(
+            _get_mp_paths_from_names(names=integration, marketplace_path=community_path)
         )
-        all_integration_results.extend(_test_integrations(community_integrations))
 
     elif group:
-        commercial_groups: set[pathlib.Path] = _get_mp_paths_from_names(
-            names=group,
-            marketplace_path=commercial_path,
+        integration_paths.extend(
+            _get_groups_integrations(
+                _get_mp_paths_from_names(names=group, marketplace_path=commercial_path)
+            )
         )
-        all_integration_results.extend(_test_groups(commercial_groups))
-
-        community_groups: set[pathlib.Path] = _get_mp_paths_from_names(
-            names=group,
-            marketplace_path=community_path,
+        integration_paths.extend(
+            _get_groups_integrations(
+                _get_mp_paths_from_names(names=group, marketplace_path=community_path)
+            )
         )
-        all_integration_results.extend(_test_groups(community_groups))
 
     elif repository:
         repos: set[RepositoryType] = set(repository)
         if RepositoryType.COMMERCIAL in repos:
-            all_integration_results.extend(_test_repository(commercial_path))
+            integration_paths.extend(_get_repository_integrations(commercial_path))
 
         if RepositoryType.COMMUNITY in repos:
-            all_integration_results.extend(_test_repository(community_path))
+            integration_paths.extend(_get_repository_integrations(community_path))
+
+    elif changed_files:
+        integration_paths.extend(
+            mp.run_pre_build_tests.impact.get_affected_integrations(
+                _get_changed_paths(),
+                [
+                    *_get_repository_integrations(commercial_path),
+                    *_get_repository_integrations(community_path),
+                ],
+            )
+        )
 
+    all_integration_results: list[IntegrationTestResults] = _test_integrations(integration_paths)
     display_test_reports(all_integration_results)
     if all_integration_results:
         raise typer.Exit(code=1)
 
 
-def _test_repository(repo: pathlib.Path) -> list[IntegrationTestResults]:
+def _get_repository_integrations(repo: pathlib.Path) -> list[pathlib.Path]:
     products: Products[set[pathlib.Path]] = (
         mp.core.file_utils.get_integrations_and_groups_from_paths(repo)
     )
-    all_integration_results: list[IntegrationTestResults] = []
-    if products.integrations:
-        all_integration_results.extend(_test_integrations(products.integrations))
+    return [*products.integrations, *_get_groups_integrations(products.groups)]
 
-    if products.groups:
-        all_integration_results.extend(_test_groups(products.groups))
 
-    return all_integration_results
+def _get_changed_paths() -> list[pathlib.Path]:
+    marketplace_path: pathlib.Path = mp.core.config.get_marketplace_path()
+    return [marketplace_path / p for p in mp.core.unix.get_changed_files()]
 
 
-def _test_groups(groups: Iterable[pathlib.Path]) -> list[IntegrationTestResults]:
-    all_integration_results: list[IntegrationTestResults] = []
-    for group in groups:
-        all_integration_results.extend(_test_integrations(group.iterdir()))
-    return all_integration_results
+def _get_groups_integrations(groups: Iterable[pathlib.Path]) -> list[pathlib.Path]:
+    return [p for group in groups for p in group.iterdir()]
 
 
 def _test_integrations(integrations: Iterable[pathlib.Path]) -> list[IntegrationTestResults]:
-    if integrations:
-        return _run_script_on_paths(
-            script_path=_get_tests_script_paths(),
-            paths=integrations,
-        )
-    return []
-
-
-def _get_tests_script_paths() -> pathlib.Path:
-    file_name: str = WINDOWS_SCRIPT_NAME if is_windows() else UNIX_SCRIPT_NAME
-    return pathlib.Path(__file__).parent / file_name
-
+    """Run the tests of all the integrations on the shared scheduler.
 
-def _run_script_on_paths(
-    script_path: pathlib.Path, paths: Iterable[pathlib.Path]
-) -> list[IntegrationTestResults]:
-    paths = [p for p in paths if p.is_dir()]
-    all_integration_results: list[IntegrationTestResults] = []
-
-    processes: int = mp.core.config.get_processes_number()
-    tasks_arguments = [(script_path, p) for p in paths]
-    with multiprocessing.Pool(processes=processes) as pool:
-        results_iterator = pool.starmap(_run_tests_for_single_integration, tasks_arguments)
-
-        for result in results_iterator:
-            if result is not None:
-                all_integration_results.append(result)  # noqa: PERF401
-
-    return all_integration_results
+    The test environments the integrations need are prepared first, once per
+    environment key, and the tests of each integration then run in a worker
+    using its environment's interpreter. Integrations whose tests took the
+    longest in previous runs start first, and the durations of this run are
+    recorded for the next ones.
 
+    Args:
+        integrations: the paths of the integrations to test
 
-def _run_tests_for_single_integration(
-    script_path: pathlib.Path, integration_path: pathlib.Path
-) -> IntegrationTestResults | None:
-    status_code: int = mp.core.unix.run_script_on_paths(script_path, integration_path)
+    Returns:
+        The results of the integrations that had failing tests
 
-    json_report_path = integration_path / ".report.json"
-    if status_code == 0:
-        json_report_path.unlink(missing_ok=True)
-        return None
+    """
+    paths: list[pathlib.Path] = [
+        p for p in integrations if (p / mp.core.constants.TESTS_DIR).is_dir()
+    ]
+    if not paths:
+        return []
+
+    durations_path: pathlib.Path = mp.run_pre_build_tests.impact.get_durations_path()
+    paths = mp.run_pre_build_tests.impact.order_by_duration(
+        paths, mp.run_pre_build_tests.impact.load_durations(durations_path)
+    )
+    pool: VenvPool = VenvPool.from_config()
+    keys: dict[pathlib.Path, str] = {p: mp.run_pre_build_tests.venv_pool.get_key(p) for p in paths}
+    projects: dict[str, pathlib.Path] = {k: p for p, k in keys.items()}
+    env_errors: dict[str, str | None] = dict(
+        zip(
+            projects,
+            mp.core.scheduler.map_processes(
+                functools.partial(runner.prepare_environment, pool),
+                projects.items(),
+            ),
+            strict=True,
+        )
+    )
+    pool.prune(keep=projects)
 
-    return process_pytest_json_report(integration_path.name, json_report_path)
+    runs: list[IntegrationTestRun] = mp.core.scheduler.map_processes(
+        functools.partial(runner.run_integration_tests, pool),
+        [(p, keys[p], env_errors[keys[p]]) for p in paths],
+    )
+    mp.run_pre_build_tests.impact.store_durations(
+        durations_path,
+        {p.name: r.duration for p, r in zip(paths, runs, strict=True) if r.duration is not None},
+    )
+    return [r.results for r in runs if r.results is not None]
 
 
 def _get_mp_paths_from_names(
@@ -0,0 +1,185 @@
+"""Test impact analysis and scheduling for `mp test`.
+
+This module maps the files changed in a git diff to the integrations whose
+tests they can affect, and orders integrations by how long their tests took
+in previous runs, so the slowest ones start first.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import math
+import tomllib
+from typing import TYPE_CHECKING, Any
+
+import mp.core.config
+import mp.core.constants
+import mp.core.file_utils
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable, Mapping
+
+
+LOCAL_SOURCE_KEYS: tuple[str, ...] = ("path", "directory", "editable")
+
+
+def get_affected_integrations(
+    changed_files: Iterable[pathlib.Path],
+    integrations: Iterable[pathlib.Path],
+) -> list[pathlib.Path]:
+    """Get the integrations whose tests can be affected by changed files.
+
+    An integration is affected by changes to:
+        - any file in its directory, including its `core` managers and tests
+        - its group's files that are not part of another integration, such as
+          the group's common scripts
+        - the local packages its lock installs from a path, such as the shared
+          TIPCommon wheel
+
+    Args:
+        changed_files: the absolute paths of the changed files
+        integrations: the paths of the integrations to choose from
+
+    Returns:
+        The affected integrations, in the order of `integrations`
+
+    """
+    changed: set[pathlib.Path] = {p.resolve() for p in changed_files}
+    integrations = [p.resolve() for p in integrations]
+    changed_dirs: set[pathlib.Path] = {d for p in changed for d in p.parents}
+
+    affected: list[pathlib.Path] = []
+    for integration in integrations:
+        if integration in changed_dirs:
+            affected.append(integration)
+            continue
+
+        group: pathlib.Path = integration.parent
+        if group.name not in mp.core.constants.INTEGRATIONS_TYPES and any(
+            group in p.parents and not _is_in_any(p, integrations) for p in changed
+        ):
+            affected.append(integration)
+            continue
+
+        if any(s in changed or s in changed_dirs for s in get_local_sources(integration)):
+            affected.append(integration)
+
+    return affected
+
+
+def get_local_sources(project_path: pathlib.Path) -> set[pathlib.Path]:
+    """Get the local packages a project's lock installs from a path.
+
+    Args:
+        project_path: the path of the project - one that contains a `uv.lock`
+
+    Returns:
+        The resolved paths of the local packages' files or directories
+
+    """
+    lock_path: pathlib.Path = project_path / mp.core.constants.LOCK_FILE
+    if not lock_path.exists():
+        return set()
+
+    lock: dict[str, Any] = tomllib.loads(lock_path.read_text(encoding="utf-8"))
+    sources: set[pathlib.Path] = set()
+    for package in lock.get("package", []):
+        source: dict[str, str] = package.get("source", {})
+        sources.update(
+            (project_path / source[k]).resolve()
+            for k in LOCAL_SOURCE_KEYS
+            if k in source and source[k] != "."
+        )
+
+    return sources
+
+
+def order_by_duration(
+    integrations: Iterable[pathlib.Path],
+    durations: Mapping[str, float],
+) -> list[pathlib.Path]:
+    """Order integrations by their tests' previous duration, longest first.
+
+    Integrations without a known duration are placed first, since they may be
+    the slowest of all.
+
+    Args:
+        integrations: the paths of the integrations to order
+        durations: the previous duration in seconds of each integration's tests
+
+    Returns:
+        The ordered integration paths
+
+    """
+    return sorted(integrations, key=lambda p: durations.get(p.name, math.inf), reverse=True)
+
+
+def get_durations_path() -> pathlib.Path:
+    """Get the path of the file that records the durations of integrations' tests.
+
+    Returns:
+        The durations file's path in the marketplace's cache directory
+
+    """
+    return (
+        mp.core.config.get_marketplace_path()
+        / mp.core.constants.CACHE_DIR_NAME
+        / mp.core.constants.TEST_DURATIONS_FILE
+    )
+
+
+def load_durations(path: pathlib.Path) -> dict[str, float]:
+    """Load the recorded durations of integrations' tests.
+
+    Args:
+        path: the durations file's path
+
+    Returns:
+        The duration in seconds of each integration's tests. Empty if the file
+        does not exist or cannot be read.
+
+    """
+    try:
+        durations: Any = json.loads(path.read_text(encoding="utf-8"))
+
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(durations, dict):
+        return {}
+
+    return {k: float(v) for k, v in durations.items() if isinstance(v, int | float)}
+
+
+def store_durations(path: pathlib.Path, durations: Mapping[str, float]) -> None:
+    """Record the durations of integrations' tests.
+
+    The durations are merged into the ones already recorded.
+
+    Args:
+        path: the durations file's path
+        durations: the duration in seconds of each integration's tests
+
+    """
+    merged: dict[str, float] = {**load_durations(path), **durations}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mp.core.file_utils.write_text_atomically(path, json.dumps(merged, indent=2, sort_keys=True))
+
+
+def _is_in_any(path: pathlib.Path, dirs: Iterable[pathlib.Path]) -> bool:
+    return any(d in path.parents for d in dirs)
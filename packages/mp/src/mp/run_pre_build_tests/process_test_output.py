@@ -15,8 +15,6 @@
 from __future__ import annotations
 
 import dataclasses
-import json
-import pathlib
 from typing import NamedTuple
 
 import rich
@@ -37,37 +35,27 @@ class IntegrationTestResults:
     skipped_tests_summary: list[TestIssue] = dataclasses.field(default_factory=list)
 
 
-def process_pytest_json_report(
-    integration_name: str, json_report_path: pathlib.Path
+def process_pytest_report(
+    integration_name: str, report_data: dict | None
 ) -> IntegrationTestResults | None:
-    """Process parsed JSON report data from pytest-json and return an IntegrationTestResults object.
+    """Process a pytest-json report and return an IntegrationTestResults object.
 
     Args:
         integration_name: The name of the integration being tested.
-        json_report_path: The path to the pytest JSON report file.
+        report_data: The report created by pytest-json-report, or `None` if no
+            report was created.
 
     Returns:
         An IntegrationTestResults object containing extracted information about
         test counts, and details of failed tests.
 
     """
-    try:
-        with pathlib.Path.open(json_report_path, encoding="utf-8") as f:
-            report_data: dict = json.load(f)
-        json_report_path.unlink(missing_ok=True)
-
-    except FileNotFoundError:
+    if report_data is None:
         rich.print(
-            f"[bold red]Error:[/bold red] JSON report not found at {json_report_path}\n"
+            f"[bold red]Error:[/bold red] JSON report not found for {integration_name}\n"
             f"Make sure you have added pytest-json-report to your dev dependency"
         )
         return None
-    except json.JSONDecodeError as e:
-        rich.print(
-            f"[bold red]Error:[/bold red] Failed to decode JSON report at {json_report_path}: {e}"
-        )
-        json_report_path.unlink(missing_ok=True)
-        return None
 
     integration_results = IntegrationTestResults(integration_name=integration_name)
 
@@ -0,0 +1,62 @@
+"""Run pytest and write its JSON report to the standard output.
+
+This script is run by `mp test` using the Python interpreter of an
+integration's test environment, which does not have `mp` installed. It must
+therefore only depend on the standard library, `pytest` and
+`pytest-json-report`.
+
+Usage:
+    python pytest_runner.py <report-separator> [pytest arguments...]
+
+The output of pytest is written first. It is followed by a line containing
+only the report separator and then by the JSON report, so the caller does not
+need to go through a report file.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+try:
+    from pytest_jsonreport.plugin import JSONReport
+except ImportError:
+    JSONReport = None
+
+
+def main() -> int:
+    """Run pytest with the command line's arguments.
+
+    Returns:
+        pytest's exit code
+
+    """
+    separator, *args = sys.argv[1:]
+    if JSONReport is None:
+        return pytest.main(args)
+
+    plugin = JSONReport()
+    exit_code: int = pytest.main(["--json-report-file=none", *args], plugins=[plugin])
+    sys.stdout.write(f"\n{separator}\n{json.dumps(plugin.report)}\n")
+    sys.stdout.flush()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Prepare the test environments of integrations and run their tests in them."""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import pathlib
+import time
+from typing import TYPE_CHECKING
+
+import rich
+
+import mp.core.config
+import mp.core.constants
+import mp.core.unix
+import mp.run_pre_build_tests.venv_pool
+
+from .process_test_output import IntegrationTestResults, TestIssue, process_pytest_report
+
+if TYPE_CHECKING:
+    import subprocess as sp
+
+    from .venv_pool import VenvPool
+
+PYTEST_RUNNER_SCRIPT_NAME: str = "pytest_runner.py"
+REPORT_SEPARATOR: str = "---------- mp pytest report ----------"
+
+
+def prepare_environment(pool: VenvPool, key_and_project: tuple[str, pathlib.Path]) -> str | None:
+    """Make sure the test environment of a key exists in the pool.
+
+    Args:
+        pool: the pool of test environments
+        key_and_project: the environment's key and a project whose lock resolves to it
+
+    Returns:
+        The error of the environment's creation, or `None` if it is ready
+
+    """
+    key, project_path = key_and_project
+    rich.print(f"Preparing the test environment of {project_path.name}")
+    try:
+        pool.ensure(key, project_path)
+    except mp.core.unix.FatalCommandError as e:
+        return str(e)
+
+    return None
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class IntegrationTestRun:
+    results: IntegrationTestResults | None
+    duration: float | None = None
+
+
+def run_integration_tests(
+    pool: VenvPool,
+    integration: tuple[pathlib.Path, str, str | None],
+) -> IntegrationTestRun:
+    """Run an integration's tests in its test environment.
+
+    Args:
+        pool: the pool of test environments
+        integration: the integration's path, its environment's key and the error of
+            the environment's creation, if it failed
+
+    Returns:
+        The run's failing test results, if any, and its duration if the tests ran
+
+    """
+    integration_path, key, env_error = integration
+    if env_error is not None:
+        return IntegrationTestRun(
+            IntegrationTestResults(
+                integration_name=integration_path.name,
+                failed_tests=1,
+                failed_tests_summary=[TestIssue("test environment", env_error)],
+            )
+        )
+
+    rich.print(f"---------- Testing {integration_path.name} ----------")
+    env_path: pathlib.Path = pool.get_env_path(key)
+    sdk_path: pathlib.Path | None = mp.run_pre_build_tests.venv_pool.get_sdk_path(env_path)
+    start: float = time.perf_counter()
+    result: sp.CompletedProcess[str] = mp.core.unix.run_python_script(
+        mp.run_pre_build_tests.venv_pool.get_python_path(env_path),
+        pathlib.Path(__file__).parent / PYTEST_RUNNER_SCRIPT_NAME,
+        REPORT_SEPARATOR,
+        *_get_pytest_args(),
+        cwd=integration_path,
+        python_path_dirs=[sdk_path] if sdk_path is not None else [],
+    )
+    duration: float = time.perf_counter() - start
+    output, separator, report = result.stdout.rpartition(f"\n{REPORT_SEPARATOR}\n")
+    if mp.core.config.is_verbose():
+        rich.print(output if separator else result.stdout, result.stderr)
+
+    if result.returncode == 0:
+        return IntegrationTestRun(None, duration)
+
+    return IntegrationTestRun(
+        process_pytest_report(integration_path.name, json.loads(report) if separator else None),
+        duration,
+    )
+
+
+def _get_pytest_args() -> list[str]:
+    args: list[str] = [f"./{mp.core.constants.TESTS_DIR}"]
+    if mp.core.config.is_verbose():
+        args.append("-vv")
+
+    elif mp.core.config.is_quiet():
+        args.append("-qq")
+
+    return args
@@ -0,0 +1,227 @@
+"""Persistent pool of virtual environments for running integration tests.
+
+This module provides the `VenvPool` class, which keeps the virtual environments
+used by `mp test` in the marketplace's cache directory instead of in each
+integration's `.venv` directory. Environments are keyed by the packages that
+the integration's `uv.lock` resolves to, so integrations whose locks resolve to
+the same packages share a single environment, and an integration whose lock
+changed automatically gets a new one.
+"""
+
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import shutil
+import time
+import tomllib
+from typing import TYPE_CHECKING, Any
+
+import mp.core.config
+import mp.core.constants
+import mp.core.file_utils
+import mp.core.unix
+import mp.core.utils
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+
+
+READY_MARKER_FILE: str = ".mp_ready"
+LOCK_FILE_SUFFIX: str = ".lock"
+MAX_UNUSED_SECONDS: int = 14 * 24 * 60 * 60
+LOCAL_SOURCE_KEYS: tuple[str, ...] = ("virtual", "editable")
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class VenvPool:
+    root: pathlib.Path
+
+    @classmethod
+    def from_config(cls) -> VenvPool:
+        """Create a virtual environment pool located in the configured marketplace.
+
+        Returns:
+            A `VenvPool` rooted in the marketplace's cache directory
+
+        """
+        return cls(
+            mp.core.config.get_marketplace_path()
+            / mp.core.constants.CACHE_DIR_NAME
+            / mp.core.constants.VENVS_CACHE_DIR_NAME
+        )
+
+    def get_env_path(self, key: str) -> pathlib.Path:
+        """Get the path of the environment of `key`.
+
+        Args:
+            key: the environment's key
+
+        Returns:
+            The environment's directory path
+
+        """
+        return self.root / key
+
+    def ensure(self, key: str, project_path: pathlib.Path) -> pathlib.Path:
+        """Make sure the environment of `key` exists, creating it if needed.
+
+        The environment is created by syncing `project_path`'s lock into it,
+        without installing the project itself. An environment whose creation
+        did not complete is recreated. Creation is serialized with other
+        processes that use the same pool through a lock file per key.
+
+        Args:
+            key: the environment's key, as returned by `get_key(project_path)`
+            project_path: a project whose lock resolves to the environment's packages
+
+        Returns:
+            The environment's directory path
+
+        """
+        env_path: pathlib.Path = self.get_env_path(key)
+        marker: pathlib.Path = env_path / READY_MARKER_FILE
+        with mp.core.file_utils.lock_file(self._get_lock_path(key)):
+            if marker.exists():
+                marker.touch()
+                return env_path
+
+            shutil.rmtree(env_path, ignore_errors=True)
+            mp.core.unix.sync_project_environment(project_path, env_path)
+            marker.touch()
+
+        return env_path
+
+    def prune(self, keep: Iterable[str] = ()) -> None:
+        """Remove environments that were not used recently.
+
+        Args:
+            keep: keys of environments to keep regardless of when they were used
+
+        """
+        if not self.root.exists():
+            return
+
+        kept: set[str] = set(keep)
+        now: float = time.time()
+        for env_path in self.root.iterdir():
+            if env_path.name in kept or not env_path.is_dir():
+                continue
+
+            with mp.core.file_utils.lock_file(self._get_lock_path(env_path.name)):
+                marker: pathlib.Path = env_path / READY_MARKER_FILE
+                if not marker.exists() or now - marker.stat().st_mtime > MAX_UNUSED_SECONDS:
+                    shutil.rmtree(env_path, ignore_errors=True)
+
+    def _get_lock_path(self, key: str) -> pathlib.Path:
+        return self.root / f"{key}{LOCK_FILE_SUFFIX}"
+
+
+def get_key(project_path: pathlib.Path) -> str:
+    """Compute the key of a project's test environment.
+
+    The key covers the packages of the project's lock and the project's direct
+    and dev dependencies' names, but not the project's own name and version, so
+    projects whose locks resolve to the same packages share a key. Local path
+    sources are resolved, so the same wheel referenced from projects in different
+    directories is keyed the same. Projects without a lock are never shared.
+
+    Args:
+        project_path: the path of the project - one that contains a `pyproject.toml`
+
+    Returns:
+        A hex digest that identifies the project's test environment
+
+    """
+    h = hashlib.sha256()
+    python_version_file: pathlib.Path = project_path / mp.core.constants.PYTHON_VERSION_FILE
+    if python_version_file.exists():
+        h.update(python_version_file.read_bytes().strip())
+
+    h.update(b"\0")
+    lock_path: pathlib.Path = project_path / mp.core.constants.LOCK_FILE
+    if not lock_path.exists():
+        h.update(f"project={project_path.resolve()}\0".encode())
+        h.update((project_path / mp.core.constants.PROJECT_FILE).read_bytes())
+        return h.hexdigest()
+
+    lock: dict[str, Any] = tomllib.loads(lock_path.read_text(encoding="utf-8"))
+    h.update(f"requires-python={lock.get('requires-python')}\0".encode())
+    for package in lock.get("package", []):
+        source: dict[str, str] = package.get("source", {})
+        if any(k in source for k in LOCAL_SOURCE_KEYS):
+            h.update(json.dumps(_get_root_dependencies(package), sort_keys=True).encode())
+            continue
+
+        keyed_package: dict[str, Any] = package
+        if "path" in source:
+            resolved: pathlib.Path = (project_path / source["path"]).resolve()
+            keyed_package = {**package, "source": {"path": resolved.as_posix()}}
+
+        h.update(json.dumps(keyed_package, sort_keys=True).encode())
+
+    return h.hexdigest()
+
+
+def get_python_path(env_path: pathlib.Path) -> pathlib.Path:
+    """Get the path of an environment's Python interpreter.
+
+    Args:
+        env_path: the environment's directory path
+
+    Returns:
+        The path of the environment's Python executable
+
+    """
+    if mp.core.utils.is_windows():
+        return env_path / "Scripts" / "python.exe"
+
+    return env_path / "bin" / "python"
+
+
+def get_sdk_path(env_path: pathlib.Path) -> pathlib.Path | None:
+    """Get the path of the SOAR SDK installed in an environment.
+
+    Args:
+        env_path: the environment's directory path
+
+    Returns:
+        The SDK package's directory, or `None` if it is not installed
+
+    """
+    patterns: tuple[str, ...] = (
+        f"lib/python*/site-packages/{mp.core.constants.SDK_PACKAGE_NAME}",
+        f"Lib/site-packages/{mp.core.constants.SDK_PACKAGE_NAME}",
+    )
+    for pattern in patterns:
+        for path in env_path.glob(pattern):
+            if path.is_dir():
+                return path
+
+    return None
+
+
+def _get_root_dependencies(package: dict[str, Any]) -> dict[str, list[str]]:
+    dependencies: dict[str, list[str]] = {
+        "": sorted(d["name"] for d in package.get("dependencies", []))
+    }
+    for group, group_dependencies in package.get("dev-dependencies", {}).items():
+        dependencies[group] = sorted(d["name"] for d in group_dependencies)
+
+    return dependencies
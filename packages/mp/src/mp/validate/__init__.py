@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import dataclasses
-import multiprocessing
 import pathlib
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Annotated, TypeAlias
@@ -24,6 +23,8 @@ import typer
 
 import mp.core.config
 import mp.core.file_utils
+import mp.core.profiling
+import mp.core.scheduler
 from mp.build_project.marketplace import Marketplace
 from mp.core.custom_types import RepositoryType
 
@@ -117,6 +118,15 @@ def validate(  # noqa: PLR0913
             ),
         ),
     ] = False,
+    profile: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            help=(
+                "Write a Chrome trace of the time spent on each integration and stage to"
+                " this path, and print the slowest ones."
+            ),
+        ),
+    ] = None,
     quiet: Annotated[
         bool,
         typer.Option(
@@ -143,6 +153,7 @@ def validate(  # noqa: PLR0913
                integrations associated with these groups.
         only_pre_build: If set to True, only pre-build validation checks are
                         performed.
+        profile: The path to write a trace of the validation into, if any.
         quiet: quiet log options
         verbose: Verbose log options
 
@@ -156,55 +167,56 @@ def validate(  # noqa: PLR0913
     params: ValidateParams = ValidateParams(repository, integration, group)
     params.validate()
 
-    commercial_mp: Marketplace = Marketplace(mp.core.file_utils.get_commercial_path())
-    community_mp: Marketplace = Marketplace(mp.core.file_utils.get_community_path())
+    with mp.core.profiling.profile(profile):
+        commercial_mp: Marketplace = Marketplace(mp.core.file_utils.get_commercial_path())
+        community_mp: Marketplace = Marketplace(mp.core.file_utils.get_community_path())
 
-    run_configurations: Configurations = Configurations(only_pre_build=only_pre_build)
+        run_configurations: Configurations = Configurations(only_pre_build=only_pre_build)
 
-    validations_output: FullReport = {}
-    commercial_output: FullReport = {}
-    community_output: FullReport = {}
+        validations_output: FullReport = {}
+        commercial_output: FullReport = {}
+        community_output: FullReport = {}
 
-    if integration:
-        commercial_output = _validate_integrations(
-            get_marketplace_paths_from_names(integration, commercial_mp.path),
-            commercial_mp,
-            run_configurations,
-        )
+        if integration:
+            commercial_output = _validate_integrations(
+                get_marketplace_paths_from_names(integration, commercial_mp.path),
+                commercial_mp,
+                run_configurations,
+            )
 
-        community_output = _validate_integrations(
-            get_marketplace_paths_from_names(integration, community_mp.path),
-            community_mp,
-            run_configurations,
-        )
+            community_output = _validate_integrations(
+                get_marketplace_paths_from_names(integration, community_mp.path),
+                community_mp,
+                run_configurations,
+            )
 
-        validations_output = _combine_results(commercial_output, community_output)
+            validations_output = _combine_results(commercial_output, community_output)
 
-    elif group:
-        commercial_output = _validate_groups(
-            get_marketplace_paths_from_names(group, commercial_mp.path),
-            commercial_mp,
-            run_configurations,
-        )
+        elif group:
+            commercial_output = _validate_groups(
+                get_marketplace_paths_from_names(group, commercial_mp.path),
+                commercial_mp,
+                run_configurations,
+            )
 
-        community_output = _validate_groups(
-            get_marketplace_paths_from_names(group, community_mp.path),
-            community_mp,
-            run_configurations,
-        )
+            community_output = _validate_groups(
+                get_marketplace_paths_from_names(group, community_mp.path),
+                community_mp,
+                run_configurations,
+            )
 
-        validations_output = _combine_results(commercial_output, community_output)
+            validations_output = _combine_results(commercial_output, community_output)
 
-    elif repository:
-        repos: set[RepositoryType] = set(repository)
+        elif repository:
+            repos: set[RepositoryType] = set(repository)
 
-        if RepositoryType.COMMERCIAL in repos:
-            commercial_output = _validate_repo(commercial_mp, run_configurations)
+            if RepositoryType.COMMERCIAL in repos:
+                commercial_output = _validate_repo(commercial_mp, run_configurations)
 
-        if RepositoryType.COMMUNITY in repos:
-            community_output = _validate_repo(community_mp, run_configurations)
+            if RepositoryType.COMMUNITY in repos:
+                community_output = _validate_repo(community_mp, run_configurations)
 
-        validations_output = _combine_results(commercial_output, community_output)
+            validations_output = _combine_results(commercial_output, community_output)
 
     display_validation_reports(validations_output)
 
@@ -313,18 +325,15 @@ def _run_validations(
         i for i in integration if i.exists() and mp.core.file_utils.is_integration(i)
     )
 
-    processes: int = mp.core.config.get_processes_number()
-    with multiprocessing.Pool(processes=processes) as pool:
-        results = pool.imap_unordered(validation_function, paths)
-        validation_outputs: list[ValidationResults] = [r for r in results if not r.is_success]
-
-    return validation_outputs
+    results: list[ValidationResults] = mp.core.scheduler.map_processes(validation_function, paths)
+    return [r for r in results if not r.is_success]
 
 
 def _run_pre_build_validations(integration_path: pathlib.Path) -> ValidationResults:
-    validation_object: PreBuildValidations = PreBuildValidations(integration_path)
-    validation_object.run_pre_build_validation()
-    return validation_object.results
+    with mp.core.profiling.span(integration_path.name, mp.core.profiling.SpanKind.INTEGRATION):
+        validation_object: PreBuildValidations = PreBuildValidations(integration_path)
+        validation_object.run_pre_build_validation()
+        return validation_object.results
 
 
 def _combine_results(*validations_outputs: FullReport) -> FullReport:
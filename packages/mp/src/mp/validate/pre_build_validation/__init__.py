@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Protocol
 
 import typer
 
+import mp.core.profiling
 from mp.core.exceptions import FatalValidationError, NonFatalValidationError
 from mp.validate.data_models import ValidationResults, ValidationTypes
 
@@ -58,7 +59,8 @@ class PreBuildValidations:
         """
         for validator in self._get_validation():
             try:
-                validator.run(self.integration_path)
+                with mp.core.profiling.span(validator.name):
+                    validator.run(self.integration_path)
 
             except NonFatalValidationError as e:
                 self.results.validation_report.add_non_fatal_validation(validator.name, str(e))
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+import mp.core.config
 import mp.core.constants
 
 if TYPE_CHECKING:
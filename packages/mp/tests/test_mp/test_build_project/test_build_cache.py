@@ -0,0 +1,142 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+import unittest.mock
+from typing import TYPE_CHECKING
+
+import mp.build_project.build_cache
+import mp.build_project.marketplace
+import mp.core.constants
+import mp.core.utils
+from mp.build_project.build_cache import BuildCache, BuildCacheStats, CacheStatus
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from mp.build_project.marketplace import Marketplace
+
+
+def test_key_is_stable(tmp_path: pathlib.Path, non_built_integration: pathlib.Path) -> None:
+    integration: pathlib.Path = tmp_path / non_built_integration.name
+    shutil.copytree(non_built_integration, integration)
+
+    first: str = mp.build_project.build_cache.get_key(integration)
+    second: str = mp.build_project.build_cache.get_key(integration)
+
+    assert first == second
+
+
+def test_key_ignores_bytecode_and_venv(
+    tmp_path: pathlib.Path,
+    non_built_integration: pathlib.Path,
+) -> None:
+    integration: pathlib.Path = tmp_path / non_built_integration.name
+    shutil.copytree(non_built_integration, integration)
+    key: str = mp.build_project.build_cache.get_key(integration)
+
+    (integration / "__pycache__").mkdir(exist_ok=True)
+    (integration / "__pycache__" / "a.cpython-311.pyc").write_bytes(b"\0")
+    (integration / mp.core.constants.INTEGRATION_VENV).mkdir(exist_ok=True)
+    (integration / mp.core.constants.INTEGRATION_VENV / "pyvenv.cfg").write_text("x")
+
+    assert mp.build_project.build_cache.get_key(integration) == key
+
+
+def test_key_changes_when_sources_change(
+    tmp_path: pathlib.Path,
+    non_built_integration: pathlib.Path,
+) -> None:
+    integration: pathlib.Path = tmp_path / non_built_integration.name
+    shutil.copytree(non_built_integration, integration)
+    key: str = mp.build_project.build_cache.get_key(integration)
+
+    release_notes: pathlib.Path = integration / mp.core.constants.RELEASE_NOTES_FILE
+    release_notes.write_text(f"{release_notes.read_text(encoding='utf-8')}\n", encoding="utf-8")
+
+    assert mp.build_project.build_cache.get_key(integration) != key
+
+
+def test_key_changes_when_mp_version_changes(
+    tmp_path: pathlib.Path,
+    non_built_integration: pathlib.Path,
+) -> None:
+    integration: pathlib.Path = tmp_path / non_built_integration.name
+    shutil.copytree(non_built_integration, integration)
+    key: str = mp.build_project.build_cache.get_key(integration)
+
+    with unittest.mock.patch.object(mp.core.utils, "get_mp_version", return_value="0.0.0"):
+        assert mp.build_project.build_cache.get_key(integration) != key
+
+
+def test_restore_missing_key_returns_none(tmp_path: pathlib.Path) -> None:
+    cache: BuildCache = BuildCache(tmp_path / "cache")
+    assert cache.restore("missing", tmp_path / "out") is None
+
+
+def test_second_build_is_restored_from_cache(
+    tmp_path: pathlib.Path,
+    non_built_integration: pathlib.Path,
+    mock_get_marketplace_path: str,
+) -> None:
+    with unittest.mock.patch(mock_get_marketplace_path, return_value=tmp_path):
+        community: pathlib.Path = tmp_path / non_built_integration.parent.name
+        shutil.copytree(non_built_integration.parent, community)
+        integration: pathlib.Path = community / non_built_integration.name
+        (integration / mp.core.constants.PYTHON_VERSION_FILE).write_text("3.11", encoding="utf-8")
+
+        marketplace: Marketplace = mp.build_project.marketplace.Marketplace(community)
+        first: BuildCacheStats = marketplace.build_integration(integration)
+        out_integration: pathlib.Path = marketplace.out_path / integration.name
+        built_files: set[str] = {p.name for p in out_integration.rglob("*")}
+
+        shutil.rmtree(out_integration)
+        second: BuildCacheStats = marketplace.build_integration(integration)
+
+    assert first.statuses == {integration.name: CacheStatus.MISS}
+    assert second.statuses == {integration.name: CacheStatus.HIT}
+    assert {p.name for p in out_integration.rglob("*")} == built_files
+
+
+def test_stats_merge() -> None:
+    merged: BuildCacheStats = BuildCacheStats.merge([
+        BuildCacheStats({"a": CacheStatus.HIT}),
+        BuildCacheStats({"b": CacheStatus.MISS}),
+        BuildCacheStats({"c": CacheStatus.HIT}),
+    ])
+
+    assert merged.hits == ["a", "c"]
+    assert merged.misses == ["b"]
+
+
+def test_prune_removes_unused_entries(tmp_path: pathlib.Path) -> None:
+    cache: BuildCache = BuildCache(tmp_path / "cache")
+    integration_out_path: pathlib.Path = tmp_path / "out" / "integration"
+    integration_out_path.mkdir(parents=True)
+    (integration_out_path / "Integration-integration.def").write_text("{}", encoding="utf-8")
+    cache.store("used", integration_out_path)
+    cache.store("unused", integration_out_path)
+
+    unused_time: float = time.time() - mp.build_project.build_cache.MAX_UNUSED_SECONDS - 60
+    for key in ("used", "unused"):
+        os.utime(cache.root / key, (unused_time, unused_time))
+
+    assert cache.restore("used", tmp_path / "restored") is not None
+    cache.prune()
+
+    assert {p.name for p in cache.root.iterdir()} == {"used"}
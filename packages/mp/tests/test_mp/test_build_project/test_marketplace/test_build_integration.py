@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 import mp.build_project.marketplace
+import mp.build_project.post_build.marketplace_json
 import mp.core.constants
 import test_mp.common
 
@@ -92,6 +93,9 @@ def assert_build_integration(
         marketplace.build_integration(integration)
 
         out_integration: pathlib.Path = marketplace.out_path / integration.name
+        assert mp.build_project.post_build.marketplace_json.load_marketplace_fragment(
+            marketplace.fragments_path, integration.name
+        )
         out_py_version: pathlib.Path = out_integration / mp.core.constants.PYTHON_VERSION_FILE
         out_py_version.unlink(missing_ok=True)
 
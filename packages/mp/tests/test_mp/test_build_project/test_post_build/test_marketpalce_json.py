@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import shutil
+import unittest.mock
 from typing import TYPE_CHECKING
 
 import mp.build_project.post_build.marketplace_json
@@ -40,3 +41,47 @@ def test_write_marketplace_json(
         expected=marketplace_json,
     )
     assert actual == expected
+
+
+def test_write_marketplace_json_from_fragments(
+    tmp_path: pathlib.Path,
+    built_integration: pathlib.Path,
+    marketplace_json: pathlib.Path,
+) -> None:
+    commercial: pathlib.Path = tmp_path / mp.core.constants.COMMERCIAL_DIR_NAME
+    fragments: pathlib.Path = tmp_path / "fragments"
+    shutil.copytree(built_integration.parent, commercial, dirs_exist_ok=True)
+    mp.build_project.post_build.marketplace_json.write_marketplace_fragment(
+        commercial / built_integration.name, fragments, key="key"
+    )
+
+    with unittest.mock.patch.object(
+        mp.build_project.post_build.marketplace_json.MarketplaceJsonDefinition,
+        "get_def_file",
+        side_effect=AssertionError("Integrations with fragments should not be read"),
+    ):
+        mp.build_project.post_build.marketplace_json.write_marketplace_json(commercial, fragments)
+
+    actual, expected = test_mp.common.get_json_content(
+        actual=commercial / marketplace_json.name,
+        expected=marketplace_json,
+    )
+    assert actual == expected
+
+
+def test_missing_fragments_are_written(
+    tmp_path: pathlib.Path,
+    built_integration: pathlib.Path,
+) -> None:
+    commercial: pathlib.Path = tmp_path / mp.core.constants.COMMERCIAL_DIR_NAME
+    fragments: pathlib.Path = tmp_path / "fragments"
+    shutil.copytree(built_integration.parent, commercial, dirs_exist_ok=True)
+
+    mp.build_project.post_build.marketplace_json.write_marketplace_json(commercial, fragments)
+
+    assert mp.build_project.post_build.marketplace_json.load_marketplace_fragment(
+        fragments, built_integration.name
+    )
+    assert not mp.build_project.post_build.marketplace_json.has_marketplace_fragment(
+        fragments, built_integration.name, "key"
+    )
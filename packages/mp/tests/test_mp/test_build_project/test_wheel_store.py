@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import unittest.mock
+from typing import TYPE_CHECKING
+
+import mp.build_project.restructure.dependencies
+import mp.build_project.wheel_store
+import mp.core.constants
+import mp.core.unix
+from mp.build_project.wheel_store import Requirement, WheelStore
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from mp.build_project.restructure.dependencies import Dependencies
+
+
+TOML_CONTENT: str = """
+[project]
+name = "mock"
+version = "1.0.0"
+description = "Add your description here"
+readme = "README.md"
+authors = [
+    { name = "me", email = "me@google.com" }
+]
+requires-python = ">=3.11"
+dependencies = ["black>=24.10.0"]
+"""
+REQUIREMENTS_CONTENT: str = """\
+# This file was autogenerated by uv via the following command:
+#    uv export --no-hashes --no-dev
+certifi==2025.6.15
+    # via requests
+colorama==0.4.6 ; sys_platform == 'win32'
+compressed-rtf @ https://example.com/compressed_rtf-1.0.6.tar.gz
+python-magic==0.4.27
+python-magic-bin==0.4.14
+"""
+
+
+def test_parse_requirements(tmp_path: pathlib.Path) -> None:
+    requirements: list[Requirement] = mp.build_project.wheel_store.parse_requirements(
+        REQUIREMENTS_CONTENT,
+        project_path=tmp_path,
+    )
+
+    assert [r.name for r in requirements] == [
+        "certifi",
+        "colorama",
+        "compressed_rtf",
+        "python_magic",
+        "python_magic_bin",
+    ]
+    assert [r.has_marker for r in requirements] == [False, True, False, False, False]
+    assert len({r.key for r in requirements}) == len(requirements)
+
+
+def test_parse_local_wheel_requirement_is_keyed_by_content(tmp_path: pathlib.Path) -> None:
+    wheel: pathlib.Path = tmp_path / "TIPCommon-1.0.0-py3-none-any.whl"
+    wheel.write_bytes(b"1")
+    first: list[Requirement] = mp.build_project.wheel_store.parse_requirements(
+        wheel.name,
+        project_path=tmp_path,
+    )
+    wheel.write_bytes(b"2")
+    second: list[Requirement] = mp.build_project.wheel_store.parse_requirements(
+        wheel.name,
+        project_path=tmp_path,
+    )
+
+    assert first[0].name == second[0].name == "tipcommon"
+    assert first[0].key != second[0].key
+
+
+def test_warm_store_builds_offline(tmp_path: pathlib.Path) -> None:
+    integration_path: pathlib.Path = tmp_path / "integration"
+    integration_path.mkdir()
+    (integration_path / mp.core.constants.PROJECT_FILE).write_text(TOML_CONTENT, encoding="utf-8")
+    store: WheelStore = WheelStore(tmp_path / "store")
+
+    first_out: pathlib.Path = tmp_path / "first_out"
+    first_out.mkdir()
+    first: Dependencies = mp.build_project.restructure.dependencies.Dependencies(
+        path=integration_path,
+        out_path=first_out,
+        wheel_store=store,
+    )
+    first.restructure()
+
+    second_out: pathlib.Path = tmp_path / "second_out"
+    second_out.mkdir()
+    second: Dependencies = mp.build_project.restructure.dependencies.Dependencies(
+        path=integration_path,
+        out_path=second_out,
+        wheel_store=store,
+    )
+    with (
+        unittest.mock.patch.object(
+            mp.core.unix,
+            "compile_core_integration_dependencies",
+            side_effect=AssertionError("Requirements should be restored from the store"),
+        ),
+        unittest.mock.patch.object(
+            mp.core.unix,
+            "download_wheels_from_requirements",
+            side_effect=AssertionError("Wheels should be restored from the store"),
+        ),
+    ):
+        second.restructure()
+
+    first_deps: pathlib.Path = first_out / mp.core.constants.OUT_DEPENDENCIES_DIR
+    second_deps: pathlib.Path = second_out / mp.core.constants.OUT_DEPENDENCIES_DIR
+    assert list(first_deps.iterdir())
+    assert {p.name for p in first_deps.iterdir()} == {p.name for p in second_deps.iterdir()}
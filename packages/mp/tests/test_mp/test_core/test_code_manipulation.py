@@ -14,11 +14,17 @@
 
 from __future__ import annotations
 
+import unittest.mock
+from typing import TYPE_CHECKING
+
 import pytest
 
 import mp.core.code_manipulation
 from mp.core.constants import COMMON_SCRIPTS_DIR, CORE_SCRIPTS_DIR, SDK_PACKAGE_NAME
 
+if TYPE_CHECKING:
+    import pathlib
+
 
 @pytest.mark.parametrize(
     ("original_import", "expected_restructured_import"),
@@ -122,3 +128,44 @@ def test_other_imports_are_not_modified(
     )
     assert modified_code == expected_restructured_import
     compile(modified_code, filename="test_import_errors", mode="exec")
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("import os\nx = 1\n", False),
+        ("from os import path\n", False),
+        ("# from . import utils\ntext = 'from core import x'\n", False),
+        ("from . import utils\n", True),
+        ("from ...data_models import Integration\n", True),
+        (f"from {CORE_SCRIPTS_DIR}.module import something\n", True),
+        (f"from {COMMON_SCRIPTS_DIR} import something\n", True),
+        (f"def f():\n    from {SDK_PACKAGE_NAME} import something\n", True),
+        ("from (\n", True),
+    ],
+)
+def test_needs_imports_restructure(code: str, *, expected: bool) -> None:
+    assert mp.core.code_manipulation.needs_imports_restructure(code) is expected
+
+
+def test_restructure_scripts_imports_uses_cache(tmp_path: pathlib.Path) -> None:
+    cache_dir: pathlib.Path = tmp_path / "cache"
+    script: pathlib.Path = tmp_path / "script.py"
+    plain: pathlib.Path = tmp_path / "plain.py"
+    script.write_text("from .utils import something\n", encoding="utf-8")
+    plain.write_text("import os\n", encoding="utf-8")
+
+    mp.core.code_manipulation.restructure_scripts_imports([script, plain], cache_dir)
+    assert script.read_text(encoding="utf-8") == "from utils import something\n"
+    assert plain.read_text(encoding="utf-8") == "import os\n"
+    assert len(list(cache_dir.iterdir())) == 1
+
+    script.write_text("from .utils import something\n", encoding="utf-8")
+    with unittest.mock.patch.object(
+        mp.core.code_manipulation,
+        "restructure_script_imports",
+        side_effect=AssertionError("Cached scripts should not be parsed"),
+    ):
+        mp.core.code_manipulation.restructure_scripts_imports([script, plain], cache_dir)
+
+    assert script.read_text(encoding="utf-8") == "from utils import something\n"
@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+import unittest.mock
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mp.core.constants
+import mp.core.data_models.metadata_cache
+import mp.core.utils
+from mp.core.data_models.release_notes.metadata import ReleaseNote
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Generator
+
+
+pytestmark = pytest.mark.usefixtures("reset_metadata_cache")
+
+
+@pytest.fixture
+def reset_metadata_cache() -> Generator[None]:
+    mp.core.data_models.metadata_cache.clear()
+    yield
+    mp.core.data_models.metadata_cache.set_cache_dir(None)
+    mp.core.data_models.metadata_cache.clear()
+
+
+@pytest.fixture
+def integration_path(tmp_path: pathlib.Path, non_built_integration: pathlib.Path) -> pathlib.Path:
+    path: pathlib.Path = tmp_path / non_built_integration.name
+    path.mkdir()
+    shutil.copyfile(
+        non_built_integration / mp.core.constants.RELEASE_NOTES_FILE,
+        path / mp.core.constants.RELEASE_NOTES_FILE,
+    )
+    return path
+
+
+def _load_without_parsing(path: pathlib.Path) -> list[ReleaseNote]:
+    with unittest.mock.patch.object(
+        mp.core.utils,
+        "load_yaml",
+        side_effect=AssertionError("Cached metadata should not be parsed"),
+    ):
+        return ReleaseNote.from_non_built_integration_path(path)
+
+
+def test_memory_cache_returns_new_objects(integration_path: pathlib.Path) -> None:
+    first: list[ReleaseNote] = ReleaseNote.from_non_built_integration_path(integration_path)
+    second: list[ReleaseNote] = _load_without_parsing(integration_path)
+
+    assert first
+    assert first == second
+    assert first[0] is not second[0]
+
+
+def test_disk_cache_is_used_by_new_processes(
+    tmp_path: pathlib.Path,
+    integration_path: pathlib.Path,
+) -> None:
+    cache_dir: pathlib.Path = tmp_path / "cache"
+    mp.core.data_models.metadata_cache.set_cache_dir(cache_dir)
+    first: list[ReleaseNote] = ReleaseNote.from_non_built_integration_path(integration_path)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    mp.core.data_models.metadata_cache.clear()
+    assert _load_without_parsing(integration_path) == first
+
+
+def test_changed_file_is_loaded_again(integration_path: pathlib.Path) -> None:
+    rn_path: pathlib.Path = integration_path / mp.core.constants.RELEASE_NOTES_FILE
+    first: list[ReleaseNote] = ReleaseNote.from_non_built_integration_path(integration_path)
+
+    rn_path.write_text(
+        rn_path.read_text(encoding="utf-8").replace("Change Description 1", "Changed"),
+        encoding="utf-8",
+    )
+    stat: os.stat_result = rn_path.stat()
+    os.utime(rn_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    second: list[ReleaseNote] = ReleaseNote.from_non_built_integration_path(integration_path)
+    assert first != second
+    assert any(rn.description == "Changed" for rn in second)
+
+
+def test_prune_removes_unused_disk_entries(
+    tmp_path: pathlib.Path,
+    integration_path: pathlib.Path,
+) -> None:
+    cache_dir: pathlib.Path = tmp_path / "cache"
+    mp.core.data_models.metadata_cache.set_cache_dir(cache_dir)
+    ReleaseNote.from_non_built_integration_path(integration_path)
+    (entry,) = cache_dir.iterdir()
+    unused: pathlib.Path = cache_dir / "unused"
+    unused.write_bytes(b"")
+
+    unused_time: float = time.time() - mp.core.data_models.metadata_cache.MAX_UNUSED_SECONDS - 60
+    for path in (entry, unused):
+        os.utime(path, (unused_time, unused_time))
+
+    mp.core.data_models.metadata_cache.clear()
+    _load_without_parsing(integration_path)
+    mp.core.data_models.metadata_cache.prune()
+
+    assert list(cache_dir.iterdir()) == [entry]
@@ -0,0 +1,95 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+import unittest.mock
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import mp.core.config
+import mp.core.profiling
+import mp.core.scheduler
+from mp.core.profiling import SpanKind
+from mp.core.scheduler import Stage, StageKind
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@mp.core.profiling.traced("square")
+def _square(n: int) -> int:
+    return n * n
+
+
+def _build(name: str) -> int:
+    with mp.core.profiling.span(name, SpanKind.INTEGRATION):
+        mp.core.scheduler.run_stages([
+            Stage("download", lambda: _square(2), kind=StageKind.IO),
+            Stage("restructure", lambda: _square(3), depends_on=("download",)),
+        ])
+
+    return os.getpid()
+
+
+def _load_events(trace_path: pathlib.Path) -> list[dict[str, Any]]:
+    return json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+
+
+def test_spans_are_not_recorded_without_a_profile(tmp_path: pathlib.Path) -> None:
+    with unittest.mock.patch.object(mp.core.profiling, "_write_event") as write_event:
+        _build("mock_integration")
+
+    write_event.assert_not_called()
+    assert mp.core.profiling.PROFILE_DIR_ENV not in os.environ
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_profile_collects_the_spans_of_all_workers(
+    tmp_path: pathlib.Path,
+    processes: int,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    trace_path: pathlib.Path = tmp_path / "trace.json"
+    with (
+        unittest.mock.patch.object(mp.core.config, "get_processes_number", return_value=processes),
+        mp.core.profiling.profile(trace_path),
+    ):
+        pids: list[int] = mp.core.scheduler.map_processes(_build, ["first", "second"])
+
+    events: list[dict[str, Any]] = _load_events(trace_path)
+    assert {e["pid"] for e in events} == set(pids)
+    assert sorted(e["name"] for e in events if e["cat"] == SpanKind.INTEGRATION.value) == [
+        "first",
+        "second",
+    ]
+    stages: collections.Counter[tuple[str, str]] = collections.Counter(
+        (e["name"], e["args"]["integration"]) for e in events if e["cat"] != "integration"
+    )
+    assert stages == {
+        (name, integration): 2 if name == "square" else 1
+        for name in ("download", "restructure", "square")
+        for integration in ("first", "second")
+    }
+
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    assert mp.core.profiling.PROFILE_DIR_ENV not in os.environ
+    output: str = capsys.readouterr().out
+    assert "Slowest integrations" in output
+    assert "Slowest stages" in output
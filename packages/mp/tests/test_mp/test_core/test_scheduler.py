@@ -0,0 +1,89 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import unittest.mock
+
+import pytest
+
+import mp.core.config
+import mp.core.scheduler
+from mp.core.scheduler import Stage, StageKind
+
+
+def _square(n: int) -> int:
+    return n * n
+
+
+def _nested_map(n: int) -> list[int]:
+    return mp.core.scheduler.map_processes(_square, range(n))
+
+
+@pytest.mark.parametrize("processes", [1, 3])
+def test_map_processes_keeps_order(processes: int) -> None:
+    with unittest.mock.patch.object(
+        mp.core.config,
+        "get_processes_number",
+        return_value=processes,
+    ):
+        assert mp.core.scheduler.map_processes(_square, range(10)) == [n * n for n in range(10)]
+
+
+def test_map_processes_does_not_nest_pools() -> None:
+    with unittest.mock.patch.object(mp.core.config, "get_processes_number", return_value=2):
+        assert mp.core.scheduler.map_processes(_nested_map, [2, 3]) == [[0, 1], [0, 1, 4]]
+
+
+def test_map_processes_with_no_items() -> None:
+    assert mp.core.scheduler.map_processes(_square, []) == []
+
+
+def test_run_stages_overlaps_io_with_cpu_stages() -> None:
+    io_started: threading.Event = threading.Event()
+    io_release: threading.Event = threading.Event()
+    order: list[str] = []
+
+    def io_stage() -> None:
+        io_started.set()
+        assert io_release.wait(timeout=5)
+        order.append("io")
+
+    def cpu_stage() -> None:
+        assert io_started.wait(timeout=5)
+        order.append("cpu")
+        io_release.set()
+
+    mp.core.scheduler.run_stages([
+        Stage("io", io_stage, kind=StageKind.IO),
+        Stage("cpu", cpu_stage),
+        Stage("after", lambda: order.append("after"), depends_on=("io", "cpu")),
+    ])
+
+    assert order == ["cpu", "io", "after"]
+
+
+def test_run_stages_propagates_errors() -> None:
+    def fail() -> None:
+        msg: str = "boom"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        mp.core.scheduler.run_stages([Stage("io", fail, kind=StageKind.IO)])
+
+
+def test_run_stages_with_unknown_dependency_raises() -> None:
+    with pytest.raises(ValueError, match="unknown stage"):
+        mp.core.scheduler.run_stages([Stage("a", lambda: None, depends_on=("b",))])
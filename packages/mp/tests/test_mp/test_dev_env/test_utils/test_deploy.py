@@ -0,0 +1,132 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import base64
+import os
+import shutil
+import unittest.mock
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+import typer
+
+import mp.dev_env
+import mp.dev_env.api
+import mp.dev_env.utils
+from mp.build_project.marketplace import Marketplace
+from mp.dev_env.deployments import DeploymentRecord
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+API_ROOT: str = "https://playground.example.com"
+
+
+@pytest.fixture
+def integration_dir(tmp_path: pathlib.Path, built_integration: pathlib.Path) -> pathlib.Path:
+    path: pathlib.Path = tmp_path / "out" / built_integration.name
+    shutil.copytree(built_integration, path)
+    return path
+
+
+def test_zip_is_deterministic(integration_dir: pathlib.Path) -> None:
+    zip_path: pathlib.Path = mp.dev_env.utils.zip_integration_dir(integration_dir)
+    first: bytes = zip_path.read_bytes()
+
+    for path in integration_dir.rglob("*"):
+        os.utime(path, (0, 1_000_000_000))
+
+    assert mp.dev_env.utils.zip_integration_dir(integration_dir).read_bytes() == first
+    with zipfile.ZipFile(zip_path) as zf:
+        names: list[str] = zf.namelist()
+
+    assert names == sorted(names)
+    assert {n.rstrip("/") for n in names} == {
+        p.relative_to(integration_dir).as_posix() for p in integration_dir.rglob("*")
+    }
+
+
+def test_encode_package_matches_whole_file_encoding(tmp_path: pathlib.Path) -> None:
+    path: pathlib.Path = tmp_path / "package.zip"
+    path.write_bytes(os.urandom(1000))
+
+    with unittest.mock.patch.object(mp.dev_env.api, "ENCODE_CHUNK_SIZE", 3 * 7):
+        assert mp.dev_env.api.encode_package(path) == base64.b64encode(path.read_bytes()).decode()
+
+
+def test_deployment_record_is_per_environment(tmp_path: pathlib.Path) -> None:
+    path: pathlib.Path = tmp_path / "deployments.json"
+    record: DeploymentRecord = DeploymentRecord(path, API_ROOT)
+    staging: DeploymentRecord = DeploymentRecord(path, f"{API_ROOT}|staging")
+
+    assert not record.is_deployed("Mock", "a")
+    record.store({"Mock": "a"})
+    staging.store({"Mock": "b"})
+
+    assert record.is_deployed("Mock", "a")
+    assert not record.is_deployed("Mock", "b")
+    assert staging.is_deployed("Mock", "b")
+
+    path.write_text("not json", encoding="utf-8")
+    assert not record.is_deployed("Mock", "a")
+
+
+def test_deploy_skips_unchanged_integrations(
+    tmp_path: pathlib.Path,
+    integration_dir: pathlib.Path,
+) -> None:
+    record: DeploymentRecord = DeploymentRecord(tmp_path / "deployments.json", API_ROOT)
+    backend_api: unittest.mock.MagicMock = unittest.mock.MagicMock()
+    with (
+        unittest.mock.patch.object(
+            mp.dev_env.utils,
+            "load_dev_env_config",
+            return_value={"api_root": API_ROOT, "api_key": "key"},
+        ),
+        unittest.mock.patch.object(
+            mp.dev_env.utils, "find_source_integrations", return_value=[integration_dir]
+        ),
+        unittest.mock.patch.object(mp.dev_env.utils, "build_integrations"),
+        unittest.mock.patch.object(
+            mp.dev_env.utils, "get_integration_identifier", return_value="Mock"
+        ),
+        unittest.mock.patch.object(
+            mp.dev_env.utils, "find_built_integration_dir", return_value=integration_dir
+        ),
+        unittest.mock.patch.object(mp.dev_env, "minor_version_bump"),
+        unittest.mock.patch.object(DeploymentRecord, "from_config", return_value=record),
+        unittest.mock.patch.object(mp.dev_env.api, "BackendAPI", return_value=backend_api),
+    ):
+        mp.dev_env.deploy(["mock_integration"])
+        mp.dev_env.deploy(["mock_integration"])
+        assert backend_api.deploy_package.call_count == 1
+
+        mp.dev_env.deploy(["mock_integration"], force=True)
+        assert backend_api.deploy_package.call_count == 2
+
+
+def test_build_failure_exits_with_an_error(integration_dir: pathlib.Path) -> None:
+    with (
+        unittest.mock.patch.object(
+            Marketplace, "build_integrations", side_effect=ValueError("broken")
+        ),
+        pytest.raises(typer.Exit) as exc_info,
+    ):
+        mp.dev_env.utils.build_integrations([integration_dir])
+
+    assert exc_info.value.exit_code == 1
@@ -0,0 +1,114 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mp.core.constants
+import mp.run_pre_build_tests.impact
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+WHEEL_PATH: str = "packages/tipcommon/TIPCommon-2.2.7/TIPCommon-2.2.7-py2.py3-none-any.whl"
+LOCK_CONTENT: str = """
+version = 1
+requires-python = ">=3.11"
+
+[[package]]
+name = "{name}"
+version = "1.0"
+source = {{ virtual = "." }}
+
+[[package]]
+name = "tipcommon"
+version = "2.2.7"
+source = {{ path = "{wheel}" }}
+"""
+
+
+@pytest.fixture
+def marketplace(tmp_path: pathlib.Path) -> pathlib.Path:
+    community: pathlib.Path = tmp_path / "integrations" / mp.core.constants.COMMUNITY_DIR_NAME
+    for integration, lock in (
+        (community / "single", True),
+        (community / "group" / "first", False),
+        (community / "group" / "second", False),
+    ):
+        (integration / mp.core.constants.CORE_SCRIPTS_DIR).mkdir(parents=True)
+        if lock:
+            (integration / mp.core.constants.LOCK_FILE).write_text(
+                LOCK_CONTENT.format(name=integration.name, wheel=f"../../../{WHEEL_PATH}")
+            )
+
+    (community / "group" / mp.core.constants.COMMON_SCRIPTS_DIR).mkdir()
+    return tmp_path
+
+
+def _get_affected_names(marketplace: pathlib.Path, *changed: str) -> list[str]:
+    community: pathlib.Path = marketplace / "integrations" / mp.core.constants.COMMUNITY_DIR_NAME
+    integrations: list[pathlib.Path] = [
+        community / "single",
+        community / "group" / "first",
+        community / "group" / "second",
+    ]
+    return [
+        p.name
+        for p in mp.run_pre_build_tests.impact.get_affected_integrations(
+            [marketplace / c for c in changed],
+            integrations,
+        )
+    ]
+
+
+def test_integration_changes_affect_only_the_integration(marketplace: pathlib.Path) -> None:
+    assert _get_affected_names(
+        marketplace,
+        "integrations/third_party/group/first/core/Manager.py",
+    ) == ["first"]
+
+
+def test_group_common_scripts_affect_all_group_integrations(marketplace: pathlib.Path) -> None:
+    assert _get_affected_names(
+        marketplace,
+        "integrations/third_party/group/group_modules/common.py",
+    ) == ["first", "second"]
+
+
+def test_local_wheel_changes_affect_integrations_that_use_it(marketplace: pathlib.Path) -> None:
+    assert _get_affected_names(marketplace, WHEEL_PATH) == ["single"]
+
+
+def test_unrelated_changes_affect_nothing(marketplace: pathlib.Path) -> None:
+    assert not _get_affected_names(marketplace, "packages/mp/src/mp/__init__.py", "README.md")
+
+
+def test_order_by_duration_puts_slow_and_unknown_integrations_first(
+    tmp_path: pathlib.Path,
+) -> None:
+    durations_path: pathlib.Path = tmp_path / "durations.json"
+    mp.run_pre_build_tests.impact.store_durations(durations_path, {"fast": 1.0, "slow": 5.0})
+    mp.run_pre_build_tests.impact.store_durations(durations_path, {"fast": 2.0})
+
+    ordered: list[pathlib.Path] = mp.run_pre_build_tests.impact.order_by_duration(
+        [tmp_path / "fast", tmp_path / "slow", tmp_path / "new"],
+        mp.run_pre_build_tests.impact.load_durations(durations_path),
+    )
+
+    assert [p.name for p in ordered] == ["new", "slow", "fast"]
+    assert mp.run_pre_build_tests.impact.load_durations(tmp_path / "missing.json") == {}
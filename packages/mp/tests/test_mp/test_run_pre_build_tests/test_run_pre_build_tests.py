@@ -0,0 +1,84 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import unittest.mock
+from typing import TYPE_CHECKING
+
+import mp.core.unix
+import mp.run_pre_build_tests.runner
+from mp.run_pre_build_tests.runner import REPORT_SEPARATOR
+from mp.run_pre_build_tests.venv_pool import VenvPool
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from mp.run_pre_build_tests.process_test_output import IntegrationTestResults
+
+
+FAILED_TEST_REPORT: dict[str, list[dict[str, str]]] = {
+    "tests": [
+        {
+            "nodeid": "tests/test_actions/test_ping.py::test_ping",
+            "outcome": "failed",
+            "call": {"longrepr": "AssertionError"},
+        },
+    ],
+}
+
+
+def _run_tests(
+    tmp_path: pathlib.Path,
+    stdout: str,
+    returncode: int,
+) -> IntegrationTestResults | None:
+    result: unittest.mock.Mock = unittest.mock.Mock(returncode=returncode, stdout=stdout, stderr="")
+    with unittest.mock.patch.object(mp.core.unix, "run_python_script", return_value=result):
+        return mp.run_pre_build_tests.runner.run_integration_tests(
+            VenvPool(tmp_path / "venvs"),
+            (tmp_path / "mock_integration", "key", None),
+        ).results
+
+
+def test_report_is_read_from_the_runner_output(tmp_path: pathlib.Path) -> None:
+    stdout: str = f"pytest output\n{REPORT_SEPARATOR}\n{json.dumps(FAILED_TEST_REPORT)}\n"
+
+    results: IntegrationTestResults | None = _run_tests(tmp_path, stdout, returncode=1)
+
+    assert results is not None
+    assert results.integration_name == "mock_integration"
+    assert results.failed_tests == 1
+
+
+def test_passing_tests_have_no_results(tmp_path: pathlib.Path) -> None:
+    stdout: str = f"pytest output\n{REPORT_SEPARATOR}\n{json.dumps({'tests': []})}\n"
+
+    assert _run_tests(tmp_path, stdout, returncode=0) is None
+
+
+def test_environment_errors_are_reported_as_failures(tmp_path: pathlib.Path) -> None:
+    with unittest.mock.patch.object(mp.core.unix, "run_python_script") as run:
+        results: IntegrationTestResults | None = (
+            mp.run_pre_build_tests.runner.run_integration_tests(
+                VenvPool(tmp_path / "venvs"),
+                (tmp_path / "mock_integration", "key", "uv sync failed"),
+            ).results
+        )
+
+    run.assert_not_called()
+    assert results is not None
+    assert results.failed_tests == 1
+    assert results.failed_tests_summary[0].stack_trace == "uv sync failed"
@@ -0,0 +1,182 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unittest.mock
+from typing import TYPE_CHECKING
+
+import mp.core.constants
+import mp.core.unix
+import mp.run_pre_build_tests.venv_pool
+from mp.run_pre_build_tests.venv_pool import READY_MARKER_FILE, VenvPool
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+LOCK_TEMPLATE: str = """
+version = 1
+requires-python = ">=3.11"
+
+[[package]]
+name = "{name}"
+version = "{version}"
+source = {{ virtual = "." }}
+dependencies = [
+    {{ name = "requests" }},
+]
+
+[package.dev-dependencies]
+dev = [
+    {{ name = "tipcommon" }},
+]
+
+[[package]]
+name = "requests"
+version = "{requests_version}"
+source = {{ registry = "https://pypi.org/simple" }}
+
+[[package]]
+name = "tipcommon"
+version = "2.0.0"
+source = {{ path = "../../packages/tipcommon/TIPCommon-2.0.0-py2.py3-none-any.whl" }}
+"""
+
+
+def _create_project(
+    root: pathlib.Path,
+    name: str,
+    version: str = "1.0",
+    requests_version: str = "2.32.3",
+) -> pathlib.Path:
+    path: pathlib.Path = root / "integrations" / name
+    path.mkdir(parents=True)
+    (path / mp.core.constants.PROJECT_FILE).write_text(f'[project]\nname = "{name}"\n')
+    (path / mp.core.constants.PYTHON_VERSION_FILE).write_text("3.11\n")
+    (path / mp.core.constants.LOCK_FILE).write_text(
+        LOCK_TEMPLATE.format(name=name, version=version, requests_version=requests_version)
+    )
+    return path
+
+
+def test_projects_with_the_same_packages_share_a_key(tmp_path: pathlib.Path) -> None:
+    first: pathlib.Path = _create_project(tmp_path, "first", version="1.0")
+    second: pathlib.Path = _create_project(tmp_path, "second", version="5.0")
+
+    assert mp.run_pre_build_tests.venv_pool.get_key(
+        first
+    ) == mp.run_pre_build_tests.venv_pool.get_key(second)
+
+
+def test_lock_changes_change_the_key(tmp_path: pathlib.Path) -> None:
+    first: pathlib.Path = _create_project(tmp_path, "first")
+    second: pathlib.Path = _create_project(tmp_path, "second", requests_version="2.32.4")
+    third: pathlib.Path = _create_project(tmp_path, "third")
+    (third / mp.core.constants.PYTHON_VERSION_FILE).write_text("3.12\n")
+
+    keys: set[str] = {mp.run_pre_build_tests.venv_pool.get_key(p) for p in (first, second, third)}
+    assert len(keys) == 3
+
+
+def test_projects_without_a_lock_are_not_shared(tmp_path: pathlib.Path) -> None:
+    first: pathlib.Path = _create_project(tmp_path, "first")
+    second: pathlib.Path = _create_project(tmp_path, "second")
+    (first / mp.core.constants.LOCK_FILE).unlink()
+    (second / mp.core.constants.LOCK_FILE).unlink()
+    (second / mp.core.constants.PROJECT_FILE).write_text('[project]\nname = "first"\n')
+
+    assert mp.run_pre_build_tests.venv_pool.get_key(
+        first
+    ) != mp.run_pre_build_tests.venv_pool.get_key(second)
+
+
+def test_ensure_syncs_an_environment_once(tmp_path: pathlib.Path) -> None:
+    project: pathlib.Path = _create_project(tmp_path, "first")
+    pool: VenvPool = VenvPool(tmp_path / "venvs")
+    key: str = mp.run_pre_build_tests.venv_pool.get_key(project)
+
+    with unittest.mock.patch.object(mp.core.unix, "sync_project_environment") as sync:
+        sync.side_effect = lambda _, env_path: env_path.mkdir()
+        env_path: pathlib.Path = pool.ensure(key, project)
+        assert pool.ensure(key, project) == env_path
+
+    sync.assert_called_once_with(project, env_path)
+    assert (env_path / READY_MARKER_FILE).exists()
+
+
+def test_concurrent_ensures_sync_an_environment_once(tmp_path: pathlib.Path) -> None:
+    project: pathlib.Path = _create_project(tmp_path, "first")
+    pool: VenvPool = VenvPool(tmp_path / "venvs")
+    key: str = mp.run_pre_build_tests.venv_pool.get_key(project)
+
+    def sync(_: pathlib.Path, env_path: pathlib.Path) -> None:
+        env_path.mkdir()
+        time.sleep(0.2)
+
+    with unittest.mock.patch.object(mp.core.unix, "sync_project_environment") as sync_mock:
+        sync_mock.side_effect = sync
+        threads: list[threading.Thread] = [
+            threading.Thread(target=pool.ensure, args=(key, project)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    sync_mock.assert_called_once()
+    assert (pool.get_env_path(key) / READY_MARKER_FILE).exists()
+
+
+def test_ensure_recreates_incomplete_environments(tmp_path: pathlib.Path) -> None:
+    project: pathlib.Path = _create_project(tmp_path, "first")
+    pool: VenvPool = VenvPool(tmp_path / "venvs")
+    key: str = mp.run_pre_build_tests.venv_pool.get_key(project)
+    leftover: pathlib.Path = pool.get_env_path(key) / "leftover"
+    leftover.parent.mkdir(parents=True)
+    leftover.touch()
+
+    with unittest.mock.patch.object(mp.core.unix, "sync_project_environment") as sync:
+        sync.side_effect = lambda _, env_path: env_path.mkdir()
+        pool.ensure(key, project)
+
+    sync.assert_called_once()
+    assert not leftover.exists()
+
+
+def test_prune_removes_stale_and_incomplete_environments(tmp_path: pathlib.Path) -> None:
+    pool: VenvPool = VenvPool(tmp_path / "venvs")
+    fresh, stale, incomplete, kept = (pool.get_env_path(k) for k in ("a", "b", "c", "d"))
+    for env_path in (fresh, stale, incomplete, kept):
+        env_path.mkdir(parents=True)
+
+    for env_path in (fresh, stale, kept):
+        (env_path / READY_MARKER_FILE).touch()
+
+    old: float = (stale / READY_MARKER_FILE).stat().st_mtime - (
+        mp.run_pre_build_tests.venv_pool.MAX_UNUSED_SECONDS + 1
+    )
+    os.utime(stale / READY_MARKER_FILE, (old, old))
+    os.utime(kept / READY_MARKER_FILE, (old, old))
+
+    pool.prune(keep=["d"])
+
+    assert fresh.exists()
+    assert kept.exists()
+    assert not stale.exists()
+    assert not incomplete.exists()
@@ -0,0 +1,84 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mp
+import mp.core.lazy_group
+import mp.core.unix
+
+if TYPE_CHECKING:
+    import subprocess as sp
+
+    from typer import _click
+
+    from mp.core.lazy_group import LazyCommand
+
+
+HEAVY_MODULES: tuple[str, ...] = (
+    "libcst",
+    "pydantic",
+    "yaml",
+    "requests",
+    "mp.build_project",
+    "mp.validate",
+    "mp.dev_env",
+)
+
+
+def _get_loaded_modules(tmp_path: pathlib.Path, *args: str) -> set[str]:
+    script: pathlib.Path = tmp_path / "run_mp.py"
+    script.write_text(
+        "import json, sys\n"
+        f"sys.argv = ['mp', *{args!r}]\n"
+        "import mp\n"
+        "try:\n"
+        "    mp.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(json.dumps(sorted(sys.modules)))\n",
+        encoding="utf-8",
+    )
+    result: sp.CompletedProcess[str] = mp.core.unix.run_python_script(
+        pathlib.Path(sys.executable), script, cwd=tmp_path
+    )
+    assert result.returncode == 0, result.stderr
+
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+@pytest.mark.parametrize("args", [("--help",), ("config", "--help")])
+def test_startup_does_not_import_heavy_modules(
+    tmp_path: pathlib.Path,
+    args: tuple[str, ...],
+) -> None:
+    modules: set[str] = _get_loaded_modules(tmp_path, *args)
+
+    assert "mp" in modules
+    assert not [m for m in modules if m.split(".")[0] in HEAVY_MODULES or m in HEAVY_MODULES]
+
+
+@pytest.mark.parametrize("lazy", mp.COMMANDS, ids=lambda c: c.name)
+def test_lazy_commands_match_their_modules(lazy: LazyCommand) -> None:
+    command: _click.Command = mp.core.lazy_group.load_command(lazy)
+
+    assert command.name == lazy.name
+    assert command.help == lazy.help
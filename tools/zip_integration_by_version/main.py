@@ -15,13 +15,19 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import enum
 import json
 import logging
+import os
 import pathlib
 import subprocess
+import tempfile
 import zipfile
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 MARKETPLACE_PATH: pathlib.Path = pathlib.Path(__file__).parent.parent.parent
 CURRENT_INTEGRATIONS_PATH: pathlib.Path = (
@@ -30,6 +36,8 @@ CURRENT_INTEGRATIONS_PATH: pathlib.Path = (
 PREVIOUS_INTEGRATIONS_PATH: pathlib.Path = MARKETPLACE_PATH / "Integrations"
 INTEGRATION_DEF: str = "Integration-{0}.def"
 RN_JSON: str = "RN.json"
+INTEGRATIONS_DIRS_IN_GIT: tuple[str, ...] = ("integrations/third_party", "Integrations")
+VERSIONS_INDEX_PATH: str = "zip_integration_by_version/versions_index.json"
 PYTHON_UPDATE_MSG: str = (
     "Important - Updated the integration code to work with Python version 3.11."
     " To ensure compatibility and avoid disruptions, follow the upgrade best practices"
@@ -54,24 +62,38 @@ def main() -> None:  # noqa: D103
     parser: argparse.ArgumentParser = argparse.ArgumentParser()
     args: argparse.Namespace = _get_parsed_arguments(parser)
     _validate_args(args)
+    if not args.checkout:
+        _zip_versions_from_git_objects(
+            integration=args.integration,
+            versions=args.version,
+            dir_=args.dir,
+            check_python_migration_rn=args.raise_python_migration_rn,
+        )
+        return
+
+    for version in args.version:
+        _zip_version_from_checkout(args.integration, version, args)
+
+
+def _zip_version_from_checkout(
+    integration: str, version: float, args: argparse.Namespace
+) -> None:
     original_branch: str = _get_current_branch()
     success: bool = False
     try:
-        commit_sha: str = _get_commit_sha(
-            integration=args.integration, version=args.version
-        )
+        commit_sha: str = _get_commit_sha(integration=integration, version=version)
         logger.info("Commit SHA found %s", commit_sha)
         _git_checkout(commit_sha)
         _validate_integration(
-            integration=args.integration,
-            version=args.version,
+            integration=integration,
+            version=version,
             check_python_migration_rn=args.raise_python_migration_rn,
         )
-        _adjust_integration(args.integration)
-        _zip_integration(args.integration, args.version, args.dir)
+        _adjust_integration(integration)
+        _zip_integration(integration, version, args.dir)
         success = True
         logger.info(
-            "Successfully created zip for %s version %s", args.integration, args.version
+            "Successfully created zip for %s version %s", integration, version
         )
 
     except Exception:
@@ -102,19 +124,34 @@ def main() -> None:  # noqa: D103
 
 def _get_parsed_arguments(parser: argparse.ArgumentParser) -> argparse.Namespace:
     parser.add_argument("-i", "--integration", help="Specify the integration's name.")
-    parser.add_argument("-v", "--version", help="Specify the requested version to zip")
+    parser.add_argument(
+        "-v",
+        "--version",
+        nargs="+",
+        help="Specify the requested versions to zip",
+    )
     parser.add_argument("-d", "--dir", help="The zip's dir. Default is repo base root")
     parser.add_argument(
         "--raise-python-migration-rn",
         help="Raise if python migration release note appear in the integration's RN",
         action="store_false",
     )
+    parser.add_argument(
+        "--checkout",
+        help=(
+            "Check out each version's commit and zip it from the worktree, instead of"
+            " reading it from git's objects"
+        ),
+        action="store_true",
+    )
     return parser.parse_args()
 
 
 def _validate_args(arguments: argparse.Namespace) -> None:
-    arguments.version = _validate_version(arguments.version)
-    _validate_integration_arg(arguments.integration)
+    arguments.version = [_validate_version(v) for v in arguments.version]
+    if arguments.checkout:
+        _validate_integration_arg(arguments.integration)
+
     arguments.dir = _validate_dir(arguments.dir)
 
 
@@ -253,6 +290,10 @@ def _validate_integration_version_in_def(integration: str, version: float) -> No
     def_name: str = INTEGRATION_DEF.format(integration)
     integration_def: pathlib.Path = _find_integration(integration, def_name)
     def_: dict[str, Any] = json.loads(integration_def.read_text(encoding="utf-8"))
+    _validate_def_version(def_, version)
+
+
+def _validate_def_version(def_: dict[str, Any], version: float) -> None:
     if def_["Version"] != version:
         msg = (
             f"The integration's version doesn't match the requested version."
@@ -264,6 +305,10 @@ def _validate_integration_version_in_def(integration: str, version: float) -> No
 def _validate_integration_python_migration_rn_description(integration: str) -> None:
     rn_path: pathlib.Path = _find_integration(integration, RN_JSON)
     rns: list[dict[str, Any]] = json.loads(rn_path.read_text(encoding="utf-8"))
+    _validate_rn_changes(rns)
+
+
+def _validate_rn_changes(rns: list[dict[str, Any]]) -> None:
     changes: set[str] = {rn["ChangeDescription"] for rn in rns}
     if not changes:
         msg = "No RNs found"
@@ -328,6 +373,324 @@ def _restore_environment(original_branch: str) -> None:
         logger.exception("Warning: Failed to restore stashed changes")
 
 
+class GitObjectReader:
+    """Read objects from the repository's object database.
+
+    The objects are read through a single `git cat-file --batch` process, so
+    reading many objects does not start a process for each one.
+    """
+
+    def __init__(self) -> None:
+        self._process: subprocess.Popen[bytes] = subprocess.Popen(  # noqa: S603
+            ["git", "cat-file", "--batch"],  # noqa: S607
+            cwd=MARKETPLACE_PATH,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> GitObjectReader:  # noqa: D105
+        return self
+
+    def __exit__(self, *_: object) -> None:  # noqa: D105
+        self.close()
+
+    def read(self, object_name: str) -> bytes:
+        """Read an object's content.
+
+        Args:
+            object_name: The object's SHA or any name git can resolve to an object.
+
+        Returns:
+            The object's content.
+
+        Raises:
+            ValueError: If the object does not exist.
+
+        """
+        stdin: IO[bytes] = self._process.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = self._process.stdout  # type: ignore[assignment]
+        stdin.write(f"{object_name}\n".encode())
+        stdin.flush()
+        header: list[str] = stdout.readline().decode().split()
+        if len(header) != 3:  # noqa: PLR2004
+            msg = f"Could not find git object {object_name}"
+            raise ValueError(msg)
+
+        content: bytes = stdout.read(int(header[2]))
+        stdout.read(1)
+        return content
+
+    def close(self) -> None:
+        """Stop the `git cat-file` process."""
+        if self._process.stdin is not None:
+            self._process.stdin.close()
+
+        self._process.wait()
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+
+def _zip_versions_from_git_objects(
+    integration: str,
+    versions: Iterable[float],
+    dir_: pathlib.Path,
+    *,
+    check_python_migration_rn: bool,
+) -> None:
+    versions = list(versions)
+    commits: dict[str, str] = _update_versions_index(integration)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(versions), os.cpu_count() or 1)
+    ) as executor:
+        futures: dict[concurrent.futures.Future[pathlib.Path], float] = {
+            executor.submit(
+                _zip_integration_from_git_objects,
+                integration=integration,
+                version=version,
+                commit_sha=_get_indexed_commit_sha(commits, integration, version),
+                dir_=dir_,
+                check_python_migration_rn=check_python_migration_rn,
+            ): version
+            for version in versions
+            if str(version) in commits
+        }
+        for version in versions:
+            if str(version) not in commits:
+                logger.error(
+                    "No commit found for integration %s at version %s",
+                    integration,
+                    version,
+                )
+
+        for future in concurrent.futures.as_completed(futures):
+            version = futures[future]
+            try:
+                future.result()
+            except Exception:
+                logger.exception("Error zipping %s version %s", integration, version)
+            else:
+                logger.info(
+                    "Successfully created zip for %s version %s", integration, version
+                )
+
+
+def _get_indexed_commit_sha(
+    commits: dict[str, str], integration: str, version: float
+) -> str:
+    commit_sha: str = commits[str(version)]
+    logger.info(
+        "Commit SHA found %s for %s version %s", commit_sha, integration, version
+    )
+    return commit_sha
+
+
+def _update_versions_index(integration: str) -> dict[str, str]:
+    """Update the index of the commits that introduced each version of an integration.
+
+    The index is stored in the repository's git directory. Only the history that
+    was added since the index was last updated is scanned, by excluding the
+    commits reachable from the refs that were already scanned.
+
+    Args:
+        integration: The integration's name.
+
+    Returns:
+        The SHA of the first commit that had each version, keyed by the version.
+
+    """
+    index_path: pathlib.Path = _get_git_dir() / VERSIONS_INDEX_PATH
+    index: dict[str, Any] = _load_versions_index(index_path)
+    entry: dict[str, Any] = index.setdefault(integration, {"tips": [], "versions": {}})
+    tips: list[str] = _get_ref_tips()
+    def_paths: list[str] = [
+        f"{d}/{integration}/{INTEGRATION_DEF.format(integration)}"
+        for d in INTEGRATIONS_DIRS_IN_GIT
+    ]
+    command: list[str] = [
+        "git",
+        "log",
+        "--all",
+        "--ignore-missing",
+        "--reverse",
+        "--format=commit %H",
+        "--raw",
+        "--no-abbrev",
+        "--no-renames",
+        *(f"^{tip}" for tip in entry["tips"]),
+        "--",
+        *def_paths,
+    ]
+    result = subprocess.run(  # noqa: S603
+        command,
+        cwd=MARKETPLACE_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    versions: dict[str, str] = entry["versions"]
+    with GitObjectReader() as reader:
+        for commit_sha, blob_sha in _get_changed_blobs(result.stdout):
+            try:
+                def_: dict[str, Any] = json.loads(reader.read(blob_sha))
+                versions.setdefault(str(float(def_["Version"])), commit_sha)
+            except (ValueError, KeyError, TypeError):
+                logger.warning(
+                    "Skipping invalid definition file at commit %s", commit_sha
+                )
+
+    entry["tips"] = tips
+    _store_versions_index(index_path, index)
+    return versions
+
+
+def _get_changed_blobs(log_output: str) -> list[tuple[str, str]]:
+    changes: list[tuple[str, str]] = []
+    commit_sha: str = ""
+    for line in log_output.splitlines():
+        if line.startswith("commit "):
+            commit_sha = line.split()[1]
+        elif line.startswith(":"):
+            *_, blob_sha, status = line.split("\t", 1)[0].split()
+            if status != "D":
+                changes.append((commit_sha, blob_sha))
+
+    return changes
+
+
+def _get_git_dir() -> pathlib.Path:
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-common-dir"],  # noqa: S607
+        cwd=MARKETPLACE_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return (MARKETPLACE_PATH / result.stdout.strip()).resolve()
+
+
+def _get_ref_tips() -> list[str]:
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD", "--all"],  # noqa: S607
+        cwd=MARKETPLACE_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return sorted(set(result.stdout.split()))
+
+
+def _load_versions_index(index_path: pathlib.Path) -> dict[str, Any]:
+    try:
+        index: Any = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    return index if isinstance(index, dict) else {}
+
+
+def _store_versions_index(index_path: pathlib.Path, index: dict[str, Any]) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=index_path.parent, delete=False, encoding="utf-8"
+    ) as f:
+        json.dump(index, f, indent=4, sort_keys=True)
+
+    pathlib.Path(f.name).replace(index_path)
+
+
+def _zip_integration_from_git_objects(
+    integration: str,
+    version: float,
+    commit_sha: str,
+    dir_: pathlib.Path,
+    *,
+    check_python_migration_rn: bool,
+) -> pathlib.Path:
+    """Zip an integration as it was at a commit without checking the commit out.
+
+    The integration's files are read directly from git's objects, so the
+    worktree is left untouched and several versions can be zipped concurrently.
+
+    Args:
+        integration: The integration's name.
+        version: The integration's version at the commit.
+        commit_sha: The SHA of the commit to zip the integration from.
+        dir_: The directory to create the zip in.
+        check_python_migration_rn: Whether to validate the integration's RNs.
+
+    Returns:
+        The path of the created zip.
+
+    Raises:
+        ValueError: If the integration is not found in the commit.
+
+    """
+    files: dict[str, str] = _list_integration_files(integration, commit_sha)
+    def_name: str = INTEGRATION_DEF.format(integration)
+    if def_name not in files:
+        msg = f"Could not find {def_name} at commit {commit_sha}"
+        raise ValueError(msg)
+
+    version_s: str = str(version).replace(".", "-")
+    zip_path: pathlib.Path = dir_ / f"{integration}_V{version_s}.zip"
+    with GitObjectReader() as reader:
+        def_: dict[str, Any] = json.loads(reader.read(files[def_name]))
+        _validate_def_version(def_, version)
+        if check_python_migration_rn:
+            if RN_JSON not in files:
+                msg = f"Could not find {RN_JSON} at commit {commit_sha}"
+                raise ValueError(msg)
+
+            _validate_rn_changes(json.loads(reader.read(files[RN_JSON])))
+
+        def_["IsCustom"] = True
+        with zipfile.ZipFile(zip_path, "w") as integration_zip:
+            for name, blob_sha in files.items():
+                content: bytes = (
+                    json.dumps(def_, indent=4).encode()
+                    if name == def_name
+                    else reader.read(blob_sha)
+                )
+                integration_zip.writestr(name, content)
+
+    logger.info("Created zip file: %s", zip_path)
+    return zip_path
+
+
+def _list_integration_files(integration: str, commit_sha: str) -> dict[str, str]:
+    for integrations_dir in INTEGRATIONS_DIRS_IN_GIT:
+        integration_dir: str = f"{integrations_dir}/{integration}/"
+        command: list[str] = [
+            "git",
+            "ls-tree",
+            "-r",
+            "-z",
+            "--full-tree",
+            commit_sha,
+            "--",
+            integration_dir,
+        ]
+        result = subprocess.run(  # noqa: S603
+            command,
+            cwd=MARKETPLACE_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        files: dict[str, str] = {}
+        for entry in filter(None, result.stdout.split("\0")):
+            info, path = entry.split("\t", 1)
+            _, type_, blob_sha = info.split()
+            if type_ == "blob":
+                files[path.removeprefix(integration_dir)] = blob_sha
+
+        if files:
+            return files
+
+    msg = f"Could not find integration {integration} at commit {commit_sha}"
+    raise ValueError(msg)
+
+
 def _run_command_safe(
     command: str | list[str],
 ) -> subprocess.CompletedProcess[str] | None:
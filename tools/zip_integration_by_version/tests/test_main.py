@@ -0,0 +1,148 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import zipfile
+from typing import Any
+
+import pytest
+
+from .. import main
+
+INTEGRATION: str = "Foo"
+INTEGRATION_PATH: str = f"integrations/third_party/{INTEGRATION}"
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    path: pathlib.Path = tmp_path / "marketplace"
+    path.mkdir()
+    _git(path, "init", "-q")
+    _git(path, "config", "user.name", "Test")
+    _git(path, "config", "user.email", "test@example.com")
+    monkeypatch.setattr(main, "MARKETPLACE_PATH", path)
+    return path
+
+
+@pytest.fixture
+def zip_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    path: pathlib.Path = tmp_path / "zips"
+    path.mkdir()
+    return path
+
+
+def _git(repo: pathlib.Path, *args: str) -> str:
+    return subprocess.run(  # noqa: S603
+        ["git", *args],  # noqa: S607
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def _commit_version(repo: pathlib.Path, version: float, files: dict[str, str]) -> str:
+    integration_path: pathlib.Path = repo / INTEGRATION_PATH
+    integration_path.mkdir(parents=True, exist_ok=True)
+    def_: dict[str, Any] = {"Identifier": INTEGRATION, "Version": version}
+    (integration_path / main.INTEGRATION_DEF.format(INTEGRATION)).write_text(
+        json.dumps(def_), encoding="utf-8"
+    )
+    (integration_path / main.RN_JSON).write_text(
+        json.dumps([{"ChangeDescription": f"Version {version}"}]), encoding="utf-8"
+    )
+    for name, content in files.items():
+        file: pathlib.Path = integration_path / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content, encoding="utf-8")
+
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", f"{INTEGRATION} {version}")
+    return _git(repo, "rev-parse", "HEAD").strip()
+
+
+def _read_zip(zip_path: pathlib.Path) -> dict[str, bytes]:
+    with zipfile.ZipFile(zip_path) as integration_zip:
+        return {name: integration_zip.read(name) for name in integration_zip.namelist()}
+
+
+def test_zip_version_from_git_objects(
+    repo: pathlib.Path, zip_dir: pathlib.Path
+) -> None:
+    _commit_version(repo, 1.0, {"ActionsScripts/Ping.py": "print('v1')\n"})
+    _commit_version(
+        repo,
+        2.0,
+        {"ActionsScripts/Ping.py": "print('v2')\n", "Managers/Manager.py": "x = 2\n"},
+    )
+    head: str = _git(repo, "rev-parse", "HEAD").strip()
+
+    main._zip_versions_from_git_objects(
+        integration=INTEGRATION,
+        versions=[1.0],
+        dir_=zip_dir,
+        check_python_migration_rn=True,
+    )
+
+    files: dict[str, bytes] = _read_zip(zip_dir / f"{INTEGRATION}_V1-0.zip")
+    def_: dict[str, Any] = json.loads(
+        files.pop(main.INTEGRATION_DEF.format(INTEGRATION))
+    )
+    assert def_ == {"Identifier": INTEGRATION, "Version": 1.0, "IsCustom": True}
+    assert files == {
+        main.RN_JSON: b'[{"ChangeDescription": "Version 1.0"}]',
+        "ActionsScripts/Ping.py": b"print('v1')\n",
+    }
+    assert _git(repo, "rev-parse", "HEAD").strip() == head
+    assert not _git(repo, "status", "--porcelain")
+
+
+def test_zip_several_versions(repo: pathlib.Path, zip_dir: pathlib.Path) -> None:
+    _commit_version(repo, 1.0, {"ActionsScripts/Ping.py": "print('v1')\n"})
+    _commit_version(repo, 2.0, {"ActionsScripts/Ping.py": "print('v2')\n"})
+
+    main._zip_versions_from_git_objects(
+        integration=INTEGRATION,
+        versions=[1.0, 2.0, 3.0],
+        dir_=zip_dir,
+        check_python_migration_rn=False,
+    )
+
+    assert sorted(p.name for p in zip_dir.iterdir()) == [
+        f"{INTEGRATION}_V1-0.zip",
+        f"{INTEGRATION}_V2-0.zip",
+    ]
+    v2: dict[str, bytes] = _read_zip(zip_dir / f"{INTEGRATION}_V2-0.zip")
+    assert v2["ActionsScripts/Ping.py"] == b"print('v2')\n"
+
+
+def test_versions_index_is_updated_incrementally(repo: pathlib.Path) -> None:
+    first: str = _commit_version(repo, 1.0, {"ActionsScripts/Ping.py": "1\n"})
+    tip: str = _commit_version(repo, 1.0, {"ActionsScripts/Ping.py": "2\n"})
+    assert main._update_versions_index(INTEGRATION) == {"1.0": first}
+
+    index_path: pathlib.Path = main._get_git_dir() / main.VERSIONS_INDEX_PATH
+    index: dict[str, Any] = json.loads(index_path.read_text(encoding="utf-8"))
+    assert index[INTEGRATION]["tips"] == [tip]
+
+    # History that was already scanned is not scanned again
+    del index[INTEGRATION]["versions"]["1.0"]
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    second: str = _commit_version(repo, 2.0, {"ActionsScripts/Ping.py": "3\n"})
+
+    assert main._update_versions_index(INTEGRATION) == {"2.0": second}